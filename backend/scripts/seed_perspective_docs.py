@@ -18,6 +18,7 @@ Usage:
 import os
 import re
 import sqlite3
+import sys
 from datetime import datetime, UTC
 from pathlib import Path
 
@@ -25,6 +26,9 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 BACKEND_ROOT = SCRIPT_DIR.parent
 DATA_DIR = BACKEND_ROOT / "data"
 
+sys.path.insert(0, str(BACKEND_ROOT))
+from src.db.models.knowledge_tables import perspective_doc_hash  # noqa: E402
+
 PERSPECTIVE_DOCUMENTS: list[dict] = [
     # ── RUSSIA ───────────────────────────────────────────────────────────────
     {
@@ -178,7 +182,8 @@ def seed() -> None:
             source           TEXT,
             date_published   DATETIME NOT NULL,
             markdown_content TEXT NOT NULL DEFAULT '',
-            is_active        INTEGER NOT NULL DEFAULT 1
+            is_active        INTEGER NOT NULL DEFAULT 1,
+            content_hash     TEXT NOT NULL DEFAULT ''
         )
     """)
     conn.execute("CREATE INDEX IF NOT EXISTS idx_persp_docs_perspective ON perspective_documents(perspective)")
@@ -193,15 +198,17 @@ def seed() -> None:
     for doc in all_docs:
         conn.execute(
             """INSERT INTO perspective_documents
-                   (id, perspective, section, title, source, date_published, markdown_content, is_active)
-               VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                   (id, perspective, section, title, source, date_published, markdown_content, is_active,
+                    content_hash)
+               VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
                ON CONFLICT(id) DO UPDATE SET
                    perspective=excluded.perspective,
                    section=excluded.section,
                    title=excluded.title,
                    source=excluded.source,
                    date_published=excluded.date_published,
-                   markdown_content=excluded.markdown_content
+                   markdown_content=excluded.markdown_content,
+                   content_hash=excluded.content_hash
             """,
             (
                 doc["id"],
@@ -211,6 +218,9 @@ def seed() -> None:
                 doc.get("source"),
                 doc["date_published"].isoformat(),
                 doc["markdown_content"],
+                perspective_doc_hash(
+                    doc["section"], doc["title"], doc.get("source"), doc["markdown_content"]
+                ),
             ),
         )
         inserted += 1
@@ -4,7 +4,8 @@ API router for the dialogue flow.
 Handles incoming messages from the frontend, routes them through
 the dialogue state machine (DirectionFlow), and returns structured responses.
 
-Sessions are cached in memory in `_sessions` and persisted to sessions.db.
+Sessions are cached in memory in `_sessions` (a bounded SessionCache) and
+persisted to sessions.db; each save only writes the columns that changed.
 """
 
 import asyncio
@@ -20,7 +21,8 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from src.db.mappers import row_to_session, session_to_row
+from src.db.content_cache import ContentCache
+from src.db.mappers import row_to_session, session_to_columns, session_to_row
 from src.db.engine import get_knowledge_session_factory
 from src.db.repositories.perspective_doc_repo import PerspectiveDocRepository
 from src.db.unit_of_work import UnitOfWork, get_uow
@@ -39,6 +41,7 @@ from src.services.direction.dialogue_service import DialogueService
 from src.services.processing.processing_result_store import ProcessingResultStore
 from src.services.processing.processing_service import ProcessingService
 from src.services.reasearch_logger import ResearchLogger
+from src.services.session_cache import TombstoneSet, create_session_cache
 from src.services.ai.review_service import ReviewService
 from src.services.state_machines.analysis_flow import AnalysisFlow, AnalysisState
 from src.services.state_machines.collection_flow import CollectionFlow, CollectionState
@@ -71,6 +74,12 @@ _OUTPUTS_DIR = _DATA_DIR / "outputs"
 _COLLECTION_STATUS_DIR = _DATA_DIR / "collection_status"
 _SESSION_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 
+# Rendered perspective reference documents, revalidated per turn against
+# PerspectiveDocRepository.version().
+_perspective_docs_cache = ContentCache(
+    max_bytes=int(os.getenv("PERSPECTIVE_DOCS_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+)
+
 
 def _dialogue_request_timeout_seconds(request: Any) -> float:
     raw_timeout = os.getenv("DIALOGUE_REQUEST_TIMEOUT_SECONDS")
@@ -122,13 +131,22 @@ class IntelligenceSession:
         self.council_flow: CouncilFlow | None = None
 
 
-_sessions: dict[str, IntelligenceSession] = {}
+_sessions = create_session_cache()
 
 # Tombstone of session ids that were explicitly deleted.  Blocks in-flight
 # requests (e.g. a long-running /api/dialogue/message handler) from
 # re-inserting the row via _save_session after the user has already
-# deleted the session on the frontend.
-_deleted_sessions: set[str] = set()
+# deleted the session on the frontend.  Entries expire once no request
+# started before the delete can still be running.
+_deleted_sessions = TombstoneSet()
+
+
+def session_cache_stats() -> dict:
+    return _sessions.stats()
+
+
+def perspective_docs_cache_stats() -> dict:
+    return _perspective_docs_cache.stats()
 
 
 async def _save_session(session: IntelligenceSession, uow: UnitOfWork) -> None:
@@ -143,9 +161,18 @@ async def _save_session(session: IntelligenceSession, uow: UnitOfWork) -> None:
             f"[Session {session.session_id}] Skipping save: session was deleted"
         )
         return
-    row = session_to_row(session)
-    await uow.sessions.upsert(row)
+    columns = session_to_columns(session)
+    diff = _sessions.diff(session.session_id, session, columns)
+    if not diff.is_new and not diff.dirty_flows:
+        _sessions.record_skipped_save()
+        return
+    if diff.is_new or not await uow.sessions.update_columns(
+        session.session_id, diff.changed
+    ):
+        await uow.sessions.upsert(session_to_row(session, columns))
+        diff.is_new = True
     await uow.commit()
+    _sessions.mark_persisted(session.session_id, session, diff)
 
 
 async def _load_session(
@@ -359,6 +386,7 @@ async def _load_perspective_docs(perspectives: list[str]) -> dict[str, str]:
 
     Returns a dict mapping each perspective to a formatted markdown block
     containing all its active Political / Economic / Military reference documents.
+    Rendered blocks are cached until the perspective's document version changes.
     """
     if not perspectives:
         return {}
@@ -368,8 +396,15 @@ async def _load_perspective_docs(perspectives: list[str]) -> dict[str, str]:
         async with factory() as session:
             repo = PerspectiveDocRepository(session)
             for perspective in perspectives:
+                version = await repo.version(perspective)
+                cached = _perspective_docs_cache.get(perspective, version)
+                if cached is not None:
+                    if cached:
+                        docs_by_perspective[perspective] = cached
+                    continue
                 docs = await repo.list_by_perspective(perspective)
                 if not docs:
+                    _perspective_docs_cache.put(perspective, version, "")
                     continue
                 sections: dict[str, list[str]] = {}
                 for doc in docs:
@@ -382,6 +417,9 @@ async def _load_perspective_docs(perspectives: list[str]) -> dict[str, str]:
                         parts.append(f"### {section.capitalize()}")
                         parts.extend(sections[section])
                 docs_by_perspective[perspective] = "\n\n".join(parts)
+                _perspective_docs_cache.put(
+                    perspective, version, docs_by_perspective[perspective]
+                )
     except Exception:
         logger.warning("[_load_perspective_docs] Failed to load docs", exc_info=True)
     return docs_by_perspective
@@ -399,15 +437,21 @@ async def _get_or_create_session(
     Returns:
         the retrieved or new IntelligenceSession
     """
-    if session_id not in _sessions:
-        research_logger = ResearchLogger(session_id=session_id)
-        loaded = await _load_session(session_id, research_logger, uow)
-        if loaded:
-            _sessions[session_id] = loaded
-        else:
-            logger.info(f"[Session {session_id}] Creating new session")
-            _sessions[session_id] = IntelligenceSession(session_id, research_logger)
-    return _sessions[session_id]
+    session = _sessions.get(session_id)
+    if session is not None:
+        return session  # type: ignore[no-any-return]
+
+    research_logger = ResearchLogger(session_id=session_id)
+    loaded = await _load_session(session_id, research_logger, uow)
+    if loaded:
+        # Snapshot what is in the DB so the next save only writes changes
+        _sessions.put(session_id, loaded, persisted=session_to_columns(loaded))
+        return loaded
+
+    logger.info(f"[Session {session_id}] Creating new session")
+    session = IntelligenceSession(session_id, research_logger)
+    _sessions.put(session_id, session)
+    return session
 
 
 def _get_active_stage_and_phase(session: IntelligenceSession) -> tuple[str, Phase]:
@@ -708,7 +752,7 @@ async def _clone_dev_artifacts(
         processing_attempts = await uow.processing_attempts.get_all(source_id)
         for attempt in processing_attempts:
             await uow.processing_attempts.append(
-                target_id, attempt.pir, attempt.raw_result
+                target_id, attempt.pir, attempt.raw_result, attempt.normalized_result
             )
 
         # Copy analysis session
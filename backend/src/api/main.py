@@ -17,7 +17,12 @@ from fastapi import (
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.analysis import router as analysis_router
-from src.api.dialogue import ensure_sessions_dir, evict_session
+from src.api.dialogue import (
+    ensure_sessions_dir,
+    evict_session,
+    perspective_docs_cache_stats,
+    session_cache_stats,
+)
 from src.api.dialogue import router as dialogue_router
 from src.db.engine import get_knowledge_engine, get_sessions_engine, run_migrations, seed_knowledge
 from src.db.unit_of_work import KnowledgeUnitOfWork, get_knowledge_uow
@@ -26,13 +31,25 @@ from src.importers.session_uploads import (
     default_uploads_root,
     delete_session_upload,
     delete_session_uploads,
+    get_session_upload,
     list_session_uploads,
     save_session_upload,
 )
+from src.importers.upload_pipeline import (
+    get_upload_pipeline,
+    start_upload_pipeline,
+    stop_upload_pipeline,
+)
 from src.logging_config import setup_logging
+from src.services.collection.otx_collector import close_otx_client
 from src.services.council.council_mcp_process import maybe_start_council_mcp, stop_council_mcp
 from src.services.council.council_service import get_council_mcp_url
-from src.services.reasearch_logger import ResearchLogger
+from src.services.reasearch_logger import (
+    ResearchLogger,
+    get_log_writer,
+    start_log_writer,
+    stop_log_writer,
+)
 
 load_dotenv()
 
@@ -52,6 +69,10 @@ async def lifespan(_app: FastAPI):
     get_knowledge_engine()
     # Keep legacy sessions/ dir creation for dev-tool snapshot endpoints
     ensure_sessions_dir()
+    start_log_writer()
+    upload_pipeline = start_upload_pipeline()
+    # Parses do not survive a restart: requeue uploads still marked pending
+    await upload_pipeline.resume_pending(UPLOADS_ROOT)
     council_mcp_process = await maybe_start_council_mcp(get_council_mcp_url())
     logger.info("Backend API started successfully: http://127.0.0.1:8000")
     print("Backend API started successfully: http://127.0.0.1:8000", flush=True)
@@ -60,6 +81,10 @@ async def lifespan(_app: FastAPI):
         yield
     finally:
         await stop_council_mcp(council_mcp_process)
+        await stop_upload_pipeline()
+        await close_otx_client()
+        # Flush queued research log entries before the process exits
+        await asyncio.to_thread(stop_log_writer)
         logger.info("Application stopped")
 
 
@@ -113,6 +138,19 @@ async def check_health():
     return {"status": "ok"}
 
 
+@app.get("/health/metrics")
+async def get_metrics():
+    """Return internal queue and throughput metrics for background workers."""
+    writer = get_log_writer()
+    pipeline = get_upload_pipeline()
+    return {
+        "research_log_writer": writer.stats() if writer else None,
+        "session_cache": session_cache_stats(),
+        "perspective_docs_cache": perspective_docs_cache_stats(),
+        "upload_parse_pipeline": pipeline.stats() if pipeline else None,
+    }
+
+
 @app.post("/api/import/upload")
 async def upload_file(
     session_id: str = Form(...),
@@ -124,6 +162,10 @@ async def upload_file(
     The endpoint validates filetype and stores files under:
     data/imports/{session_id}/
 
+    PDFs are accepted with parse_status "pending" and parsed in the background
+    upload pipeline; poll GET /api/import/files/{file_upload_id}/status until
+    parsing finishes.
+
     Args:
         session_id str: Session identifier used to scope uploaded sources.
         file UploadFile: The file that is being uploaded.
@@ -138,15 +180,25 @@ async def upload_file(
 
     Raises:
         - HTTPException 400: If request validation fails
+        - HTTPException 503: If the background parse queue is full
         - HTTPException 500: If an error occurs while saving
     """
+    pipeline = get_upload_pipeline()
+    defer_parse = pipeline is not None and pipeline.is_running
+    if pipeline is not None and defer_parse and not pipeline.has_capacity():
+        raise HTTPException(
+            status_code=503, detail="Upload parse queue is full, try again shortly"
+        )
     try:
-        result = save_session_upload(
+        # Disk writes and the sqlite sync are blocking; keep them off the loop
+        result = await asyncio.to_thread(
+            save_session_upload,
             file_obj=file.file,
             filename=file.filename or "",
             session_id=session_id,
             uploads_root=UPLOADS_ROOT,
             mime_type=file.content_type,
+            defer_pdf_parse=defer_parse,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -158,10 +210,34 @@ async def upload_file(
         raise HTTPException(
             status_code=500, detail="Failed to save uploaded file"
         ) from e
+    if pipeline is not None and result["parse_status"] == "pending":
+        pipeline.submit(result, UPLOADS_ROOT)
     logger.info(f"[upload_file] Saved '{file.filename}' for session {session_id}")
     return {"status": "success", **result}
 
 
+@app.get("/api/import/files/{file_upload_id}/status")
+async def get_upload_status(file_upload_id: str, session_id: str = Query(...)):
+    """Return the parse status of one uploaded source (for polling)."""
+    try:
+        entry = get_session_upload(
+            session_id=session_id,
+            file_upload_id=file_upload_id,
+            uploads_root=UPLOADS_ROOT,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return {
+        "file_upload_id": file_upload_id,
+        "session_id": session_id,
+        "parse_status": entry.get("parse_status"),
+        "searchable": entry.get("searchable", False),
+        "search_skip_reason": entry.get("search_skip_reason"),
+    }
+
+
 @app.get("/api/import/files")
 async def list_uploaded_files(session_id: str = Query(...)):
     """List all uploaded sources for a session."""
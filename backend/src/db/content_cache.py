@@ -0,0 +1,83 @@
+"""Size-bounded content cache, revalidated by an ETag.
+
+The cache keeps content per key together with the validator it was built
+under; a lookup only returns the content while the caller's current
+validator still matches, so checking freshness costs one cheap query instead
+of reloading the content.
+
+Used for the rendered perspective reference documents every processing and
+council turn injects (validator: PerspectiveDocRepository.version). The
+generation MCP server keeps a copy for knowledge resources.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class ContentCache:
+    """LRU of ``key -> (etag, content)`` bounded by total content size.
+
+    Args:
+        max_bytes: Upper bound on the summed length of cached content.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Hashable, str]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, etag: Hashable) -> str | None:
+        """Return cached content if it was stored under the same etag."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry[0] != etag:
+                self._stale += 1
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, etag: Hashable, content: str) -> None:
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (etag, content)
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        lookups = self._hits + self._misses + self._stale
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale": self._stale,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
@@ -128,8 +128,10 @@ def seed_knowledge() -> None:
     sys.path.insert(0, str(_BACKEND_ROOT))
     from scripts.seed_knowledge import seed as seed_kb
     from scripts.seed_perspective_docs import seed as seed_pdocs
+    from src.db.repositories.knowledge_repo import invalidate_knowledge_index
     seed_kb()
     seed_pdocs()
+    invalidate_knowledge_index()
 
 
 def _has_pending_migrations(cfg, db_url: str) -> bool:
@@ -6,94 +6,125 @@ intermediate representation, keeping state machine code untouched.
 
 import json
 from datetime import UTC, datetime
+from typing import Any
 
 from src.db.models.session_tables import SessionTable
 
-
-def session_to_row(session) -> SessionTable:
-    """Map an IntelligenceSession to a SessionTable row.
+# SessionTable columns owned by each flow. ``pir`` is shared: it is taken from
+# the first of collection/processing/analysis that has one.
+FLOW_COLUMNS: dict[str, tuple[str, ...]] = {
+    "direction": (
+        "direction_state",
+        "direction_context",
+        "question_count",
+        "current_pir",
+        "pending_reasoning_log_direction",
+    ),
+    "collection": (
+        "collection_state",
+        "collection_plan",
+        "selected_sources",
+        "gather_more_feedback",
+        "pending_reasoning_log_collection",
+    ),
+    "processing": ("processing_state", "pending_reasoning_log_processing"),
+    "analysis": ("analysis_state", "analysis_result"),
+    "council": ("council_state", "latest_council_note"),
+    "pir": ("pir",),
+}
+
+
+def _dumps_or_none(value) -> str | None:
+    return json.dumps(value) if value else None
+
+
+def session_to_columns(session) -> dict[str, dict[str, Any]]:
+    """Serialise an IntelligenceSession into SessionTable column values per flow.
+
+    Every group in FLOW_COLUMNS is always present; a flow that does not exist
+    maps all of its columns to None so that dropping a flow (e.g. gather-more
+    discarding processing) clears the persisted state.
 
     Args:
         session: An IntelligenceSession instance (imported lazily to avoid circles).
     """
-    direction_data = session.direction_flow.to_dict()
-    collection_data = (
-        session.collection_flow.to_dict() if session.collection_flow else None
-    )
-    processing_data = (
-        session.processing_flow.to_dict() if session.processing_flow else None
-    )
-    analysis_data = (
-        session.analysis_flow.to_dict()
-        if getattr(session, "analysis_flow", None)
-        else None
-    )
-    council_data = (
-        session.council_flow.to_dict()
-        if getattr(session, "council_flow", None)
-        else None
-    )
+    columns: dict[str, dict[str, Any]] = {
+        flow: dict.fromkeys(names) for flow, names in FLOW_COLUMNS.items()
+    }
 
-    row = SessionTable(
-        id=session.session_id,
-        updated_at=datetime.now(UTC),
-        # Direction flow
-        direction_state=direction_data["state"],
-        direction_context=json.dumps(direction_data["context"]),
-        question_count=direction_data.get("question_count", 0),
-        current_pir=direction_data.get("current_pir"),
-        pending_reasoning_log_direction=(
-            json.dumps(direction_data["pending_reasoning_log"])
-            if direction_data.get("pending_reasoning_log")
-            else None
+    direction_data = session.direction_flow.to_dict()
+    columns["direction"] = {
+        "direction_state": direction_data["state"],
+        "direction_context": json.dumps(direction_data["context"]),
+        "question_count": direction_data.get("question_count", 0),
+        "current_pir": direction_data.get("current_pir"),
+        "pending_reasoning_log_direction": _dumps_or_none(
+            direction_data.get("pending_reasoning_log")
         ),
-    )
+    }
 
-    # Collection flow
-    if collection_data:
-        row.collection_state = collection_data["state"]
-        row.pir = collection_data.get("pir", "")
-        row.collection_plan = collection_data.get("collection_plan")
-        row.selected_sources = json.dumps(collection_data.get("selected_sources", []))
-        row.gather_more_feedback = collection_data.get("gather_more_feedback")
-        row.pending_reasoning_log_collection = (
-            json.dumps(collection_data["pending_reasoning_log"])
-            if collection_data.get("pending_reasoning_log")
-            else None
-        )
-
-    # Processing flow
-    if processing_data:
-        row.processing_state = processing_data["state"]
-        if not row.pir:
-            row.pir = processing_data.get("pir", "")
-        row.pending_reasoning_log_processing = (
-            json.dumps(processing_data["pending_reasoning_log"])
-            if processing_data.get("pending_reasoning_log")
-            else None
-        )
-
-    # Analysis flow
-    if analysis_data:
-        row.analysis_state = analysis_data["state"]
-        if not row.pir:
-            row.pir = analysis_data.get("pir", "")
-        row.analysis_result = (
-            json.dumps(analysis_data["analysis_result"])
-            if analysis_data.get("analysis_result")
-            else None
-        )
-
-    # Council flow
-    if council_data:
-        row.council_state = council_data["state"]
-        row.latest_council_note = (
-            json.dumps(council_data["latest_council_note"])
-            if council_data.get("latest_council_note")
-            else None
-        )
+    pir = None
+    if session.collection_flow:
+        collection_data = session.collection_flow.to_dict()
+        pir = collection_data.get("pir", "")
+        columns["collection"] = {
+            "collection_state": collection_data["state"],
+            "collection_plan": collection_data.get("collection_plan"),
+            "selected_sources": json.dumps(collection_data.get("selected_sources", [])),
+            "gather_more_feedback": collection_data.get("gather_more_feedback"),
+            "pending_reasoning_log_collection": _dumps_or_none(
+                collection_data.get("pending_reasoning_log")
+            ),
+        }
+
+    if session.processing_flow:
+        processing_data = session.processing_flow.to_dict()
+        if not pir:
+            pir = processing_data.get("pir", "")
+        columns["processing"] = {
+            "processing_state": processing_data["state"],
+            "pending_reasoning_log_processing": _dumps_or_none(
+                processing_data.get("pending_reasoning_log")
+            ),
+        }
 
-    return row
+    if getattr(session, "analysis_flow", None):
+        analysis_data = session.analysis_flow.to_dict()
+        if not pir:
+            pir = analysis_data.get("pir", "")
+        columns["analysis"] = {
+            "analysis_state": analysis_data["state"],
+            "analysis_result": _dumps_or_none(analysis_data.get("analysis_result")),
+        }
+
+    if getattr(session, "council_flow", None):
+        council_data = session.council_flow.to_dict()
+        columns["council"] = {
+            "council_state": council_data["state"],
+            "latest_council_note": _dumps_or_none(
+                council_data.get("latest_council_note")
+            ),
+        }
+
+    columns["pir"] = {"pir": pir}
+    return columns
+
+
+def session_to_row(
+    session, columns: dict[str, dict[str, Any]] | None = None
+) -> SessionTable:
+    """Map an IntelligenceSession to a SessionTable row.
+
+    Args:
+        session: An IntelligenceSession instance (imported lazily to avoid circles).
+        columns: Pre-computed output of session_to_columns(), if available.
+    """
+    if columns is None:
+        columns = session_to_columns(session)
+    values: dict[str, Any] = {}
+    for group in columns.values():
+        values.update(group)
+    return SessionTable(id=session.session_id, updated_at=datetime.now(UTC), **values)
 
 
 def row_to_session(row: SessionTable, research_logger):
@@ -0,0 +1,64 @@
+"""Add perspective_documents.content_hash and a covering index for it.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+
+import hashlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _content_hash(
+    section: str, title: str, source: str | None, markdown_content: str
+) -> str:
+    # Frozen copy of knowledge_tables.perspective_doc_hash at this revision
+    payload = "\x1f".join((section, title, source or "", markdown_content))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("perspective_documents") as batch:
+        batch.add_column(
+            sa.Column("content_hash", sa.String(), nullable=False, server_default="")
+        )
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(
+            "SELECT id, section, title, source, markdown_content "
+            "FROM perspective_documents"
+        )
+    ).fetchall()
+    for row in rows:
+        conn.execute(
+            sa.text(
+                "UPDATE perspective_documents SET content_hash = :hash WHERE id = :id"
+            ),
+            {
+                "hash": _content_hash(
+                    row.section, row.title, row.source, row.markdown_content
+                ),
+                "id": row.id,
+            },
+        )
+
+    op.create_index(
+        "ix_perspective_documents_version",
+        "perspective_documents",
+        ["perspective", "is_active", "id", "content_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_perspective_documents_version", "perspective_documents")
+    with op.batch_alter_table("perspective_documents") as batch:
+        batch.drop_column("content_hash")
@@ -0,0 +1,51 @@
+"""Add parsed_documents (content-addressed parse cache) and uploaded_files.content_ref.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parsed_documents",
+        sa.Column("sha256", sa.String(), primary_key=True),
+        sa.Column("page_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("body", sa.Text(), nullable=True),
+        sa.Column("page_index", sa.Text(), nullable=True),
+        sa.Column("citation", sa.Text(), nullable=True),
+        sa.Column("metadata_flags", sa.Text(), nullable=True),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+
+    with op.batch_alter_table("uploaded_files") as batch:
+        batch.add_column(sa.Column("content_ref", sa.String(), nullable=True))
+        batch.create_index("ix_uploaded_files_content_ref", ["content_ref"])
+
+
+def downgrade() -> None:
+    # Put shared bodies back into parsed_content before they are dropped
+    op.execute(
+        """UPDATE uploaded_files SET
+            parsed_content = COALESCE(parsed_content, '') || (
+                SELECT body FROM parsed_documents
+                WHERE sha256 = uploaded_files.content_ref
+            ),
+            content_ref = NULL
+        WHERE content_ref IN (SELECT sha256 FROM parsed_documents WHERE body IS NOT NULL)"""
+    )
+    with op.batch_alter_table("uploaded_files") as batch:
+        batch.drop_index("ix_uploaded_files_content_ref")
+        batch.drop_column("content_ref")
+    op.drop_table("parsed_documents")
@@ -0,0 +1,136 @@
+"""Add upload_pages, a page-granularity FTS5 index over parsed_documents.
+
+Also moves uploads stored before 003 (full markdown in parsed_content, no
+content_ref) into parsed_documents so every parsed upload is indexed, and
+sets every ref_count to the number of uploaded_files rows referencing it.
+Downgrade writes the bodies back into uploaded_files.parsed_content.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+
+import json
+import re
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TITLE_LINE = re.compile(r"^# .*$\n?", re.MULTILINE)
+_PAGE_HEADING = re.compile(r"^## Page (\d+)$", re.MULTILINE)
+
+# Same statement as migration 003's downgrade.
+_RESTORE_BODIES = """UPDATE uploaded_files SET
+        parsed_content = COALESCE(parsed_content, '') || (
+            SELECT body FROM parsed_documents WHERE sha256 = uploaded_files.content_ref
+        ),
+        content_ref = NULL
+    WHERE content_ref IN (SELECT sha256 FROM parsed_documents WHERE body IS NOT NULL)"""
+
+
+def _page_index(body: str) -> list[dict[str, int]]:
+    matches = list(_PAGE_HEADING.finditer(body))
+    return [
+        {
+            "page": int(match.group(1)),
+            "start": match.start(),
+            "end": matches[i + 1].start() if i + 1 < len(matches) else len(body),
+        }
+        for i, match in enumerate(matches)
+    ]
+
+
+def _pages(body: str) -> list[tuple[int | None, str]]:
+    matches = list(_PAGE_HEADING.finditer(body))
+    if not matches:
+        return [(None, body)]
+    return [
+        (
+            int(match.group(1)),
+            body[
+                match.end() : matches[i + 1].start()
+                if i + 1 < len(matches)
+                else len(body)
+            ],
+        )
+        for i, match in enumerate(matches)
+    ]
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE VIRTUAL TABLE upload_pages USING fts5("
+        "content, sha256 UNINDEXED, page UNINDEXED, tokenize='unicode61')"
+    )
+
+    conn = op.get_bind()
+    legacy = conn.execute(
+        sa.text(
+            "SELECT id, sha256, parsed_content, citation, metadata_flags "
+            "FROM uploaded_files WHERE content_ref IS NULL "
+            "AND parsed_content IS NOT NULL AND sha256 != ''"
+        )
+    ).fetchall()
+    for row in legacy:
+        match = _TITLE_LINE.search(row.parsed_content)
+        if match is None:
+            continue
+        head, body = (
+            row.parsed_content[: match.end()],
+            row.parsed_content[match.end() :],
+        )
+        conn.execute(
+            sa.text(
+                "INSERT INTO parsed_documents (sha256, page_count, body, page_index, "
+                "citation, metadata_flags, ref_count, created_at) "
+                "VALUES (:sha, :pages, :body, :page_index, :citation, :flags, 1, :now) "
+                "ON CONFLICT(sha256) DO NOTHING"
+            ),
+            {
+                "sha": row.sha256,
+                "pages": len(_PAGE_HEADING.findall(body)),
+                "body": body,
+                "page_index": json.dumps(_page_index(body)),
+                "citation": row.citation,
+                "flags": row.metadata_flags,
+                "now": datetime.now(UTC),
+            },
+        )
+        conn.execute(
+            sa.text(
+                "UPDATE uploaded_files SET parsed_content = :head, content_ref = :sha "
+                "WHERE id = :id"
+            ),
+            {"head": head, "sha": row.sha256, "id": row.id},
+        )
+
+    conn.execute(
+        sa.text(
+            "UPDATE parsed_documents SET ref_count = (SELECT COUNT(*) "
+            "FROM uploaded_files WHERE content_ref = parsed_documents.sha256)"
+        )
+    )
+
+    for sha256, body in conn.execute(
+        sa.text("SELECT sha256, body FROM parsed_documents WHERE body IS NOT NULL")
+    ).fetchall():
+        for page, text in _pages(body):
+            conn.execute(
+                sa.text(
+                    "INSERT INTO upload_pages (content, sha256, page) "
+                    "VALUES (:content, :sha, :page)"
+                ),
+                {"content": text.strip(), "sha": sha256, "page": page},
+            )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE upload_pages")
+    op.execute(_RESTORE_BODIES)
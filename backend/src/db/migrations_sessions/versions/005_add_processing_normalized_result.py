@@ -0,0 +1,26 @@
+"""Add processing_attempts.normalized_result (validated ProcessingResult JSON).
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("processing_attempts") as batch:
+        batch.add_column(sa.Column("normalized_result", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("processing_attempts") as batch:
+        batch.drop_column("normalized_result")
@@ -5,6 +5,7 @@ from src.db.models.session_tables import (
     AnalysisSessionTable,
     CollectionAttemptTable,
     CollectionStatusTable,
+    ParsedDocumentTable,
     ProcessingAttemptTable,
     ResearchLogEntryTable,
     SessionTable,
@@ -16,6 +17,7 @@ __all__ = [
     "CollectionAttemptTable",
     "ProcessingAttemptTable",
     "UploadedFileTable",
+    "ParsedDocumentTable",
     "AnalysisSessionTable",
     "ResearchLogEntryTable",
     "CollectionStatusTable",
@@ -1,7 +1,9 @@
 """SQLModel table models for knowledge.db."""
 
+import hashlib
 from datetime import UTC, datetime
 
+from sqlalchemy import Index, event
 from sqlmodel import Field, SQLModel
 
 
@@ -24,6 +26,16 @@ class PerspectiveDocumentTable(SQLModel, table=True):
     """One row per official government reference document, linked to a perspective."""
 
     __tablename__ = "perspective_documents"
+    # Covers PerspectiveDocRepository.version() without touching the rows
+    __table_args__ = (
+        Index(
+            "ix_perspective_documents_version",
+            "perspective",
+            "is_active",
+            "id",
+            "content_hash",
+        ),
+    )
 
     id: str = Field(primary_key=True)  # e.g. "us_nss_2022"
     perspective: str = Field(index=True)  # "us", "norway", "eu", "china", "russia"
@@ -33,3 +45,20 @@ class PerspectiveDocumentTable(SQLModel, table=True):
     date_published: datetime = Field(default_factory=lambda: datetime.now(UTC))
     markdown_content: str = Field(default="")
     is_active: bool = Field(default=True)
+    content_hash: str = Field(default="")  # perspective_doc_hash() of the row
+
+
+def perspective_doc_hash(
+    section: str, title: str, source: str | None, markdown_content: str
+) -> str:
+    """sha256 over the fields a rendered perspective document is built from."""
+    payload = "\x1f".join((section, title, source or "", markdown_content))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@event.listens_for(PerspectiveDocumentTable, "before_insert")
+@event.listens_for(PerspectiveDocumentTable, "before_update")
+def _stamp_content_hash(_mapper, _connection, target: PerspectiveDocumentTable) -> None:
+    target.content_hash = perspective_doc_hash(
+        target.section, target.title, target.source, target.markdown_content
+    )
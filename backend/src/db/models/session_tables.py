@@ -73,6 +73,9 @@ class ProcessingAttemptTable(SQLModel, table=True):
     attempt_number: int = Field(default=1)
     pir: str = Field(default="")
     raw_result: str = Field(default="")
+    # Canonical ProcessingResult JSON; None when raw_result held no valid result
+    # (or for attempts stored before it was introduced).
+    normalized_result: str | None = Field(default=None)
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
@@ -95,12 +98,28 @@ class UploadedFileTable(SQLModel, table=True):
     parse_status: str = Field(default="pending")
     searchable: bool = Field(default=False)
     search_skip_reason: str | None = Field(default=None)
-    parsed_content: str | None = Field(default=None)  # Full parsed markdown
+    parsed_content: str | None = Field(default=None)  # Front matter + title
+    content_ref: str | None = Field(default=None, index=True)  # parsed_documents.sha256
     parsed_markdown_path: str | None = Field(default=None)
     citation: str | None = Field(default=None)  # JSON
     metadata_flags: str | None = Field(default=None)  # JSON array
 
 
+class ParsedDocumentTable(SQLModel, table=True):
+    """Parsed body of an uploaded document, stored once per sha256."""
+
+    __tablename__ = "parsed_documents"
+
+    sha256: str = Field(primary_key=True)
+    page_count: int = Field(default=0)
+    body: str | None = Field(default=None)  # Markdown after the title line
+    page_index: str | None = Field(default=None)  # JSON [{page, start, end}]
+    citation: str | None = Field(default=None)  # JSON
+    metadata_flags: str | None = Field(default=None)  # JSON array
+    ref_count: int = Field(default=1)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
 class AnalysisSessionTable(SQLModel, table=True):
     """Persisted analysis state — processing result, draft, council note."""
 
@@ -3,11 +3,26 @@
 import json
 from collections.abc import Sequence
 
+from sqlalchemy import func
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.db.keyword_index import KeywordIndex
 from src.db.models.knowledge_tables import KnowledgeResourceTable
 from src.db.repositories.base import GenericRepository
 
+# Process-wide keyword index, rebuilt when the table fingerprint (row count,
+# newest last_updated) changes or after bulk_upsert()/seeding.
+_index: KeywordIndex | None = None
+_index_version: tuple | None = None
+
+
+def invalidate_knowledge_index() -> None:
+    """Drop the cached keyword index; the next search() rebuilds it."""
+    global _index, _index_version
+    _index = None
+    _index_version = None
+
 
 class KnowledgeRepository(GenericRepository[KnowledgeResourceTable]):
     def __init__(self, session: AsyncSession):
@@ -16,19 +31,45 @@ class KnowledgeRepository(GenericRepository[KnowledgeResourceTable]):
     async def search(
         self, scan_text: str, limit: int = 5
     ) -> Sequence[KnowledgeResourceTable]:
-        """Match keywords in scan_text, return top matches sorted by priority."""
-        all_resources = await self.list_all()
-        text_lower = scan_text.lower()
+        """Match keywords in scan_text, return top matches sorted by priority.
 
-        scored: list[tuple[int, KnowledgeResourceTable]] = []
-        for resource in all_resources:
-            keywords = json.loads(resource.keywords) if resource.keywords else []
-            hits = sum(1 for kw in keywords if kw.lower() in text_lower)
-            if hits > 0:
-                scored.append((hits, resource))
+        Matching runs against the cached KeywordIndex; only the top ``limit``
+        rows are loaded with their markdown.
+        """
+        top_ids = (await self._keyword_index()).top(scan_text, limit=limit)
+        if not top_ids:
+            return []
+        result = await self._session.exec(
+            select(KnowledgeResourceTable).where(
+                col(KnowledgeResourceTable.id).in_(top_ids)
+            )
+        )
+        by_id = {resource.id: resource for resource in result.all()}
+        return [by_id[rid] for rid in top_ids if rid in by_id]
 
-        scored.sort(key=lambda x: (-x[0], x[1].priority))
-        return [r for _, r in scored[:limit]]
+    async def _keyword_index(self) -> KeywordIndex:
+        global _index, _index_version
+        fingerprint = await self._session.exec(
+            select(
+                func.count(col(KnowledgeResourceTable.id)),
+                func.max(KnowledgeResourceTable.last_updated),
+            )
+        )
+        version = tuple(fingerprint.one())
+        if _index is None or version != _index_version:
+            rows = await self._session.exec(
+                select(
+                    KnowledgeResourceTable.id,
+                    KnowledgeResourceTable.keywords,
+                    KnowledgeResourceTable.priority,
+                )
+            )
+            _index = KeywordIndex(
+                (rid, json.loads(keywords) if keywords else [], priority)
+                for rid, keywords, priority in rows.all()
+            )
+            _index_version = version
+        return _index
 
     async def bulk_upsert(self, resources: list[KnowledgeResourceTable]) -> int:
         """Insert or update multiple knowledge resources. Returns count."""
@@ -47,4 +88,5 @@ class KnowledgeRepository(GenericRepository[KnowledgeResourceTable]):
                 self._session.add(resource)
             count += 1
         await self._session.flush()
+        invalidate_knowledge_index()
         return count
@@ -1,5 +1,6 @@
 """Repository for the perspective_documents table."""
 
+import hashlib
 from collections.abc import Sequence
 
 from sqlmodel import select
@@ -26,12 +27,33 @@ class PerspectiveDocRepository(GenericRepository[PerspectiveDocumentTable]):
         result = await self._session.exec(stmt)
         return result.all()
 
+    async def version(self, perspective: str) -> str:
+        """Validator for a perspective's active documents.
+
+        A digest of every active document's id and content_hash, so it changes
+        whenever a document is added, deactivated or has its rendered fields
+        edited. Served from the covering index without reading the markdown.
+        """
+        stmt = (
+            select(PerspectiveDocumentTable.id, PerspectiveDocumentTable.content_hash)
+            .where(PerspectiveDocumentTable.perspective == perspective.lower())
+            .where(PerspectiveDocumentTable.is_active == True)  # noqa: E712
+            .order_by(PerspectiveDocumentTable.id)
+        )
+        result = await self._session.exec(stmt)
+        digest = hashlib.sha256()
+        for doc_id, content_hash in result.all():
+            digest.update(f"{doc_id}\x1f{content_hash}\x1e".encode())
+        return digest.hexdigest()
+
     async def list_all_active(self) -> Sequence[PerspectiveDocumentTable]:
         """Return all active documents across all perspectives."""
         stmt = (
             select(PerspectiveDocumentTable)
             .where(PerspectiveDocumentTable.is_active == True)  # noqa: E712
-            .order_by(PerspectiveDocumentTable.perspective, PerspectiveDocumentTable.section)
+            .order_by(
+                PerspectiveDocumentTable.perspective, PerspectiveDocumentTable.section
+            )
         )
         result = await self._session.exec(stmt)
         return result.all()
@@ -3,7 +3,8 @@
 from collections.abc import Sequence
 from datetime import UTC, datetime
 
-from sqlmodel import select
+from sqlalchemy import func
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.db.models.session_tables import ProcessingAttemptTable
@@ -15,7 +16,11 @@ class ProcessingAttemptRepository(GenericRepository[ProcessingAttemptTable]):
         super().__init__(ProcessingAttemptTable, session)
 
     async def append(
-        self, session_id: str, pir: str, raw_result: str
+        self,
+        session_id: str,
+        pir: str,
+        raw_result: str,
+        normalized_result: str | None = None,
     ) -> ProcessingAttemptTable:
         """Append a new processing attempt, auto-numbering."""
         latest = await self.get_latest(session_id)
@@ -26,6 +31,7 @@ class ProcessingAttemptRepository(GenericRepository[ProcessingAttemptTable]):
             attempt_number=next_num,
             pir=pir,
             raw_result=raw_result,
+            normalized_result=normalized_result,
             created_at=datetime.now(UTC),
         )
         return await self.create(row)
@@ -48,3 +54,46 @@ class ProcessingAttemptRepository(GenericRepository[ProcessingAttemptTable]):
         )
         result = await self._session.exec(stmt)
         return result.first()
+
+    async def version(self, session_id: str) -> tuple | None:
+        """Validator for a session's attempts, or None when it has none.
+
+        (row count, newest id, newest created_at): changes when an attempt is
+        appended or deleted, and when deleted rows' ids are reused by SQLite.
+        """
+        stmt = select(
+            func.count(col(ProcessingAttemptTable.id)),
+            func.max(ProcessingAttemptTable.id),
+            func.max(ProcessingAttemptTable.created_at),
+        ).where(ProcessingAttemptTable.session_id == session_id)
+        result = await self._session.exec(stmt)
+        count, newest_id, newest_at = result.one()
+        return (count, newest_id, newest_at) if count else None
+
+    async def get_latest_normalized(
+        self, session_id: str
+    ) -> ProcessingAttemptTable | None:
+        """Newest attempt that carries a validated ProcessingResult."""
+        stmt = (
+            select(ProcessingAttemptTable)
+            .where(ProcessingAttemptTable.session_id == session_id)
+            .where(col(ProcessingAttemptTable.normalized_result).is_not(None))
+            .order_by(ProcessingAttemptTable.attempt_number.desc())
+            .limit(1)
+        )
+        result = await self._session.exec(stmt)
+        return result.first()
+
+    async def get_unnormalized_after(
+        self, session_id: str, attempt_number: int
+    ) -> Sequence[ProcessingAttemptTable]:
+        """Attempts newer than attempt_number without a normalized result, newest first."""
+        stmt = (
+            select(ProcessingAttemptTable)
+            .where(ProcessingAttemptTable.session_id == session_id)
+            .where(ProcessingAttemptTable.attempt_number > attempt_number)
+            .where(col(ProcessingAttemptTable.normalized_result).is_(None))
+            .order_by(ProcessingAttemptTable.attempt_number.desc())
+        )
+        result = await self._session.exec(stmt)
+        return result.all()
@@ -1,8 +1,9 @@
 """Repository for the sessions table."""
 
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlmodel import select
+from sqlmodel import select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.db.models.session_tables import (
@@ -40,6 +41,20 @@ class SessionRepository(GenericRepository[SessionTable]):
         await self._session.flush()
         return existing
 
+    async def update_columns(self, session_id: str, values: dict[str, Any]) -> bool:
+        """UPDATE only the given columns of an existing row, without a SELECT.
+
+        Returns:
+            True if the row existed and was updated, False otherwise.
+        """
+        stmt = (
+            update(SessionTable)
+            .where(SessionTable.id == session_id)  # type: ignore[arg-type]
+            .values(**values, updated_at=datetime.now(UTC))
+        )
+        result = await self._session.execute(stmt)
+        return bool(result.rowcount)
+
     async def delete_cascade(self, session_id: str) -> bool:
         """Delete a session and all related rows across child tables.
 
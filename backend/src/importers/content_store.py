@@ -0,0 +1,159 @@
+"""Content-addressed store for uploaded documents, keyed by sha256.
+
+The same report uploaded into several sessions is kept, and parsed, once.
+Layout under ``{uploads_root}/.content/{sha256}/``:
+
+    blob{ext}     original bytes; per-session copies are hard links to it
+    parsed.json   session-independent parse result (citation, metadata flags,
+                  page texts, status) reused by later uploads of the same file
+    parsed.md     shared "## Page N" markdown body; per-session artifacts of
+                  re-uploads hold only their front matter and point here
+    refs.json     ``["{session_id}/{file_upload_id}", ...]`` still using it
+
+The directory name starts with a dot so it can never clash with a session id
+(see SESSION_ID_PATTERN). When the last reference is released the entry is
+removed from disk. The ``parsed_documents`` row is reference-counted in the
+DB instead (uploaded_files.content_ref), which also covers uploads stored
+before this store existed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("app")
+
+CONTENT_DIR_NAME = ".content"
+
+# Serialises refs.json / parsed.json updates across request and parse threads.
+_store_lock = threading.RLock()
+
+
+def upload_ref(session_id: str, file_upload_id: str) -> str:
+    return f"{session_id}/{file_upload_id}"
+
+
+class ContentStore:
+    """Content-addressed blob + parse cache rooted at an uploads directory."""
+
+    def __init__(self, uploads_root: Path):
+        self.root = Path(uploads_root) / CONTENT_DIR_NAME
+
+    def entry_dir(self, sha256: str) -> Path:
+        return self.root / sha256
+
+    def adopt(self, sha256: str, stored_path: Path, extension: str) -> None:
+        """Deduplicate a freshly stored upload against the blob for its hash.
+
+        The first upload of some content becomes the blob (hard-linked back to
+        the session path); later uploads are replaced by a hard link to the
+        existing blob. Where hard links are unsupported the session keeps its
+        own copy and only the parse result is shared.
+        """
+        entry_dir = self.entry_dir(sha256)
+        blob = entry_dir / f"blob{extension}"
+        with _store_lock:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                if not blob.exists():
+                    os.link(stored_path, blob)
+                    return
+                tmp_path = stored_path.with_name(stored_path.name + ".link")
+                os.link(blob, tmp_path)
+                tmp_path.replace(stored_path)
+            except OSError:
+                logger.debug(
+                    f"[ContentStore] Hard links unavailable for {stored_path.name}; "
+                    "keeping a private copy"
+                )
+
+    def lookup(self, sha256: str) -> dict[str, Any] | None:
+        """Return the cached parse result for a hash, or None."""
+        parsed_path = self.entry_dir(sha256) / "parsed.json"
+        with _store_lock:
+            if not parsed_path.exists():
+                return None
+            try:
+                data = json.loads(parsed_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return None
+        return data if isinstance(data, dict) else None
+
+    def save_parse(self, sha256: str, result: dict[str, Any]) -> None:
+        """Cache a session-independent parse result for a hash."""
+        entry_dir = self.entry_dir(sha256)
+        with _store_lock:
+            if not entry_dir.exists():
+                # Every reference was released while the parse was running.
+                return
+            tmp_path = entry_dir / "parsed.json.tmp"
+            tmp_path.write_text(json.dumps(result), encoding="utf-8")
+            tmp_path.replace(entry_dir / "parsed.json")
+
+    def body_path(self, sha256: str) -> Path:
+        return self.entry_dir(sha256) / "parsed.md"
+
+    def save_body(self, sha256: str, body: str) -> Path | None:
+        """Store the shared markdown body for a hash once.
+
+        Returns:
+            The body path, or None if the entry was released meanwhile.
+        """
+        body_path = self.body_path(sha256)
+        with _store_lock:
+            if not body_path.parent.exists():
+                return None
+            if not body_path.exists():
+                tmp_path = body_path.with_name("parsed.md.tmp")
+                tmp_path.write_text(body, encoding="utf-8")
+                tmp_path.replace(body_path)
+        return body_path
+
+    def refs(self, sha256: str) -> list[str]:
+        refs_path = self.entry_dir(sha256) / "refs.json"
+        with _store_lock:
+            if not refs_path.exists():
+                return []
+            try:
+                data = json.loads(refs_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return []
+        return [str(ref) for ref in data] if isinstance(data, list) else []
+
+    def add_ref(self, sha256: str, ref: str) -> int:
+        """Register an upload as using this content. Returns the new ref count."""
+        with _store_lock:
+            refs = self.refs(sha256)
+            if ref not in refs:
+                refs.append(ref)
+                self._write_refs(sha256, refs)
+            return len(refs)
+
+    def release(self, sha256: str, ref: str) -> int:
+        """Drop one reference; removes the entry when none remain.
+
+        Returns:
+            The number of references left.
+        """
+        with _store_lock:
+            refs = [existing for existing in self.refs(sha256) if existing != ref]
+            if refs:
+                self._write_refs(sha256, refs)
+                return len(refs)
+            entry_dir = self.entry_dir(sha256)
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            return 0
+
+    def _write_refs(self, sha256: str, refs: list[str]) -> None:
+        entry_dir = self.entry_dir(sha256)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_dir / "refs.json.tmp"
+        tmp_path.write_text(json.dumps(refs), encoding="utf-8")
+        tmp_path.replace(entry_dir / "refs.json")
@@ -9,11 +9,14 @@ import os
 import re
 import shutil
 import sqlite3
+import threading
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from src.importers.content_store import ContentStore, upload_ref
+
 logger = logging.getLogger("app")
 
 ALLOWED_FILETYPES = {".txt", ".pdf", ".json", ".csv"}
@@ -23,6 +26,12 @@ _UNKNOWN = "Unknown"
 _READY = "ready"
 _FAILED = "failed"
 _SKIPPED = "skipped"
+_PENDING = "pending"
+
+# Guards manifest read-modify-write cycles; background parses finish on other
+# threads than the upload request that created the entry.
+_manifest_locks: dict[str, threading.Lock] = {}
+_manifest_locks_guard = threading.Lock()
 
 
 def default_uploads_root() -> Path:
@@ -103,6 +112,15 @@ def _load_manifest(manifest_path: Path, session_id: str) -> dict[str, Any]:
     }
 
 
+def _manifest_lock(manifest_path: Path) -> threading.Lock:
+    key = str(manifest_path)
+    with _manifest_locks_guard:
+        lock = _manifest_locks.get(key)
+        if lock is None:
+            lock = _manifest_locks[key] = threading.Lock()
+        return lock
+
+
 def _write_manifest(manifest_path: Path, manifest: dict[str, Any]) -> None:
     manifest["updated_at"] = _now_iso()
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -150,7 +168,14 @@ def _compose_pdf_markdown(
     parsed_at: str,
     page_count: int,
     page_texts: list[str],
+    content_path: Path | None = None,
 ) -> str:
+    """Compose the parsed artifact for a PDF.
+
+    With ``content_path`` the page sections are left out and the front matter
+    points at the shared body in the content store instead (see
+    read_parsed_markdown()).
+    """
     lines: list[str] = [
         "---",
         f"file_upload_id: {_yaml_quote(file_upload_id)}",
@@ -173,19 +198,53 @@ def _compose_pdf_markdown(
             f"parsed_at: {_yaml_quote(parsed_at)}",
             f"page_count: {page_count}",
             "ocr_applied: false",
+        ]
+    )
+    if content_path is not None:
+        lines.append(f"content_path: {_yaml_quote(content_path.as_posix())}")
+    lines.extend(
+        [
             "---",
             "",
             f"# {citation['title'] if citation['title'] != 'Unknown' else source_filename}",
-            "",
         ]
     )
+    head = "\n".join(lines) + "\n"
+    if content_path is not None:
+        return head
+    return head + compose_pdf_body(page_texts)
 
+
+def compose_pdf_body(page_texts: list[str]) -> str:
+    """The "## Page N" sections that follow the title line of a parsed PDF."""
+    lines: list[str] = []
     for idx, text in enumerate(page_texts, start=1):
         lines.append(f"## Page {idx}")
         lines.append(text or "[No extractable text on this page.]")
         lines.append("")
+    if not lines:
+        return ""
+    return "\n" + "\n".join(lines).strip() + "\n"
+
+
+_CONTENT_PATH_LINE = re.compile(r'^content_path: ("(?:[^"\\]|\\.)*")$', re.MULTILINE)
+
+
+def read_parsed_markdown(parsed_path: Path) -> str:
+    """Read a parsed artifact, following its content_path to the shared body.
 
-    return "\n".join(lines).strip() + "\n"
+    Re-uploads of already parsed bytes only store their own front matter and
+    title; the page sections live once in the content store.
+    """
+    markdown = parsed_path.read_text(encoding="utf-8", errors="ignore")
+    head, _ = split_parsed_markdown(markdown)
+    match = _CONTENT_PATH_LINE.search(head)
+    if match is None:
+        return markdown
+    body_path = Path(json.loads(match.group(1)))
+    if not body_path.exists():
+        return markdown
+    return markdown + body_path.read_text(encoding="utf-8", errors="ignore")
 
 
 def _convert_to_markdown(
@@ -232,45 +291,41 @@ def _convert_to_markdown(
     return "ready"
 
 
-def _parse_pdf_to_markdown(
-    *,
-    file_upload_id: str,
-    session_id: str,
-    source_filename: str,
-    stored_pdf_path: Path,
-    parsed_path: Path,
-) -> tuple[dict[str, str], str, bool, str | None, list[str]]:
-    """Parse copyable PDF text and write markdown artifact.
+def _unknown_citation(source_filename: str) -> dict[str, str]:
+    return {
+        "author": _UNKNOWN,
+        "year": _UNKNOWN,
+        "title": Path(source_filename).stem or _UNKNOWN,
+        "publisher": _UNKNOWN,
+    }
+
+
+def read_pdf_info(stored_pdf_path: Path, source_filename: str) -> dict[str, Any]:
+    """Open a PDF and read its citation metadata and page count.
+
+    Module-level and picklable so the upload pipeline can run it in a worker
+    process.
 
     Returns:
-        tuple of (citation, parse_status, searchable, skip_reason, metadata_flags)
+        dict with "citation", "metadata_flags" and "page_count", or with
+        "error" set to a skip reason when the PDF cannot be opened.
     """
     try:
         from pypdf import (
             PdfReader,  # Imported lazily to avoid hard runtime import failures
         )
     except Exception:
-        citation = {
-            "author": _UNKNOWN,
-            "year": _UNKNOWN,
-            "title": Path(source_filename).stem or _UNKNOWN,
-            "publisher": _UNKNOWN,
-        }
-        return citation, _FAILED, False, "pypdf_not_available", ["pypdf_not_available"]
+        return {"error": "pypdf_not_available"}
 
     try:
         reader = PdfReader(str(stored_pdf_path))
+        page_count = len(reader.pages)
     except Exception:
-        citation = {
-            "author": _UNKNOWN,
-            "year": _UNKNOWN,
-            "title": Path(source_filename).stem or _UNKNOWN,
-            "publisher": _UNKNOWN,
-        }
-        return citation, _FAILED, False, "pdf_read_failed", ["pdf_read_failed"]
+        return {"error": "pdf_read_failed"}
 
     metadata = reader.metadata
     title = getattr(metadata, "title", None) if metadata else None
+    title = str(title).strip() if title else ""
     author = getattr(metadata, "author", None) if metadata else None
     creation_date = getattr(metadata, "creation_date", None) if metadata else None
     producer = getattr(metadata, "producer", None) if metadata else None
@@ -279,9 +334,7 @@ def _parse_pdf_to_markdown(
     citation = {
         "author": str(author).strip() if author else _UNKNOWN,
         "year": _extract_year(creation_date),
-        "title": str(title).strip()
-        if title
-        else (Path(source_filename).stem or _UNKNOWN),
+        "title": title or (Path(source_filename).stem or _UNKNOWN),
         "publisher": (str(producer).strip() if producer else "")
         or (str(creator).strip() if creator else "")
         or _UNKNOWN,
@@ -297,14 +350,52 @@ def _parse_pdf_to_markdown(
     if citation["publisher"] == _UNKNOWN:
         metadata_flags.append("missing_publisher")
 
-    page_texts: list[str] = []
-    has_extractable_text = False
-    for page in reader.pages:
-        extracted = (page.extract_text() or "").strip()
-        if extracted:
-            has_extractable_text = True
-        page_texts.append(extracted)
+    return {
+        "citation": citation,
+        "metadata_flags": metadata_flags,
+        "page_count": page_count,
+        # Lets a cached parse of the same bytes re-derive the title from the
+        # filename of a later upload (see ContentStore).
+        "title_from_filename": not title,
+    }
+
+
+def extract_pdf_page_texts(stored_pdf_path: Path, start: int, stop: int) -> list[str]:
+    """Extract stripped text for pages [start, stop) of a PDF.
 
+    Module-level and picklable so large PDFs can be split across worker
+    processes by page range.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(str(stored_pdf_path))
+    return [
+        (reader.pages[index].extract_text() or "").strip()
+        for index in range(start, min(stop, len(reader.pages)))
+    ]
+
+
+def write_pdf_markdown(
+    *,
+    file_upload_id: str,
+    session_id: str,
+    source_filename: str,
+    citation: dict[str, str],
+    metadata_flags: list[str],
+    page_texts: list[str],
+    parsed_path: Path,
+    content_path: Path | None = None,
+) -> tuple[str, bool, str | None, list[str]]:
+    """Compose and write the markdown artifact for already-extracted pages.
+
+    ``content_path`` names a shared body already in the content store; the
+    artifact then references it instead of repeating the pages.
+
+    Returns:
+        tuple of (parse_status, searchable, skip_reason, metadata_flags)
+    """
+    metadata_flags = list(metadata_flags)
+    has_extractable_text = any(page_texts)
     if not has_extractable_text:
         metadata_flags.append("no_extractable_text")
 
@@ -325,13 +416,82 @@ def _parse_pdf_to_markdown(
         parsed_at=_now_iso(),
         page_count=len(page_texts),
         page_texts=page_texts,
+        content_path=content_path,
     )
     parsed_path.parent.mkdir(parents=True, exist_ok=True)
     parsed_path.write_text(parsed_content, encoding="utf-8")
 
     if has_extractable_text:
-        return citation, _READY, True, None, metadata_flags
-    return citation, _SKIPPED, False, "no_extractable_text", metadata_flags
+        return _READY, True, None, metadata_flags
+    return _SKIPPED, False, "no_extractable_text", metadata_flags
+
+
+def _pdf_entry_fields(
+    *,
+    file_upload_id: str,
+    session_id: str,
+    source_filename: str,
+    parsed_path: Path,
+    info: dict[str, Any],
+    page_texts: list[str] | None,
+    content_path: Path | None = None,
+) -> dict[str, Any]:
+    """Write the markdown artifact for a parsed PDF.
+
+    Returns:
+        The manifest fields (parse_status, searchable, search_skip_reason,
+        citation, metadata_flags) describing the outcome.
+    """
+    if "error" in info or page_texts is None:
+        reason = info.get("error", "pdf_read_failed")
+        return {
+            "parse_status": _FAILED,
+            "searchable": False,
+            "search_skip_reason": reason,
+            "citation": _unknown_citation(source_filename),
+            "metadata_flags": [reason],
+        }
+
+    citation = dict(info["citation"])
+    if info.get("title_from_filename"):
+        citation["title"] = Path(source_filename).stem or _UNKNOWN
+    parse_status, searchable, skip_reason, metadata_flags = write_pdf_markdown(
+        file_upload_id=file_upload_id,
+        session_id=session_id,
+        source_filename=source_filename,
+        citation=citation,
+        metadata_flags=info["metadata_flags"],
+        page_texts=page_texts,
+        parsed_path=parsed_path,
+        content_path=content_path,
+    )
+    return {
+        "parse_status": parse_status,
+        "searchable": searchable,
+        "search_skip_reason": skip_reason,
+        "citation": citation,
+        "metadata_flags": metadata_flags,
+    }
+
+
+def cache_pdf_parse(
+    uploads_root: Path,
+    sha256: str,
+    info: dict[str, Any],
+    page_texts: list[str] | None,
+) -> None:
+    """Store a PDF parse result in the content store for later re-uploads.
+
+    Unreadable PDFs are cached too (the bytes will not parse any better next
+    time); a missing pypdf install is an environment problem and is not.
+    """
+    if info.get("error") == "pypdf_not_available":
+        return
+    if "error" in info or page_texts is None:
+        result = {"error": info.get("error", "pdf_read_failed")}
+    else:
+        result = {**info, "page_texts": page_texts}
+    ContentStore(uploads_root).save_parse(sha256, result)
 
 
 def format_apa_citation(citation: dict[str, str]) -> str:
@@ -352,28 +512,132 @@ def _get_db_path() -> str:
     return str(Path(__file__).resolve().parents[2] / "data" / "sessions.db")
 
 
+_PAGE_HEADING = re.compile(r"^## Page (\d+)$", re.MULTILINE)
+
+
+def split_parsed_markdown(markdown: str) -> tuple[str, str]:
+    """Split a parsed artifact into its per-upload head and shared body.
+
+    The head is the front matter plus the "# title" line (it names the session
+    and upload); the body is the extracted content, identical for every upload
+    of the same bytes and stored once in parsed_documents.
+    """
+    match = re.search(r"^# .*$\n?", markdown, re.MULTILINE)
+    if match is None:
+        return markdown, ""
+    return markdown[: match.end()], markdown[match.end() :]
+
+
+def build_page_index(body: str) -> list[dict[str, int]]:
+    """Character offsets of each "## Page N" section within a parsed body."""
+    starts = [(int(m.group(1)), m.start()) for m in _PAGE_HEADING.finditer(body)]
+    return [
+        {
+            "page": page,
+            "start": offset,
+            "end": starts[i + 1][1] if i + 1 < len(starts) else len(body),
+        }
+        for i, (page, offset) in enumerate(starts)
+    ]
+
+
+def _index_pages(conn: sqlite3.Connection, sha256: str, body: str) -> None:
+    """Replace the upload_pages FTS5 rows for one parsed document.
+
+    PDFs are indexed per "## Page N" section (heading excluded); other files
+    have no pages and are indexed as a single row with page NULL.
+    """
+    conn.execute("DELETE FROM upload_pages WHERE sha256 = ?", (sha256,))
+    pages = [
+        (body[item["start"] : item["end"]].partition("\n")[2].strip(), item["page"])
+        for item in build_page_index(body)
+    ] or [(body.strip(), None)]
+    conn.executemany(
+        "INSERT INTO upload_pages (content, sha256, page) VALUES (?, ?, ?)",
+        [(text, sha256, page) for text, page in pages],
+    )
+
+
+def _connect_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(_get_db_path())
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+_RECOUNT_REFS = """UPDATE parsed_documents SET ref_count = (
+        SELECT COUNT(*) FROM uploaded_files WHERE content_ref = parsed_documents.sha256
+    ) WHERE sha256 = ?"""
+
+
 def _sync_to_db(entry: dict[str, Any], parsed_path: Path) -> None:
-    """Insert/update the uploaded_files row in sessions.db (sync)."""
+    """Insert/update the uploaded_files row in sessions.db (sync).
+
+    The parsed body goes to parsed_documents (one row per sha256) and is
+    indexed page by page in the upload_pages FTS5 table; the uploaded_files
+    row keeps only its own front matter plus a content_ref. ref_count is the
+    number of uploaded_files rows pointing at the body, counted in the DB so
+    uploads that predate the content store (no refs.json entry) are included.
+    """
     try:
-        parsed_content = None
+        head = body = None
         if parsed_path.exists():
-            parsed_content = parsed_path.read_text(encoding="utf-8", errors="ignore")
+            head, body = split_parsed_markdown(read_parsed_markdown(parsed_path))
+        sha256 = entry.get("sha256", "")
+        content_ref = sha256 if body is not None and sha256 else None
+        citation = json.dumps(entry.get("citation", {}))
+        metadata_flags = (
+            json.dumps(entry.get("metadata_flags"))
+            if entry.get("metadata_flags")
+            else None
+        )
 
-        conn = sqlite3.connect(_get_db_path())
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
+        conn = _connect_db()
+        if content_ref:
+            unchanged = conn.execute(
+                "SELECT 1 FROM parsed_documents WHERE sha256 = ? AND body = ?",
+                (content_ref, body),
+            ).fetchone()
+            if not unchanged:
+                _index_pages(conn, content_ref, body or "")
+            conn.execute(
+                """INSERT INTO parsed_documents
+                       (sha256, page_count, body, page_index, citation,
+                        metadata_flags, ref_count, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, 0, ?)
+                   ON CONFLICT(sha256) DO UPDATE SET
+                        page_count=excluded.page_count,
+                        body=excluded.body,
+                        page_index=excluded.page_index,
+                        citation=excluded.citation,
+                        metadata_flags=excluded.metadata_flags
+                """,
+                (
+                    content_ref,
+                    len(_PAGE_HEADING.findall(body or "")),
+                    body,
+                    json.dumps(build_page_index(body or "")),
+                    citation,
+                    metadata_flags,
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
         conn.execute(
             """INSERT INTO uploaded_files
                    (id, session_id, original_filename, filename, stored_filename,
                     stored_path, extension, mime_type, size_bytes, sha256,
                     uploaded_at, parse_status, searchable, search_skip_reason,
-                    parsed_content, parsed_markdown_path, citation, metadata_flags)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    parsed_content, content_ref, parsed_markdown_path, citation,
+                    metadata_flags)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                ON CONFLICT(id) DO UPDATE SET
                     parsed_content=excluded.parsed_content,
+                    content_ref=excluded.content_ref,
                     parse_status=excluded.parse_status,
                     searchable=excluded.searchable,
-                    citation=excluded.citation
+                    search_skip_reason=excluded.search_skip_reason,
+                    citation=excluded.citation,
+                    metadata_flags=excluded.metadata_flags
             """,
             (
                 entry["file_upload_id"],
@@ -385,19 +649,20 @@ def _sync_to_db(entry: dict[str, Any], parsed_path: Path) -> None:
                 entry.get("extension", ""),
                 entry.get("mime_type"),
                 entry.get("size_bytes", 0),
-                entry.get("sha256", ""),
+                sha256,
                 entry.get("uploaded_at", datetime.now(UTC).isoformat()),
                 entry.get("parse_status", "pending"),
                 entry.get("searchable", False),
                 entry.get("search_skip_reason"),
-                parsed_content,
+                head,
+                content_ref,
                 entry.get("parsed_markdown_path"),
-                json.dumps(entry.get("citation", {})),
-                json.dumps(entry.get("metadata_flags"))
-                if entry.get("metadata_flags")
-                else None,
+                citation,
+                metadata_flags,
             ),
         )
+        if content_ref:
+            conn.execute(_RECOUNT_REFS, (content_ref,))
         conn.commit()
         conn.close()
     except Exception:
@@ -407,6 +672,38 @@ def _sync_to_db(entry: dict[str, Any], parsed_path: Path) -> None:
         )
 
 
+def _release_in_db(entry: dict[str, Any]) -> None:
+    """Drop an upload's row and its share of the parsed_documents row.
+
+    The shared body and its upload_pages rows go only once no uploaded_files
+    row references them any more.
+    """
+    try:
+        conn = _connect_db()
+        conn.execute(
+            "DELETE FROM uploaded_files WHERE id = ?", (entry["file_upload_id"],)
+        )
+        sha256 = entry.get("sha256")
+        if sha256:
+            conn.execute(_RECOUNT_REFS, (sha256,))
+            conn.execute(
+                "DELETE FROM upload_pages WHERE sha256 IN ("
+                "SELECT sha256 FROM parsed_documents "
+                "WHERE sha256 = ? AND ref_count = 0)",
+                (sha256,),
+            )
+            conn.execute(
+                "DELETE FROM parsed_documents WHERE sha256 = ? AND ref_count = 0",
+                (sha256,),
+            )
+        conn.commit()
+        conn.close()
+    except Exception:
+        logger.warning(
+            "[session_uploads] Failed to release upload in DB", exc_info=True
+        )
+
+
 def save_session_upload(
     *,
     file_obj,
@@ -414,8 +711,14 @@ def save_session_upload(
     session_id: str,
     uploads_root: Path,
     mime_type: str | None = None,
+    defer_pdf_parse: bool = False,
 ) -> dict[str, Any]:
-    """Save uploaded file under a session and update manifest metadata."""
+    """Save uploaded file under a session and update manifest metadata.
+
+    With ``defer_pdf_parse`` a PDF is stored and registered with
+    parse_status "pending" but not parsed; the caller is expected to finish it
+    with complete_pdf_parse() (see importers.upload_pipeline).
+    """
     validated_session_id = validate_session_id(session_id)
     if not legal_file_upload(filename):
         raise ValueError("Illegal filetype")
@@ -432,6 +735,10 @@ def save_session_upload(
     sha256, size_bytes = _stream_to_disk(file_obj, stored_path)
     uploaded_at = _now_iso()
 
+    store = ContentStore(uploads_root)
+    store.adopt(sha256, stored_path, extension)
+    store.add_ref(sha256, upload_ref(validated_session_id, file_upload_id))
+
     entry: dict[str, Any] = {
         "file_upload_id": file_upload_id,
         "session_id": validated_session_id,
@@ -458,22 +765,51 @@ def save_session_upload(
 
     parsed_path = paths["parsed_dir"] / f"{file_upload_id}.md"
 
-    if extension == ".pdf":
-        citation, parse_status, searchable, skip_reason, metadata_flags = (
-            _parse_pdf_to_markdown(
+    cached = store.lookup(sha256) if extension == ".pdf" else None
+
+    if cached is not None:
+        # Same bytes were parsed before (any session): reuse the extraction
+        # and reference the shared body rather than writing the pages again.
+        page_texts = cached.get("page_texts")
+        content_path = None
+        if "error" not in cached and page_texts is not None:
+            content_path = store.save_body(sha256, compose_pdf_body(page_texts))
+        entry.update(
+            _pdf_entry_fields(
                 file_upload_id=file_upload_id,
                 session_id=validated_session_id,
                 source_filename=safe_filename,
-                stored_pdf_path=stored_path,
                 parsed_path=parsed_path,
+                info=cached,
+                page_texts=page_texts,
+                content_path=content_path,
+            )
+        )
+        entry["parsed_markdown_path"] = parsed_path.as_posix()
+    elif extension == ".pdf" and defer_pdf_parse:
+        entry["parse_status"] = _PENDING
+        entry["searchable"] = False
+        entry["search_skip_reason"] = "parse_pending"
+        entry["parsed_markdown_path"] = parsed_path.as_posix()
+    elif extension == ".pdf":
+        info = read_pdf_info(stored_path, safe_filename)
+        page_texts = (
+            None
+            if "error" in info
+            else extract_pdf_page_texts(stored_path, 0, info["page_count"])
+        )
+        cache_pdf_parse(uploads_root, sha256, info, page_texts)
+        entry.update(
+            _pdf_entry_fields(
+                file_upload_id=file_upload_id,
+                session_id=validated_session_id,
+                source_filename=safe_filename,
+                parsed_path=parsed_path,
+                info=info,
+                page_texts=page_texts,
             )
         )
-        entry["parse_status"] = parse_status
-        entry["searchable"] = searchable
-        entry["search_skip_reason"] = skip_reason
-        entry["citation"] = citation
         entry["parsed_markdown_path"] = parsed_path.as_posix()
-        entry["metadata_flags"] = metadata_flags
     else:
         parse_status = _convert_to_markdown(
             file_upload_id=file_upload_id,
@@ -486,9 +822,10 @@ def save_session_upload(
         entry["parse_status"] = parse_status
         entry["parsed_markdown_path"] = parsed_path.as_posix()
 
-    manifest = _load_manifest(paths["manifest_path"], validated_session_id)
-    manifest["files"].append(entry)
-    _write_manifest(paths["manifest_path"], manifest)
+    with _manifest_lock(paths["manifest_path"]):
+        manifest = _load_manifest(paths["manifest_path"], validated_session_id)
+        manifest["files"].append(entry)
+        _write_manifest(paths["manifest_path"], manifest)
 
     # Also persist to uploaded_files table in sessions.db
     _sync_to_db(entry, parsed_path)
@@ -496,6 +833,107 @@ def save_session_upload(
     return entry
 
 
+def complete_pdf_parse(
+    *,
+    entry: dict[str, Any],
+    uploads_root: Path,
+    info: dict[str, Any],
+    page_texts: list[str] | None,
+    cache_result: bool = True,
+) -> dict[str, Any] | None:
+    """Finish a deferred PDF parse: write markdown, update manifest and DB row.
+
+    Args:
+        entry: Manifest entry returned by save_session_upload(defer_pdf_parse=True).
+        uploads_root: Uploads root the entry was saved under.
+        info: Result of read_pdf_info() for the stored PDF.
+        page_texts: Extracted page texts, or None when extraction failed.
+        cache_result: Record the outcome in the content store. Off for
+            failures that say nothing about the bytes (e.g. a missing file).
+
+    Returns:
+        The updated entry, or None if the upload was deleted while parsing.
+    """
+    session_id = entry["session_id"]
+    paths = _session_paths(uploads_root, session_id)
+    parsed_path = Path(entry["parsed_markdown_path"])
+    if cache_result:
+        cache_pdf_parse(uploads_root, entry["sha256"], info, page_texts)
+    updated = dict(entry)
+    updated.update(
+        _pdf_entry_fields(
+            file_upload_id=entry["file_upload_id"],
+            session_id=session_id,
+            source_filename=entry["filename"],
+            parsed_path=parsed_path,
+            info=info,
+            page_texts=page_texts,
+        )
+    )
+
+    with _manifest_lock(paths["manifest_path"]):
+        manifest = _load_manifest(paths["manifest_path"], session_id)
+        files = manifest.get("files", [])
+        index = next(
+            (
+                i
+                for i, item in enumerate(files)
+                if item.get("file_upload_id") == entry["file_upload_id"]
+            ),
+            None,
+        )
+        if index is None:
+            # Deleted while the parse was running — drop the orphaned artifact.
+            if parsed_path.exists():
+                parsed_path.unlink()
+            return None
+        files[index] = updated
+        _write_manifest(paths["manifest_path"], manifest)
+
+    _sync_to_db(updated, parsed_path)
+    return updated
+
+
+def find_pending_uploads(uploads_root: Path) -> list[dict[str, Any]]:
+    """Return manifest entries of all sessions still marked "pending".
+
+    Parses run in memory, so uploads that were pending when the server
+    stopped are found here at startup and handed back to the pipeline.
+    """
+    if not uploads_root.is_dir():
+        return []
+    pending: list[dict[str, Any]] = []
+    for session_dir in sorted(uploads_root.iterdir()):
+        manifest_path = session_dir / "manifest.json"
+        if not (
+            SESSION_ID_PATTERN.fullmatch(session_dir.name) and manifest_path.exists()
+        ):
+            continue
+        try:
+            manifest = _load_manifest(manifest_path, session_dir.name)
+        except ValueError:
+            logger.warning(
+                f"[session_uploads] Skipping unreadable manifest {manifest_path}"
+            )
+            continue
+        pending.extend(
+            entry
+            for entry in manifest["files"]
+            if isinstance(entry, dict) and entry.get("parse_status") == _PENDING
+        )
+    return pending
+
+
+def get_session_upload(
+    *, session_id: str, file_upload_id: str, uploads_root: Path
+) -> dict[str, Any] | None:
+    """Return the manifest entry for one upload, or None if not found."""
+    for entry in list_session_uploads(session_id=session_id, uploads_root=uploads_root):
+        if entry.get("file_upload_id") == file_upload_id:
+            return entry
+    return None
+
+
 def list_session_uploads(
     *, session_id: str, uploads_root: Path
 ) -> list[dict[str, Any]]:
@@ -513,21 +951,29 @@ def delete_session_upload(
     file_upload_id: str,
     uploads_root: Path,
 ) -> bool:
-    """Delete one upload and related artifacts. Returns False if not found."""
+    """Delete one upload and related artifacts. Returns False if not found.
+
+    The shared content-store entry (and its parsed_documents row) is only
+    removed once no other upload references the same bytes.
+    """
     validated_session_id = validate_session_id(session_id)
     paths = _session_paths(uploads_root, validated_session_id)
-    manifest = _load_manifest(paths["manifest_path"], validated_session_id)
+    with _manifest_lock(paths["manifest_path"]):
+        manifest = _load_manifest(paths["manifest_path"], validated_session_id)
 
-    kept: list[dict[str, Any]] = []
-    removed_entry: dict[str, Any] | None = None
-    for entry in manifest.get("files", []):
-        if entry.get("file_upload_id") == file_upload_id:
-            removed_entry = entry
-        else:
-            kept.append(entry)
+        kept: list[dict[str, Any]] = []
+        removed_entry: dict[str, Any] | None = None
+        for entry in manifest.get("files", []):
+            if entry.get("file_upload_id") == file_upload_id:
+                removed_entry = entry
+            else:
+                kept.append(entry)
+
+        if removed_entry is None:
+            return False
 
-    if removed_entry is None:
-        return False
+        manifest["files"] = kept
+        _write_manifest(paths["manifest_path"], manifest)
 
     for path_key in ("path", "parsed_markdown_path"):
         value = removed_entry.get(path_key)
@@ -537,23 +983,40 @@ def delete_session_upload(
         if target.exists():
             target.unlink()
 
-    manifest["files"] = kept
-    _write_manifest(paths["manifest_path"], manifest)
+    _release_content(uploads_root, removed_entry)
     return True
 
 
+def _release_content(uploads_root: Path, entry: dict[str, Any]) -> None:
+    """Drop an upload's reference to its content-store entry and DB rows."""
+    sha256 = entry.get("sha256")
+    if sha256:
+        ContentStore(uploads_root).release(
+            sha256, upload_ref(entry["session_id"], entry["file_upload_id"])
+        )
+    _release_in_db(entry)
+
+
 def delete_session_uploads(*, session_id: str, uploads_root: Path) -> bool:
     """Delete all upload artifacts for a session and remove the session directory.
 
-    Removes the entire {uploads_root}/{session_id}/ directory tree.
+    Removes the entire {uploads_root}/{session_id}/ directory tree and releases
+    the session's references into the shared content store.
 
     Returns True if the session directory existed and was removed, False otherwise.
     """
     validated_session_id = validate_session_id(session_id)
-    session_dir = _session_paths(uploads_root, validated_session_id)["session_dir"]
-
-    existed = session_dir.exists()
-    if existed:
-        shutil.rmtree(session_dir)
+    paths = _session_paths(uploads_root, validated_session_id)
+    session_dir = paths["session_dir"]
+
+    with _manifest_lock(paths["manifest_path"]):
+        existed = session_dir.exists()
+        if existed:
+            manifest = _load_manifest(paths["manifest_path"], validated_session_id)
+            for entry in manifest.get("files", []):
+                _release_content(uploads_root, entry)
+            shutil.rmtree(session_dir)
+    with _manifest_locks_guard:
+        _manifest_locks.pop(str(paths["manifest_path"]), None)
 
     return existed
@@ -0,0 +1,246 @@
+"""UploadParsePipeline — parses uploaded PDFs off the event loop.
+
+POST /api/import/upload stores the file and registers it with
+parse_status "pending"; the PDF is then parsed here in a bounded process
+pool. Large PDFs are split into page ranges that are extracted in parallel
+by separate worker processes, then stitched back together and written via
+session_uploads.complete_pdf_parse(). Clients poll the upload's status (or
+the file list) until parse_status leaves "pending".
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from src.importers.session_uploads import (
+    complete_pdf_parse,
+    extract_pdf_page_texts,
+    find_pending_uploads,
+    read_pdf_info,
+)
+
+logger = logging.getLogger("app")
+
+_DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_DEFAULT_PAGES_PER_TASK = 25
+_DEFAULT_MAX_QUEUE = 100
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def _page_ranges(page_count: int, pages_per_task: int) -> list[tuple[int, int]]:
+    return [
+        (start, min(start + pages_per_task, page_count))
+        for start in range(0, page_count, pages_per_task)
+    ]
+
+
+class UploadParsePipeline:
+    """Bounded background parser for uploaded PDFs.
+
+    Args:
+        max_workers: Worker processes in the pool; also the number of
+            documents parsed concurrently.
+        pages_per_task: Page range size handed to one worker. PDFs with more
+            pages than this are extracted in parallel chunks.
+        max_queue: Maximum documents waiting for a slot before new uploads
+            are refused (see has_capacity()).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        pages_per_task: int = _DEFAULT_PAGES_PER_TASK,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+    ):
+        self.max_workers = max_workers
+        self.pages_per_task = pages_per_task
+        self.max_queue = max_queue
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._pages_parsed = 0
+        self._busy_seconds = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        # spawn: workers must not inherit the API's threads or open DB handles
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    async def stop(self) -> None:
+        """Finish in-flight parses, then shut the worker pool down."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, True)
+
+    def has_capacity(self) -> bool:
+        return self._queued < self.max_queue
+
+    def submit(self, entry: dict[str, Any], uploads_root: Path) -> None:
+        """Schedule a pending upload entry for parsing."""
+        if not self.is_running:
+            raise RuntimeError("UploadParsePipeline is not running")
+        self._queued += 1
+        task = asyncio.create_task(self._run(entry, uploads_root))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def resume_pending(self, uploads_root: Path) -> int:
+        """Requeue uploads left "pending" by a previous run.
+
+        Uploads whose stored file is gone are marked failed instead, so no
+        entry stays pending forever. Returns the number requeued.
+        """
+        resumed = 0
+        for entry in await asyncio.to_thread(find_pending_uploads, uploads_root):
+            if Path(entry["path"]).exists():
+                self.submit(entry, uploads_root)
+                resumed += 1
+                continue
+            await asyncio.to_thread(
+                complete_pdf_parse,
+                entry=entry,
+                uploads_root=uploads_root,
+                info={"error": "stored_file_missing"},
+                page_texts=None,
+                cache_result=False,
+            )
+            self._failed += 1
+        if resumed:
+            logger.info(f"[UploadParsePipeline] Resumed {resumed} pending upload(s)")
+        return resumed
+
+    def stats(self) -> dict:
+        return {
+            "running": self.is_running,
+            "max_workers": self.max_workers,
+            "queue_length": self._queued,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "completed": self._completed,
+            "failed": self._failed,
+            "pages_parsed": self._pages_parsed,
+            "pages_per_second": (
+                round(self._pages_parsed / self._busy_seconds, 2)
+                if self._busy_seconds
+                else 0.0
+            ),
+        }
+
+    async def _run(self, entry: dict[str, Any], uploads_root: Path) -> None:
+        assert self._slots is not None
+        async with self._slots:
+            self._queued -= 1
+            self._active += 1
+            started = time.perf_counter()
+            try:
+                info, page_texts = await self._extract(entry)
+                result = await asyncio.to_thread(
+                    complete_pdf_parse,
+                    entry=entry,
+                    uploads_root=uploads_root,
+                    info=info,
+                    page_texts=page_texts,
+                )
+                if page_texts is None:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                    self._pages_parsed += len(page_texts)
+                logger.info(
+                    f"[UploadParsePipeline] {entry['file_upload_id']} -> "
+                    f"{result['parse_status'] if result else 'deleted'} "
+                    f"in {time.perf_counter() - started:.2f}s"
+                )
+            except Exception:
+                self._failed += 1
+                logger.error(
+                    f"[UploadParsePipeline] Failed to parse {entry['file_upload_id']}",
+                    exc_info=True,
+                )
+            finally:
+                self._active -= 1
+                self._busy_seconds += time.perf_counter() - started
+
+    async def _extract(
+        self, entry: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[str] | None]:
+        loop = asyncio.get_running_loop()
+        stored_path = Path(entry["path"])
+        info = await loop.run_in_executor(
+            self._executor, read_pdf_info, stored_path, entry["filename"]
+        )
+        if "error" in info:
+            return info, None
+        try:
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self._executor, extract_pdf_page_texts, stored_path, start, stop
+                    )
+                    for start, stop in _page_ranges(
+                        info["page_count"], self.pages_per_task
+                    )
+                )
+            )
+        except Exception:
+            logger.warning(
+                f"[UploadParsePipeline] Text extraction failed for {stored_path.name}",
+                exc_info=True,
+            )
+            return {"error": "pdf_read_failed"}, None
+        return info, [text for chunk in chunks for text in chunk]
+
+
+_pipeline: UploadParsePipeline | None = None
+
+
+def start_upload_pipeline() -> UploadParsePipeline:
+    """Start the process-wide parse pipeline (called from the FastAPI lifespan)."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = UploadParsePipeline(
+            max_workers=_env_int("UPLOAD_PARSE_WORKERS", _DEFAULT_MAX_WORKERS),
+            pages_per_task=_env_int(
+                "UPLOAD_PARSE_PAGES_PER_TASK", _DEFAULT_PAGES_PER_TASK
+            ),
+            max_queue=_env_int("UPLOAD_PARSE_MAX_QUEUE", _DEFAULT_MAX_QUEUE),
+        )
+    _pipeline.start()
+    return _pipeline
+
+
+async def stop_upload_pipeline() -> None:
+    global _pipeline
+    if _pipeline is not None:
+        await _pipeline.stop()
+        _pipeline = None
+
+
+def get_upload_pipeline() -> UploadParsePipeline | None:
+    return _pipeline
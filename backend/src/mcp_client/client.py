@@ -5,10 +5,12 @@ The MCP server runs as a separate process (started independently via
 using Server-Sent Events (SSE) transport — no subprocess management needed.
 """
 
+import hashlib
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
@@ -29,6 +31,22 @@ _RESTRICTED_TLP = frozenset({"TLP:RED", "TLP:AMBER", "TLP:AMBER+STRICT"})
 _USE_LOCAL = "Bytt til lokal LLM"
 _USE_CLOUD = "Fortsett med Gemini"
 
+_PROMPT_CACHE_MAX_ENTRIES = int(os.getenv("MCP_PROMPT_CACHE_MAX_ENTRIES", "256"))
+_PROMPT_CACHE_TTL_SECONDS = float(os.getenv("MCP_PROMPT_CACHE_TTL_SECONDS", "900"))
+
+# Rendered prompts shared by every MCPClient (one is opened per request).
+# Key: (server_url, server version, prompt name, argument hash, UTC date) —
+# the server advertises a fingerprint of its prompt sources as its version,
+# so a redeployed server with changed templates misses the cache. Prompts
+# embed today's date, hence the date in the key.
+_prompt_cache: OrderedDict[tuple[str, str, str, str, str], tuple[float, str]] = (
+    OrderedDict()
+)
+
+
+def clear_prompt_cache() -> None:
+    _prompt_cache.clear()
+
 
 def _get_tlp_level(content_header: str) -> str | None:
     upper = content_header.upper()
@@ -64,6 +82,7 @@ class MCPClient:
         self.session: ClientSession | None = None
         self._elicitation_callback = elicitation_callback
         self._resource_tlp_warned: bool = False
+        self.server_version: str | None = None
 
     @asynccontextmanager
     async def connect(self):
@@ -85,11 +104,13 @@ class MCPClient:
             sse_client(self.server_url) as (read, write),
             ClientSession(read, write, elicitation_callback=sdk_callback) as session,
         ):
-            await session.initialize()
+            init_result = await session.initialize()
+            self.server_version = init_result.serverInfo.version
             self.session = session
             logger.info("[MCP] Connected")
             yield self
         self.session = None
+        self.server_version = None
         logger.info("[MCP] Disconnected")
 
     @staticmethod
@@ -204,7 +225,9 @@ class MCPClient:
                        All values must be strings per the MCP Prompts spec.
 
         Returns:
-            The rendered prompt text, ready to send to an LLM.
+            The rendered prompt text, ready to send to an LLM. Served from the
+            local prompt cache when the same server version already rendered
+            it with the same arguments today.
 
         Raises:
             RuntimeError: If not connected to the server.
@@ -214,11 +237,40 @@ class MCPClient:
                 "Not connected to MCP server. Use 'async with client.connect():'"
             )
 
+        key = self._prompt_cache_key(name, arguments or {})
+        now = time.monotonic()
+        cached = _prompt_cache.get(key) if key else None
+        if cached is not None and cached[0] > now:
+            _prompt_cache.move_to_end(key)
+            return cached[1]
+
         logger.info(f"[MCP] Fetching prompt: {name}")
         result = await self.session.get_prompt(name, arguments or {})
-        return "\n".join(
+        text = "\n".join(
             msg.content.text for msg in result.messages if hasattr(msg.content, "text")
         )
+        if key:
+            _prompt_cache[key] = (now + _PROMPT_CACHE_TTL_SECONDS, text)
+            _prompt_cache.move_to_end(key)
+            while len(_prompt_cache) > _PROMPT_CACHE_MAX_ENTRIES:
+                _prompt_cache.popitem(last=False)
+        return text
+
+    def _prompt_cache_key(
+        self, name: str, arguments: dict[str, str]
+    ) -> tuple[str, str, str, str, str] | None:
+        if not self.server_version or _PROMPT_CACHE_MAX_ENTRIES <= 0:
+            return None
+        argument_hash = hashlib.sha256(
+            json.dumps(arguments, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return (
+            self.server_url,
+            self.server_version,
+            name,
+            argument_hash,
+            time.strftime("%Y-%m-%d", time.gmtime()),
+        )
 
     async def list_resources(self) -> list[dict[str, Any]]:
         """List available resources on the MCP server.
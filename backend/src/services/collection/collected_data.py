@@ -0,0 +1,122 @@
+"""Structured access to collection agent output.
+
+A collection attempt produces a ``{"collected_data": [...]}`` document,
+often wrapped in a markdown fence or slightly malformed. Accumulated
+collections are several such documents joined with COLLECTION_SEPARATOR,
+one per attempt.
+
+Each document is parsed once (memoized by content hash) and edited as a
+CollectedData object, so appending page summaries or dropping search
+snippets does not round-trip the whole text through json again, and
+re-reading an accumulated collection only parses attempts not seen before.
+"""
+
+import json
+import logging
+import re
+from typing import Any
+
+from src.services import json_codec
+from src.services.json_codec import ParseMemo
+
+logger = logging.getLogger("app")
+
+# Separator used to join multiple collection attempts and to split them back
+# when merging collected_data lists in parse_collected_data.
+COLLECTION_SEPARATOR = "--- NEW COLLECTION ATTEMPT ---"
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
+# Invalid JSON escape sequences (e.g. \' produced by some LLMs — only \", \\,
+# \/, \b, \f, \n, \r, \t, \uXXXX are valid in JSON).
+_INVALID_ESCAPE_RE = re.compile(r"\\([^\"\\\/bfnrtu])")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+def try_parse_json_lenient(s: str) -> dict | None:
+    """Try to parse s; on failure apply common LLM-output repairs and retry."""
+    try:
+        result = json_codec.loads(s)
+        return result if isinstance(result, dict) else None
+    except json.JSONDecodeError:
+        pass
+    repaired = _INVALID_ESCAPE_RE.sub(r"\1", s)
+    repaired = _TRAILING_COMMA_RE.sub(r"\1", repaired)
+    try:
+        result = json_codec.loads(repaired)
+        return result if isinstance(result, dict) else None
+    except json.JSONDecodeError:
+        return None
+
+
+def _parse_document(text: str) -> dict | None:
+    fence = _FENCE_RE.search(text)
+    body = fence.group(1).strip() if fence else text.strip()
+    parsed = try_parse_json_lenient(body) if body else None
+    if parsed is None:
+        # Fence regex failed (e.g. closing ``` split away) — extract by braces.
+        for candidate in (body, text):
+            start, end = candidate.find("{"), candidate.rfind("}")
+            if 0 <= start < end:
+                parsed = try_parse_json_lenient(candidate[start : end + 1])
+                if parsed is not None:
+                    break
+    return parsed
+
+
+def _copy_document(document: dict) -> dict:
+    copied = dict(document)
+    items = copied.get("collected_data")
+    if isinstance(items, list):
+        copied["collected_data"] = [
+            dict(item) if isinstance(item, dict) else item for item in items
+        ]
+    return copied
+
+
+_documents: ParseMemo[dict] = ParseMemo(max_entries=128, copy=_copy_document)
+
+
+def parse_document(text: str) -> dict | None:
+    """Parse one attempt's document (memoized); None if it cannot be repaired."""
+    return _documents.get_or_parse(text, _parse_document)
+
+
+def split_attempts(raw_data: str) -> list[str]:
+    """Split accumulated collection output into per-attempt segments."""
+    return [
+        segment.strip()
+        for segment in raw_data.split(COLLECTION_SEPARATOR)
+        if segment.strip()
+    ]
+
+
+class CollectedData:
+    """One parsed attempt document, edited in place and serialised once."""
+
+    def __init__(self, payload: dict[str, Any]):
+        self._payload = payload
+        if not isinstance(payload.get("collected_data"), list):
+            payload["collected_data"] = []
+
+    @classmethod
+    def parse(cls, raw_data: str) -> "CollectedData | None":
+        payload = parse_document(raw_data)
+        return cls(payload) if payload is not None else None
+
+    @property
+    def items(self) -> list[dict]:
+        return self._payload["collected_data"]
+
+    def extend(self, items: list[dict]) -> None:
+        self.items.extend(items)
+
+    def drop_sources(self, sources: set[str]) -> int:
+        """Remove items whose source is in sources; returns how many were removed."""
+        before = len(self.items)
+        self._payload["collected_data"] = [
+            item for item in self.items if item.get("source") not in sources
+        ]
+        return before - len(self.items)
+
+    def dumps(self) -> str:
+        return json_codec.dumps(self._payload)
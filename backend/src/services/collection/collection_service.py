@@ -16,6 +16,13 @@ from typing import Any
 from datetime import UTC, datetime
 
 from src.mcp_client.client import MCPClient
+from src.services import json_codec
+from src.services.collection.collected_data import (
+    COLLECTION_SEPARATOR as _COLLECTION_SEPARATOR,
+    CollectedData,
+    parse_document,
+    split_attempts,
+)
 from src.services.collection.collection_status import CollectionStatusTracker
 from src.services.reasearch_logger import ResearchLogger
 from src.services.ai.gemini_agent import GeminiAgent
@@ -103,33 +110,9 @@ def _extract_search_urls(raw_data: str) -> list[str]:
     return unique
 
 
-# Separator used to join multiple collection attempts and to split them back
-# when merging collected_data lists in parse_collected_data.
-_COLLECTION_SEPARATOR = "--- NEW COLLECTION ATTEMPT ---"
-
 # Web-fetch source tool names — used for title-based secondary deduplication.
 _WEB_FETCH_SOURCES = {"fetch_page", "google_news_search", "google_search"}
 
-
-def _try_parse_json_lenient(s: str) -> dict | None:
-    """Try json.loads; on failure apply common LLM-output repairs and retry."""
-    try:
-        result = json.loads(s)
-        return result if isinstance(result, dict) else None
-    except json.JSONDecodeError:
-        pass
-    # Remove invalid JSON escape sequences (e.g. \' produced by some LLMs —
-    # only \", \\, \/, \b, \f, \n, \r, \t, \uXXXX are valid in JSON).
-    repaired = re.sub(r"\\([^\"\\\/bfnrtu])", r"\1", s)
-    # Strip trailing commas before ] or }
-    repaired = re.sub(r",\s*([}\]])", r"\1", repaired)
-    try:
-        result = json.loads(repaired)
-        return result if isinstance(result, dict) else None
-    except json.JSONDecodeError:
-        return None
-
-
 _SEARCH_SNIPPET_SOURCES = {"google_search", "google_news_search"}
 
 
@@ -140,36 +123,27 @@ def _strip_search_snippet_items(raw_data: str) -> str:
     only the fetch_page summaries carry real intelligence value.
     Returns the modified JSON string, or the original if parsing fails.
     """
-    fence = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", raw_data, re.IGNORECASE)
-    json_str = fence.group(1).strip() if fence else raw_data.strip()
-
-    parsed = _try_parse_json_lenient(json_str)
-    if parsed is None:
+    document = CollectedData.parse(raw_data)
+    if document is None:
         return raw_data
+    _drop_search_snippets(document)
+    return document.dumps()
+
 
-    original_count = len(parsed.get("collected_data", []))
-    parsed["collected_data"] = [
-        item
-        for item in parsed.get("collected_data", [])
-        if item.get("source") not in _SEARCH_SNIPPET_SOURCES
-    ]
-    stripped_count = original_count - len(parsed["collected_data"])
+def _drop_search_snippets(document: CollectedData) -> None:
+    stripped_count = document.drop_sources(_SEARCH_SNIPPET_SOURCES)
     if stripped_count:
         logger.info(
             f"[CollectionService] Stripped {stripped_count} Serper snippet items from collected_data"
         )
-    return json.dumps(parsed, ensure_ascii=False)
 
 
 def _append_to_collected_data(raw_data: str, extra_items: list[dict]) -> str:
     """Insert additional items into the collected_data list in raw_data JSON."""
-    fence = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", raw_data, re.IGNORECASE)
-    json_str = fence.group(1).strip() if fence else raw_data.strip()
-
-    parsed = _try_parse_json_lenient(json_str)
-    if parsed is not None:
-        parsed["collected_data"] = parsed.get("collected_data", []) + extra_items
-        return json.dumps(parsed, ensure_ascii=False)
+    document = CollectedData.parse(raw_data)
+    if document is not None:
+        document.extend(extra_items)
+        return document.dumps()
 
     logger.warning(
         "[CollectionService] _append_to_collected_data: could not parse base JSON, appending via separator"
@@ -177,7 +151,7 @@ def _append_to_collected_data(raw_data: str, extra_items: list[dict]) -> str:
     return (
         raw_data
         + f"\n{_COLLECTION_SEPARATOR}\n"
-        + json.dumps({"collected_data": extra_items}, ensure_ascii=False)
+        + json_codec.dumps({"collected_data": extra_items})
     )
 
 
@@ -273,42 +247,19 @@ class CollectionService:
             stripped = raw_data.strip() if isinstance(raw_data, str) else ""
 
             # Multi-attempt accumulation: orchestrator joins attempts (and appended
-            # URL summaries) with _COLLECTION_SEPARATOR.  Split, parse each segment
-            # independently, then merge all collected_data lists.
+            # URL summaries) with _COLLECTION_SEPARATOR.  Each segment is parsed
+            # independently (memoized, so earlier attempts are not re-parsed as
+            # the accumulation grows), then all collected_data lists are merged.
             if _COLLECTION_SEPARATOR in stripped:
-                segments = [
-                    s.strip()
-                    for s in stripped.split(_COLLECTION_SEPARATOR)
-                    if s.strip()
-                ]
                 items = []
-                for seg in segments:
-                    fence = re.search(
-                        r"```(?:json)?\s*([\s\S]*?)\s*```", seg, re.IGNORECASE
-                    )
-                    seg_text = fence.group(1).strip() if fence else seg
-                    seg_parsed = _try_parse_json_lenient(seg_text) if seg_text else None
-                    # If fence regex failed (e.g. closing ``` split away), extract by braces
-                    if seg_parsed is None:
-                        start, end = seg.find("{"), seg.rfind("}")
-                        if 0 <= start < end:
-                            seg_parsed = _try_parse_json_lenient(seg[start : end + 1])
+                for seg in split_attempts(stripped):
+                    seg_parsed = parse_document(seg)
                     if seg_parsed and isinstance(
                         seg_parsed.get("collected_data"), list
                     ):
                         items.extend(seg_parsed["collected_data"])
             else:
-                fence_match = re.search(
-                    r"```(?:json)?\s*([\s\S]*?)\s*```", stripped, re.IGNORECASE
-                )
-                if fence_match:
-                    stripped = fence_match.group(1).strip()
-                parsed = _try_parse_json_lenient(stripped) if stripped else {}
-                if parsed is None:
-                    # Last resort: extract largest {...} block
-                    start, end = stripped.find("{"), stripped.rfind("}")
-                    if 0 <= start < end:
-                        parsed = _try_parse_json_lenient(stripped[start : end + 1])
+                parsed = parse_document(stripped) if stripped else None
                 if not parsed:
                     raise json.JSONDecodeError("Could not repair JSON", stripped, 0)
                 items = parsed.get("collected_data", [])
@@ -360,7 +311,7 @@ class CollectionService:
                 raw_content = item.get("content", "")
                 if isinstance(raw_content, str) and raw_content.startswith("{"):
                     try:
-                        inner = json.loads(raw_content)
+                        inner = json_codec.loads(raw_content)
                         if isinstance(inner, dict):
                             if "result" in inner and isinstance(inner["result"], str):
                                 item["content"] = inner["result"]
@@ -658,16 +609,26 @@ class CollectionService:
                     urls=urls[:_url_buffer],
                     pir=pir,
                     perspectives=perspectives or [],
-                )
-                if summaries:
-                    raw_data = _append_to_collected_data(raw_data, summaries)
-                    logger.info(
-                        f"[CollectionService] url_context: added {len(summaries)} page summaries"
-                    )
+                ) or []
                 if tracker:
-                    tracker.set_source_count("Web Search", len(summaries) if summaries else 0)
+                    tracker.set_source_count("Web Search", len(summaries))
+            else:
+                summaries = []
 
-            raw_data = _strip_search_snippet_items(raw_data)
+            # Parse the attempt once; append summaries and strip snippets on the
+            # structured document, then serialise once.
+            document = CollectedData.parse(raw_data)
+            if document is not None:
+                if summaries:
+                    document.extend(summaries)
+                _drop_search_snippets(document)
+                raw_data = document.dumps()
+            elif summaries:
+                raw_data = _append_to_collected_data(raw_data, summaries)
+            if summaries:
+                logger.info(
+                    f"[CollectionService] url_context: added {len(summaries)} page summaries"
+                )
 
         if tracker:
             tracker.mark_complete()
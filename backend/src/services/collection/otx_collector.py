@@ -6,14 +6,22 @@ It normalizes OTX responses into internal models (OTXPulse,
 NormalizedIndicator) and handles rate limiting, pagination, and
 error recovery.
 
+All collectors in the process share one pooled httpx.AsyncClient and one
+token-bucket rate limiter, so running several collectors side by side still
+stays within OTX's per-key request budget.
+
 API Reference: https://otx.alienvault.com/api
 """
 
 import asyncio
+import email.utils
 import logging
+import math
 import os
+import threading
 import time
 import uuid
+from collections import OrderedDict
 
 import httpx
 
@@ -23,13 +31,103 @@ from src.models.sources.otx import OTXIndicator, OTXPulse
 
 logger = logging.getLogger("app")
 
+# Upper bound on a single backoff sleep, whatever Retry-After asks for.
+_MAX_RETRY_DELAY = 120.0
+
+# Last ETag + body per GET URL, for If-None-Match revalidation (304 -> reuse).
+_MAX_ETAG_ENTRIES = 256
+_etag_cache: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+
+
+class TokenBucket:
+    """Process-wide token bucket shared by every OTXCollector.
+
+    reserve() never blocks: it takes a token (the balance may go negative,
+    which queues the caller behind earlier reservations) and returns how long
+    the caller must sleep before sending. pause() holds all callers back,
+    e.g. for a Retry-After received by any collector.
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token. Returns seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"[OTXCollector] Rate limit: waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# (client, loop) — httpx pools are bound to the loop that opened them.
+_client: tuple[httpx.AsyncClient, asyncio.AbstractEventLoop] | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client[1] is not loop or _client[0].is_closed:
+        _client = (
+            httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            ),
+            loop,
+        )
+    return _client[0]
+
+
+async def close_otx_client() -> None:
+    """Close the shared OTX client (called from the FastAPI lifespan)."""
+    global _client
+    if _client is not None:
+        client, loop = _client
+        _client = None
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+
 
 class OTXCollector:
     """Async client for the AlienVault OTX REST API.
 
     Queries OTX for pulses, indicators, and IOCs, returning
-    normalized internal models. Implements rate limiting (10 req/min)
-    and exponential backoff on 429/5xx errors.
+    normalized internal models. Implements process-wide rate limiting
+    (10 req/min) and backoff on 429/5xx errors that honours Retry-After.
     """
 
     BASE_URL = "https://otx.alienvault.com/api/v1"
@@ -66,7 +164,6 @@ class OTXCollector:
         self._api_key = os.getenv("OTX_API_KEY")
         if not self._api_key:
             raise ValueError("OTX_API_KEY environment variable is not set")
-        self._request_timestamps: list[float] = []
 
     # ------------------------------------------------------------------
     # Public methods
@@ -146,6 +243,9 @@ class OTXCollector:
     ) -> dict:
         """Make a rate-limited request to the OTX API.
 
+        GET responses carrying an ETag are remembered and revalidated with
+        If-None-Match; a 304 returns the remembered body.
+
         Args:
             method: HTTP method.
             path: API path (appended to BASE_URL).
@@ -157,27 +257,41 @@ class OTXCollector:
         Raises:
             httpx.HTTPStatusError: On non-retryable HTTP errors.
         """
-        wait = self._enforce_rate_limit()
-        if wait > 0:
-            logger.debug(f"[OTXCollector] Rate limit: waiting {wait:.1f}s")
-            await asyncio.sleep(wait)
-
-        self._request_timestamps.append(time.monotonic())
         url = f"{self.BASE_URL}/{path.lstrip('/')}"
         headers = {"X-OTX-API-KEY": self._api_key}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await self._backoff_request(
-                client, method, url, headers=headers, params=params
-            )
+        cache_key = str(httpx.URL(url, params=params))
+        cached = _etag_cache.get(cache_key) if method == "GET" else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
-        return response.json()
+        response = await self._backoff_request(
+            _get_client(), method, url, headers=headers, params=params
+        )
+
+        if response.status_code == 304 and cached is not None:
+            _etag_cache.move_to_end(cache_key)
+            return cached[1]
+
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if method == "GET" and etag:
+            _etag_cache[cache_key] = (etag, data)
+            _etag_cache.move_to_end(cache_key)
+            while len(_etag_cache) > _MAX_ETAG_ENTRIES:
+                _etag_cache.popitem(last=False)
+        return data
 
     async def _paginate(
         self, path: str, params: dict | None = None, max_pages: int = 10
     ) -> list[dict]:
         """Fetch all pages from a paginated OTX endpoint.
 
+        When the first page reports a total ``count``, the remaining pages
+        are requested concurrently (the shared rate limiter still spaces
+        them out); otherwise pages are fetched one at a time until a short
+        page is returned.
+
         Args:
             path: API path (appended to BASE_URL).
             params: Query parameters. 'page' and 'limit' are managed internally.
@@ -188,34 +302,37 @@ class OTXCollector:
         """
         params = dict(params or {})
         params.setdefault("limit", self.DEFAULT_PAGE_LIMIT)
-        all_results: list[dict] = []
+        limit = params["limit"]
+
+        first = await self._request("GET", path, params={**params, "page": 1})
+        all_results: list[dict] = list(first.get("results", []))
+        if len(all_results) < limit:
+            return all_results
+
+        count = first.get("count")
+        if isinstance(count, int):
+            last_page = min(max_pages, math.ceil(count / limit))
+            pages = await asyncio.gather(
+                *(
+                    self._request("GET", path, params={**params, "page": page})
+                    for page in range(2, last_page + 1)
+                )
+            )
+            for data in pages:
+                all_results.extend(data.get("results", []))
+            return all_results
 
-        for page in range(1, max_pages + 1):
-            params["page"] = page
-            data = await self._request("GET", path, params=params)
+        for page in range(2, max_pages + 1):
+            data = await self._request("GET", path, params={**params, "page": page})
 
             results = data.get("results", [])
             all_results.extend(results)
 
-            if len(results) < params["limit"]:
+            if len(results) < limit:
                 break
 
         return all_results
 
-    def _enforce_rate_limit(self) -> float:
-        """Calculate delay needed to stay within rate limit.
-
-        Returns:
-            Seconds to wait before making the next request (0 if none needed).
-        """
-        now = time.monotonic()
-        self._request_timestamps = [t for t in self._request_timestamps if now - t < 60]
-        if len(self._request_timestamps) >= self.MAX_REQUESTS_PER_MINUTE:
-            oldest = self._request_timestamps[0]
-            wait = 60 - (now - oldest)
-            return max(wait, 0)
-        return 0.0
-
     async def _backoff_request(
         self,
         client: httpx.AsyncClient,
@@ -223,7 +340,12 @@ class OTXCollector:
         url: str,
         **kwargs: object,
     ) -> httpx.Response:
-        """Make an HTTP request with exponential backoff on 429/5xx.
+        """Make a rate-limited HTTP request with backoff on 429/5xx.
+
+        Every attempt takes a token from the shared limiter. The delay before
+        a retry is the server's Retry-After when present, otherwise
+        exponential; a 429 also pauses the shared limiter so other requests
+        in flight back off too.
 
         Args:
             client: The httpx async client to use.
@@ -232,7 +354,7 @@ class OTXCollector:
             **kwargs: Additional arguments passed to client.request.
 
         Returns:
-            The successful httpx.Response.
+            The successful (or 304 Not Modified) httpx.Response.
 
         Raises:
             httpx.HTTPStatusError: After max retries are exhausted.
@@ -241,12 +363,21 @@ class OTXCollector:
         base_delay = 1.0
 
         for attempt in range(max_retries + 1):
+            await _rate_limiter.acquire()
             response = await client.request(method, url, **kwargs)
 
             if response.status_code == 429 or response.status_code >= 500:
                 if attempt == max_retries:
                     response.raise_for_status()
-                delay = base_delay * (2**attempt)
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                delay = min(
+                    retry_after
+                    if retry_after is not None
+                    else base_delay * (2**attempt),
+                    _MAX_RETRY_DELAY,
+                )
+                if response.status_code == 429:
+                    _rate_limiter.pause(delay)
                 logger.warning(
                     f"[OTXCollector] {response.status_code} on attempt "
                     f"{attempt + 1}, retrying in {delay}s"
@@ -254,7 +385,8 @@ class OTXCollector:
                 await asyncio.sleep(delay)
                 continue
 
-            response.raise_for_status()
+            if response.status_code != 304:
+                response.raise_for_status()
             return response
 
         # Unreachable, but satisfies type checker
@@ -357,3 +489,6 @@ class OTXCollector:
                 f"(type={otx_ind.type})"
             )
             return None
+
+
+_rate_limiter = TokenBucket(OTXCollector.MAX_REQUESTS_PER_MINUTE)
@@ -0,0 +1,75 @@
+"""JSON codec for large LLM payloads, backed by orjson.
+
+Collected data and processing results are JSON documents that grow with
+every collection attempt. orjson parses and serialises them several times
+faster than the stdlib; the stdlib is kept as a fallback for the inputs
+orjson rejects (NaN, integers wider than 64 bits, non-string keys).
+
+ParseMemo remembers parse results by content hash, so a document that is
+re-read on every turn (the latest attempt, earlier attempts of an
+accumulated collection) is only parsed once.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+import orjson
+
+T = TypeVar("T")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON; raises json.JSONDecodeError like json.loads."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialise to compact JSON, keeping non-ASCII text unescaped."""
+    try:
+        return orjson.dumps(obj).decode("utf-8")
+    except TypeError:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+class ParseMemo(Generic[T]):
+    """Bounded LRU from a text's sha1 to the value parsed from it.
+
+    Keys are digests so cached entries do not keep large source strings
+    alive. ``copy`` is applied to every value handed out, so callers may
+    mutate what they receive without corrupting the cache.
+    """
+
+    def __init__(self, max_entries: int, copy: Callable[[T], T]):
+        self.max_entries = max_entries
+        self._copy = copy
+        self._entries: OrderedDict[bytes, T | None] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_parse(self, text: str, parse: Callable[[str], T | None]) -> T | None:
+        key = hashlib.sha1(text.encode("utf-8", "surrogatepass")).digest()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = self._entries[key]
+                return None if value is None else self._copy(value)
+        value = parse(text)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return None if value is None else self._copy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
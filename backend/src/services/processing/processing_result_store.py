@@ -7,12 +7,16 @@ Falls back to the legacy processed.json files if DB load fails.
 import json
 import logging
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from pydantic import ValidationError
 
 from src.models.analysis import ProcessingResult
 from src.models.processing import ProcessingResult as LegacyProcessingResult
+from src.services import json_codec
+from src.services.json_codec import ParseMemo
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,50 @@ PROCESSING_RESULT_UNAVAILABLE_MESSAGE = (
     "No processed result available for this session. Complete processing first."
 )
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
+_ARRAY_WITH_GAPS_RE = re.compile(
+    r"\s*(\[[\s\S]*\])\s*,\s*\"gaps\"\s*:\s*(\[[\s\S]*?\])\s*\}?\s*$", re.DOTALL
+)
+
+# Parsed (or unparseable) attempts by content hash — every analysis draft,
+# council run and snapshot re-reads the same attempts.
+_parsed_attempts: ParseMemo[ProcessingResult] = ParseMemo(
+    max_entries=256, copy=lambda result: result.model_copy(deep=True)
+)
+
+# session_id -> (ProcessingAttemptRepository.version, resolved result). An
+# appended or deleted attempt changes the version, which invalidates the entry.
+_SESSION_RESULTS_MAX_ENTRIES = 128
+_session_results: OrderedDict[str, tuple[tuple, ProcessingResult | None]] = (
+    OrderedDict()
+)
+_session_results_lock = threading.Lock()
+
+
+def _cached_session_result(
+    session_id: str, version: tuple
+) -> tuple[bool, ProcessingResult | None]:
+    with _session_results_lock:
+        entry = _session_results.get(session_id)
+        if entry is None or entry[0] != version:
+            return False, None
+        _session_results.move_to_end(session_id)
+        result = entry[1]
+    return True, None if result is None else result.model_copy(deep=True)
+
+
+def _remember_session_result(
+    session_id: str, version: tuple, result: ProcessingResult | None
+) -> None:
+    with _session_results_lock:
+        _session_results[session_id] = (
+            version,
+            None if result is None else result.model_copy(deep=True),
+        )
+        _session_results.move_to_end(session_id)
+        while len(_session_results) > _SESSION_RESULTS_MAX_ENTRIES:
+            _session_results.popitem(last=False)
+
 
 def _repair_array_with_gaps(candidate: str) -> dict | None:
     """Repair the case where the model returned a bare findings array with gaps appended.
@@ -29,16 +77,12 @@ def _repair_array_with_gaps(candidate: str) -> dict | None:
     Handles: [...findings...],\n  "gaps": [...]\n}
     instead of: {"findings": [...], "gaps": [...]}
     """
-    m = re.match(
-        r"\s*(\[[\s\S]*\])\s*,\s*\"gaps\"\s*:\s*(\[[\s\S]*?\])\s*\}?\s*$",
-        candidate,
-        re.DOTALL,
-    )
+    m = _ARRAY_WITH_GAPS_RE.match(candidate)
     if not m:
         return None
     try:
-        findings = json.loads(m.group(1))
-        gaps = json.loads(m.group(2))
+        findings = json_codec.loads(m.group(1))
+        gaps = json_codec.loads(m.group(2))
         if isinstance(findings, list) and isinstance(gaps, list):
             return {"findings": findings, "gaps": gaps}
     except json.JSONDecodeError:
@@ -47,15 +91,19 @@ def _repair_array_with_gaps(candidate: str) -> dict | None:
 
 
 def _try_parse_processing_result(raw: str) -> ProcessingResult | None:
-    """Attempt to extract a ProcessingResult from raw LLM output."""
-    match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", raw, re.IGNORECASE)
+    """Attempt to extract a ProcessingResult from raw LLM output (memoized)."""
+    return _parsed_attempts.get_or_parse(raw, _parse_processing_result)
+
+
+def _parse_processing_result(raw: str) -> ProcessingResult | None:
+    match = _FENCE_RE.search(raw)
     candidate = match.group(1) if match else raw.strip()
     if candidate.startswith("```"):
         candidate = re.sub(r"^```(?:json)?\s*", "", candidate, flags=re.IGNORECASE)
         candidate = re.sub(r"\s*```$", "", candidate).strip()
 
     try:
-        payload = json.loads(candidate)
+        payload = json_codec.loads(candidate)
     except json.JSONDecodeError:
         payload = _repair_array_with_gaps(candidate)
         if payload is None:
@@ -83,16 +131,22 @@ def _try_parse_processing_result(raw: str) -> ProcessingResult | None:
     return None
 
 
+def processing_result_json(raw: str) -> str | None:
+    """Canonical JSON of the ProcessingResult in raw LLM output, or None."""
+    result = _try_parse_processing_result(raw)
+    if result is None:
+        return None
+    return json_codec.dumps(result.model_dump(mode="json"))
+
+
 def normalize_raw_result(raw: str) -> str:
     """Re-serialize malformed LLM output as canonical JSON if possible.
 
     Returns the original string unchanged when parsing fails so callers always
     get a usable value.
     """
-    result = _try_parse_processing_result(raw)
-    if result is None:
-        return raw
-    return json.dumps(result.model_dump(mode="json"), ensure_ascii=False)
+    normalized = processing_result_json(raw)
+    return raw if normalized is None else normalized
 
 
 def _convert_legacy_processing_result(
@@ -236,30 +290,55 @@ class ProcessingResultStore:
         raise ValueError(PROCESSING_RESULT_UNAVAILABLE_MESSAGE)
 
     async def _try_load_from_db(self, session_id: str) -> ProcessingResult | None:
-        """Read processing attempts from DB, return the latest valid ProcessingResult."""
+        """Return the latest valid ProcessingResult for a session from DB.
+
+        Results are cached per session and revalidated against the attempts'
+        version (count, newest id and timestamp), so repeated loads cost one
+        indexed aggregate query.
+        """
+        repo = self._uow.processing_attempts
         try:
-            attempts = await self._uow.processing_attempts.get_all(session_id)
+            version = await repo.version(session_id)
+            if version is None:
+                return None
+            hit, result = _cached_session_result(session_id, version)
+            if hit:
+                return result
+            result = await self._resolve_latest(session_id)
         except Exception:
             logger.exception(
                 "DB load failed for session %s processing attempts", session_id
             )
             return None
 
-        if not attempts:
-            return None
-
-        # Walk attempts newest-first to find the most recent valid result
-        for attempt in reversed(attempts):
+        _remember_session_result(session_id, version, result)
+        if result is None:
+            logger.info(
+                "No valid ProcessingResult found in DB attempts for session %s",
+                session_id,
+            )
+        return result
+
+    async def _resolve_latest(self, session_id: str) -> ProcessingResult | None:
+        """Newest valid result: the stored normalized JSON, unless a newer
+        attempt without one (stored before normalization existed) parses."""
+        repo = self._uow.processing_attempts
+        stored = await repo.get_latest_normalized(session_id)
+        floor = stored.attempt_number if stored else 0
+        for attempt in await repo.get_unnormalized_after(session_id, floor):
             result = _try_parse_processing_result(attempt.raw_result)
             if result is not None:
                 return result
-
-        logger.info(
-            "No valid ProcessingResult found in %d DB attempts for session %s",
-            len(attempts),
-            session_id,
-        )
-        return None
+        if stored is None:
+            return None
+        try:
+            return ProcessingResult.model_validate_json(stored.normalized_result)
+        except ValidationError:
+            logger.warning(
+                "Stored normalized result for session %s failed validation",
+                session_id,
+            )
+            return _try_parse_processing_result(stored.raw_result)
 
     def _try_load_session(self, processed_path: Path) -> ProcessingResult | None:
         """Try to load a ProcessingResult from a legacy processed.json file."""
@@ -4,13 +4,21 @@ Uses the sync sqlite3 module because the logger is invoked from many sync
 contexts (state machines, agent callbacks). The `research_log_entries` table
 holds both append-style entries (ai_generation, user_action) and the full
 reasoning trace written on PIR approval.
+
+While the API is running, entries are handed to a ResearchLogWriter thread
+that batches the INSERTs into one transaction, so request handlers never wait
+on a commit. Without a running writer (scripts, tests) entries are written
+inline.
 """
 
+import contextlib
 import json
 import logging
 import os
+import queue
 import sqlite3
 import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -23,6 +31,19 @@ _DEFAULT_DATA_DIR = _BACKEND_ROOT / "data"
 
 _conn: sqlite3.Connection | None = None
 _conn_lock = threading.Lock()
+# Serialises statements on the shared connection (writer thread + inline writes).
+_write_lock = threading.Lock()
+
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_FLUSH_INTERVAL_MS = 250
+_DEFAULT_MAX_QUEUE_SIZE = 10_000
+
+_INSERT_SQL = """INSERT INTO research_log_entries
+                     (session_id, entry_type, phase, timestamp, content)
+                 VALUES (?, ?, ?, ?, ?)"""
+
+# (session_id, entry_type, phase, timestamp, content)
+LogRow = tuple[str, str, str | None, str, str]
 
 
 def _db_path() -> str:
@@ -44,6 +65,232 @@ def _get_connection() -> sqlite3.Connection:
     return _conn
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def _write_rows(rows: list[LogRow]) -> None:
+    """INSERT rows into research_log_entries in a single transaction."""
+    conn = _get_connection()
+    with _write_lock:
+        try:
+            conn.executemany(_INSERT_SQL, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+class ResearchLogWriter:
+    """Background thread that batches research_log_entries INSERTs.
+
+    Rows are queued by submit() and written in one transaction whenever
+    `batch_size` rows are pending or `flush_interval_ms` has passed since the
+    first pending row arrived. The queue is bounded: when it is full submit()
+    returns False and the caller writes the row inline, so a stalled disk slows
+    producers down instead of dropping entries or growing memory.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        flush_interval_ms: int = _DEFAULT_FLUSH_INTERVAL_MS,
+        max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue_size = max_queue_size
+        # None is a wake-up sentinel put by stop(); it is never written.
+        self._queue: queue.Queue[LogRow | None] = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._backpressure_rejections = 0
+        self._max_queue_depth = 0
+        self._max_batch_size = 0
+        self._total_batch_ms = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="research-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the writer thread after flushing everything still queued."""
+        self._stop_event.set()
+        with contextlib.suppress(queue.Full):
+            self._queue.put_nowait(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # Anything submitted after the thread exited is written here.
+        leftover = self._drain_nowait()
+        if leftover:
+            self._write_batch(leftover)
+
+    def submit(self, row: LogRow) -> bool:
+        """Queue a row for the next batch. Returns False when the queue is full."""
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._stats_lock:
+                self._backpressure_rejections += 1
+            return False
+        with self._stats_lock:
+            self._enqueued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return True
+
+    def flush(self) -> None:
+        """Block until every row submitted so far has been written."""
+        if self.is_running:
+            self._queue.join()
+        else:
+            leftover = self._drain_nowait()
+            if leftover:
+                self._write_batch(leftover)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "running": self.is_running,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "max_queue_size": self.max_queue_size,
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "failed": self._failed,
+                "batches": self._batches,
+                "max_batch_size": self._max_batch_size,
+                "avg_batch_ms": (
+                    round(self._total_batch_ms / self._batches, 3)
+                    if self._batches
+                    else 0.0
+                ),
+                "backpressure_rejections": self._backpressure_rejections,
+            }
+
+    def _run(self) -> None:
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            batch = self._collect_batch()
+            if batch:
+                self._write_batch(batch)
+
+    def _collect_batch(self) -> list[LogRow]:
+        # Wait (bounded, so stop() is noticed) for the first row, then keep
+        # collecting until the batch is full or the flush interval elapses.
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        if first is None:
+            self._queue.task_done()
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                row = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if row is None:
+                self._queue.task_done()
+                break
+            batch.append(row)
+        return batch
+
+    def _drain_nowait(self) -> list[LogRow]:
+        rows: list[LogRow] = []
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if row is None:
+                self._queue.task_done()
+            else:
+                rows.append(row)
+
+    def _write_batch(self, batch: list[LogRow]) -> None:
+        started = time.perf_counter()
+        try:
+            _write_rows(batch)
+            ok = True
+        except Exception as e:
+            ok = False
+            logger.error(
+                f"[ResearchLogWriter] Failed to write batch of {len(batch)} entries: {e}"
+            )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            if ok:
+                self._written += len(batch)
+            else:
+                self._failed += len(batch)
+            self._batches += 1
+            self._max_batch_size = max(self._max_batch_size, len(batch))
+            self._total_batch_ms += elapsed_ms
+        for _ in batch:
+            self._queue.task_done()
+
+
+_writer: ResearchLogWriter | None = None
+
+
+def start_log_writer() -> ResearchLogWriter:
+    """Start the process-wide log writer (called from the FastAPI lifespan)."""
+    global _writer
+    if _writer is None:
+        _writer = ResearchLogWriter(
+            batch_size=_env_int("RESEARCH_LOG_BATCH_SIZE", _DEFAULT_BATCH_SIZE),
+            flush_interval_ms=_env_int(
+                "RESEARCH_LOG_FLUSH_INTERVAL_MS", _DEFAULT_FLUSH_INTERVAL_MS
+            ),
+            max_queue_size=_env_int(
+                "RESEARCH_LOG_MAX_QUEUE_SIZE", _DEFAULT_MAX_QUEUE_SIZE
+            ),
+        )
+    _writer.start()
+    return _writer
+
+
+def stop_log_writer() -> None:
+    """Flush pending entries and stop the process-wide log writer."""
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
+def get_log_writer() -> ResearchLogWriter | None:
+    return _writer
+
+
+def _persist(row: LogRow) -> None:
+    writer = _writer
+    if writer is not None and writer.is_running and writer.submit(row):
+        return
+    _write_rows([row])
+
+
 class ResearchLogger:
     """Persists per-session research and reasoning logs to sessions.db.
 
@@ -81,39 +328,29 @@ class ResearchLogger:
             return
 
         try:
-            conn = _get_connection()
-            conn.execute(
-                """INSERT INTO research_log_entries
-                       (session_id, entry_type, phase, timestamp, content)
-                   VALUES (?, ?, ?, ?, ?)""",
+            _persist(
                 (
                     session_id,
                     entry_type,
                     phase,
                     payload.get("timestamp") or datetime.now(UTC).isoformat(),
                     json.dumps(payload),
-                ),
+                )
             )
-            conn.commit()
         except Exception as e:
             logger.error(f"[ResearchLogger] Failed to write log entry: {e}")
 
     def write_reasoning_log(self, reasoning_log: "ReasoningLog") -> None:
         """Persist the full reasoning trace (one row per PIR approval)."""
         try:
-            conn = _get_connection()
-            conn.execute(
-                """INSERT INTO research_log_entries
-                       (session_id, entry_type, phase, timestamp, content)
-                   VALUES (?, ?, ?, ?, ?)""",
+            _persist(
                 (
                     reasoning_log.session_id,
                     "reasoning_log",
                     reasoning_log.phase,
                     datetime.now(UTC).isoformat(),
                     reasoning_log.model_dump_json(),
-                ),
+                )
             )
-            conn.commit()
         except Exception as e:
             logger.error(f"[ResearchLogger] Failed to write reasoning log: {e}")
@@ -0,0 +1,288 @@
+"""SessionCache — bounded in-memory cache of live IntelligenceSessions.
+
+The dialogue API keeps recently used sessions in memory so a turn does not
+have to rebuild five state machines from sessions.db. The cache is bounded by
+entry count, approximate memory and idle time; evicted sessions are simply
+reloaded from the DB on their next request.
+
+Alongside each session the cache remembers the column values that were last
+written to the `sessions` row, grouped per flow (see FLOW_COLUMNS). diff()
+compares a fresh serialisation against that snapshot, so a save only writes
+the columns of flows that actually changed — and nothing at all for a turn
+that did not change session state.
+"""
+
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("app")
+
+_DEFAULT_MAX_ENTRIES = 256
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_IDLE_TTL_SECONDS = 60 * 60
+_DEFAULT_TOMBSTONE_TTL_SECONDS = 2 * 60 * 60
+_DEFAULT_MAX_TOMBSTONES = 10_000
+
+# Rough fixed cost of the flow objects themselves, on top of their payload.
+_ENTRY_OVERHEAD_BYTES = 16 * 1024
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def estimate_columns_size(columns: dict[str, dict[str, Any]]) -> int:
+    """Approximate memory held by a session from its serialised column values."""
+    size = _ENTRY_OVERHEAD_BYTES
+    for group in columns.values():
+        for value in group.values():
+            if isinstance(value, str):
+                size += sys.getsizeof(value)
+    return size
+
+
+@dataclass
+class _CacheEntry:
+    session: Any
+    last_access: float
+    persisted: dict[str, dict[str, Any]] | None = None
+    size_bytes: int = _ENTRY_OVERHEAD_BYTES
+
+
+@dataclass
+class SessionDiff:
+    """Result of comparing a session against its last persisted columns."""
+
+    columns: dict[str, dict[str, Any]]
+    dirty_flows: list[str] = field(default_factory=list)
+    changed: dict[str, Any] = field(default_factory=dict)
+    is_new: bool = False
+
+
+class SessionCache:
+    """LRU + idle-TTL cache of sessions with per-flow dirty tracking.
+
+    Supports the subset of the dict interface the dialogue API and its tests
+    rely on (``in``, ``[]``, ``get``, ``pop``, ``clear``, ``len``).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        idle_ttl_seconds: float = _DEFAULT_IDLE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._saves = 0
+        self._skipped_saves = 0
+        self._columns_written = 0
+
+    # -- dict-style access --------------------------------------------------
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __getitem__(self, session_id: str) -> Any:
+        entry = self._entries[session_id]
+        self._touch(session_id, entry)
+        return entry.session
+
+    def __setitem__(self, session_id: str, session: Any) -> None:
+        self.put(session_id, session)
+
+    def get(self, session_id: str, default: Any = None) -> Any:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._touch(session_id, entry)
+        return entry.session
+
+    def pop(self, session_id: str, default: Any = None) -> Any:
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return default
+        self._total_bytes -= entry.size_bytes
+        return entry.session
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+
+    # -- cache management ---------------------------------------------------
+
+    def put(
+        self,
+        session_id: str,
+        session: Any,
+        persisted: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Insert a session. ``persisted`` is the snapshot of its DB row, if any."""
+        self.pop(session_id)
+        entry = _CacheEntry(session=session, last_access=time.monotonic())
+        self._entries[session_id] = entry
+        if persisted is not None:
+            self._set_persisted(entry, persisted)
+        self._evict()
+
+    def diff(
+        self, session_id: str, session: Any, columns: dict[str, dict[str, Any]]
+    ) -> SessionDiff:
+        """Compare freshly serialised columns against the last persisted snapshot.
+
+        A session object that is not the cached instance (e.g. it was evicted
+        while a request still held it) has no trusted snapshot and is treated
+        as new, which makes the caller write the full row.
+        """
+        entry = self._entries.get(session_id)
+        persisted = entry.persisted if entry and entry.session is session else None
+        if persisted is None:
+            return SessionDiff(columns=columns, dirty_flows=list(columns), is_new=True)
+
+        result = SessionDiff(columns=columns)
+        for flow, values in columns.items():
+            previous = persisted.get(flow, {})
+            changed = {k: v for k, v in values.items() if previous.get(k) != v}
+            if changed:
+                result.dirty_flows.append(flow)
+                result.changed.update(changed)
+        return result
+
+    def mark_persisted(self, session_id: str, session: Any, diff: SessionDiff) -> None:
+        """Record that ``diff`` has been written, making it the new snapshot."""
+        self._saves += 1
+        entry = self._entries.get(session_id)
+        if entry is not None and entry.session is session:
+            self._set_persisted(entry, diff.columns)
+        self._columns_written += (
+            sum(len(group) for group in diff.columns.values())
+            if diff.is_new
+            else len(diff.changed)
+        )
+        self._evict()
+
+    def record_skipped_save(self) -> None:
+        self._skipped_saves += 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "approx_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "saves": self._saves,
+            "skipped_saves": self._skipped_saves,
+            "columns_written": self._columns_written,
+        }
+
+    def _touch(self, session_id: str, entry: _CacheEntry) -> None:
+        entry.last_access = time.monotonic()
+        self._entries.move_to_end(session_id)
+
+    def _set_persisted(
+        self, entry: _CacheEntry, columns: dict[str, dict[str, Any]]
+    ) -> None:
+        entry.persisted = {flow: dict(values) for flow, values in columns.items()}
+        size = estimate_columns_size(columns)
+        self._total_bytes += size - entry.size_bytes
+        entry.size_bytes = size
+
+    def _evict(self) -> None:
+        # Idle entries first (oldest at the front), then LRU until within bounds.
+        # The most recently used entry is never evicted.
+        if self.idle_ttl_seconds:
+            cutoff = time.monotonic() - self.idle_ttl_seconds
+            while len(self._entries) > 1:
+                session_id, entry = next(iter(self._entries.items()))
+                if entry.last_access >= cutoff:
+                    break
+                self.pop(session_id)
+                self._expirations += 1
+                logger.debug(f"[SessionCache] Expired idle session {session_id}")
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            session_id = next(iter(self._entries))
+            self.pop(session_id)
+            self._evictions += 1
+            logger.debug(f"[SessionCache] Evicted session {session_id}")
+
+
+class TombstoneSet:
+    """Bounded, expiring set of deleted session ids.
+
+    A tombstone only has to outlive requests that were already in flight when
+    the session was deleted, so entries expire after ``ttl_seconds`` and the
+    oldest are dropped beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = _DEFAULT_TOMBSTONE_TTL_SECONDS,
+        max_entries: int = _DEFAULT_MAX_TOMBSTONES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._added: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, session_id: str) -> None:
+        self._added.pop(session_id, None)
+        self._added[session_id] = time.monotonic()
+        self._prune()
+
+    def discard(self, session_id: str) -> None:
+        self._added.pop(session_id, None)
+
+    def __contains__(self, session_id: object) -> bool:
+        self._prune()
+        return session_id in self._added
+
+    def __len__(self) -> int:
+        return len(self._added)
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._added:
+            session_id, added_at = next(iter(self._added.items()))
+            if added_at >= cutoff and len(self._added) <= self.max_entries:
+                break
+            del self._added[session_id]
+
+
+def create_session_cache() -> SessionCache:
+    """Build a SessionCache sized from SESSION_CACHE_* environment variables."""
+    return SessionCache(
+        max_entries=int(_env_number("SESSION_CACHE_MAX_ENTRIES", _DEFAULT_MAX_ENTRIES)),
+        max_bytes=int(_env_number("SESSION_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES)),
+        idle_ttl_seconds=_env_number(
+            "SESSION_CACHE_IDLE_TTL_SECONDS", _DEFAULT_IDLE_TTL_SECONDS
+        ),
+    )
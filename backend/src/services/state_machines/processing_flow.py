@@ -22,7 +22,10 @@ from src.models.dialogue import (
     PhaseReviewItem,
 )
 from src.models.reasoning import ReasoningLog
-from src.services.processing.processing_result_store import normalize_raw_result
+from src.services.processing.processing_result_store import (
+    normalize_raw_result,
+    processing_result_json,
+)
 from src.services.state_machines.base_phase_flow import BasePhaseFlow
 
 logger = logging.getLogger("app")
@@ -98,7 +101,9 @@ async def _write_processed(
         raise RuntimeError(
             f"[ProcessingFlow] UoW required to persist processed data for {session_id}"
         )
-    await uow.processing_attempts.append(session_id, pir, raw_result)
+    await uow.processing_attempts.append(
+        session_id, pir, raw_result, processing_result_json(raw_result)
+    )
     logger.info(f"[ProcessingFlow] Appended processing attempt to DB for {session_id}")
     logger.info(f"[ProcessingFlow] Wrote processed.json for {session_id}")
 
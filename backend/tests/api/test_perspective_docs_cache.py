@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api import dialogue
+from src.db.content_cache import ContentCache
+from src.db.models.knowledge_tables import PerspectiveDocumentTable
+from src.db.repositories.perspective_doc_repo import PerspectiveDocRepository
+
+
+@pytest.fixture
+async def knowledge_factory(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'knowledge.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(
+            PerspectiveDocumentTable(
+                id="us_nss",
+                perspective="us",
+                section="political",
+                title="National Security Strategy",
+                markdown_content="Original text",
+            )
+        )
+        await session.commit()
+
+    monkeypatch.setattr(dialogue, "get_knowledge_session_factory", lambda: factory)
+    monkeypatch.setattr(dialogue, "_perspective_docs_cache", ContentCache(1024 * 1024))
+    yield factory
+    await engine.dispose()
+
+
+@pytest.mark.usefixtures("knowledge_factory")
+async def test_perspective_docs_are_served_from_cache(monkeypatch):
+    first = await dialogue._load_perspective_docs(["us", "norway"])
+    assert "Original text" in first["us"]
+    assert "norway" not in first
+
+    async def fail(*_args, **_kwargs):
+        raise AssertionError("documents reloaded despite unchanged version")
+
+    monkeypatch.setattr(PerspectiveDocRepository, "list_by_perspective", fail)
+    assert await dialogue._load_perspective_docs(["us", "norway"]) == first
+    assert dialogue.perspective_docs_cache_stats()["hits"] == 2
+
+
+async def test_perspective_docs_revalidate_after_update(knowledge_factory):
+    await dialogue._load_perspective_docs(["us"])
+
+    async with knowledge_factory() as session:
+        doc = await session.get(PerspectiveDocumentTable, "us_nss")
+        doc.markdown_content = "Revised text"
+        session.add(doc)
+        await session.commit()
+
+    docs = await dialogue._load_perspective_docs(["us"])
+    assert "Revised text" in docs["us"]
+
+
+async def test_same_length_edit_changes_version(knowledge_factory):
+    async with knowledge_factory() as session:
+        repo = PerspectiveDocRepository(session)
+        before = await repo.version("us")
+        doc = await session.get(PerspectiveDocumentTable, "us_nss")
+        doc.markdown_content = "Original texT"
+        session.add(doc)
+        await session.commit()
+        assert await repo.version("us") != before
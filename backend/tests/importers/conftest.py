@@ -1,10 +1,40 @@
+from pathlib import Path
+
 import pytest
+from alembic import command
+from alembic.config import Config
 
 from src.api import main
 
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
 
 # For mocking the upload path in tests to prevent test data from being saved
 @pytest.fixture
 def mock_upload_path(tmp_path, monkeypatch):
     monkeypatch.setattr(main, "UPLOADS_ROOT", tmp_path)
     return tmp_path
+
+
+def _sessions_config() -> Config:
+    cfg = Config(str(_BACKEND_ROOT / "alembic_sessions.ini"))
+    cfg.set_main_option(
+        "script_location", str(_BACKEND_ROOT / "src" / "db" / "migrations_sessions")
+    )
+    return cfg
+
+
+@pytest.fixture
+def sessions_db(tmp_path, monkeypatch):
+    """Fresh sessions.db migrated to head (includes the FTS5 upload index)."""
+    db_path = tmp_path / "sessions.db"
+    monkeypatch.setenv("SESSIONS_DB_PATH", str(db_path))
+    command.upgrade(_sessions_config(), "head")
+    return db_path
+
+
+@pytest.fixture
+def sessions_migrations(tmp_path, monkeypatch):
+    """Alembic config for a sessions.db left unmigrated, for upgrade tests."""
+    monkeypatch.setenv("SESSIONS_DB_PATH", str(tmp_path / "sessions.db"))
+    return _sessions_config()
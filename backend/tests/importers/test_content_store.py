@@ -0,0 +1,235 @@
+import hashlib
+import io
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from alembic import command
+
+from src.importers.content_store import ContentStore
+from src.importers.session_uploads import (
+    build_page_index,
+    delete_session_upload,
+    delete_session_uploads,
+    read_parsed_markdown,
+    save_session_upload,
+    split_parsed_markdown,
+)
+
+
+def _build_pdf(pages: int) -> bytes:
+    pytest.importorskip("reportlab")
+    from reportlab.pdfgen import canvas
+
+    stream = io.BytesIO()
+    canv = canvas.Canvas(stream)
+    canv.setTitle("Threat Report")
+    for number in range(1, pages + 1):
+        canv.drawString(72, 720, f"Content of page {number}.")
+        canv.showPage()
+    canv.save()
+    return stream.getvalue()
+
+
+def _upload(uploads_root: Path, session_id: str, content: bytes, **kwargs) -> dict:
+    return save_session_upload(
+        file_obj=io.BytesIO(content),
+        filename="report.pdf",
+        session_id=session_id,
+        uploads_root=uploads_root,
+        mime_type="application/pdf",
+        **kwargs,
+    )
+
+
+def test_reupload_in_another_session_reuses_parse_and_blob(tmp_path, sessions_db):
+    pytest.importorskip("pypdf")
+    uploads_root = tmp_path / "imports"
+    content = _build_pdf(2)
+
+    first = _upload(uploads_root, "session-a", content)
+    second = _upload(uploads_root, "session-b", content, defer_pdf_parse=True)
+
+    # Cached parse: no pending state even though parsing was deferred
+    assert second["parse_status"] == "ready"
+    assert second["citation"] == first["citation"]
+    # The re-upload stores only its own head and references the shared body
+    stub = Path(second["parsed_markdown_path"]).read_text(encoding="utf-8")
+    assert 'session_id: "session-b"' in stub
+    assert "Content of page" not in stub
+    markdown = read_parsed_markdown(Path(second["parsed_markdown_path"]))
+    assert "Content of page 2." in markdown
+    assert (
+        split_parsed_markdown(markdown)[1]
+        == split_parsed_markdown(
+            Path(first["parsed_markdown_path"]).read_text(encoding="utf-8")
+        )[1]
+    )
+
+    assert Path(first["path"]).stat().st_ino == Path(second["path"]).stat().st_ino
+    assert len(ContentStore(uploads_root).refs(first["sha256"])) == 2
+
+    conn = sqlite3.connect(sessions_db)
+    rows = conn.execute(
+        "SELECT content_ref, parsed_content FROM uploaded_files ORDER BY session_id"
+    ).fetchall()
+    ref_count, body = conn.execute(
+        "SELECT ref_count, body FROM parsed_documents"
+    ).fetchone()
+    conn.close()
+    assert [row[0] for row in rows] == [first["sha256"]] * 2
+    assert all("Content of page" not in row[1] for row in rows)
+    assert ref_count == 2
+    assert "Content of page 1." in body
+
+
+def test_content_released_with_last_reference(tmp_path, sessions_db):
+    pytest.importorskip("pypdf")
+    uploads_root = tmp_path / "imports"
+    content = _build_pdf(1)
+    first = _upload(uploads_root, "session-a", content)
+    _upload(uploads_root, "session-b", content)
+    entry_dir = ContentStore(uploads_root).entry_dir(first["sha256"])
+
+    delete_session_upload(
+        session_id="session-a",
+        file_upload_id=first["file_upload_id"],
+        uploads_root=uploads_root,
+    )
+    assert entry_dir.exists()
+    conn = sqlite3.connect(sessions_db)
+    assert conn.execute("SELECT ref_count FROM parsed_documents").fetchone() == (1,)
+
+    delete_session_uploads(session_id="session-b", uploads_root=uploads_root)
+    assert not entry_dir.exists()
+    assert conn.execute("SELECT COUNT(*) FROM parsed_documents").fetchone() == (0,)
+    assert conn.execute("SELECT COUNT(*) FROM uploaded_files").fetchone() == (0,)
+    conn.close()
+
+
+def _insert_legacy_upload(db_path: Path, content: bytes) -> str:
+    """An upload as stored before 003: full markdown in parsed_content."""
+    sha256 = hashlib.sha256(content).hexdigest()
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO uploaded_files (id, session_id, sha256, uploaded_at, "
+        "parse_status, searchable, parsed_content) "
+        "VALUES ('legacy', 'session-old', ?, '2026-01-01', 'ready', 1, ?)",
+        (
+            sha256,
+            '---\nsession_id: "session-old"\n---\n\n# Threat Report\n\n'
+            "## Page 1\nContent of page 1.\n",
+        ),
+    )
+    conn.commit()
+    conn.close()
+    return sha256
+
+
+def _legacy_text(db_path: Path) -> str:
+    conn = sqlite3.connect(db_path)
+    (text,) = conn.execute(
+        "SELECT COALESCE(u.parsed_content, '') || COALESCE(p.body, '') "
+        "FROM uploaded_files u LEFT JOIN parsed_documents p "
+        "ON p.sha256 = u.content_ref WHERE u.id = 'legacy'"
+    ).fetchone()
+    conn.close()
+    return text
+
+
+def test_releasing_new_upload_keeps_body_of_migrated_legacy_upload(
+    tmp_path, sessions_migrations
+):
+    pytest.importorskip("pypdf")
+    db_path = tmp_path / "sessions.db"
+    content = _build_pdf(1)
+    command.upgrade(sessions_migrations, "002")
+    sha256 = _insert_legacy_upload(db_path, content)
+    command.upgrade(sessions_migrations, "head")
+
+    uploads_root = tmp_path / "imports"
+    entry = _upload(uploads_root, "session-a", content)
+    assert entry["sha256"] == sha256
+    delete_session_upload(
+        session_id="session-a",
+        file_upload_id=entry["file_upload_id"],
+        uploads_root=uploads_root,
+    )
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT ref_count FROM parsed_documents").fetchone() == (1,)
+    assert conn.execute("SELECT COUNT(*) FROM upload_pages").fetchone()[0] > 0
+    conn.close()
+    assert "Content of page 1." in _legacy_text(db_path)
+
+
+def test_downgrade_restores_bodies_of_split_uploads(tmp_path, sessions_migrations):
+    db_path = tmp_path / "sessions.db"
+    command.upgrade(sessions_migrations, "002")
+    _insert_legacy_upload(db_path, b"legacy bytes")
+    command.upgrade(sessions_migrations, "head")
+    assert "Content of page 1." not in _read_head(db_path)
+
+    command.downgrade(sessions_migrations, "002")
+
+    assert "Content of page 1." in _read_head(db_path)
+
+
+def _read_head(db_path: Path) -> str:
+    conn = sqlite3.connect(db_path)
+    (head,) = conn.execute(
+        "SELECT parsed_content FROM uploaded_files WHERE id = 'legacy'"
+    ).fetchone()
+    conn.close()
+    return head
+
+
+def test_unreadable_pdf_failure_is_cached(tmp_path):
+    uploads_root = tmp_path / "imports"
+    entry = _upload(uploads_root, "session-a", b"%PDF-1.4\nnot-a-real-pdf")
+
+    assert entry["parse_status"] == "failed"
+    cached = ContentStore(uploads_root).lookup(entry["sha256"])
+    if entry["search_skip_reason"] == "pypdf_not_available":
+        assert cached is None
+    else:
+        assert cached == {"error": "pdf_read_failed"}
+
+
+def test_split_parsed_markdown_and_page_index():
+    markdown = (
+        '---\nsession_id: "s"\n---\n\n# Title\n\n## Page 1\nabc\n\n## Page 2\ndef\n'
+    )
+
+    head, body = split_parsed_markdown(markdown)
+    index = build_page_index(body)
+
+    assert head + body == markdown
+    assert head.endswith("# Title\n")
+    assert [item["page"] for item in index] == [1, 2]
+    assert body[index[1]["start"] : index[1]["end"]] == "## Page 2\ndef\n"
+    assert json.dumps(index)
+
+
+def test_parsed_pages_are_indexed_for_full_text_search(tmp_path, sessions_db):
+    pytest.importorskip("pypdf")
+    uploads_root = tmp_path / "imports"
+    content = _build_pdf(3)
+    entry = _upload(uploads_root, "session-a", content)
+    _upload(uploads_root, "session-b", content)
+
+    conn = sqlite3.connect(sessions_db)
+    rows = conn.execute(
+        "SELECT page, content FROM upload_pages WHERE upload_pages MATCH ? "
+        "ORDER BY bm25(upload_pages)",
+        ('"page" AND "2"',),
+    ).fetchall()
+    assert rows == [(2, "Content of page 2.")]
+
+    delete_session_uploads(session_id="session-a", uploads_root=uploads_root)
+    delete_session_uploads(session_id="session-b", uploads_root=uploads_root)
+    assert conn.execute(
+        "SELECT COUNT(*) FROM upload_pages WHERE sha256 = ?", (entry["sha256"],)
+    ).fetchone() == (0,)
+    conn.close()
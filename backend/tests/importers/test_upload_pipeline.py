@@ -0,0 +1,156 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from src.importers.session_uploads import (
+    complete_pdf_parse,
+    delete_session_upload,
+    get_session_upload,
+    read_pdf_info,
+    save_session_upload,
+)
+from src.importers.upload_pipeline import UploadParsePipeline
+
+
+def _build_pdf(pages: int) -> bytes:
+    pytest.importorskip("reportlab")
+    from reportlab.pdfgen import canvas
+
+    stream = io.BytesIO()
+    canv = canvas.Canvas(stream)
+    canv.setAuthor("Jane Analyst")
+    canv.setTitle("Threat Report")
+    for number in range(1, pages + 1):
+        canv.drawString(72, 720, f"Content of page {number}.")
+        canv.showPage()
+    canv.save()
+    return stream.getvalue()
+
+
+def _save_pending(tmp_path: Path, content: bytes) -> dict:
+    return save_session_upload(
+        file_obj=io.BytesIO(content),
+        filename="report.pdf",
+        session_id="session-a",
+        uploads_root=tmp_path,
+        mime_type="application/pdf",
+        defer_pdf_parse=True,
+    )
+
+
+def test_deferred_pdf_upload_is_registered_as_pending(tmp_path):
+    entry = _save_pending(tmp_path, _build_pdf(1))
+
+    assert entry["parse_status"] == "pending"
+    assert entry["searchable"] is False
+    assert not Path(entry["parsed_markdown_path"]).exists()
+    stored = get_session_upload(
+        session_id="session-a",
+        file_upload_id=entry["file_upload_id"],
+        uploads_root=tmp_path,
+    )
+    assert stored["parse_status"] == "pending"
+
+
+async def test_pipeline_parses_page_ranges_in_order(tmp_path):
+    pytest.importorskip("pypdf")
+    entry = _save_pending(tmp_path, _build_pdf(5))
+
+    pipeline = UploadParsePipeline(max_workers=2, pages_per_task=2)
+    pipeline.start()
+    try:
+        pipeline.submit(entry, tmp_path)
+    finally:
+        await pipeline.stop()
+
+    stored = get_session_upload(
+        session_id="session-a",
+        file_upload_id=entry["file_upload_id"],
+        uploads_root=tmp_path,
+    )
+    assert stored["parse_status"] == "ready"
+    assert stored["searchable"] is True
+    assert stored["citation"]["author"] == "Jane Analyst"
+
+    markdown = Path(stored["parsed_markdown_path"]).read_text(encoding="utf-8")
+    positions = [markdown.index(f"Content of page {n}.") for n in range(1, 6)]
+    assert positions == sorted(positions)
+    assert "## Page 5" in markdown
+
+    stats = pipeline.stats()
+    assert stats["completed"] == 1
+    assert stats["pages_parsed"] == 5
+    assert stats["queue_length"] == 0
+
+
+def test_complete_pdf_parse_marks_unreadable_pdf_failed(tmp_path):
+    entry = _save_pending(tmp_path, b"%PDF-1.4\nnot-a-real-pdf")
+
+    result = complete_pdf_parse(
+        entry=entry,
+        uploads_root=tmp_path,
+        info=read_pdf_info(Path(entry["path"]), entry["filename"]),
+        page_texts=None,
+    )
+
+    assert result["parse_status"] == "failed"
+    assert result["searchable"] is False
+
+
+def test_complete_pdf_parse_skips_upload_deleted_while_parsing(tmp_path):
+    pytest.importorskip("pypdf")
+    entry = _save_pending(tmp_path, _build_pdf(1))
+    info = read_pdf_info(Path(entry["path"]), entry["filename"])
+    delete_session_upload(
+        session_id="session-a",
+        file_upload_id=entry["file_upload_id"],
+        uploads_root=tmp_path,
+    )
+
+    result = complete_pdf_parse(
+        entry=entry, uploads_root=tmp_path, info=info, page_texts=["text"]
+    )
+
+    assert result is None
+    assert not Path(entry["parsed_markdown_path"]).exists()
+
+
+async def test_resume_pending_requeues_uploads_left_by_previous_run(tmp_path):
+    pytest.importorskip("pypdf")
+    entry = _save_pending(tmp_path, _build_pdf(2))
+
+    pipeline = UploadParsePipeline(max_workers=1)
+    pipeline.start()
+    try:
+        assert await pipeline.resume_pending(tmp_path) == 1
+    finally:
+        await pipeline.stop()
+
+    stored = get_session_upload(
+        session_id="session-a",
+        file_upload_id=entry["file_upload_id"],
+        uploads_root=tmp_path,
+    )
+    assert stored["parse_status"] == "ready"
+    assert pipeline.stats()["completed"] == 1
+
+
+async def test_resume_pending_fails_uploads_whose_file_is_gone(tmp_path):
+    entry = _save_pending(tmp_path, _build_pdf(1))
+    Path(entry["path"]).unlink()
+
+    pipeline = UploadParsePipeline(max_workers=1)
+    pipeline.start()
+    try:
+        assert await pipeline.resume_pending(tmp_path) == 0
+    finally:
+        await pipeline.stop()
+
+    stored = get_session_upload(
+        session_id="session-a",
+        file_upload_id=entry["file_upload_id"],
+        uploads_root=tmp_path,
+    )
+    assert stored["parse_status"] == "failed"
+    assert pipeline.stats()["failed"] == 1
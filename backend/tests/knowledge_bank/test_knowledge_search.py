@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.models.knowledge_tables import KnowledgeResourceTable
+from src.db.repositories import knowledge_repo
+from src.db.repositories.knowledge_repo import KnowledgeRepository
+
+
+def _resource(resource_id: str, keywords: list[str], priority: int = 1):
+    return KnowledgeResourceTable(
+        id=resource_id,
+        category=resource_id.split("/")[0],
+        keywords=json.dumps(keywords),
+        priority=priority,
+        markdown_content=f"# {resource_id}",
+    )
+
+
+@pytest.fixture
+async def session(tmp_path):
+    knowledge_repo.invalidate_knowledge_index()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'knowledge.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as db_session:
+        yield db_session
+    await engine.dispose()
+    knowledge_repo.invalidate_knowledge_index()
+
+
+async def test_search_ranks_by_hits_then_priority(session):
+    repo = KnowledgeRepository(session)
+    await repo.bulk_upsert(
+        [
+            _resource("geopolitical/norway_russia", ["norway", "russia"], priority=2),
+            _resource("actors/apt28", ["apt28", "russia"], priority=1),
+            _resource("sectors/energy", ["energy"], priority=1),
+        ]
+    )
+
+    results = await repo.search("APT28 targeted Norway and Russia")
+
+    assert [r.id for r in results] == ["actors/apt28", "geopolitical/norway_russia"]
+    assert results[0].markdown_content == "# actors/apt28"
+    assert [r.id for r in await repo.search("russia", limit=1)] == ["actors/apt28"]
+    assert await repo.search("nothing relevant") == []
+
+
+async def test_bulk_upsert_refreshes_index(session):
+    repo = KnowledgeRepository(session)
+    await repo.bulk_upsert([_resource("sectors/energy", ["energy"])])
+    assert [r.id for r in await repo.search("energy grid")] == ["sectors/energy"]
+
+    await repo.bulk_upsert([_resource("sectors/energy", ["pipeline"])])
+
+    assert await repo.search("energy grid") == []
+    assert [r.id for r in await repo.search("pipeline")] == ["sectors/energy"]
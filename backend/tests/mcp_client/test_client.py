@@ -3,7 +3,7 @@
 import pytest
 from mcp.types import TextContent
 
-from src.mcp_client.client import MCPClient
+from src.mcp_client.client import MCPClient, clear_prompt_cache
 from src.models.dialogue import DialogueContext
 
 
@@ -197,3 +197,68 @@ class TestMCPClientCallToolParsing:
         client = self._make_client_with_response("Hello from the server")
         result = await client.call_tool("greet", {})
         assert result == "Hello from the server"
+
+
+class TestMCPClientPromptCache:
+    """get_prompt reuses rendered prompts per server version and arguments."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_prompt_cache()
+        yield
+        clear_prompt_cache()
+
+    def _make_client(self, version: str | None, calls: list) -> MCPClient:
+        client = MCPClient("http://fake/sse")
+        client.server_version = version
+
+        class MockSession:
+            async def get_prompt(self, name, arguments):
+                calls.append((name, arguments))
+
+                class PromptMessage:
+                    content = TextContent(type="text", text=f"{name}:{len(calls)}")
+
+                class PromptResult:
+                    messages = [PromptMessage()]
+
+                return PromptResult()
+
+        client.session = MockSession()  # type: ignore
+        return client
+
+    @pytest.mark.asyncio
+    async def test_same_arguments_are_served_from_cache(self) -> None:
+        calls: list = []
+        first = self._make_client("abc", calls)
+        assert (
+            await first.get_prompt("collection_plan", {"pir": "x"})
+            == "collection_plan:1"
+        )
+
+        # A new client (next request) against the same server version hits the cache.
+        second = self._make_client("abc", calls)
+        assert (
+            await second.get_prompt("collection_plan", {"pir": "x"})
+            == "collection_plan:1"
+        )
+        assert (
+            await second.get_prompt("collection_plan", {"pir": "y"})
+            == "collection_plan:2"
+        )
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_new_server_version_invalidates_cache(self) -> None:
+        calls: list = []
+        await self._make_client("abc", calls).get_prompt("direction_pir", {})
+        await self._make_client("def", calls).get_prompt("direction_pir", {})
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_unversioned_server_is_not_cached(self) -> None:
+        calls: list = []
+        client = self._make_client(None, calls)
+        await client.get_prompt("direction_pir", {})
+        await client.get_prompt("direction_pir", {})
+        assert len(calls) == 2
@@ -0,0 +1,89 @@
+import json
+
+from src.services.collection import collected_data
+from src.services.collection.collected_data import (
+    COLLECTION_SEPARATOR,
+    CollectedData,
+    parse_document,
+)
+from src.services.collection.collection_service import (
+    CollectionService,
+    _append_to_collected_data,
+    _strip_search_snippet_items,
+)
+
+
+def _attempt(*items: dict) -> str:
+    return "```json\n" + json.dumps({"collected_data": list(items)}) + "\n```"
+
+
+def test_collected_data_edits_and_serialises_once():
+    document = CollectedData.parse(
+        _attempt(
+            {
+                "source": "google_search",
+                "resource_id": "https://a",
+                "content": "snippet",
+            },
+            {"source": "query_otx", "resource_id": "APT29", "content": "pulse"},
+        )
+    )
+    document.extend(
+        [{"source": "fetch_page", "resource_id": "https://a", "content": "æøå"}]
+    )
+
+    assert document.drop_sources({"google_search"}) == 1
+    payload = json.loads(document.dumps())
+    assert [item["source"] for item in payload["collected_data"]] == [
+        "query_otx",
+        "fetch_page",
+    ]
+    assert "æøå" in document.dumps()
+
+
+def test_string_helpers_match_structured_edits():
+    raw = _attempt(
+        {"source": "google_search", "resource_id": "https://a", "content": "s"}
+    )
+
+    appended = _append_to_collected_data(
+        raw, [{"source": "fetch_page", "content": "x"}]
+    )
+    assert len(json.loads(appended)["collected_data"]) == 2
+    assert json.loads(_strip_search_snippet_items(appended))["collected_data"] == [
+        {"source": "fetch_page", "content": "x"}
+    ]
+    assert _strip_search_snippet_items("not json") == "not json"
+
+
+def test_accumulated_attempts_are_parsed_once(monkeypatch):
+    calls = []
+    original = collected_data._parse_document
+
+    def counting_parse(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(collected_data, "_parse_document", counting_parse)
+    collected_data._documents.clear()
+
+    first = _attempt({"source": "query_otx", "resource_id": "APT28", "content": "one"})
+    second = _attempt({"source": "query_otx", "resource_id": "APT29", "content": "two"})
+    accumulated = f"{first}\n\n{COLLECTION_SEPARATOR}\n\n{second}"
+
+    CollectionService.parse_collected_data(first)
+    result = CollectionService.parse_collected_data(accumulated)
+    CollectionService.parse_collected_data(accumulated)
+
+    assert [item["resource_id"] for item in result["collected_data"]] == [
+        "APT28",
+        "APT29",
+    ]
+    assert len(calls) == 2
+
+
+def test_cached_documents_are_not_shared_between_callers():
+    raw = _attempt({"source": "query_otx", "resource_id": "APT28", "content": "one"})
+    parse_document(raw)["collected_data"][0]["content"] = "mutated"
+
+    assert parse_document(raw)["collected_data"][0]["content"] == "one"
@@ -3,23 +3,28 @@
 Uses respx to mock httpx requests and pytest-asyncio for async tests.
 """
 
-import time
-
 import httpx
 import pytest
 import respx
 
 from src.models.enums import DataSource, IOCType, ThreatLevel
 from src.models.sources.otx import OTXIndicator
-from src.services.collection.otx_collector import OTXCollector
+from src.services.collection import otx_collector
+from src.services.collection.otx_collector import OTXCollector, TokenBucket
 
 BASE = "https://otx.alienvault.com/api/v1"
 
 
 @pytest.fixture
 def collector(monkeypatch):
-    """OTXCollector with a test API key."""
+    """OTXCollector with a test API key and fresh process-wide state."""
     monkeypatch.setenv("OTX_API_KEY", "test-key-123")
+    monkeypatch.setattr(
+        otx_collector,
+        "_rate_limiter",
+        TokenBucket(OTXCollector.MAX_REQUESTS_PER_MINUTE),
+    )
+    monkeypatch.setattr(otx_collector, "_etag_cache", otx_collector.OrderedDict())
     return OTXCollector()
 
 
@@ -44,21 +49,39 @@ class TestInit:
 
 
 class TestRateLimiting:
-    def test_no_delay_under_limit(self, collector):
-        assert collector._enforce_rate_limit() == 0.0
-
-    def test_delay_at_limit(self, collector):
-        now = time.monotonic()
-        collector._request_timestamps = [now - i for i in range(10)]
-        wait = collector._enforce_rate_limit()
-        assert wait > 0
-
-    def test_old_timestamps_pruned(self, collector):
-        old = time.monotonic() - 120
-        collector._request_timestamps = [old] * 15
-        wait = collector._enforce_rate_limit()
-        assert wait == 0.0
-        assert len(collector._request_timestamps) == 0
+    def test_no_delay_under_limit(self):
+        bucket = TokenBucket(10)
+        assert all(bucket.reserve() == 0.0 for _ in range(10))
+
+    def test_delay_at_limit(self):
+        bucket = TokenBucket(10)
+        for _ in range(10):
+            bucket.reserve()
+        first_wait = bucket.reserve()
+        assert first_wait == pytest.approx(6.0, abs=0.1)
+        # Queued callers are spaced out, not all released at once
+        assert bucket.reserve() == pytest.approx(12.0, abs=0.1)
+
+    def test_tokens_refill_over_time(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(otx_collector.time, "monotonic", lambda: now[0])
+        bucket = TokenBucket(10)
+        for _ in range(10):
+            bucket.reserve()
+        now[0] += 60
+        assert bucket.reserve() == 0.0
+
+    def test_pause_delays_every_caller(self):
+        bucket = TokenBucket(10)
+        bucket.pause(5)
+        assert bucket.reserve() == pytest.approx(5.0, abs=0.1)
+
+    @pytest.mark.usefixtures("collector")
+    def test_limiter_is_shared_between_collectors(self):
+        for _ in range(OTXCollector.MAX_REQUESTS_PER_MINUTE):
+            otx_collector._rate_limiter.reserve()
+        OTXCollector()  # a second collector does not get its own budget
+        assert otx_collector._rate_limiter.reserve() > 0
 
 
 # ------------------------------------------------------------------
@@ -100,6 +123,38 @@ class TestBackoff:
         with pytest.raises(httpx.HTTPStatusError):
             await collector._request("GET", "test")
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_honours_retry_after(self, collector, monkeypatch):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(otx_collector.asyncio, "sleep", fake_sleep)
+        respx.get(f"{BASE}/test").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        result = await collector._request("GET", "test")
+        assert result == {"ok": True}
+        assert sleeps[0] == 7.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_revalidates_with_etag(self, collector):
+        route = respx.get(f"{BASE}/pulses/abc").mock(
+            side_effect=[
+                httpx.Response(200, json={"ok": True}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        assert await collector._request("GET", "pulses/abc") == {"ok": True}
+        assert await collector._request("GET", "pulses/abc") == {"ok": True}
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_no_retry_on_400(self, collector):
@@ -311,6 +366,27 @@ class TestSearchPulses:
         assert len(pulses) == 51
         assert route.call_count == 2
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fetches_remaining_pages_concurrently_when_count_known(
+        self, collector
+    ):
+        def page_response(request):
+            page = int(request.url.params["page"])
+            results = [
+                {**SAMPLE_PULSE, "id": f"pulse-{page}-{i}", "name": f"Pulse {i}"}
+                for i in range(50 if page < 3 else 10)
+            ]
+            return httpx.Response(200, json={"count": 110, "results": results})
+
+        route = respx.get(f"{BASE}/search/pulses").mock(side_effect=page_response)
+
+        pulses = await collector.search_pulses("APT29")
+
+        assert len(pulses) == 110
+        assert route.call_count == 3
+        assert [p.id for p in pulses][50] == "pulse-2-0"
+
 
 # ------------------------------------------------------------------
 # Type mapping
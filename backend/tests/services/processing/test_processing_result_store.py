@@ -63,7 +63,9 @@ def _write_processed_json(tmp_path, session_id: str, attempts: list[str]) -> Non
 class TestProcessingResultStore:
     """Test ProcessingResultStore."""
 
-    async def test_successful_load_returns_processing_result(self, monkeypatch, tmp_path):
+    async def test_successful_load_returns_processing_result(
+        self, monkeypatch, tmp_path
+    ):
         """Service should load the session processing result successfully."""
         monkeypatch.setattr(
             processing_service_module,
@@ -187,4 +189,125 @@ class TestProcessingResultStore:
         )
 
         with pytest.raises(ValueError, match=PROCESSING_RESULT_UNAVAILABLE_MESSAGE):
-            await ProcessingResultStore().get_processing_result("invalid-payload-session")
+            await ProcessingResultStore().get_processing_result(
+                "invalid-payload-session"
+            )
+
+
+def test_parsed_attempt_is_memoized_and_copied(monkeypatch):
+    raw = json.dumps(VALID_PROCESSING_PAYLOAD)
+    calls = []
+    original = processing_service_module._parse_processing_result
+
+    def counting_parse(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(
+        processing_service_module, "_parse_processing_result", counting_parse
+    )
+    processing_service_module._parsed_attempts.clear()
+
+    first = processing_service_module._try_parse_processing_result(raw)
+    first.findings[0].title = "mutated"
+    second = processing_service_module._try_parse_processing_result(raw)
+
+    assert len(calls) == 1
+    assert second.findings[0].title == "Credential-access activity"
+
+
+@pytest.fixture
+async def sessions_uow(tmp_path):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from src.db.unit_of_work import UnitOfWork
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sessions.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    processing_service_module._session_results.clear()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield UnitOfWork(session)
+    await engine.dispose()
+    processing_service_module._session_results.clear()
+
+
+class TestProcessingResultStoreDb:
+    async def test_loads_normalized_result_and_caches_per_session(
+        self, sessions_uow, monkeypatch
+    ):
+        raw = json.dumps(VALID_PROCESSING_PAYLOAD)
+        repo = sessions_uow.processing_attempts
+        await repo.append(
+            "s1", "PIR", raw, processing_service_module.processing_result_json(raw)
+        )
+        await repo.append("s1", "PIR", "not json", None)
+
+        parsed = []
+
+        def tracking_parse(raw):
+            parsed.append(raw)
+            return None
+
+        # Only the newer attempt without a normalized result may be parsed.
+        monkeypatch.setattr(
+            processing_service_module, "_try_parse_processing_result", tracking_parse
+        )
+
+        store = ProcessingResultStore(uow=sessions_uow)
+        first = await store.get_processing_result("s1")
+        assert first.findings[0].id == "F-001"
+        assert parsed == ["not json"]
+
+        calls = []
+        original = repo.get_latest_normalized
+
+        async def counting(session_id):
+            calls.append(session_id)
+            return await original(session_id)
+
+        monkeypatch.setattr(repo, "get_latest_normalized", counting)
+        again = await store.get_processing_result("s1")
+        assert again == first
+        assert calls == []
+
+    async def test_new_attempt_invalidates_cached_result(self, sessions_uow):
+        repo = sessions_uow.processing_attempts
+        raw = json.dumps(VALID_PROCESSING_PAYLOAD)
+        await repo.append(
+            "s1", "PIR", raw, processing_service_module.processing_result_json(raw)
+        )
+        store = ProcessingResultStore(uow=sessions_uow)
+        await store.get_processing_result("s1")
+
+        updated = json.loads(raw)
+        updated["gaps"] = ["New gap."]
+        # Attempt stored before normalization existed: parsed from raw_result.
+        await repo.append("s1", "PIR", json.dumps(updated), None)
+
+        result = await store.get_processing_result("s1")
+        assert result.gaps == ["New gap."]
+
+    async def test_replaced_attempt_with_reused_id_invalidates_cached_result(
+        self, sessions_uow
+    ):
+        repo = sessions_uow.processing_attempts
+        raw = json.dumps(VALID_PROCESSING_PAYLOAD)
+        await repo.append("s1", "PIR", raw, None)
+        store = ProcessingResultStore(uow=sessions_uow)
+        await store.get_processing_result("s1")
+
+        # SQLite hands the deleted row's id to the next insert: same count and
+        # MAX(id) as before, different result.
+        latest = await repo.get_latest("s1")
+        latest_id = latest.id
+        await repo.delete(latest)
+        updated = json.loads(raw)
+        updated["gaps"] = ["Replacement gap."]
+        replacement = await repo.append("s1", "PIR", json.dumps(updated), None)
+        assert replacement.id == latest_id
+
+        result = await store.get_processing_result("s1")
+        assert result.gaps == ["Replacement gap."]
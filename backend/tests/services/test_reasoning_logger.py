@@ -114,6 +114,87 @@ def test_logger_writes_log_entry_to_db(tmp_path, monkeypatch):
     assert rows[0][1] == "pir_generation"
 
 
+def _create_log_table(db_path) -> None:
+    import sqlite3
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS research_log_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT, entry_type TEXT, phase TEXT,
+            timestamp TEXT, content TEXT
+        )"""
+    )
+    conn.commit()
+    conn.close()
+
+
+def _count_rows(db_path, session_id: str) -> int:
+    import sqlite3
+
+    conn = sqlite3.connect(str(db_path))
+    count = conn.execute(
+        "SELECT COUNT(*) FROM research_log_entries WHERE session_id = ?",
+        (session_id,),
+    ).fetchone()[0]
+    conn.close()
+    return count
+
+
+def test_log_writer_batches_entries_and_flushes_on_stop(tmp_path, monkeypatch):
+    import src.services.reasearch_logger as logger_module
+
+    db_path = tmp_path / "test_sessions.db"
+    monkeypatch.setenv("SESSIONS_DB_PATH", str(db_path))
+    monkeypatch.setenv("RESEARCH_LOG_BATCH_SIZE", "10")
+    monkeypatch.setenv("RESEARCH_LOG_FLUSH_INTERVAL_MS", "5000")
+    monkeypatch.setattr(logger_module, "_conn", None)
+    monkeypatch.setattr(logger_module, "_writer", None)
+    _create_log_table(db_path)
+
+    writer = logger_module.start_log_writer()
+    session_id = str(uuid4())
+    research_logger = ResearchLogger(session_id=session_id)
+    for i in range(25):
+        research_logger.create_log({"action": "user_action", "index": i})
+
+    logger_module.stop_log_writer()
+
+    assert _count_rows(db_path, session_id) == 25
+    stats = writer.stats()
+    assert stats["written"] == 25
+    assert stats["enqueued"] == 25
+    assert stats["max_batch_size"] <= 10
+    assert stats["batches"] >= 3
+    assert not stats["running"]
+
+
+def test_log_writer_falls_back_to_inline_write_when_queue_full(tmp_path, monkeypatch):
+    import src.services.reasearch_logger as logger_module
+
+    db_path = tmp_path / "test_sessions.db"
+    monkeypatch.setenv("SESSIONS_DB_PATH", str(db_path))
+    monkeypatch.setattr(logger_module, "_conn", None)
+    _create_log_table(db_path)
+
+    writer = logger_module.ResearchLogWriter(max_queue_size=2)
+    # Pretend the thread is alive but never draining, so the queue fills up.
+    monkeypatch.setattr(
+        logger_module.ResearchLogWriter, "is_running", property(lambda _self: True)
+    )
+    monkeypatch.setattr(logger_module, "_writer", writer)
+
+    session_id = str(uuid4())
+    research_logger = ResearchLogger(session_id=session_id)
+    for i in range(5):
+        research_logger.create_log({"action": "user_action", "index": i})
+
+    # 2 queued, 3 written inline by the caller
+    assert _count_rows(db_path, session_id) == 3
+    assert writer.stats()["backpressure_rejections"] == 3
+    assert writer.stats()["queue_depth"] == 2
+
+
 @pytest.mark.asyncio
 async def test_orchestrator_logs_reasoning():
     context = DialogueContext()
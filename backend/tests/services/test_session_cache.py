@@ -0,0 +1,123 @@
+# Tests for the bounded in-memory session cache used by the dialogue API
+
+from src.api.dialogue import IntelligenceSession
+from src.db.mappers import session_to_columns, session_to_row
+from src.services.reasearch_logger import ResearchLogger
+from src.services.session_cache import SessionCache, TombstoneSet
+from src.services.state_machines.collection_flow import CollectionFlow
+
+
+def _make_session(session_id: str) -> IntelligenceSession:
+    return IntelligenceSession(session_id, ResearchLogger(session_id))
+
+
+def test_new_session_diff_is_full_row():
+    cache = SessionCache()
+    session = _make_session("s-1")
+    cache.put("s-1", session)
+
+    diff = cache.diff("s-1", session, session_to_columns(session))
+
+    assert diff.is_new
+    assert set(diff.dirty_flows) == set(diff.columns)
+
+
+def test_unchanged_session_has_no_dirty_flows():
+    cache = SessionCache()
+    session = _make_session("s-1")
+    columns = session_to_columns(session)
+    cache.put("s-1", session, persisted=columns)
+
+    diff = cache.diff("s-1", session, session_to_columns(session))
+
+    assert not diff.is_new
+    assert diff.dirty_flows == []
+    assert diff.changed == {}
+
+
+def test_only_changed_flow_columns_are_reported():
+    cache = SessionCache()
+    session = _make_session("s-1")
+    cache.put("s-1", session, persisted=session_to_columns(session))
+
+    session.collection_flow = CollectionFlow(session_id="s-1")
+    diff = cache.diff("s-1", session, session_to_columns(session))
+
+    assert "collection" in diff.dirty_flows
+    assert "direction" not in diff.dirty_flows
+    assert diff.changed["collection_state"] == session.collection_flow.state.value
+    assert not any(key.startswith("direction") for key in diff.changed)
+
+
+def test_stale_session_object_is_treated_as_new():
+    cache = SessionCache()
+    cached = _make_session("s-1")
+    cache.put("s-1", cached, persisted=session_to_columns(cached))
+    stale = _make_session("s-1")
+
+    assert cache.diff("s-1", stale, session_to_columns(stale)).is_new
+
+
+def test_session_to_row_matches_columns():
+    session = _make_session("s-1")
+    session.collection_flow = CollectionFlow(session_id="s-1")
+    row = session_to_row(session)
+
+    assert row.id == "s-1"
+    assert row.collection_state == session.collection_flow.state.value
+    assert row.processing_state is None
+
+
+def test_cache_evicts_least_recently_used_beyond_max_entries():
+    cache = SessionCache(max_entries=2)
+    cache["a"] = _make_session("a")
+    cache["b"] = _make_session("b")
+    assert cache.get("a") is not None  # "a" is now most recently used
+    cache["c"] = _make_session("c")
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_evicts_by_memory_budget():
+    cache = SessionCache(max_bytes=1)
+    cache.put("a", _make_session("a"), persisted={"direction": {"x": "y" * 100}})
+    cache.put("b", _make_session("b"), persisted={"direction": {"x": "y" * 100}})
+
+    # The most recently used entry is always kept
+    assert len(cache) == 1
+    assert "b" in cache
+
+
+def test_cache_expires_idle_sessions(monkeypatch):
+    import src.services.session_cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = SessionCache(idle_ttl_seconds=60)
+    cache["old"] = _make_session("old")
+    now[0] += 120
+    cache["new"] = _make_session("new")
+
+    assert "old" not in cache
+    assert cache.stats()["expirations"] == 1
+
+
+def test_tombstones_expire_and_are_bounded(monkeypatch):
+    import src.services.session_cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    tombstones = TombstoneSet(ttl_seconds=60, max_entries=2)
+    tombstones.add("a")
+    tombstones.add("b")
+    tombstones.add("c")
+
+    assert "a" not in tombstones
+    assert "b" in tombstones and "c" in tombstones
+
+    now[0] += 120
+    assert "c" not in tombstones
+    assert len(tombstones) == 0
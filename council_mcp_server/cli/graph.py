@@ -8,11 +8,12 @@ with MCP tools.
 import json
 import logging
 import sys
-from pathlib import Path
+from datetime import datetime
 from typing import Optional
 
 import click
 
+from decision_graph.maintenance import DecisionGraphMaintenance
 from decision_graph.storage import DecisionGraphStorage
 from deliberation.exporters import DecisionGraphExporter
 from deliberation.query_engine import QueryEngine
@@ -47,6 +48,11 @@ def graph():
     type=float,
     help="Minimum similarity threshold (0.0-1.0)",
 )
+@click.option(
+    "--deep",
+    is_flag=True,
+    help="Also search archived decisions",
+)
 @click.option(
     "--db",
     default="decision_graph.db",
@@ -59,7 +65,9 @@ def graph():
     default="table",
     help="Output format",
 )
-def similar(query: str, limit: int, threshold: float, db: str, format: str) -> None:
+def similar(
+    query: str, limit: int, threshold: float, deep: bool, db: str, format: str
+) -> None:
     """Search for similar past deliberations.
 
     Example:
@@ -69,7 +77,7 @@ def similar(query: str, limit: int, threshold: float, db: str, format: str) -> N
         storage = DecisionGraphStorage(db)
         engine = QueryEngine(storage)
 
-        results = engine._search_similar_sync(query, limit, threshold)
+        results = engine._search_similar_sync(query, limit, threshold, deep=deep)
 
         if format == "json":
             output = json.dumps(
@@ -256,12 +264,138 @@ def timeline(decision_id: str, related: bool, db: str, format: str) -> None:
         sys.exit(1)
 
 
+@graph.command("backfill-neighbors")
+@click.option(
+    "--threshold",
+    "-t",
+    default=0.5,
+    type=float,
+    help="Minimum similarity for a neighbour (0.0-1.0)",
+)
+@click.option(
+    "--chunk-size",
+    default=64,
+    type=int,
+    help="Decisions scored per batch",
+)
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Recompute all neighbour lists, not only missing ones",
+)
+@click.option(
+    "--db",
+    default="decision_graph.db",
+    help="Path to decision graph database",
+)
+def backfill_neighbors(
+    threshold: float, chunk_size: int, rebuild: bool, db: str
+) -> None:
+    """Build the top-k neighbour lists used for related-decision lookups.
+
+    Example:
+        ai-counsel graph backfill-neighbors --rebuild
+    """
+    try:
+        storage = DecisionGraphStorage(db)
+        maintenance = DecisionGraphMaintenance(storage)
+
+        result = maintenance.backfill_neighbor_lists(
+            threshold=threshold, chunk_size=chunk_size, rebuild=rebuild
+        )
+
+        click.echo(
+            f"Computed neighbour lists for {result['decisions_scanned']} of "
+            f"{result['total_decisions']} decisions "
+            f"({result['neighbor_entries']} neighbours, "
+            f"{result['elapsed_seconds']}s)"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in backfill-neighbors: {e}", exc_info=True)
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@graph.command()
+@click.option(
+    "--apply",
+    is_flag=True,
+    help="Move the candidates (default: dry run)",
+)
+@click.option(
+    "--age-days",
+    default=None,
+    type=int,
+    help="Minimum decision age in days (default: 180)",
+)
+@click.option(
+    "--unused-days",
+    default=None,
+    type=int,
+    help="Days since the decision was last retrieved (default: 90)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Archive even below the decision-count trigger",
+)
+@click.option(
+    "--db",
+    default="decision_graph.db",
+    help="Path to decision graph database",
+)
+def archive(
+    apply: bool,
+    age_days: Optional[int],
+    unused_days: Optional[int],
+    force: bool,
+    db: str,
+) -> None:
+    """Move old, unused decisions to the archive database.
+
+    Archived decisions are left out of retrieval and only found by
+    `graph similar --deep` or by ID.
+
+    Example:
+        ai-counsel graph archive --apply
+    """
+    try:
+        storage = DecisionGraphStorage(db)
+        maintenance = DecisionGraphMaintenance(storage)
+
+        result = maintenance.archive_old_decisions(
+            dry_run=not apply,
+            age_days=age_days,
+            unused_days=unused_days,
+            force=force,
+        )
+
+        click.echo(result["message"])
+        click.echo(
+            f"Candidates: {result['candidate_count']}, "
+            f"archived: {result['archived_count']} "
+            f"(archive: {result['archive_path']})"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in archive: {e}", exc_info=True)
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 @graph.command()
 @click.option(
     "--participant",
     "-p",
     help="Filter analysis by participant",
 )
+@click.option(
+    "--since",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Only analyze decisions from this date (YYYY-MM-DD)",
+)
 @click.option(
     "--db",
     default="decision_graph.db",
@@ -274,17 +408,19 @@ def timeline(decision_id: str, related: bool, db: str, format: str) -> None:
     default="summary",
     help="Output format",
 )
-def analyze(participant: Optional[str], db: str, format: str) -> None:
+def analyze(
+    participant: Optional[str], since: Optional[datetime], db: str, format: str
+) -> None:
     """Analyze voting patterns and convergence statistics.
 
     Example:
-        ai-counsel graph analyze --participant "opus@claude"
+        ai-counsel graph analyze --participant "opus@claude" --since 2025-01-01
     """
     try:
         storage = DecisionGraphStorage(db)
         engine = QueryEngine(storage)
 
-        analysis = engine._analyze_patterns_sync(participant)
+        analysis = engine._analyze_patterns_sync(participant, since)
 
         if format == "json":
             output = json.dumps(
@@ -316,6 +452,11 @@ def analyze(participant: Optional[str], db: str, format: str) -> None:
                 for key, value in analysis.convergence_stats.items():
                     click.echo(f"  {key}: {value}")
 
+            if analysis.participation_metrics:
+                click.echo("\nParticipation:")
+                for key, value in analysis.participation_metrics.items():
+                    click.echo(f"  {key}: {value}")
+
             if analysis.voting_patterns:
                 click.echo("\nVoting Patterns:")
                 for pattern in analysis.voting_patterns[:5]:
@@ -334,7 +475,7 @@ def analyze(participant: Optional[str], db: str, format: str) -> None:
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["json", "graphml", "dot", "markdown"]),
+    type=click.Choice(["json", "jsonl", "graphml", "dot", "markdown"]),
     default="json",
     help="Export format",
 )
@@ -344,47 +485,141 @@ def analyze(participant: Optional[str], db: str, format: str) -> None:
     type=click.Path(),
     help="Output file (default: stdout)",
 )
+@click.option(
+    "--gzip",
+    "compress",
+    is_flag=True,
+    help="Gzip the output",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    help="Only export what changed since the last --since-last export",
+)
+@click.option(
+    "--checkpoint",
+    default="default",
+    show_default=True,
+    help="Checkpoint name tracked by --since-last",
+)
+@click.option(
+    "--include-archived",
+    is_flag=True,
+    help="Also export archived decisions (full exports only)",
+)
 @click.option(
     "--db",
     default="decision_graph.db",
     help="Path to decision graph database",
 )
-def export(format: str, output: Optional[str], db: str) -> None:
+def export(
+    format: str,
+    output: Optional[str],
+    compress: bool,
+    since_last: bool,
+    checkpoint: str,
+    include_archived: bool,
+    db: str,
+) -> None:
     """Export decision graph to external formats.
 
-    Supports JSON, GraphML (Gephi), Graphviz DOT, and Markdown formats.
+    Supports JSON, JSON Lines, GraphML (Gephi), Graphviz DOT, and Markdown
+    formats. Decisions, similarity edges and (for JSON formats) participant
+    stances are streamed from the database straight to the output.
+
+    With --since-last only decisions stored and edges computed since the
+    previous --since-last export under the same --checkpoint are written;
+    the first run exports everything.
 
     Example:
         ai-counsel graph export --format graphml --output graph.graphml
         ai-counsel graph export --format dot | dot -Tpng > graph.png
+        ai-counsel graph export -f jsonl --gzip --since-last -o delta.jsonl.gz
     """
+    if since_last and include_archived:
+        raise click.UsageError("--include-archived applies to full exports only")
+
     try:
         storage = DecisionGraphStorage(db)
-        decisions = storage.get_all_decisions()
 
-        if not decisions:
-            click.echo("No decisions found in graph.", err=True)
-            sys.exit(1)
+        # Bounds are read before streaming so rows written meanwhile are
+        # picked up by the next incremental export rather than lost
+        started_at = datetime.now()
+        graph_version = storage.get_graph_version()
+        since_version, computed_after = 0, None
+        if since_last:
+            previous = storage.get_export_checkpoint(checkpoint)
+            if previous is not None:
+                since_version, computed_after = previous
+
+        incremental = computed_after is not None
+        total_decisions = None
+        if not incremental:
+            total_decisions = storage.count_decisions()
+            if include_archived:
+                total_decisions += storage.count_archived_decisions()
+            if not total_decisions:
+                click.echo("No decisions found in graph.", err=True)
+                sys.exit(1)
+
+        exported = 0
+
+        def decisions():
+            nonlocal exported
+            for decision in storage.iter_decisions(
+                since_version=since_version,
+                until_version=graph_version,
+                include_archived=include_archived,
+            ):
+                exported += 1
+                yield decision
+
+        similarities = storage.iter_similarities(
+            computed_after=computed_after, include_archived=include_archived
+        )
 
-        # Export based on format
-        if format == "json":
-            result = DecisionGraphExporter.to_json(decisions)
+        if format in ("json", "jsonl"):
+            stances = storage.iter_participant_stances(
+                since_version=since_version,
+                until_version=graph_version,
+                include_archived=include_archived,
+            )
+            metadata = {"graph_version": graph_version}
+            if incremental:
+                metadata["since_version"] = since_version
+                metadata["edges_computed_after"] = computed_after.isoformat()
+            iter_format = (
+                DecisionGraphExporter.iter_json
+                if format == "json"
+                else DecisionGraphExporter.iter_jsonl
+            )
+            lines = iter_format(decisions(), similarities, stances, metadata)
         elif format == "graphml":
-            result = DecisionGraphExporter.to_graphml(decisions)
+            lines = DecisionGraphExporter.iter_graphml(decisions(), similarities)
         elif format == "dot":
-            result = DecisionGraphExporter.to_dot(decisions)
+            lines = DecisionGraphExporter.iter_dot(decisions(), similarities)
         elif format == "markdown":
-            result = DecisionGraphExporter.to_markdown(decisions)
+            lines = DecisionGraphExporter.iter_markdown(
+                decisions(),
+                similarities,
+                total_decisions=total_decisions,
+                total_similarities=(
+                    None
+                    if incremental
+                    else storage.count_similarities(include_archived)
+                ),
+            )
         else:
             click.echo(f"Unknown format: {format}", err=True)
             sys.exit(1)
 
-        # Write to file or stdout
+        DecisionGraphExporter.write(lines, output, compress=compress)
+
+        if since_last:
+            storage.save_export_checkpoint(checkpoint, graph_version, started_at)
+
         if output:
-            Path(output).write_text(result)
-            click.echo(f"Exported {len(decisions)} decisions to {output}")
-        else:
-            click.echo(result)
+            click.echo(f"Exported {exported} decisions to {output}")
 
     except Exception as e:
         logger.error(f"Error in export: {e}", exc_info=True)
@@ -5,8 +5,9 @@ This module provides a high-performance two-tier cache:
 - L2: Embedding cache (decoded vectors, permanent)
 
 The cache is designed to minimize redundant embedding computations and
-similarity searches while providing event-based invalidation when new
-decisions are added to the graph.
+similarity searches. Query results are stamped with the graph version they
+were computed at, so a new decision only requires scoring that decision
+against a cached query instead of discarding the cached result.
 """
 
 import hashlib
@@ -14,7 +15,7 @@ import logging
 import time
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -170,7 +171,8 @@ class SimilarityCache:
     L1 Cache (Query Results):
     - Stores final top-k search results for questions
     - TTL-based expiration (5-10 minutes)
-    - Invalidated when new decisions added
+    - Stamped with the graph version; refreshed (not dropped) when new
+      decisions are added
     - Key: (question_hash, threshold, max_results)
 
     L2 Cache (Embeddings):
@@ -182,7 +184,7 @@ class SimilarityCache:
     Design rationale:
     - L1 provides fast retrieval of complete search results
     - L2 avoids recomputing expensive embeddings
-    - Event-based invalidation ensures consistency
+    - Version stamps keep L1 consistent across writes
     - TTL provides safety net for L1
     """
 
@@ -208,6 +210,8 @@ class SimilarityCache:
 
         # Track when cache was last invalidated
         self._last_invalidation: Optional[datetime] = None
+        # L1 entries brought up to date by merging newly added decisions
+        self._refreshes = 0
 
         logger.info(
             f"Initialized SimilarityCache (L1: {query_cache_size}, "
@@ -264,16 +268,33 @@ class SimilarityCache:
         Returns:
             List of result dicts if cached, None otherwise
         """
+        versioned = self.get_versioned_result(question, threshold, max_results)
+        return versioned[1] if versioned is not None else None
+
+    def get_versioned_result(
+        self, question: str, threshold: float, max_results: int
+    ) -> Optional[Tuple[Any, List[Dict[str, Any]]]]:
+        """Retrieve cached query results from L1 with their graph version.
+
+        Args:
+            question: Question text
+            threshold: Similarity threshold used in query
+            max_results: Max results used in query
+
+        Returns:
+            (version, results) if cached, None otherwise. version is None for
+            results cached without one.
+        """
         key = self._make_query_key(question, threshold, max_results)
-        result = self.query_cache.get(key)
+        entry = self.query_cache.get(key)
 
-        if result is not None:
+        if entry is not None:
             logger.debug(
                 f"L1 cache hit for question: {question[:50]}... "
                 f"(threshold={threshold}, max={max_results})"
             )
 
-        return result
+        return entry
 
     def cache_result(
         self,
@@ -281,6 +302,7 @@ class SimilarityCache:
         threshold: float,
         max_results: int,
         results: List[Dict[str, Any]],
+        version: Any = None,
     ) -> None:
         """Store query results in L1 cache with TTL.
 
@@ -289,9 +311,10 @@ class SimilarityCache:
             threshold: Similarity threshold used
             max_results: Max results used
             results: List of result dicts to cache
+            version: Graph version the results were computed at
         """
         key = self._make_query_key(question, threshold, max_results)
-        self.query_cache.put(key, results, ttl=self.query_ttl)
+        self.query_cache.put(key, (version, results), ttl=self.query_ttl)
 
         logger.debug(
             f"Cached L1 result for question: {question[:50]}... "
@@ -331,18 +354,22 @@ class SimilarityCache:
             f"(dim={len(embedding)})"
         )
 
+    def record_refresh(self) -> None:
+        """Count an L1 result refreshed to a newer graph version."""
+        self._refreshes += 1
+
     def invalidate_all_queries(self) -> None:
         """Invalidate all L1 query results (event-based invalidation).
 
-        Called when a new decision is added to the graph, ensuring that
-        subsequent queries will reflect the updated decision set.
+        Adding decisions does not require this (results are version-stamped);
+        use it when decisions are removed or rewritten.
 
         Note: Does NOT invalidate L2 embedding cache (embeddings are immutable).
         """
         self.query_cache.clear()
         self._last_invalidation = datetime.now()
 
-        logger.info("Invalidated all L1 query results (new decision added to graph)")
+        logger.info("Invalidated all L1 query results")
 
     def invalidate_all(self) -> None:
         """Invalidate both L1 and L2 caches completely.
@@ -383,10 +410,12 @@ class SimilarityCache:
                 self._last_invalidation.isoformat() if self._last_invalidation else None
             ),
             "query_ttl_seconds": self.query_ttl,
+            "l1_refreshes": self._refreshes,
         }
 
     def reset_stats(self) -> None:
         """Reset all statistics counters."""
         self.query_cache.reset_stats()
         self.embedding_cache.reset_stats()
+        self._refreshes = 0
         logger.debug("Reset cache statistics")
@@ -77,6 +77,7 @@ class DecisionGraphIntegration:
         self._worker_enabled = enable_background_worker
         self.maintenance = DecisionGraphMaintenance(storage)
         self._decision_count = 0
+        self._archival_task: Optional[asyncio.Task] = None
 
         # Initialize background worker if enabled
         if enable_background_worker:
@@ -102,6 +103,50 @@ class DecisionGraphIntegration:
             await self.worker.start()
             logger.info("Started background worker for similarity computation")
 
+    def _schedule_archival(self) -> None:
+        """Archive cold decisions without holding up store_deliberation.
+
+        With a running event loop the move runs in a worker thread on its own
+        storage connection (sqlite connections are bound to their thread), at
+        most one at a time. Without one, or for an in-memory database that a
+        second connection cannot see, it runs inline like the synchronous
+        similarity fallback.
+        """
+        if self._archival_task is not None and not self._archival_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or self.storage.db_path == ":memory:":
+            archival = self.maintenance.archive_old_decisions(dry_run=False)
+            self._after_archival(archival["archived_count"])
+            return
+        self._archival_task = loop.create_task(self._archive_in_background())
+
+    async def _archive_in_background(self) -> None:
+        try:
+            archived = await asyncio.to_thread(self._archive_on_own_connection)
+        except Exception as e:
+            logger.error(f"Background archival failed: {e}", exc_info=True)
+            return
+        self._after_archival(archived)
+
+    def _archive_on_own_connection(self) -> int:
+        storage = DecisionGraphStorage(db_path=self.storage.db_path)
+        try:
+            archival = DecisionGraphMaintenance(storage).archive_old_decisions(
+                dry_run=False
+            )
+        finally:
+            storage.close()
+        return archival["archived_count"]
+
+    def _after_archival(self, archived_count: int) -> None:
+        if archived_count:
+            # Cached results may reference archived decisions
+            self.retriever.invalidate_cache()
+
     def store_deliberation(self, question: str, result: DeliberationResult) -> str:
         """Store completed deliberation in decision graph.
 
@@ -164,7 +209,7 @@ class DecisionGraphIntegration:
             )
 
             # Extract and save participant stances from final round
-            stances_saved = 0
+            stances: list[ParticipantStance] = []
             if result.rounds_completed > 0 and result.full_debate:
                 # Get final round responses (last N responses where N = number of participants)
                 num_participants = len(result.participants)
@@ -202,12 +247,15 @@ class DecisionGraphIntegration:
                         final_position=final_position,
                     )
                     self.storage.save_participant_stance(stance)
-                    stances_saved += 1
+                    stances.append(stance)
 
             logger.info(
-                f"Saved {stances_saved} participant stances for decision {decision_id}"
+                f"Saved {len(stances)} participant stances for decision {decision_id}"
             )
 
+            # Render context fragments while the stances are at hand
+            self.retriever.prime_fragments(node, stances)
+
             # Increment decision count and perform periodic health checks
             self._decision_count += 1
             if self._decision_count % 100 == 0:
@@ -221,12 +269,16 @@ class DecisionGraphIntegration:
                         f"{stats['db_size_mb']} MB"
                     )
 
-                    # Warn if approaching archival threshold
+                    # Keep the hot set bounded: move cold decisions to the
+                    # archive tier once the size trigger is reached
                     total_decisions = stats.get("total_decisions", 0)
-                    if total_decisions >= 4500:
+                    trigger = self.maintenance.ARCHIVE_TRIGGER_DECISIONS
+                    if total_decisions >= trigger:
+                        self._schedule_archival()
+                    elif total_decisions >= trigger - 500:
                         logger.warning(
                             f"Decision graph approaching archival threshold: "
-                            f"{total_decisions} decisions (threshold: 5000)"
+                            f"{total_decisions} decisions (threshold: {trigger})"
                         )
 
                     # Get growth analysis periodically (every 500 decisions)
@@ -250,13 +302,14 @@ class DecisionGraphIntegration:
                     try:
                         loop = asyncio.get_event_loop()
                         if loop.is_running():
-                            # Ensure worker is started and enqueue
+                            # Ensure worker is started and enqueue; the worker
+                            # micro-batches jobs itself, so no delay is needed
                             async def enqueue_job():
                                 await self.ensure_worker_started()
                                 await self.worker.enqueue(
                                     decision_id=decision_id,
                                     priority="low",
-                                    delay_seconds=5,
+                                    delay_seconds=0,
                                 )
 
                             asyncio.create_task(enqueue_job())
@@ -299,15 +352,8 @@ class DecisionGraphIntegration:
                         exc_info=True,
                     )
 
-            # Invalidate retriever cache so next query reflects this new decision
-            # This ensures that subsequent get_context_for_deliberation() calls
-            # will find context from this newly stored decision
-            try:
-                self.retriever.invalidate_cache()
-            except Exception as e:
-                logger.warning(
-                    f"Error invalidating retriever cache after storing decision {decision_id}: {e}"
-                )
+            # No retriever cache invalidation: cached query results are stamped
+            # with the graph version and score just this decision on next use
 
             return decision_id
 
@@ -343,7 +389,7 @@ class DecisionGraphIntegration:
             # Initialize similarity detector
             detector = QuestionSimilarityDetector()
 
-            similarities_stored = 0
+            similarities = []
             for existing in all_decisions:
                 # Skip self-comparison
                 if existing.id == new_node.id:
@@ -357,17 +403,13 @@ class DecisionGraphIntegration:
 
                     # Store similarity if above threshold (0.5 = moderate similarity)
                     if score >= 0.5:
-                        similarity = DecisionSimilarity(
-                            source_id=new_node.id,
-                            target_id=existing.id,
-                            similarity_score=score,
-                            computed_at=datetime.now(),
-                        )
-                        self.storage.save_similarity(similarity)
-                        similarities_stored += 1
-                        logger.debug(
-                            f"Stored similarity: {new_node.id} -> {existing.id} "
-                            f"(score={score:.3f})"
+                        similarities.append(
+                            DecisionSimilarity(
+                                source_id=new_node.id,
+                                target_id=existing.id,
+                                similarity_score=score,
+                                computed_at=datetime.now(),
+                            )
                         )
                 except Exception as e:
                     logger.error(
@@ -376,6 +418,11 @@ class DecisionGraphIntegration:
                     )
                     continue
 
+            # One transaction for all edges; also maintains neighbour lists
+            similarities_stored = self.storage.save_similarities(
+                similarities, scanned_ids=[new_node.id]
+            )
+
             logger.info(
                 f"Computed and stored {similarities_stored} similarities "
                 f"for decision {new_node.id}"
@@ -686,6 +733,8 @@ class DecisionGraphIntegration:
             >>> # ... use integration ...
             >>> await integration.shutdown()
         """
+        if self._archival_task is not None:
+            await self._archival_task
         if self.worker:
             logger.info("Shutting down background worker...")
             try:
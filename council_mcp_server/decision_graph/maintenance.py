@@ -1,26 +1,28 @@
 """Maintenance and monitoring infrastructure for decision graph.
 
-This module provides monitoring, analysis, and archival preparation capabilities
-for the decision graph. It implements Phase 1 (monitoring only) with preparation
-for future Phase 2 (soft archival) once database size warrants it.
+This module provides monitoring, analysis and archival for the decision graph.
 
-Phase 1 (Current): Monitoring and analysis
+Monitoring and analysis:
 - Database statistics and growth tracking
 - Health checks and data integrity validation
-- Archival benefit estimation (simulation only)
-- Migration SQL generation for future Phase 2
-
-Phase 2 (Future, Month 6+): Soft archival
-- Archive old, unused decisions (marked archived=TRUE, kept in DB)
-- Requires migration to add 'archived' and 'last_accessed' columns
-- Triggered when >5000 decisions AND unused >180 days
+- Archival benefit estimation
+- Schema migration status
+
+Archival (hot/cold tiers):
+- Retrieval stamps last_accessed on the decisions it returns
+- Decisions older than 180 days and unused for 90 days are moved, with their
+  stances and similarity edges, to the archive database
+- Triggered once the hot set reaches 5000 decisions, so retrieval, neighbour
+  lists and caches only ever cover a bounded working set
 """
 
 import logging
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from decision_graph.similarity import QuestionSimilarityDetector
 from decision_graph.storage import DecisionGraphStorage
 
 logger = logging.getLogger(__name__)
@@ -32,19 +34,16 @@ class DecisionGraphMaintenance:
     Provides infrastructure for:
     - Database statistics collection and growth analysis
     - Health checks and data integrity validation
-    - Archival candidate identification (Phase 2 preparation)
-    - Migration SQL generation for future archival support
-
-    Phase 1 (Current):
-        All methods are monitoring-only. No data modification occurs.
-        Archival methods return simulations and estimations.
+    - Archival of cold decisions to the archive tier
+    - Schema migration status
+    - Backfilling the top-k neighbour lists used for related-decision lookups
 
-    Phase 2 (Future):
-        After migration, archival methods will soft-archive old decisions
-        by setting archived=TRUE (keeping data in DB for queries).
+    Monitoring methods do not modify data. archive_old_decisions() moves
+    decisions out of the hot tables (see DecisionGraphStorage.archive_decisions)
+    and backfill_neighbor_lists() rewrites neighbour lists.
     """
 
-    # Phase 2 archive triggers (not enforced in Phase 1)
+    # Archive triggers: hot set size, decision age, days since last retrieval
     ARCHIVE_TRIGGER_DECISIONS = 5000
     ARCHIVE_TRIGGER_AGE_DAYS = 180
     ARCHIVE_TRIGGER_UNUSED_DAYS = 90
@@ -56,16 +55,20 @@ class DecisionGraphMaintenance:
             storage: DecisionGraphStorage instance to monitor
         """
         self.storage = storage
-        logger.info("Initialized DecisionGraphMaintenance (Phase 1: monitoring only)")
+        logger.info(
+            f"Initialized DecisionGraphMaintenance "
+            f"(archive trigger: {self.ARCHIVE_TRIGGER_DECISIONS} decisions)"
+        )
 
-    # PHASE 1: Monitoring and analysis
+    # Monitoring and analysis
 
     def get_database_stats(self) -> Dict[str, int | float]:
         """Get current database statistics.
 
         Returns:
             Dictionary with keys:
-                - total_decisions: Total decision nodes in database
+                - total_decisions: Total decision nodes in database (hot tier)
+                - archived_decisions: Decisions moved to the archive tier
                 - total_stances: Total participant stances
                 - total_similarities: Total similarity relationships
                 - db_size_bytes: Database file size in bytes
@@ -96,6 +99,7 @@ class DecisionGraphMaintenance:
 
             stats = {
                 "total_decisions": total_decisions,
+                "archived_decisions": self.storage.count_archived_decisions(),
                 "total_stances": total_stances,
                 "total_similarities": total_similarities,
                 "db_size_bytes": db_size_bytes,
@@ -114,6 +118,7 @@ class DecisionGraphMaintenance:
             logger.error(f"Error collecting database stats: {e}", exc_info=True)
             return {
                 "total_decisions": 0,
+                "archived_decisions": 0,
                 "total_stances": 0,
                 "total_similarities": 0,
                 "db_size_bytes": 0,
@@ -195,8 +200,8 @@ class DecisionGraphMaintenance:
     def estimate_archival_benefit(self) -> Dict:
         """Estimate space savings if archival were triggered (simulation only).
 
-        This method identifies what WOULD be archived in Phase 2 but does not
-        actually modify any data. Used for planning and capacity management.
+        Counts what archive_old_decisions() would move without modifying any
+        data. Used for planning and capacity management.
 
         Returns:
             Dictionary with keys:
@@ -221,22 +226,9 @@ class DecisionGraphMaintenance:
                     "trigger_reason": "No decisions in database",
                 }
 
-            # Simulate Phase 2 archival logic
-            # Decisions are candidates if:
-            # - Created >180 days ago AND
-            # - Not accessed in last 90 days (we don't track this yet, so assume all old)
-            cutoff_age = datetime.now() - timedelta(days=self.ARCHIVE_TRIGGER_AGE_DAYS)
-
-            cursor = self.storage.conn.cursor()
-            cursor.execute(
-                """
-                SELECT COUNT(*)
-                FROM decision_nodes
-                WHERE timestamp < ?
-                """,
-                (cutoff_age.isoformat(),),
-            )
-            eligible_count = cursor.fetchone()[0] or 0
+            # Same criteria as archive_old_decisions(): old and not recently
+            # retrieved
+            eligible_count = len(self.identify_archive_candidates())
 
             eligible_percent = (
                 (eligible_count / total_decisions * 100) if total_decisions > 0 else 0
@@ -247,7 +239,7 @@ class DecisionGraphMaintenance:
             avg_decision_size_kb = 15
             estimated_savings_mb = (eligible_count * avg_decision_size_kb) / 1024
 
-            # Check if archival would trigger in Phase 2
+            # Check if archival would trigger
             would_trigger = (
                 total_decisions >= self.ARCHIVE_TRIGGER_DECISIONS and eligible_count > 0
             )
@@ -255,7 +247,8 @@ class DecisionGraphMaintenance:
             if would_trigger:
                 trigger_reason = (
                     f"Database has {total_decisions} decisions (>={self.ARCHIVE_TRIGGER_DECISIONS}) "
-                    f"and {eligible_count} are >{self.ARCHIVE_TRIGGER_AGE_DAYS} days old"
+                    f"and {eligible_count} are >{self.ARCHIVE_TRIGGER_AGE_DAYS} days old "
+                    f"and unused for {self.ARCHIVE_TRIGGER_UNUSED_DAYS} days"
                 )
             elif total_decisions < self.ARCHIVE_TRIGGER_DECISIONS:
                 trigger_reason = (
@@ -264,7 +257,8 @@ class DecisionGraphMaintenance:
                 )
             else:
                 trigger_reason = (
-                    f"No decisions >{self.ARCHIVE_TRIGGER_AGE_DAYS} days old"
+                    f"No decisions >{self.ARCHIVE_TRIGGER_AGE_DAYS} days old and "
+                    f"unused for {self.ARCHIVE_TRIGGER_UNUSED_DAYS} days"
                 )
 
             result = {
@@ -452,98 +446,213 @@ class DecisionGraphMaintenance:
                 "details": {},
             }
 
-    # PHASE 2: Archival methods (skeleton only, not implemented)
+    # Neighbour index
+
+    def backfill_neighbor_lists(
+        self,
+        threshold: float = 0.5,
+        chunk_size: int = 64,
+        rebuild: bool = False,
+        detector: Optional[QuestionSimilarityDetector] = None,
+    ) -> Dict:
+        """Compute top-k neighbour lists for decisions that lack one.
+
+        Each decision is scored against every other decision (one similarity
+        matrix per chunk of decisions) and its best matches above threshold
+        replace its neighbour list. The background worker only compares new
+        decisions against a recent window, so this also fills in links to
+        older decisions.
+
+        Args:
+            threshold: Minimum similarity score for a neighbour
+            chunk_size: Decisions scored per similarity matrix / transaction
+            rebuild: Recompute every list, not only missing ones
+            detector: Similarity detector (default: best available backend)
+
+        Returns:
+            Dictionary with decisions_scanned, total_decisions,
+            neighbor_entries and elapsed_seconds
+        """
+        start = time.perf_counter()
+        detector = detector or QuestionSimilarityDetector()
+
+        candidates = self.storage.get_decision_questions()
+        targets = (
+            candidates
+            if rebuild
+            else self.storage.get_decision_questions(unscanned_only=True)
+        )
+        candidate_ids = [decision_id for decision_id, _ in candidates]
+        candidate_questions = [question for _, question in candidates]
+
+        step = max(1, chunk_size)
+        neighbor_entries = 0
+        for offset in range(0, len(targets), step):
+            chunk = targets[offset : offset + step]
+            matrix = detector.compute_similarity_matrix(
+                [question for _, question in chunk], candidate_questions
+            )
+            neighbor_lists = {}
+            for (decision_id, _), row in zip(chunk, matrix):
+                neighbors = [
+                    (neighbor_id, score)
+                    for neighbor_id, score in zip(candidate_ids, row)
+                    if neighbor_id != decision_id and score >= threshold
+                ]
+                neighbor_lists[decision_id] = neighbors
+                neighbor_entries += min(len(neighbors), self.storage.NEIGHBOR_LIST_SIZE)
+            self.storage.replace_neighbor_lists(neighbor_lists)
+            logger.debug(
+                f"Backfilled neighbour lists for "
+                f"{offset + len(chunk)}/{len(targets)} decisions"
+            )
+
+        result = {
+            "decisions_scanned": len(targets),
+            "total_decisions": len(candidates),
+            "neighbor_entries": neighbor_entries,
+            "elapsed_seconds": round(time.perf_counter() - start, 3),
+        }
+        logger.info(
+            f"Backfilled neighbour lists: {result['decisions_scanned']} decisions "
+            f"scanned against {result['total_decisions']} "
+            f"in {result['elapsed_seconds']}s"
+        )
+        return result
+
+    # Archival
 
     def identify_archive_candidates(
         self, age_days: Optional[int] = None, unused_days: Optional[int] = None
     ) -> List[str]:
-        """Identify decisions eligible for archival (Phase 2 - NOT IMPLEMENTED).
+        """Identify hot decisions eligible for archival.
 
-        Phase 2 will identify decisions that are:
-        - Created >age_days ago (default: 180 days)
-        - Not accessed in last unused_days (default: 90 days)
+        A decision is a candidate if it was created more than age_days ago and
+        has not been retrieved in the last unused_days (decisions never
+        retrieved count from their creation time).
 
         Args:
             age_days: Minimum age in days for archival (default: 180)
             unused_days: Days since last access for archival (default: 90)
 
         Returns:
-            List of decision IDs eligible for archival
-
-        Note:
-            PHASE 1: Returns empty list (not implemented)
-            PHASE 2: Will require 'last_accessed' column migration
+            List of decision IDs eligible for archival, oldest first
         """
-        logger.info(
-            "identify_archive_candidates() called but not implemented (Phase 2 feature)"
+        if age_days is None:
+            age_days = self.ARCHIVE_TRIGGER_AGE_DAYS
+        if unused_days is None:
+            unused_days = self.ARCHIVE_TRIGGER_UNUSED_DAYS
+
+        # Archival must see accesses still buffered by retrieval
+        self.storage.flush_access()
+
+        now = datetime.now()
+        cursor = self.storage.conn.execute(
+            """
+            SELECT id
+            FROM decision_nodes
+            WHERE timestamp < ?
+              AND COALESCE(last_accessed, timestamp) < ?
+            ORDER BY timestamp
+            """,
+            (
+                (now - timedelta(days=age_days)).isoformat(),
+                (now - timedelta(days=unused_days)).isoformat(),
+            ),
+        )
+        candidates = [row[0] for row in cursor.fetchall()]
+        logger.debug(
+            f"Found {len(candidates)} archive candidates "
+            f"(age>{age_days}d, unused>{unused_days}d)"
         )
-        return []
+        return candidates
 
-    def archive_old_decisions(self, dry_run: bool = True) -> Dict:
-        """Soft archive old, unused decisions (Phase 2 - NOT IMPLEMENTED).
+    def archive_old_decisions(
+        self,
+        dry_run: bool = True,
+        age_days: Optional[int] = None,
+        unused_days: Optional[int] = None,
+        force: bool = False,
+    ) -> Dict:
+        """Move old, unused decisions to the archive tier.
 
-        Phase 2 will mark decisions as archived=TRUE, keeping them in DB for queries
-        but potentially optimizing storage/indexes for active decisions.
+        Only runs once the hot set has ARCHIVE_TRIGGER_DECISIONS decisions,
+        unless force is set. Archived decisions leave retrieval, neighbour
+        lists and the hot indexes; they stay reachable through deep search.
 
         Args:
-            dry_run: If True, simulate archival without modifying data
+            dry_run: If True, report candidates without moving anything
+            age_days: Minimum age in days for archival (default: 180)
+            unused_days: Days since last access for archival (default: 90)
+            force: Archive candidates even below the size trigger
 
         Returns:
-            Dictionary with archival results
-
-        Note:
-            PHASE 1: Returns not_implemented status
-            PHASE 2: Will require migration to add 'archived' column
+            Dictionary with keys:
+                - status: "archived", "dry_run", "below_threshold" or
+                  "no_candidates"
+                - message: Human-readable summary
+                - candidate_count: Decisions eligible for archival
+                - archived_count: Decisions moved (0 unless archived)
+                - archived_stances / archived_similarities: Rows moved
+                - dry_run: Echo of the dry_run argument
+                - archive_path: Archive database path
         """
-        logger.info(
-            "archive_old_decisions() called but not implemented (Phase 2 feature)"
-        )
-        return {
-            "status": "not_implemented",
-            "phase": "Phase 1",
-            "message": (
-                "Archival is not implemented in Phase 1. "
-                "This feature will be enabled in Phase 2 (Month 6+) "
-                "after migration adds 'archived' and 'last_accessed' columns."
-            ),
+        total_decisions = self.storage.count_decisions()
+        candidates = self.identify_archive_candidates(age_days, unused_days)
+        result = {
+            "status": "dry_run",
+            "message": "",
+            "candidate_count": len(candidates),
             "archived_count": 0,
+            "archived_stances": 0,
+            "archived_similarities": 0,
             "dry_run": dry_run,
+            "archive_path": self.storage.archive_path,
         }
 
+        if not force and total_decisions < self.ARCHIVE_TRIGGER_DECISIONS:
+            result["status"] = "below_threshold"
+            result["message"] = (
+                f"Database has only {total_decisions} decisions "
+                f"(<{self.ARCHIVE_TRIGGER_DECISIONS} trigger threshold)"
+            )
+        elif not candidates:
+            result["status"] = "no_candidates"
+            result["message"] = "No decisions are old and unused enough to archive"
+        elif dry_run:
+            result["message"] = f"Would archive {len(candidates)} decisions"
+        else:
+            counts = self.storage.archive_decisions(candidates)
+            result["status"] = "archived"
+            result["archived_count"] = counts["decisions"]
+            result["archived_stances"] = counts["stances"]
+            result["archived_similarities"] = counts["similarities"]
+            result["message"] = (
+                f"Archived {counts['decisions']} decisions to "
+                f"{self.storage.archive_path}"
+            )
+
+        logger.info(f"archive_old_decisions: {result['message']}")
+        return result
+
     def get_pending_migrations(self) -> List[str]:
-        """Get list of SQL migrations needed for Phase 2 archival support.
+        """Get schema migrations not yet applied to this database.
+
+        DecisionGraphStorage applies migrations when it opens a database, so
+        this is normally empty; a non-empty list means the schema was changed
+        outside the storage layer.
 
         Returns:
-            List of SQL statements to add archival infrastructure
+            List of SQL statements still to be applied
         """
-        migrations = [
-            # Migration 1: Add archived column (default FALSE)
-            """
-            ALTER TABLE decision_nodes
-            ADD COLUMN archived BOOLEAN DEFAULT FALSE;
-            """,
-            # Migration 2: Add last_accessed column (default to timestamp)
-            """
-            ALTER TABLE decision_nodes
-            ADD COLUMN last_accessed TEXT DEFAULT NULL;
-            """,
-            # Migration 3: Initialize last_accessed to timestamp for existing rows
-            """
-            UPDATE decision_nodes
-            SET last_accessed = timestamp
-            WHERE last_accessed IS NULL;
-            """,
-            # Migration 4: Add index on archived column for queries
-            """
-            CREATE INDEX IF NOT EXISTS idx_decision_archived
-            ON decision_nodes(archived);
-            """,
-            # Migration 5: Add index on last_accessed for archival queries
-            """
-            CREATE INDEX IF NOT EXISTS idx_decision_last_accessed
-            ON decision_nodes(last_accessed DESC);
-            """,
-        ]
-
-        logger.debug(f"Generated {len(migrations)} pending migrations for Phase 2")
+        migrations = self.storage.pending_migrations()
+        logger.debug(f"Found {len(migrations)} pending migrations")
         return migrations
+
+    def apply_pending_migrations(self) -> List[str]:
+        """Apply pending schema migrations.
+
+        Returns:
+            List of SQL statements that were applied
+        """
+        return self.storage.apply_migrations()
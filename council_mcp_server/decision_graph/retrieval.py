@@ -5,18 +5,30 @@ deliberations and formats them as enriched context for new deliberations.
 """
 
 import logging
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from decision_graph.cache import SimilarityCache
-from decision_graph.schema import DecisionNode
+from decision_graph.cache import LRUCache, SimilarityCache
+from decision_graph.schema import DecisionNode, ParticipantStance
 from decision_graph.similarity import QuestionSimilarityDetector
 from decision_graph.storage import DecisionGraphStorage
+from decision_graph.tokenizers import Tokenizer, get_tokenizer
 
 if TYPE_CHECKING:
     from models.config import DecisionGraphConfig
 
 logger = logging.getLogger(__name__)
 
+# Context tiers, richest first
+TIERS = ("strong", "moderate", "brief")
+
+# Every tier rendering is prefix + score + per-decision body, so bodies can be
+# rendered and sized once and reused for any score
+_TIER_PREFIXES = {
+    "strong": "### Strong Match (similarity: ",
+    "moderate": "### Moderate Match (similarity: ",
+    "brief": "- **Brief Match** (",
+}
+
 
 class DecisionRetriever:
     """Retrieves relevant past decisions and formats them as deliberation context.
@@ -42,6 +54,7 @@ class DecisionRetriever:
         cache: Optional[SimilarityCache] = None,
         enable_cache: bool = True,
         config: Optional["DecisionGraphConfig"] = None,
+        tokenizer: Optional[Tokenizer] = None,
     ):
         """Initialize with storage backend and optional caching.
 
@@ -51,16 +64,22 @@ class DecisionRetriever:
                    creates a default cache.
             enable_cache: Whether to enable caching (default: True)
             config: Optional DecisionGraphConfig for configurable thresholds and cache sizes
+            tokenizer: Optional Tokenizer for context budgets. If None, built from
+                   config.context_tokenizer (heuristic by default).
         """
         self.storage = storage
         self.similarity_detector = QuestionSimilarityDetector()
         self.config = config
+        self.tokenizer = tokenizer or get_tokenizer(
+            config.context_tokenizer if config else "heuristic"
+        )
 
         # Extract config values with defaults
         if config:
             query_cache_size = config.query_cache_size
             embedding_cache_size = config.embedding_cache_size
             query_ttl = config.query_ttl
+            fragment_cache_size = config.fragment_cache_size
             self.noise_floor = config.noise_floor
             self.adaptive_k_small_threshold = config.adaptive_k_small_threshold
             self.adaptive_k_medium_threshold = config.adaptive_k_medium_threshold
@@ -72,6 +91,7 @@ class DecisionRetriever:
             query_cache_size = 200
             embedding_cache_size = 500
             query_ttl = 300
+            fragment_cache_size = 1000
             self.noise_floor = 0.40
             self.adaptive_k_small_threshold = 100
             self.adaptive_k_medium_threshold = 1000
@@ -86,12 +106,18 @@ class DecisionRetriever:
                 embedding_cache_size=embedding_cache_size,
                 query_ttl=query_ttl,
             )
+            # decision_id -> {tier: (body, tokens)}; see prime_fragments()
+            self.fragment_cache: Optional[LRUCache] = LRUCache(
+                maxsize=fragment_cache_size
+            )
             logger.info(
                 f"Initialized DecisionRetriever with caching enabled "
-                f"(L1: {self.cache.query_cache.maxsize}, L2: {self.cache.embedding_cache.maxsize})"
+                f"(L1: {self.cache.query_cache.maxsize}, L2: {self.cache.embedding_cache.maxsize}, "
+                f"fragments: {fragment_cache_size}, tokenizer: {self.tokenizer.name})"
             )
         else:
             self.cache = None
+            self.fragment_cache = None
             logger.info("Initialized DecisionRetriever with caching disabled")
 
         logger.info(
@@ -162,14 +188,28 @@ class DecisionRetriever:
 
         # 1. Try L1 cache hit (query results) - use threshold=0.0 for cache key
         cache_key_threshold = 0.0  # Cache all results, not filtered by threshold
+        graph_version = None
         if self.cache:
-            cached_similar = self.cache.get_cached_result(
+            graph_version = self.storage.get_graph_version()
+            cached = self.cache.get_versioned_result(
                 query_question, cache_key_threshold, max_results
             )
-            if cached_similar is not None:
-                logger.info(
-                    f"L1 cache hit for query: {query_question[:50]}..."
-                )
+            if cached is not None:
+                cached_version, cached_similar = cached
+                if cached_version != graph_version:
+                    # Decisions were added since caching: score only those
+                    cached_similar = self._refresh_cached_result(
+                        query_question,
+                        cached_similar,
+                        cached_version,
+                        graph_version,
+                        cache_key_threshold,
+                        max_results,
+                    )
+                else:
+                    logger.info(f"L1 cache hit for query: {query_question[:50]}...")
+
+            if cached is not None and cached_similar is not None:
                 # Reconstruct (DecisionNode, score) tuples from cached results
                 results = []
                 for match in cached_similar:
@@ -179,8 +219,9 @@ class DecisionRetriever:
                     else:
                         logger.warning(
                             f"Cached decision {match['id']} not found in storage "
-                            "(may have been deleted)"
+                            "(may have been deleted or archived)"
                         )
+                self._record_access(results)
                 return results
 
         # 2. Cache miss - proceed with similarity computation
@@ -215,7 +256,13 @@ class DecisionRetriever:
             logger.info(f"No similar decisions found above noise floor {self.noise_floor}")
             # Cache empty result to avoid recomputation
             if self.cache:
-                self.cache.cache_result(query_question, cache_key_threshold, max_results, [])
+                self.cache.cache_result(
+                    query_question,
+                    cache_key_threshold,
+                    max_results,
+                    [],
+                    version=graph_version,
+                )
             return []
 
         # 8. Apply adaptive k limit (not threshold filtering)
@@ -224,7 +271,11 @@ class DecisionRetriever:
         # 9. Cache the similarity results (L1) - cache with threshold=0.0
         if self.cache:
             self.cache.cache_result(
-                query_question, cache_key_threshold, max_results, limited_similar
+                query_question,
+                cache_key_threshold,
+                max_results,
+                limited_similar,
+                version=graph_version,
             )
             logger.debug(
                 f"Cached L1 result for query: {query_question[:50]}... "
@@ -251,8 +302,77 @@ class DecisionRetriever:
             f"Found {len(results)} relevant decisions for query "
             f"(adaptive_k={adaptive_k}, noise_floor={self.noise_floor})"
         )
+        self._record_access(results)
         return results
 
+    def _record_access(self, results: List[Tuple[DecisionNode, float]]) -> None:
+        """Stamp last_accessed on retrieved decisions so archival keeps them hot.
+
+        Stamps are buffered by storage and written periodically, so lookups
+        (including L1 cache hits) stay read-only.
+        """
+        if not results:
+            return
+        try:
+            self.storage.record_access([decision.id for decision, _ in results])
+        except Exception as e:
+            # Access tracking only informs archival; never fail retrieval for it
+            logger.warning(f"Failed to record decision access: {e}")
+
+    def _refresh_cached_result(
+        self,
+        query_question: str,
+        cached_similar: List[dict],
+        cached_version: Optional[int],
+        graph_version: int,
+        cache_key_threshold: float,
+        max_results: int,
+    ) -> Optional[List[dict]]:
+        """Bring a cached top-k up to date by scoring only newly added decisions.
+
+        The cached list is the top-k of the graph at cached_version; the top-k
+        of the current graph is the best of that list plus the new decisions,
+        because adaptive k never grows with database size.
+
+        Returns:
+            Refreshed result list (also re-cached), or None if the entry cannot
+            be refreshed and must be recomputed.
+        """
+        if cached_version is None or cached_version > graph_version:
+            return None
+
+        new_decisions = self.storage.get_decisions_since(cached_version)
+        new_matches = self.similarity_detector.find_similar(
+            query_question,
+            [(d.id, d.question) for d in new_decisions],
+            threshold=self.noise_floor,
+        )
+
+        merged = {match["id"]: match for match in cached_similar}
+        for match in new_matches:
+            if match["score"] >= self.noise_floor:
+                merged[match["id"]] = match
+
+        # Same window as a full recomputation (get_all_decisions(limit=1000))
+        db_size = min(self.storage.count_decisions(), 1000)
+        adaptive_k = self._compute_adaptive_k(db_size)
+        ranked = sorted(merged.values(), key=lambda m: m["score"], reverse=True)
+        refreshed = ranked[:adaptive_k]
+
+        self.cache.cache_result(
+            query_question,
+            cache_key_threshold,
+            max_results,
+            refreshed,
+            version=graph_version,
+        )
+        self.cache.record_refresh()
+        logger.info(
+            f"Refreshed L1 result for query: {query_question[:50]}... "
+            f"({len(new_decisions)} new decisions scored, {len(refreshed)} results)"
+        )
+        return refreshed
+
     def format_context(self, decisions: List[DecisionNode], query: str) -> str:
         """Format relevant decisions as context string for deliberation.
 
@@ -433,16 +553,20 @@ class DecisionRetriever:
             return ""
 
     def invalidate_cache(self) -> None:
-        """Invalidate L1 query cache when new decisions are added.
+        """Invalidate L1 query cache.
 
-        Call this method after adding new decisions to the graph to ensure
-        subsequent queries reflect the updated decision set.
+        Not needed after adding decisions: cached results carry the graph
+        version and are refreshed on their next lookup. Call this after
+        removing, archiving or rewriting decisions.
+
+        Also drops cached tier fragments, which embed decision and stance text.
 
         Note: Does not invalidate L2 embedding cache (embeddings are immutable).
         """
         if self.cache:
             self.cache.invalidate_all_queries()
-            logger.info("Invalidated L1 query cache (new decision added)")
+            self.fragment_cache.clear()
+            logger.info("Invalidated L1 query cache and tier fragments")
         else:
             logger.debug("Cache invalidation called but caching is disabled")
 
@@ -456,18 +580,55 @@ class DecisionRetriever:
             return self.cache.get_stats()
         return None
 
-    def _estimate_tokens(self, formatted_str: str) -> int:
-        """Estimate token count for a formatted string.
+    def invalidate_fragments(self, decision_ids: List[str]) -> None:
+        """Drop cached tier fragments of decisions whose data changed.
 
-        Uses rough heuristic: 1 token ≈ 4 characters (conservative estimate).
+        Args:
+            decision_ids: IDs of decisions whose node or stances were rewritten
+        """
+        if self.fragment_cache:
+            for decision_id in decision_ids:
+                self.fragment_cache.invalidate(decision_id)
+
+    def prime_fragments(
+        self, decision: DecisionNode, stances: List[ParticipantStance]
+    ) -> None:
+        """Render and cache all tier fragments of a newly stored decision.
+
+        Called at store time with the stances already in hand, so context
+        assembly never has to query stances for recent decisions.
+
+        Args:
+            decision: The stored DecisionNode
+            stances: Its participant stances
+        """
+        if self.fragment_cache is None:
+            return
+        self.fragment_cache.put(
+            decision.id,
+            {
+                "strong": self._size_fragment(
+                    "strong", self._render_strong_body(decision, stances)
+                ),
+                "moderate": self._size_fragment(
+                    "moderate", self._render_moderate_body(decision)
+                ),
+                "brief": self._size_fragment(
+                    "brief", self._render_brief_body(decision)
+                ),
+            },
+        )
+
+    def _estimate_tokens(self, formatted_str: str) -> int:
+        """Count tokens in a formatted string with the configured tokenizer.
 
         Args:
-            formatted_str: The formatted string to estimate tokens for
+            formatted_str: The formatted string to count tokens for
 
         Returns:
-            Estimated token count
+            Token count (heuristic: 1 token ≈ 4 characters)
         """
-        return len(formatted_str) // 4
+        return self.tokenizer.count(formatted_str)
 
     def _compute_adaptive_k(self, db_size: int) -> int:
         """Compute adaptive k (number of candidates) based on database size.
@@ -515,10 +676,94 @@ class DecisionRetriever:
         Returns:
             Formatted markdown string with full details (~400-600 tokens)
         """
+        body, _ = self._get_fragment(decision, "strong")
+        return f"{_TIER_PREFIXES['strong']}{score:.2f}{body}"
+
+    def _format_moderate_tier(self, decision: DecisionNode, score: float) -> str:
+        """Format a moderate similarity match with summary details.
+
+        Moderate tier (0.60-0.74 similarity) gets summary formatting:
+        - Question, consensus, winning option
+        - No detailed participant stances
+
+        Args:
+            decision: DecisionNode to format
+            score: Similarity score (for display)
+
+        Returns:
+            Formatted markdown string with summary (~150-250 tokens)
+        """
+        body, _ = self._get_fragment(decision, "moderate")
+        return f"{_TIER_PREFIXES['moderate']}{score:.2f}{body}"
+
+    def _format_brief_tier(self, decision: DecisionNode, score: float) -> str:
+        """Format a brief similarity match with minimal details.
+
+        Brief tier (<0.60 similarity, ≥0.40 noise floor) gets one-liner:
+        - Question and winning option only
+
+        Args:
+            decision: DecisionNode to format
+            score: Similarity score (for display)
+
+        Returns:
+            Formatted markdown string with minimal info (~30-70 tokens)
+        """
+        body, _ = self._get_fragment(decision, "brief")
+        return f"{_TIER_PREFIXES['brief']}{score:.2f}{body}"
+
+    def _get_fragment(self, decision: DecisionNode, tier: str) -> Tuple[str, int]:
+        """Return (body, tokens) of a decision's tier rendering.
+
+        Served from the fragment cache when primed; otherwise rendered (the
+        strong tier queries stances) and cached for the next deliberation.
+        """
+        fragments: Optional[Dict[str, Tuple[str, int]]] = None
+        if self.fragment_cache is not None:
+            fragments = self.fragment_cache.get(decision.id)
+        if fragments is not None and tier in fragments:
+            return fragments[tier]
+
+        cacheable = True
+        if tier == "strong":
+            try:
+                stances = self.storage.get_participant_stances(decision.id)
+                body = self._render_strong_body(decision, stances)
+            except Exception as e:
+                logger.error(
+                    f"Error retrieving stances for decision {decision.id}: {e}",
+                    exc_info=True,
+                )
+                body = self._render_strong_body(decision, None)
+                cacheable = False
+        elif tier == "moderate":
+            body = self._render_moderate_body(decision)
+        else:
+            body = self._render_brief_body(decision)
+
+        fragment = self._size_fragment(tier, body)
+        if cacheable and self.fragment_cache is not None:
+            fragments = dict(fragments or {})
+            fragments[tier] = fragment
+            self.fragment_cache.put(decision.id, fragments)
+        return fragment
+
+    def _size_fragment(self, tier: str, body: str) -> Tuple[str, int]:
+        """Pair a tier body with the tokens of its full rendering.
+
+        Scores always render as four characters, so sizing with a
+        placeholder score holds for every query.
+        """
+        return body, self.tokenizer.count(f"{_TIER_PREFIXES[tier]}0.00{body}")
+
+    def _render_strong_body(
+        self, decision: DecisionNode, stances: Optional[List[ParticipantStance]]
+    ) -> str:
+        """Strong tier text after the score (stances=None marks a lookup error)."""
         lines = []
 
-        # Header with score
-        lines.append(f"### Strong Match (similarity: {score:.2f}): {decision.question}")
+        # Header (after the score)
+        lines.append(f"): {decision.question}")
         lines.append(f"**Date**: {decision.timestamp.isoformat()}")
         lines.append(f"**Convergence Status**: {decision.convergence_status}")
         lines.append(f"**Consensus**: {decision.consensus}")
@@ -531,56 +776,35 @@ class DecisionRetriever:
         participants_str = ", ".join(decision.participants)
         lines.append(f"**Participants**: {participants_str}")
 
-        # Get stances for this decision
-        try:
-            stances = self.storage.get_participant_stances(decision.id)
-            if stances:
-                lines.append("\n**Participant Positions**:")
-                for stance in stances:
-                    stance_line = f"- **{stance.participant}**: "
-
-                    # Vote information (if available)
-                    if stance.vote_option:
-                        stance_line += f"Voted for '{stance.vote_option}'"
-                        if stance.confidence is not None:
-                            confidence_pct = stance.confidence * 100
-                            stance_line += f" (confidence: {confidence_pct:.0f}%)"
-
-                    # Rationale (if available)
-                    if stance.rationale:
-                        stance_line += f" - {stance.rationale}"
-
-                    lines.append(stance_line)
-        except Exception as e:
-            logger.error(
-                f"Error retrieving stances for decision {decision.id}: {e}",
-                exc_info=True,
-            )
+        if stances is None:
             lines.append("\n*[Error retrieving participant positions]*")
+        elif stances:
+            lines.append("\n**Participant Positions**:")
+            for stance in stances:
+                stance_line = f"- **{stance.participant}**: "
 
-        lines.append("")  # Blank line
-        return "\n".join(lines)
+                # Vote information (if available)
+                if stance.vote_option:
+                    stance_line += f"Voted for '{stance.vote_option}'"
+                    if stance.confidence is not None:
+                        confidence_pct = stance.confidence * 100
+                        stance_line += f" (confidence: {confidence_pct:.0f}%)"
 
-    def _format_moderate_tier(self, decision: DecisionNode, score: float) -> str:
-        """Format a moderate similarity match with summary details.
+                # Rationale (if available)
+                if stance.rationale:
+                    stance_line += f" - {stance.rationale}"
 
-        Moderate tier (0.60-0.74 similarity) gets summary formatting:
-        - Question, consensus, winning option
-        - No detailed participant stances
+                lines.append(stance_line)
 
-        Args:
-            decision: DecisionNode to format
-            score: Similarity score (for display)
+        lines.append("")  # Blank line
+        return "\n".join(lines)
 
-        Returns:
-            Formatted markdown string with summary (~150-250 tokens)
-        """
+    def _render_moderate_body(self, decision: DecisionNode) -> str:
+        """Moderate tier text after the score."""
         lines = []
 
-        # Header with score
-        lines.append(
-            f"### Moderate Match (similarity: {score:.2f}): {decision.question}"
-        )
+        # Header (after the score)
+        lines.append(f"): {decision.question}")
         lines.append(f"**Consensus**: {decision.consensus}")
 
         # Winning option (optional)
@@ -590,22 +814,10 @@ class DecisionRetriever:
         lines.append("")  # Blank line
         return "\n".join(lines)
 
-    def _format_brief_tier(self, decision: DecisionNode, score: float) -> str:
-        """Format a brief similarity match with minimal details.
-
-        Brief tier (<0.60 similarity, ≥0.40 noise floor) gets one-liner:
-        - Question and winning option only
-
-        Args:
-            decision: DecisionNode to format
-            score: Similarity score (for display)
-
-        Returns:
-            Formatted markdown string with minimal info (~30-70 tokens)
-        """
-        # One-liner format
+    def _render_brief_body(self, decision: DecisionNode) -> str:
+        """Brief tier one-liner after the score."""
         result = decision.winning_option or decision.consensus[:50]
-        return f"- **Brief Match** ({score:.2f}): {decision.question} → {result}\n"
+        return f"): {decision.question} → {result}\n"
 
     def format_context_tiered(
         self,
@@ -616,8 +828,8 @@ class DecisionRetriever:
         """Format decisions using tiered approach with token budget tracking.
 
         This method implements budget-aware context injection by formatting decisions
-        based on their similarity scores (strong/moderate/brief tiers) and stopping
-        when the token budget is exceeded.
+        based on their similarity scores (strong/moderate/brief tiers) within a
+        token budget.
 
         Tiers:
         - Strong (≥strong_threshold): Full formatting with stances (~500 tokens)
@@ -625,6 +837,11 @@ class DecisionRetriever:
         - Brief (≥0.40, <moderate): One-liner format (~50 tokens)
         - Noise floor (<0.40): Filtered out entirely
 
+        Assembly is a greedy knapsack over pre-sized fragments: in score order,
+        each decision gets the richest tier its score allows that still fits the
+        remaining budget, and decisions that fit no tier are skipped rather than
+        ending the context.
+
         Args:
             scored_decisions: List of (DecisionNode, score) tuples sorted by score descending
             tier_boundaries: Dict with 'strong' and 'moderate' thresholds
@@ -676,30 +893,27 @@ class DecisionRetriever:
                 )
                 continue
 
-            # Determine tier and format accordingly
+            # Richest tier the score earns, then cheaper fallbacks
             if score >= strong_threshold:
-                formatted = self._format_strong_tier(decision, score)
-                tier = "strong"
+                candidate_tiers = TIERS
             elif score >= moderate_threshold:
-                formatted = self._format_moderate_tier(decision, score)
-                tier = "moderate"
+                candidate_tiers = TIERS[1:]
             else:
-                formatted = self._format_brief_tier(decision, score)
-                tier = "brief"
+                candidate_tiers = TIERS[2:]
 
-            # Estimate tokens for this decision
-            decision_tokens = self._estimate_tokens(formatted)
-
-            # Check if adding this decision would exceed budget
-            if tokens_used + decision_tokens > token_budget:
-                logger.info(
-                    f"Token budget reached: {tokens_used} + {decision_tokens} > {token_budget}. "
-                    f"Stopping context injection (processed {sum(tier_distribution.values())} decisions)"
+            for tier in candidate_tiers:
+                body, decision_tokens = self._get_fragment(decision, tier)
+                if tokens_used + decision_tokens <= token_budget:
+                    break
+            else:
+                logger.debug(
+                    f"Skipping decision {decision.id}: no tier fits the remaining "
+                    f"budget ({token_budget - tokens_used} tokens)"
                 )
-                break
+                continue
 
             # Add to context
-            formatted_parts.append(formatted)
+            formatted_parts.append(f"{_TIER_PREFIXES[tier]}{score:.2f}{body}")
             tokens_used += decision_tokens
             tier_distribution[tier] += 1
 
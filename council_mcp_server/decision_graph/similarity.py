@@ -124,6 +124,43 @@ class QuestionSimilarityDetector:
             logger.error(f"Error computing similarity: {e}", exc_info=True)
             return 0.0
 
+    def compute_similarity_matrix(
+        self, questions1: List[str], questions2: List[str]
+    ) -> List[List[float]]:
+        """
+        Compute similarity between every pair of questions from two lists.
+
+        Lets the backend vectorise each question once (one batched encode for
+        sentence transformers) instead of once per pair. Scores match
+        compute_similarity for the same pair.
+
+        Args:
+            questions1: Questions for the matrix rows
+            questions2: Questions for the matrix columns
+
+        Returns:
+            len(questions1) x len(questions2) matrix of scores in [0.0, 1.0]
+        """
+        normalized1 = [" ".join(q.split()) if q else "" for q in questions1]
+        normalized2 = [" ".join(q.split()) if q else "" for q in questions2]
+
+        try:
+            matrix = self.backend.compute_similarity_matrix(normalized1, normalized2)
+        except Exception as e:
+            logger.error(f"Error computing similarity matrix: {e}", exc_info=True)
+            return [
+                [self.compute_similarity(a, b) for b in normalized2]
+                for a in normalized1
+            ]
+
+        return [
+            [
+                float(max(0.0, min(1.0, score))) if a and b else 0.0
+                for b, score in zip(normalized2, row)
+            ]
+            for a, row in zip(normalized1, matrix)
+        ]
+
     def find_similar(
         self,
         query_question: str,
@@ -9,15 +9,20 @@ import json
 import logging
 import os
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from decision_graph.schema import (DecisionNode, DecisionSimilarity,
                                    ParticipantStance)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for open-ended rowid ranges
+_MAX_ROWID = 2**63 - 1
+
 
 class DecisionGraphStorage:
     """SQLite storage layer for decision graph memory.
@@ -26,21 +31,52 @@ class DecisionGraphStorage:
     - DecisionNode: Completed deliberations with metadata
     - ParticipantStance: Individual participant positions and votes
     - DecisionSimilarity: Pre-computed similarity relationships
+    - Neighbour lists: the NEIGHBOR_LIST_SIZE most similar decisions per
+      decision, maintained as similarities are saved
+
+    Decisions are kept in two tiers. The main database holds the hot set that
+    retrieval, neighbour lists and caches work on; archive_decisions() moves
+    cold decisions with their stances and similarity edges to an archive
+    database, attached to the same connection as schema "archive", where they
+    are only read by explicit deep lookups (get_archived_decisions,
+    include_archived=True).
 
     Supports both file-based and in-memory databases for testing.
     """
 
-    def __init__(self, db_path: str = "decision_graph.db"):
+    # Entries kept per decision in decision_neighbors
+    NEIGHBOR_LIST_SIZE = 10
+
+    # Seconds between writes of buffered last_accessed stamps
+    ACCESS_FLUSH_INTERVAL = 60.0
+
+    def __init__(
+        self, db_path: str = "decision_graph.db", archive_path: Optional[str] = None
+    ):
         """Initialize storage with SQLite database.
 
         Args:
             db_path: Path to SQLite database file. Use ":memory:" for in-memory database.
+            archive_path: Path to the archive tier database (default: db_path
+                with an ".archive.db" suffix, in-memory for in-memory storage).
+                Only created once decisions are archived.
 
         Raises:
             RuntimeError: If database initialization or schema verification fails.
         """
         self.db_path = db_path
+        self.archive_path = archive_path or (
+            ":memory:"
+            if db_path == ":memory:"
+            else f"{os.path.splitext(db_path)[0]}.archive.db"
+        )
         self._conn: Optional[sqlite3.Connection] = None
+        # Connection the archive database is attached to (None if not attached)
+        self._archive_conn: Optional[sqlite3.Connection] = None
+        # decision_id -> last_accessed not yet written (see record_access)
+        self._pending_access: Dict[str, str] = {}
+        self._access_lock = threading.Lock()
+        self._last_access_flush = time.monotonic()
 
         # Ensure parent directory exists (unless using in-memory database)
         if db_path != ":memory:":
@@ -57,6 +93,7 @@ class DecisionGraphStorage:
 
             # Initialize database schema
             self._initialize_db()
+            self.apply_migrations()
 
             # Verify schema was properly created
             if not self._verify_schema():
@@ -212,6 +249,58 @@ class DecisionGraphStorage:
             """
             )
 
+            # Tables keyed by a natural primary key (decision_neighbors,
+            # decision_neighbor_scans, export_checkpoints and the daily
+            # rollups in the migrations below) are declared WITHOUT ROWID, so
+            # each is stored as its primary-key b-tree instead of a rowid
+            # table plus a separate key index. Secondary indexes on them
+            # (idx_neighbors_decision_score, idx_stance_summary_participant)
+            # still add a b-tree of their own.
+
+            # Maintained top-k neighbour lists (both directions of each edge)
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS decision_neighbors (
+                    decision_id TEXT NOT NULL,
+                    neighbor_id TEXT NOT NULL,
+                    similarity_score REAL NOT NULL,
+                    PRIMARY KEY (decision_id, neighbor_id),
+                    FOREIGN KEY (decision_id) REFERENCES decision_nodes(id),
+                    FOREIGN KEY (neighbor_id) REFERENCES decision_nodes(id)
+                ) WITHOUT ROWID
+            """
+            )
+
+            # Decisions whose neighbour list has been computed
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS decision_neighbor_scans (
+                    decision_id TEXT PRIMARY KEY,
+                    scanned_at TEXT NOT NULL,
+                    FOREIGN KEY (decision_id) REFERENCES decision_nodes(id)
+                ) WITHOUT ROWID
+            """
+            )
+
+            # For reading a decision's neighbours best-first
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_neighbors_decision_score
+                ON decision_neighbors(decision_id, similarity_score DESC)
+            """
+            )
+
+            # High-water marks of incremental exports, by checkpoint name
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS export_checkpoints (
+                    name TEXT PRIMARY KEY,
+                    graph_version INTEGER NOT NULL,
+                    exported_at TEXT NOT NULL
+                ) WITHOUT ROWID
+            """
+            )
+
             logger.debug("Database schema and indexes initialized successfully")
 
     def _verify_schema(self) -> bool:
@@ -250,6 +339,180 @@ class DecisionGraphStorage:
             logger.error(f"Schema verification failed: {e}", exc_info=True)
             return False
 
+    def pending_migrations(self) -> List[str]:
+        """Return the schema migrations this database still needs.
+
+        Databases created before archival support lack the last_accessed
+        column and its index; databases created before voting analytics lack
+        the daily rollup tables and the triggers that maintain them (their
+        migration backfills the rollups from existing hot and archived rows,
+        attaching the archive database if it exists).
+
+        Returns:
+            SQL statements not yet applied (empty if the schema is current)
+        """
+        columns = {
+            row["name"]
+            for row in self.conn.execute("PRAGMA main.table_info(decision_nodes)")
+        }
+        objects = {
+            (row["type"], row["name"])
+            for row in self.conn.execute("SELECT type, name FROM main.sqlite_master")
+        }
+
+        migrations = []
+        if "last_accessed" not in columns:
+            migrations.append(
+                "ALTER TABLE decision_nodes ADD COLUMN last_accessed TEXT"
+            )
+        if ("index", "idx_decision_last_accessed") not in objects:
+            migrations.append(
+                "CREATE INDEX IF NOT EXISTS idx_decision_last_accessed "
+                "ON decision_nodes(last_accessed)"
+            )
+        rollups = [
+            (trigger, statements)
+            for trigger, statements in (
+                ("trg_decision_daily_summary", self._DECISION_SUMMARY_MIGRATION),
+                ("trg_stance_daily_summary", self._STANCE_SUMMARY_MIGRATION),
+            )
+            if ("trigger", trigger) not in objects
+        ]
+        if rollups:
+            # Archived decisions count towards the rollups too
+            sources = {
+                "decisions": self._HOT_DECISION_ROWS,
+                "stances": self._HOT_STANCE_ROWS,
+            }
+            if self.attach_archive(create=False):
+                sources["decisions"] += " UNION ALL " + self._ARCHIVED_DECISION_ROWS
+                sources["stances"] += " UNION ALL " + self._ARCHIVED_STANCE_ROWS
+            for _, statements in rollups:
+                migrations.extend(
+                    statement.format(**sources) for statement in statements
+                )
+        return migrations
+
+    # Rows the rollup backfills read. A decision lives in exactly one tier,
+    # so the hot and archived rows are concatenated without deduplication.
+    _HOT_DECISION_ROWS = "SELECT timestamp, convergence_status FROM main.decision_nodes"
+    _ARCHIVED_DECISION_ROWS = (
+        "SELECT timestamp, convergence_status FROM archive.decision_nodes"
+    )
+    _HOT_STANCE_ROWS = """
+        SELECT dn.timestamp, dn.convergence_status, ps.participant,
+               ps.vote_option, ps.confidence
+        FROM main.participant_stances ps
+        JOIN main.decision_nodes dn ON dn.id = ps.decision_id
+    """
+    _ARCHIVED_STANCE_ROWS = """
+        SELECT dn.timestamp, dn.convergence_status, ps.participant,
+               ps.vote_option, ps.confidence
+        FROM archive.participant_stances ps
+        JOIN archive.decision_nodes dn ON dn.id = ps.decision_id
+    """
+
+    # Daily rollups for voting analytics. Insert triggers keep them current;
+    # rows are never subtracted, so archived decisions stay counted (nothing
+    # deletes decisions outright). Each migration rebuilds its rollup from
+    # the hot and archived rows before installing the trigger. Statements are
+    # templates over {decisions} / {stances}, filled in by pending_migrations.
+    _DECISION_SUMMARY_MIGRATION = [
+        """
+        CREATE TABLE IF NOT EXISTS decision_daily_summary (
+            day TEXT NOT NULL,
+            convergence_status TEXT NOT NULL,
+            decisions INTEGER NOT NULL,
+            PRIMARY KEY (day, convergence_status)
+        ) WITHOUT ROWID
+        """,
+        "DELETE FROM decision_daily_summary",
+        """
+        INSERT INTO decision_daily_summary (day, convergence_status, decisions)
+        SELECT substr(timestamp, 1, 10), convergence_status, COUNT(*)
+        FROM ({decisions})
+        GROUP BY substr(timestamp, 1, 10), convergence_status
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_decision_daily_summary
+        AFTER INSERT ON decision_nodes
+        BEGIN
+            INSERT INTO decision_daily_summary (day, convergence_status, decisions)
+            VALUES (substr(NEW.timestamp, 1, 10), NEW.convergence_status, 1)
+            ON CONFLICT (day, convergence_status)
+            DO UPDATE SET decisions = decisions + 1;
+        END
+        """,
+    ]
+    _STANCE_SUMMARY_MIGRATION = [
+        """
+        CREATE TABLE IF NOT EXISTS stance_daily_summary (
+            day TEXT NOT NULL,
+            participant TEXT NOT NULL,
+            vote_option TEXT NOT NULL,
+            convergence_status TEXT NOT NULL,
+            stances INTEGER NOT NULL,
+            confidence_sum REAL NOT NULL,
+            confidence_count INTEGER NOT NULL,
+            PRIMARY KEY (day, participant, vote_option, convergence_status)
+        ) WITHOUT ROWID
+        """,
+        "DELETE FROM stance_daily_summary",
+        """
+        INSERT INTO stance_daily_summary (
+            day, participant, vote_option, convergence_status,
+            stances, confidence_sum, confidence_count
+        )
+        SELECT substr(timestamp, 1, 10), participant,
+               COALESCE(vote_option, ''), convergence_status,
+               COUNT(*), COALESCE(SUM(confidence), 0), COUNT(confidence)
+        FROM ({stances})
+        GROUP BY substr(timestamp, 1, 10), participant,
+                 COALESCE(vote_option, ''), convergence_status
+        """,
+        # Per-participant reads; a second b-tree next to the table's own
+        """
+        CREATE INDEX IF NOT EXISTS idx_stance_summary_participant
+        ON stance_daily_summary(participant, day)
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_stance_daily_summary
+        AFTER INSERT ON participant_stances
+        BEGIN
+            INSERT INTO stance_daily_summary (
+                day, participant, vote_option, convergence_status,
+                stances, confidence_sum, confidence_count
+            )
+            SELECT substr(timestamp, 1, 10), NEW.participant,
+                   COALESCE(NEW.vote_option, ''), convergence_status,
+                   1, COALESCE(NEW.confidence, 0), NEW.confidence IS NOT NULL
+            FROM decision_nodes
+            WHERE id = NEW.decision_id
+            ON CONFLICT (day, participant, vote_option, convergence_status)
+            DO UPDATE SET
+                stances = stances + 1,
+                confidence_sum = confidence_sum + excluded.confidence_sum,
+                confidence_count = confidence_count + excluded.confidence_count;
+        END
+        """,
+    ]
+
+    def apply_migrations(self) -> List[str]:
+        """Apply pending schema migrations in one transaction.
+
+        Returns:
+            SQL statements that were applied
+        """
+        migrations = self.pending_migrations()
+        if migrations:
+            with self.transaction() as conn:
+                for statement in migrations:
+                    conn.execute(statement)
+            logger.info(
+                f"Applied {len(migrations)} schema migrations to {self.db_path}"
+            )
+        return migrations
+
     def save_decision_node(self, node: DecisionNode) -> str:
         """Save a decision node to the database.
 
@@ -285,11 +548,14 @@ class DecisionGraphStorage:
             logger.info(f"Saved decision node {node.id}")
             return node.id
 
-    def get_decision_node(self, decision_id: str) -> Optional[DecisionNode]:
+    def get_decision_node(
+        self, decision_id: str, include_archived: bool = False
+    ) -> Optional[DecisionNode]:
         """Retrieve a decision node by ID.
 
         Args:
             decision_id: UUID of the decision node
+            include_archived: Also look in the archive tier
 
         Returns:
             DecisionNode if found, None otherwise
@@ -298,13 +564,24 @@ class DecisionGraphStorage:
             """
             SELECT id, question, timestamp, consensus, winning_option,
                    convergence_status, participants, transcript_path, metadata
-            FROM decision_nodes
+            FROM main.decision_nodes
             WHERE id = ?
             """,
             (decision_id,),
         )
         row = cursor.fetchone()
 
+        if row is None and include_archived and self.attach_archive(create=False):
+            row = self.conn.execute(
+                """
+                SELECT id, question, timestamp, consensus, winning_option,
+                       convergence_status, participants, transcript_path, metadata
+                FROM archive.decision_nodes
+                WHERE id = ?
+                """,
+                (decision_id,),
+            ).fetchone()
+
         if row is None:
             logger.debug(f"Decision node {decision_id} not found")
             return None
@@ -340,6 +617,121 @@ class DecisionGraphStorage:
         )
         return nodes
 
+    def get_graph_version(self) -> int:
+        """Return the decision high-water mark (largest decision_nodes rowid).
+
+        Grows with every stored decision, so query results stamped with it can
+        be brought up to date by scoring only get_decisions_since(version).
+        Deleting the newest decision can let its rowid be reused, so callers
+        that delete decisions must invalidate version-stamped caches.
+
+        Returns:
+            Current graph version (0 for an empty graph)
+        """
+        row = self.conn.execute(
+            "SELECT COALESCE(MAX(rowid), 0) FROM decision_nodes"
+        ).fetchone()
+        return row[0]
+
+    def get_decisions_since(self, version: int) -> List[DecisionNode]:
+        """List decisions stored after the given graph version (oldest first).
+
+        Args:
+            version: Graph version from get_graph_version()
+
+        Returns:
+            List of DecisionNode objects added since that version
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT id, question, timestamp, consensus, winning_option,
+                   convergence_status, participants, transcript_path, metadata
+            FROM decision_nodes
+            WHERE rowid > ?
+            ORDER BY rowid
+            """,
+            (version,),
+        )
+        return [self._row_to_decision_node(row) for row in cursor.fetchall()]
+
+    def count_decisions(self) -> int:
+        """Return the number of stored decisions."""
+        row = self.conn.execute("SELECT COUNT(*) FROM decision_nodes").fetchone()
+        return row[0]
+
+    def count_similarities(self, include_archived: bool = False) -> int:
+        """Return the number of stored similarity edges."""
+        count = self.conn.execute(
+            "SELECT COUNT(*) FROM main.decision_similarities"
+        ).fetchone()[0]
+        if include_archived and self.attach_archive(create=False):
+            count += self.conn.execute(
+                "SELECT COUNT(*) FROM archive.decision_similarities"
+            ).fetchone()[0]
+        return count
+
+    def touch_decisions(self, decision_ids: List[str]) -> None:
+        """Record that decisions were just retrieved (sets last_accessed).
+
+        Args:
+            decision_ids: IDs of the decisions that were returned to a caller
+        """
+        if not decision_ids:
+            return
+        accessed_at = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.executemany(
+                "UPDATE decision_nodes SET last_accessed = ? WHERE id = ?",
+                [(accessed_at, decision_id) for decision_id in decision_ids],
+            )
+
+    def record_access(self, decision_ids: List[str]) -> None:
+        """Buffer last_accessed stamps for decisions returned by retrieval.
+
+        Retrieval is read-only; stamps are kept in memory and written in one
+        transaction at most once per ACCESS_FLUSH_INTERVAL (or on
+        flush_access / close), so cache hits do not each open a write.
+
+        Args:
+            decision_ids: IDs of the decisions that were returned to a caller
+        """
+        if not decision_ids:
+            return
+        accessed_at = datetime.now().isoformat()
+        with self._access_lock:
+            for decision_id in decision_ids:
+                self._pending_access[decision_id] = accessed_at
+        self.flush_access(due_only=True)
+
+    def flush_access(self, due_only: bool = False) -> int:
+        """Write buffered last_accessed stamps.
+
+        Args:
+            due_only: Only write if ACCESS_FLUSH_INTERVAL has passed since the
+                last flush
+
+        Returns:
+            Number of decisions stamped
+        """
+        with self._access_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_access_flush
+            if due_only and elapsed < self.ACCESS_FLUSH_INTERVAL:
+                return 0
+            pending, self._pending_access = self._pending_access, {}
+            self._last_access_flush = now
+        if not pending:
+            return 0
+        with self.transaction() as conn:
+            conn.executemany(
+                "UPDATE decision_nodes SET last_accessed = ? WHERE id = ?",
+                [
+                    (accessed_at, decision_id)
+                    for decision_id, accessed_at in pending.items()
+                ],
+            )
+        return len(pending)
+
     def save_participant_stance(self, stance: ParticipantStance) -> int:
         """Save a participant stance to the database.
 
@@ -376,11 +768,14 @@ class DecisionGraphStorage:
             )
             return row_id
 
-    def get_participant_stances(self, decision_id: str) -> List[ParticipantStance]:
+    def get_participant_stances(
+        self, decision_id: str, include_archived: bool = False
+    ) -> List[ParticipantStance]:
         """Get all participant stances for a decision.
 
         Args:
             decision_id: UUID of the decision
+            include_archived: Also look in the archive tier
 
         Returns:
             List of ParticipantStance objects (may be empty)
@@ -389,17 +784,154 @@ class DecisionGraphStorage:
             """
             SELECT decision_id, participant, vote_option, confidence,
                    rationale, final_position
-            FROM participant_stances
+            FROM main.participant_stances
             WHERE decision_id = ?
             ORDER BY participant
             """,
             (decision_id,),
         )
+        rows = cursor.fetchall()
+
+        if not rows and include_archived and self.attach_archive(create=False):
+            rows = self.conn.execute(
+                """
+                SELECT decision_id, participant, vote_option, confidence,
+                       rationale, final_position
+                FROM archive.participant_stances
+                WHERE decision_id = ?
+                ORDER BY participant
+                """,
+                (decision_id,),
+            ).fetchall()
 
-        stances = [self._row_to_participant_stance(row) for row in cursor.fetchall()]
+        stances = [self._row_to_participant_stance(row) for row in rows]
         logger.debug(f"Retrieved {len(stances)} stances for decision {decision_id}")
         return stances
 
+    def get_vote_aggregates(
+        self,
+        since: Optional[datetime] = None,
+        participant: Optional[str] = None,
+        top_options: int = 3,
+    ) -> Dict:
+        """Aggregate votes and convergence outcomes from the daily rollups.
+
+        Reads decision_daily_summary / stance_daily_summary only, so the cost
+        grows with days x participants x options rather than with the number
+        of stances. Archived decisions are included.
+
+        Args:
+            since: Only count decisions from this day onwards (day granularity)
+            participant: Only count this participant's stances
+            top_options: Preferred options returned per participant
+
+        Returns:
+            Dictionary with keys:
+                - total_decisions: Decisions in the window (for a participant:
+                  decisions they took a stance in)
+                - participants: List of dicts (participant, stances, votes,
+                  avg_confidence, preferred_options), most votes first
+                - convergence: {convergence_status: decisions}
+                - total_stances / votes_cast: Stance and non-empty vote counts
+                - window_decisions: Decisions in the window, all participants
+        """
+        day = since.date().isoformat() if since else ""
+        stance_filter = "day >= ?"
+        stance_params: list = [day]
+        if participant is not None:
+            stance_filter += " AND participant = ?"
+            stance_params.append(participant)
+
+        conn = self.conn
+        participants = {}
+        for row in conn.execute(
+            f"""
+            SELECT participant,
+                   SUM(stances) AS stances,
+                   SUM(CASE WHEN vote_option != '' THEN stances ELSE 0 END) AS votes,
+                   SUM(confidence_sum) / NULLIF(SUM(confidence_count), 0)
+                       AS avg_confidence
+            FROM stance_daily_summary
+            WHERE {stance_filter}
+            GROUP BY participant
+            ORDER BY votes DESC, participant
+            """,
+            stance_params,
+        ):
+            participants[row["participant"]] = {
+                "participant": row["participant"],
+                "stances": row["stances"],
+                "votes": row["votes"],
+                "avg_confidence": row["avg_confidence"],
+                "preferred_options": [],
+            }
+
+        for row in conn.execute(
+            f"""
+            SELECT participant, vote_option
+            FROM (
+                SELECT participant, vote_option,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY participant
+                           ORDER BY SUM(stances) DESC, vote_option
+                       ) AS option_rank
+                FROM stance_daily_summary
+                WHERE {stance_filter} AND vote_option != ''
+                GROUP BY participant, vote_option
+            )
+            WHERE option_rank <= ?
+            ORDER BY participant, option_rank
+            """,
+            stance_params + [top_options],
+        ):
+            participants[row["participant"]]["preferred_options"].append(
+                row["vote_option"]
+            )
+
+        window_decisions = conn.execute(
+            "SELECT COALESCE(SUM(decisions), 0) FROM decision_daily_summary "
+            "WHERE day >= ?",
+            (day,),
+        ).fetchone()[0]
+
+        if participant is None:
+            convergence_rows = conn.execute(
+                """
+                SELECT convergence_status, SUM(decisions) AS decisions
+                FROM decision_daily_summary
+                WHERE day >= ?
+                GROUP BY convergence_status
+                ORDER BY decisions DESC
+                """,
+                (day,),
+            )
+            total_decisions = window_decisions
+        else:
+            # A participant takes one stance per decision
+            convergence_rows = conn.execute(
+                f"""
+                SELECT convergence_status, SUM(stances) AS decisions
+                FROM stance_daily_summary
+                WHERE {stance_filter}
+                GROUP BY convergence_status
+                ORDER BY decisions DESC
+                """,
+                stance_params,
+            )
+            total_decisions = sum(p["stances"] for p in participants.values())
+        convergence = {
+            row["convergence_status"]: row["decisions"] for row in convergence_rows
+        }
+
+        return {
+            "total_decisions": total_decisions,
+            "participants": list(participants.values()),
+            "convergence": convergence,
+            "total_stances": sum(p["stances"] for p in participants.values()),
+            "votes_cast": sum(p["votes"] for p in participants.values()),
+            "window_decisions": window_decisions,
+        }
+
     def save_similarity(self, similarity: DecisionSimilarity) -> None:
         """Save or update a similarity relationship.
 
@@ -425,11 +957,205 @@ class DecisionGraphStorage:
                     similarity.computed_at.isoformat(),
                 ),
             )
+            self._merge_neighbors(conn, [similarity])
             logger.debug(
                 f"Saved similarity: {similarity.source_id} -> {similarity.target_id} "
                 f"(score={similarity.similarity_score:.3f})"
             )
 
+    def save_similarities(
+        self,
+        similarities: List[DecisionSimilarity],
+        scanned_ids: Optional[List[str]] = None,
+    ) -> int:
+        """Save or update many similarity relationships in one transaction.
+
+        Each edge is also merged into the neighbour lists of both endpoints.
+
+        Args:
+            similarities: DecisionSimilarity edges to save
+            scanned_ids: Decisions whose candidates were all scored to produce
+                these edges; their neighbour lists are marked as computed
+
+        Returns:
+            Number of edges written
+
+        Raises:
+            sqlite3.IntegrityError: If any source_id or target_id doesn't exist
+        """
+        if not similarities and not scanned_ids:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO decision_similarities (
+                    source_id, target_id, similarity_score, computed_at
+                ) VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (
+                        similarity.source_id,
+                        similarity.target_id,
+                        similarity.similarity_score,
+                        similarity.computed_at.isoformat(),
+                    )
+                    for similarity in similarities
+                ],
+            )
+            self._merge_neighbors(conn, similarities)
+            if scanned_ids:
+                self._mark_scanned(conn, scanned_ids)
+        logger.debug(f"Saved {len(similarities)} similarities in one transaction")
+        return len(similarities)
+
+    def _merge_neighbors(
+        self, conn: sqlite3.Connection, similarities: List[DecisionSimilarity]
+    ) -> None:
+        """Add edges to both endpoints' neighbour lists and re-trim them."""
+        if not similarities:
+            return
+        rows = []
+        for similarity in similarities:
+            score = similarity.similarity_score
+            rows.append((similarity.source_id, similarity.target_id, score))
+            rows.append((similarity.target_id, similarity.source_id, score))
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO decision_neighbors (
+                decision_id, neighbor_id, similarity_score
+            ) VALUES (?, ?, ?)
+            """,
+            rows,
+        )
+        self._trim_neighbors(conn, {row[0] for row in rows})
+
+    def _trim_neighbors(self, conn: sqlite3.Connection, decision_ids) -> None:
+        """Drop everything past the NEIGHBOR_LIST_SIZE best entries."""
+        conn.executemany(
+            """
+            DELETE FROM decision_neighbors
+            WHERE decision_id = ?
+              AND neighbor_id NOT IN (
+                  SELECT neighbor_id FROM decision_neighbors
+                  WHERE decision_id = ?
+                  ORDER BY similarity_score DESC, neighbor_id
+                  LIMIT ?
+              )
+            """,
+            [
+                (decision_id, decision_id, self.NEIGHBOR_LIST_SIZE)
+                for decision_id in decision_ids
+            ],
+        )
+
+    def _mark_scanned(self, conn: sqlite3.Connection, decision_ids: List[str]) -> None:
+        """Record that these decisions' neighbour lists have been computed."""
+        scanned_at = datetime.now().isoformat()
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO decision_neighbor_scans (decision_id, scanned_at)
+            VALUES (?, ?)
+            """,
+            [(decision_id, scanned_at) for decision_id in decision_ids],
+        )
+
+    def replace_neighbor_lists(
+        self, neighbor_lists: Dict[str, List[Tuple[str, float]]]
+    ) -> None:
+        """Replace decisions' neighbour lists with fully computed ones.
+
+        Used by the backfill. Each list is trimmed to NEIGHBOR_LIST_SIZE, the
+        decisions are marked as scanned and their neighbours gain them in
+        return, all in one transaction.
+
+        Args:
+            neighbor_lists: decision_id -> [(neighbor_id, similarity_score)]
+        """
+        if not neighbor_lists:
+            return
+
+        with self.transaction() as conn:
+            rows = []
+            for decision_id, neighbors in neighbor_lists.items():
+                conn.execute(
+                    "DELETE FROM decision_neighbors WHERE decision_id = ?",
+                    (decision_id,),
+                )
+                ranked = sorted(neighbors, key=lambda n: n[1], reverse=True)
+                for neighbor_id, score in ranked[: self.NEIGHBOR_LIST_SIZE]:
+                    rows.append((decision_id, neighbor_id, score))
+                    rows.append((neighbor_id, decision_id, score))
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO decision_neighbors (
+                    decision_id, neighbor_id, similarity_score
+                ) VALUES (?, ?, ?)
+                """,
+                rows,
+            )
+            self._trim_neighbors(conn, {row[0] for row in rows})
+            self._mark_scanned(conn, list(neighbor_lists))
+
+    def get_neighbors(
+        self, decision_id: str, min_score: float = 0.0, limit: int = 10
+    ) -> Optional[List[Tuple[DecisionNode, float]]]:
+        """Read a decision's maintained neighbour list (best first).
+
+        Args:
+            decision_id: UUID of the decision
+            min_score: Minimum similarity score to include
+            limit: Maximum number of neighbours to return
+
+        Returns:
+            List of (DecisionNode, similarity_score) tuples, or None if the
+            decision's neighbour list has not been computed yet
+        """
+        scanned = self.conn.execute(
+            "SELECT 1 FROM decision_neighbor_scans WHERE decision_id = ?",
+            (decision_id,),
+        ).fetchone()
+        if scanned is None:
+            return None
+
+        cursor = self.conn.execute(
+            """
+            SELECT
+                dn.id, dn.question, dn.timestamp, dn.consensus, dn.winning_option,
+                dn.convergence_status, dn.participants, dn.transcript_path, dn.metadata,
+                nb.similarity_score
+            FROM decision_neighbors nb
+            JOIN decision_nodes dn ON nb.neighbor_id = dn.id
+            WHERE nb.decision_id = ? AND nb.similarity_score >= ?
+            ORDER BY nb.similarity_score DESC
+            LIMIT ?
+            """,
+            (decision_id, min_score, limit),
+        )
+        return [
+            (self._row_to_decision_node(row), row["similarity_score"])
+            for row in cursor.fetchall()
+        ]
+
+    def get_decision_questions(
+        self, unscanned_only: bool = False
+    ) -> List[Tuple[str, str]]:
+        """List (id, question) for all decisions, newest first.
+
+        Args:
+            unscanned_only: Only decisions without a computed neighbour list
+
+        Returns:
+            List of (decision_id, question) tuples
+        """
+        query = "SELECT id, question FROM decision_nodes"
+        if unscanned_only:
+            query += (
+                " WHERE id NOT IN (SELECT decision_id FROM decision_neighbor_scans)"
+            )
+        query += " ORDER BY timestamp DESC"
+        return [(row["id"], row["question"]) for row in self.conn.execute(query)]
+
     def get_similar_decisions(
         self, decision_id: str, threshold: float = 0.7, limit: int = 10
     ) -> List[Tuple[DecisionNode, float]]:
@@ -472,11 +1198,404 @@ class DecisionGraphStorage:
         )
         return results
 
+    # Streaming reads (exports)
+
+    def iter_decisions(
+        self,
+        since_version: int = 0,
+        until_version: Optional[int] = None,
+        include_archived: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[DecisionNode]:
+        """Stream decisions in storage order without loading them all.
+
+        Args:
+            since_version: Only decisions stored after this graph version
+            until_version: Only decisions up to this graph version
+            include_archived: Also stream the archive tier (after hot rows)
+            batch_size: Rows fetched from the cursor at a time
+
+        Yields:
+            DecisionNode objects, oldest first
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT id, question, timestamp, consensus, winning_option,
+                   convergence_status, participants, transcript_path, metadata
+            FROM main.decision_nodes
+            WHERE rowid > ? AND rowid <= ?
+            ORDER BY rowid
+            """,
+            (since_version, _MAX_ROWID if until_version is None else until_version),
+        )
+        yield from self._iter_cursor(cursor, self._row_to_decision_node, batch_size)
+
+        if include_archived and self.attach_archive(create=False):
+            cursor = self.conn.execute(
+                """
+                SELECT id, question, timestamp, consensus, winning_option,
+                       convergence_status, participants, transcript_path, metadata
+                FROM archive.decision_nodes
+                ORDER BY rowid
+                """
+            )
+            yield from self._iter_cursor(
+                cursor, self._row_to_decision_node, batch_size
+            )
+
+    def iter_participant_stances(
+        self,
+        since_version: int = 0,
+        until_version: Optional[int] = None,
+        include_archived: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[ParticipantStance]:
+        """Stream the stances of the decisions iter_decisions() would yield.
+
+        Args:
+            since_version: Only stances of decisions stored after this version
+            until_version: Only stances of decisions up to this version
+            include_archived: Also stream the archive tier
+            batch_size: Rows fetched from the cursor at a time
+
+        Yields:
+            ParticipantStance objects
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT ps.decision_id, ps.participant, ps.vote_option, ps.confidence,
+                   ps.rationale, ps.final_position
+            FROM main.participant_stances ps
+            JOIN main.decision_nodes dn ON dn.id = ps.decision_id
+            WHERE dn.rowid > ? AND dn.rowid <= ?
+            ORDER BY ps.id
+            """,
+            (since_version, _MAX_ROWID if until_version is None else until_version),
+        )
+        yield from self._iter_cursor(
+            cursor, self._row_to_participant_stance, batch_size
+        )
+
+        if include_archived and self.attach_archive(create=False):
+            cursor = self.conn.execute(
+                """
+                SELECT decision_id, participant, vote_option, confidence,
+                       rationale, final_position
+                FROM archive.participant_stances
+                ORDER BY id
+                """
+            )
+            yield from self._iter_cursor(
+                cursor, self._row_to_participant_stance, batch_size
+            )
+
+    def iter_similarities(
+        self,
+        computed_after: Optional[datetime] = None,
+        include_archived: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[DecisionSimilarity]:
+        """Stream similarity edges without loading them all.
+
+        Args:
+            computed_after: Only edges computed (or recomputed) after this time
+            include_archived: Also stream the archive tier
+            batch_size: Rows fetched from the cursor at a time
+
+        Yields:
+            DecisionSimilarity objects
+        """
+        after = computed_after.isoformat() if computed_after else ""
+        cursor = self.conn.execute(
+            """
+            SELECT source_id, target_id, similarity_score, computed_at
+            FROM main.decision_similarities
+            WHERE computed_at > ?
+            ORDER BY rowid
+            """,
+            (after,),
+        )
+        yield from self._iter_cursor(cursor, self._row_to_similarity, batch_size)
+
+        if include_archived and self.attach_archive(create=False):
+            cursor = self.conn.execute(
+                """
+                SELECT source_id, target_id, similarity_score, computed_at
+                FROM archive.decision_similarities
+                ORDER BY rowid
+                """
+            )
+            yield from self._iter_cursor(cursor, self._row_to_similarity, batch_size)
+
+    def get_export_checkpoint(self, name: str) -> Optional[Tuple[int, datetime]]:
+        """Return (graph_version, exported_at) of the last export under name."""
+        row = self.conn.execute(
+            "SELECT graph_version, exported_at FROM export_checkpoints WHERE name = ?",
+            (name,),
+        ).fetchone()
+        if row is None:
+            return None
+        return row["graph_version"], datetime.fromisoformat(row["exported_at"])
+
+    def save_export_checkpoint(
+        self, name: str, graph_version: int, exported_at: datetime
+    ) -> None:
+        """Record the high-water mark of a completed export.
+
+        Args:
+            name: Checkpoint name (one per export pipeline)
+            graph_version: Graph version the export covered
+            exported_at: When the export started reading
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO export_checkpoints (
+                    name, graph_version, exported_at
+                ) VALUES (?, ?, ?)
+                """,
+                (name, graph_version, exported_at.isoformat()),
+            )
+
+    @staticmethod
+    def _iter_cursor(
+        cursor: sqlite3.Cursor, convert: Callable, batch_size: int
+    ) -> Iterator:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield convert(row)
+
+    # Archive tier
+
+    def attach_archive(self, create: bool = True) -> bool:
+        """Attach the archive database to the connection as schema "archive".
+
+        Args:
+            create: Create the archive database if it does not exist yet
+
+        Returns:
+            True if the archive is attached, False if it does not exist and
+            create is False
+        """
+        conn = self.conn
+        if self._archive_conn is conn:
+            return True
+        if not create and (
+            self.archive_path == ":memory:" or not os.path.exists(self.archive_path)
+        ):
+            return False
+
+        conn.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS archive.decision_nodes (
+                    id TEXT PRIMARY KEY,
+                    question TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    consensus TEXT NOT NULL,
+                    winning_option TEXT,
+                    convergence_status TEXT NOT NULL,
+                    participants TEXT NOT NULL,
+                    transcript_path TEXT NOT NULL,
+                    metadata TEXT,
+                    last_accessed TEXT,
+                    archived_at TEXT NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS archive.participant_stances (
+                    id INTEGER PRIMARY KEY,
+                    decision_id TEXT NOT NULL,
+                    participant TEXT NOT NULL,
+                    vote_option TEXT,
+                    confidence REAL,
+                    rationale TEXT,
+                    final_position TEXT
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS archive.decision_similarities (
+                    source_id TEXT NOT NULL,
+                    target_id TEXT NOT NULL,
+                    similarity_score REAL NOT NULL,
+                    computed_at TEXT NOT NULL,
+                    PRIMARY KEY (source_id, target_id)
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS archive.idx_archive_decision_timestamp
+                ON decision_nodes(timestamp DESC)
+            """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS archive.idx_archive_participant_decision
+                ON participant_stances(decision_id)
+            """
+            )
+
+        self._archive_conn = conn
+        logger.debug(f"Attached archive database {self.archive_path}")
+        return True
+
+    def archive_decisions(self, decision_ids: List[str]) -> Dict[str, int]:
+        """Move decisions to the archive tier in one transaction.
+
+        Each decision is copied to the archive with its participant stances
+        and every similarity edge that touches it, then removed from the hot
+        tables along with its neighbour list and its entries in other
+        decisions' neighbour lists. Callers holding version-stamped query
+        caches must invalidate them.
+
+        Args:
+            decision_ids: IDs of hot decisions to archive
+
+        Returns:
+            Dictionary with the number of decisions, stances and similarities
+            moved
+        """
+        counts = {"decisions": 0, "stances": 0, "similarities": 0}
+        if not decision_ids:
+            return counts
+
+        self.attach_archive()
+        archived_at = datetime.now().isoformat()
+        batch = "SELECT id FROM temp.archive_batch"
+        with self.transaction() as conn:
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS archive_batch (id TEXT PRIMARY KEY)"
+            )
+            conn.execute("DELETE FROM temp.archive_batch")
+            conn.executemany(
+                "INSERT OR IGNORE INTO temp.archive_batch (id) VALUES (?)",
+                [(decision_id,) for decision_id in decision_ids],
+            )
+
+            counts["decisions"] = conn.execute(
+                f"""
+                INSERT OR REPLACE INTO archive.decision_nodes (
+                    id, question, timestamp, consensus, winning_option,
+                    convergence_status, participants, transcript_path, metadata,
+                    last_accessed, archived_at
+                )
+                SELECT id, question, timestamp, consensus, winning_option,
+                       convergence_status, participants, transcript_path, metadata,
+                       last_accessed, ?
+                FROM main.decision_nodes
+                WHERE id IN ({batch})
+                """,
+                (archived_at,),
+            ).rowcount
+            counts["stances"] = conn.execute(
+                f"""
+                INSERT OR REPLACE INTO archive.participant_stances (
+                    id, decision_id, participant, vote_option, confidence,
+                    rationale, final_position
+                )
+                SELECT id, decision_id, participant, vote_option, confidence,
+                       rationale, final_position
+                FROM main.participant_stances
+                WHERE decision_id IN ({batch})
+                """
+            ).rowcount
+            counts["similarities"] = conn.execute(
+                f"""
+                INSERT OR REPLACE INTO archive.decision_similarities (
+                    source_id, target_id, similarity_score, computed_at
+                )
+                SELECT source_id, target_id, similarity_score, computed_at
+                FROM main.decision_similarities
+                WHERE source_id IN ({batch}) OR target_id IN ({batch})
+                """
+            ).rowcount
+
+            # Children first so foreign keys hold at every step
+            conn.execute(
+                f"""
+                DELETE FROM main.decision_neighbors
+                WHERE decision_id IN ({batch}) OR neighbor_id IN ({batch})
+                """
+            )
+            conn.execute(
+                f"""
+                DELETE FROM main.decision_neighbor_scans
+                WHERE decision_id IN ({batch})
+                """
+            )
+            conn.execute(
+                f"""
+                DELETE FROM main.decision_similarities
+                WHERE source_id IN ({batch}) OR target_id IN ({batch})
+                """
+            )
+            conn.execute(
+                f"DELETE FROM main.participant_stances WHERE decision_id IN ({batch})"
+            )
+            conn.execute(f"DELETE FROM main.decision_nodes WHERE id IN ({batch})")
+            conn.execute("DELETE FROM temp.archive_batch")
+
+        logger.info(
+            f"Archived {counts['decisions']} decisions "
+            f"({counts['stances']} stances, {counts['similarities']} similarities) "
+            f"to {self.archive_path}"
+        )
+        return counts
+
+    def get_archived_decisions(
+        self, limit: int = 100, offset: int = 0
+    ) -> List[DecisionNode]:
+        """List archived decisions ordered by timestamp (newest first).
+
+        Args:
+            limit: Maximum number of decisions to return
+            offset: Number of decisions to skip (for pagination)
+
+        Returns:
+            List of DecisionNode objects (empty if nothing was ever archived)
+        """
+        if not self.attach_archive(create=False):
+            return []
+        cursor = self.conn.execute(
+            """
+            SELECT id, question, timestamp, consensus, winning_option,
+                   convergence_status, participants, transcript_path, metadata
+            FROM archive.decision_nodes
+            ORDER BY timestamp DESC
+            LIMIT ? OFFSET ?
+            """,
+            (limit, offset),
+        )
+        return [self._row_to_decision_node(row) for row in cursor.fetchall()]
+
+    def count_archived_decisions(self) -> int:
+        """Return the number of decisions in the archive tier."""
+        if not self.attach_archive(create=False):
+            return 0
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM archive.decision_nodes"
+        ).fetchone()
+        return row[0]
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Write buffered access stamps and close the database connection."""
         if self._conn is not None:
+            try:
+                self.flush_access()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write buffered decision access: {e}")
             self._conn.close()
             self._conn = None
+            self._archive_conn = None
             logger.debug(f"Closed database connection to {self.db_path}")
 
     def _row_to_decision_node(self, row: sqlite3.Row) -> DecisionNode:
@@ -518,6 +1637,15 @@ class DecisionGraphStorage:
             final_position=row["final_position"],
         )
 
+    def _row_to_similarity(self, row: sqlite3.Row) -> DecisionSimilarity:
+        """Convert database row to DecisionSimilarity model."""
+        return DecisionSimilarity(
+            source_id=row["source_id"],
+            target_id=row["target_id"],
+            similarity_score=row["similarity_score"],
+            computed_at=datetime.fromisoformat(row["computed_at"]),
+        )
+
     def __enter__(self):
         """Support context manager protocol."""
         return self
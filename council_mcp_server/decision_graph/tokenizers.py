@@ -0,0 +1,78 @@
+"""Token counting for decision graph context injection.
+
+Context injection is budgeted in tokens. The default HeuristicTokenizer
+assumes ~4 characters per token and has no dependencies; TiktokenTokenizer
+counts real BPE tokens when tiktoken is installed.
+
+Example:
+    >>> tokenizer = get_tokenizer("tiktoken:cl100k_base")
+    >>> tokenizer.count("Should we adopt TypeScript?")
+"""
+
+import logging
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+
+class Tokenizer(ABC):
+    """Counts tokens in rendered context."""
+
+    #: Identifies the tokenizer in caches (counts differ between tokenizers)
+    name: str
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in text."""
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Rough estimate: 1 token ≈ 4 characters (conservative for English)."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        return len(text) // 4
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact BPE token counts via tiktoken.
+
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken:{encoding}"
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def get_tokenizer(spec: str = "heuristic") -> Tokenizer:
+    """Build a tokenizer from a config string.
+
+    Args:
+        spec: "heuristic", "tiktoken" or "tiktoken:<encoding>"
+
+    Returns:
+        Tokenizer instance (HeuristicTokenizer if tiktoken is unavailable)
+
+    Raises:
+        ValueError: If spec names an unknown tokenizer
+    """
+    kind, _, encoding = spec.partition(":")
+    if kind == "heuristic":
+        return HeuristicTokenizer()
+    if kind == "tiktoken":
+        try:
+            return TiktokenTokenizer(encoding or "cl100k_base")
+        except ImportError:
+            logger.warning(
+                "tiktoken not installed, falling back to heuristic token counts"
+            )
+            return HeuristicTokenizer()
+    raise ValueError(f"Unknown tokenizer: {spec}")
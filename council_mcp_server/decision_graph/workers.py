@@ -7,9 +7,10 @@ times fast by deferring expensive similarity computation to background tasks.
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Set
 from uuid import uuid4
 
 from decision_graph.schema import DecisionSimilarity
@@ -46,7 +47,8 @@ class BackgroundWorker:
     - Priority queue for similarity computation jobs
     - Async worker loop for processing jobs
     - Graceful shutdown with pending job handling
-    - Batch processing to reduce overhead
+    - Micro-batching: jobs arriving within batch_wait_ms are scored together
+      with one similarity matrix and written in one transaction
     - Memory-bounded queue to prevent runaway growth
 
     Example:
@@ -68,6 +70,8 @@ class BackgroundWorker:
         batch_size: int = 50,
         similarity_threshold: float = 0.5,
         config: Optional["DecisionGraphConfig"] = None,
+        max_batch_jobs: int = 32,
+        batch_wait_ms: int = 50,
     ):
         """Initialize background worker.
 
@@ -77,6 +81,8 @@ class BackgroundWorker:
             batch_size: Number of recent decisions to compare against per job
             similarity_threshold: Minimum similarity score to store (0.0-1.0)
             config: Optional DecisionGraphConfig to override defaults
+            max_batch_jobs: Maximum number of jobs processed together
+            batch_wait_ms: How long to keep collecting jobs once one arrives
         """
         self.storage = storage
         self.config = config
@@ -96,6 +102,8 @@ class BackgroundWorker:
             self.max_queue_size = max_queue_size
             self.batch_size = batch_size
             self.similarity_threshold = similarity_threshold
+        self.max_batch_jobs = max(1, max_batch_jobs)
+        self.batch_wait_ms = max(0, batch_wait_ms)
 
         # Priority queues
         self.high_priority_queue: asyncio.Queue[SimilarityJob] = asyncio.Queue(
@@ -114,13 +122,21 @@ class BackgroundWorker:
         self.jobs_processed = 0
         self.jobs_failed = 0
         self.total_similarities_computed = 0
+        self.batches_processed = 0
+        self.total_batched_jobs = 0
+        self.last_batch_size = 0
+        self.max_batch_size_seen = 0
+        self.last_batch_latency_ms = 0.0
+        self.max_batch_latency_ms = 0.0
+        self.total_batch_latency_ms = 0.0
 
         # Similarity detector
         self.similarity_detector = QuestionSimilarityDetector()
 
         logger.info(
             f"Initialized BackgroundWorker (max_queue_size={max_queue_size}, "
-            f"batch_size={batch_size}, threshold={similarity_threshold})"
+            f"batch_size={batch_size}, threshold={similarity_threshold}, "
+            f"max_batch_jobs={self.max_batch_jobs}, batch_wait_ms={self.batch_wait_ms})"
         )
 
     async def start(self) -> None:
@@ -204,7 +220,8 @@ class BackgroundWorker:
         Args:
             decision_id: UUID of decision to compute similarities for
             priority: Job priority ("high" or "low")
-            delay_seconds: Delay before processing (allows batching)
+            delay_seconds: Delay before the job is queued. Batching happens in
+                the worker loop, so callers normally pass 0.
 
         Raises:
             asyncio.QueueFull: If queue is at max capacity
@@ -231,7 +248,6 @@ class BackgroundWorker:
         )
 
         try:
-            # Apply delay to allow batching
             if delay_seconds > 0:
                 await asyncio.sleep(delay_seconds)
 
@@ -246,56 +262,58 @@ class BackgroundWorker:
             )
             raise
 
+    def _next_job(self) -> Optional[SimilarityJob]:
+        """Pop the next job without waiting, high priority first."""
+        for queue in (self.high_priority_queue, self.low_priority_queue):
+            try:
+                return queue.get_nowait()
+            except asyncio.QueueEmpty:
+                continue
+        return None
+
+    async def _collect_batch(self, first: SimilarityJob) -> List[SimilarityJob]:
+        """Gather jobs behind first until max_batch_jobs or batch_wait_ms elapse."""
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait_ms / 1000
+        while len(batch) < self.max_batch_jobs:
+            job = self._next_job()
+            if job is not None:
+                batch.append(job)
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, 0.01))
+        return batch
+
     async def _process_queue(self) -> None:
-        """Main worker loop - processes queued jobs.
+        """Main worker loop - processes queued jobs in micro-batches.
 
-        Continuously processes jobs from priority queues until stopped.
-        High-priority jobs are processed before low-priority jobs.
+        Waits for a job, then keeps draining the priority queues (high before
+        low) until max_batch_jobs are collected or batch_wait_ms has passed,
+        and computes similarities for the whole batch at once.
         """
         logger.info("Worker loop started")
 
         while self.running:
             try:
-                # Try high-priority queue first (non-blocking)
-                job = None
-                try:
-                    job = self.high_priority_queue.get_nowait()
-                    logger.debug(f"Processing high-priority job {job.job_id}")
-                except asyncio.QueueEmpty:
-                    pass
+                job = self._next_job()
 
-                # If no high-priority job, try low-priority
-                if job is None:
-                    try:
-                        job = self.low_priority_queue.get_nowait()
-                        logger.debug(f"Processing low-priority job {job.job_id}")
-                    except asyncio.QueueEmpty:
-                        pass
-
-                # If still no job, sleep briefly and continue
+                # If no job, write due access stamps, sleep briefly and continue
                 if job is None:
+                    self._flush_access()
                     await asyncio.sleep(0.1)
                     continue
 
-                # Process job
-                self.active_jobs.append(job.job_id)
+                batch = await self._collect_batch(job)
+                job_ids = [batch_job.job_id for batch_job in batch]
+                self.active_jobs.extend(job_ids)
                 try:
-                    await self._compute_similarities(
-                        decision_id=job.decision_id,
-                        batch_size=self.batch_size,
-                    )
-                    self.jobs_processed += 1
-                    logger.debug(
-                        f"Completed job {job.job_id} for decision {job.decision_id}"
-                    )
-                except Exception as e:
-                    self.jobs_failed += 1
-                    logger.error(
-                        f"Job {job.job_id} failed for decision {job.decision_id}: {e}",
-                        exc_info=True,
-                    )
+                    await self._process_batch(batch)
                 finally:
-                    self.active_jobs.remove(job.job_id)
+                    for job_id in job_ids:
+                        self.active_jobs.remove(job_id)
 
             except asyncio.CancelledError:
                 logger.info("Worker loop cancelled")
@@ -304,87 +322,144 @@ class BackgroundWorker:
                 logger.error(f"Unexpected error in worker loop: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Back off on errors
 
+    def _flush_access(self) -> None:
+        """Write retrieval's buffered last_accessed stamps once they are due."""
+        try:
+            self.storage.flush_access(due_only=True)
+        except Exception as e:
+            logger.warning(f"Failed to write buffered decision access: {e}")
+
+    async def _process_batch(self, batch: List[SimilarityJob]) -> None:
+        """Compute similarities for a batch of jobs and record batch statistics."""
+        start = time.perf_counter()
+        decision_ids = list(dict.fromkeys(job.decision_id for job in batch))
+
+        try:
+            failed_ids = await self._compute_batch_similarities(
+                decision_ids, batch_size=self.batch_size
+            )
+        except Exception as e:
+            failed_ids = set(decision_ids)
+            logger.error(
+                f"Batch of {len(batch)} jobs failed: {e}",
+                exc_info=True,
+            )
+
+        for job in batch:
+            if job.decision_id in failed_ids:
+                self.jobs_failed += 1
+                logger.error(f"Job {job.job_id} failed for decision {job.decision_id}")
+            else:
+                self.jobs_processed += 1
+                logger.debug(
+                    f"Completed job {job.job_id} for decision {job.decision_id}"
+                )
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.batches_processed += 1
+        self.last_batch_size = len(batch)
+        self.max_batch_size_seen = max(self.max_batch_size_seen, len(batch))
+        self.total_batched_jobs += len(batch)
+        self.last_batch_latency_ms = latency_ms
+        self.max_batch_latency_ms = max(self.max_batch_latency_ms, latency_ms)
+        self.total_batch_latency_ms += latency_ms
+        logger.debug(f"Processed batch of {len(batch)} jobs in {latency_ms:.1f}ms")
+
     async def _compute_similarities(
         self,
         decision_id: str,
         batch_size: int = 50,
     ) -> None:
-        """Compute similarities for a decision.
-
-        Compares the decision against recent decisions and stores
-        similarity relationships above the threshold.
+        """Compute similarities for a single decision.
 
         Args:
             decision_id: UUID of decision to compute similarities for
             batch_size: Number of recent decisions to compare against
+
+        Raises:
+            ValueError: If the decision is not in storage
         """
-        try:
-            # Get the decision node
-            decision = self.storage.get_decision_node(decision_id)
-            if not decision:
-                logger.error(f"Decision {decision_id} not found in storage")
-                raise ValueError(f"Decision {decision_id} not found in storage")
+        failed = await self._compute_batch_similarities([decision_id], batch_size)
+        if failed:
+            raise ValueError(f"Decision {decision_id} not found in storage")
 
-            # Get recent decisions to compare against
-            recent_decisions = self.storage.get_all_decisions(
-                limit=batch_size + 1  # +1 to account for self
-            )
+    async def _compute_batch_similarities(
+        self,
+        decision_ids: List[str],
+        batch_size: int = 50,
+    ) -> Set[str]:
+        """Compute similarities for several decisions in one pass.
 
-            if not recent_decisions:
-                logger.debug(f"No decisions to compare against for {decision_id}")
-                return
+        Compares every decision against the batch_size most recent decisions
+        using a single similarity matrix computed in the default executor,
+        then stores all edges above the threshold in one transaction.
 
-            # Compute similarities
-            similarities_stored = 0
-            for existing in recent_decisions:
-                # Skip self-comparison
-                if existing.id == decision_id:
-                    continue
+        Args:
+            decision_ids: UUIDs of decisions to compute similarities for
+            batch_size: Number of recent decisions to compare each against
 
-                try:
-                    # Compute similarity score
-                    score = self.similarity_detector.compute_similarity(
-                        decision.question,
-                        existing.question,
-                    )
+        Returns:
+            IDs of decisions that could not be found in storage
+        """
+        decisions = []
+        missing: Set[str] = set()
+        for decision_id in decision_ids:
+            decision = self.storage.get_decision_node(decision_id)
+            if decision is None:
+                logger.error(f"Decision {decision_id} not found in storage")
+                missing.add(decision_id)
+            else:
+                decisions.append(decision)
+
+        if not decisions:
+            return missing
+
+        # Comparison window; room for the batch itself so every decision
+        # still sees batch_size others after skipping self.
+        window = self.storage.get_all_decisions(limit=batch_size + len(decisions))
+        if not window:
+            logger.debug(f"No decisions to compare against for {decision_ids}")
+            return missing
+
+        loop = asyncio.get_running_loop()
+        matrix = await loop.run_in_executor(
+            None,
+            self.similarity_detector.compute_similarity_matrix,
+            [decision.question for decision in decisions],
+            [existing.question for existing in window],
+        )
 
-                    # Store if above threshold (clamp score to [0, 1] to handle floating point precision)
-                    if score >= self.similarity_threshold:
-                        # Clamp score to [0, 1] to prevent validation errors from floating point overflow
-                        clamped_score = max(0.0, min(1.0, score))
-                        similarity = DecisionSimilarity(
-                            source_id=decision_id,
+        computed_at = datetime.now()
+        similarities = []
+        for decision, row in zip(decisions, matrix):
+            compared = 0
+            for existing, score in zip(window, row):
+                # Skip self-comparison
+                if existing.id == decision.id:
+                    continue
+                if compared >= batch_size:
+                    break
+                compared += 1
+                if score >= self.similarity_threshold:
+                    similarities.append(
+                        DecisionSimilarity(
+                            source_id=decision.id,
                             target_id=existing.id,
-                            similarity_score=clamped_score,
-                            computed_at=datetime.now(),
+                            similarity_score=max(0.0, min(1.0, score)),
+                            computed_at=computed_at,
                         )
-                        self.storage.save_similarity(similarity)
-                        similarities_stored += 1
-                        self.total_similarities_computed += 1
-
-                        logger.debug(
-                            f"Stored similarity: {decision_id[:8]}... -> "
-                            f"{existing.id[:8]}... (score={score:.3f})"
-                        )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error computing similarity with {existing.id}: {e}",
-                        exc_info=True,
                     )
-                    continue
 
-            logger.info(
-                f"Computed {similarities_stored} similarities for decision {decision_id} "
-                f"(compared against {len(recent_decisions) - 1} decisions)"
-            )
+        stored = self.storage.save_similarities(
+            similarities, scanned_ids=[decision.id for decision in decisions]
+        )
+        self.total_similarities_computed += stored
 
-        except Exception as e:
-            logger.error(
-                f"Error in _compute_similarities for {decision_id}: {e}",
-                exc_info=True,
-            )
-            raise
+        logger.info(
+            f"Computed {stored} similarities for {len(decisions)} decisions "
+            f"(compared against {len(window)} recent decisions)"
+        )
+        return missing
 
     def get_stats(self) -> dict:
         """Return queue statistics.
@@ -403,4 +478,21 @@ class BackgroundWorker:
             "max_queue_size": self.max_queue_size,
             "batch_size": self.batch_size,
             "similarity_threshold": self.similarity_threshold,
+            "max_batch_jobs": self.max_batch_jobs,
+            "batch_wait_ms": self.batch_wait_ms,
+            "batches_processed": self.batches_processed,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size_seen,
+            "avg_batch_size": (
+                round(self.total_batched_jobs / self.batches_processed, 2)
+                if self.batches_processed
+                else 0.0
+            ),
+            "last_batch_latency_ms": round(self.last_batch_latency_ms, 2),
+            "max_batch_latency_ms": round(self.max_batch_latency_ms, 2),
+            "avg_batch_latency_ms": (
+                round(self.total_batch_latency_ms / self.batches_processed, 2)
+                if self.batches_processed
+                else 0.0
+            ),
         }
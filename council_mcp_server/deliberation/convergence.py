@@ -2,7 +2,7 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,20 @@ class SimilarityBackend(ABC):
         """
         pass
 
+    def compute_similarity_matrix(
+        self, texts1: Sequence[str], texts2: Sequence[str]
+    ) -> List[List[float]]:
+        """
+        Compute similarities between every text in texts1 and every text in texts2.
+
+        The default implementation scores each pair with compute_similarity;
+        backends that can vectorise the texts once override it.
+
+        Returns:
+            Matrix with one row per text in texts1 and one column per text in texts2
+        """
+        return [[self.compute_similarity(a, b) for b in texts2] for a in texts1]
+
 
 # =============================================================================
 # Jaccard Backend (Zero Dependencies)
@@ -89,6 +103,16 @@ class JaccardBackend(SimilarityBackend):
         similarity = len(intersection) / len(union)
         return similarity
 
+    def compute_similarity_matrix(
+        self, texts1: Sequence[str], texts2: Sequence[str]
+    ) -> List[List[float]]:
+        """Jaccard similarity matrix, tokenising each text only once."""
+        sets1 = [set(text.lower().split()) if text else set() for text in texts1]
+        sets2 = [set(text.lower().split()) if text else set() for text in texts2]
+        return [
+            [len(a & b) / len(a | b) if a and b else 0.0 for b in sets2] for a in sets1
+        ]
+
 
 # =============================================================================
 # TF-IDF Backend (Requires scikit-learn)
@@ -224,6 +248,22 @@ class SentenceTransformerBackend(SimilarityBackend):
 
         return float(similarity)
 
+    def compute_similarity_matrix(
+        self, texts1: Sequence[str], texts2: Sequence[str]
+    ) -> List[List[float]]:
+        """Cosine similarity matrix from a single batched encode of all texts."""
+        if not texts1 or not texts2:
+            return [[0.0] * len(texts2) for _ in texts1]
+
+        embeddings = self.model.encode(list(texts1) + list(texts2))
+        matrix = self.cosine_similarity(
+            embeddings[: len(texts1)], embeddings[len(texts1) :]
+        )
+        return [
+            [float(score) if a and b else 0.0 for b, score in zip(texts2, row)]
+            for a, row in zip(texts1, matrix)
+        ]
+
 
 # =============================================================================
 # Convergence Result
@@ -71,7 +71,13 @@ class DeliberationEngine:
         if transcript_manager is None:
             from deliberation.transcript import TranscriptManager
 
-            self.transcript_manager = TranscriptManager(server_dir=server_dir)
+            storage_config = getattr(config, "storage", None) if config else None
+            compression = getattr(storage_config, "compression", None)
+            self.transcript_manager = TranscriptManager(
+                server_dir=server_dir,
+                compression=compression if isinstance(compression, str) else None,
+                index=getattr(storage_config, "transcript_index", True) is not False,
+            )
 
         # Initialize convergence detector if enabled
         self.convergence_detector = None
@@ -1430,9 +1436,11 @@ TOOL_REQUEST: {"name": "search_code", "arguments": {"pattern": "class.*Adapter",
                 else {},
             )
 
-        # Save transcript
+        # Save transcript (off the event loop, on the transcript writer thread)
         if self.transcript_manager:
-            transcript_path = self.transcript_manager.save(result, request.question)
+            transcript_path = await self.transcript_manager.save_async(
+                result, request.question
+            )
             result.transcript_path = transcript_path
 
         # Store deliberation in decision graph if enabled
@@ -0,0 +1,227 @@
+"""One-sentence summaries of council transcript entries.
+
+Entries are grouped into chunks that fit a token budget and each chunk is
+summarized by its own adapter call, with a bounded number of calls in
+flight. Results are merged back by (round, participant), so one chunk
+failing to parse only loses that chunk's summaries. Summaries are cached by
+a hash of the response text, so re-rendering a council only summarizes
+entries that changed.
+
+Example:
+    >>> summarizer = EntrySummarizer()
+    >>> rows = await summarizer.summarize(entries, adapter, "gemini-2.5-flash")
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from decision_graph.cache import LRUCache
+from decision_graph.tokenizers import HeuristicTokenizer, Tokenizer
+
+logger = logging.getLogger(__name__)
+
+#: Characters of each response (before its VOTE section) sent for summarizing
+MAX_BODY_CHARS = 1500
+
+PROMPT_TEMPLATE = (
+    "{lang_note}"
+    "For each analyst response below, write a single sentence (max 180 characters) "
+    "capturing the analyst's core strategic position and key finding. "
+    "Be specific - name the key claim, not just the topic.\n\n"
+    "Return ONLY a JSON array. Each element must have exactly these keys: "
+    "round (integer), participant (string), summary (string). "
+    "Preserve the exact round number and participant name from the input.\n\n"
+    "{entries_text}"
+)
+
+
+def _entry_body(response_text: str) -> str:
+    vote_index = response_text.rfind("VOTE:")
+    body = (
+        response_text[:vote_index].strip()
+        if vote_index != -1
+        else response_text.strip()
+    )
+    return body[:MAX_BODY_CHARS]
+
+
+def _format_item(item: dict) -> str:
+    return f"Round {item['round']} - {item['participant']}:\n{item['body']}"
+
+
+def parse_summary_rows(raw_text: str) -> List[dict]:
+    """Extract summary rows from a model's JSON-array reply.
+
+    Args:
+        raw_text: Adapter output, possibly fenced or wrapped in prose
+
+    Returns:
+        Rows with round (int), participant (str) and summary (str)
+
+    Raises:
+        ValueError: If no JSON array can be parsed
+    """
+    text = raw_text.strip()
+    if text.startswith("```"):
+        lines = text.splitlines()
+        text = "\n".join(lines[1:-1]).strip()
+    start = text.find("[")
+    end = text.rfind("]")
+    if start != -1 and end != -1:
+        text = text[start : end + 1]
+
+    return [
+        {
+            "round": int(row["round"]),
+            "participant": str(row["participant"]),
+            "summary": str(row["summary"]),
+        }
+        for row in json.loads(text)
+        if "round" in row and "participant" in row and "summary" in row
+    ]
+
+
+class EntrySummarizer:
+    """Chunked, concurrent, cached summarization of transcript entries."""
+
+    def __init__(
+        self,
+        chunk_token_budget: int = 2000,
+        max_concurrency: int = 4,
+        cache_size: int = 4096,
+        tokenizer: Optional[Tokenizer] = None,
+    ):
+        """
+        Initialize the summarizer.
+
+        Args:
+            chunk_token_budget: Maximum entry tokens per adapter call (an
+                entry larger than the budget gets a chunk of its own)
+            max_concurrency: Maximum adapter calls in flight per summarize()
+            cache_size: Maximum number of cached entry summaries
+            tokenizer: Token counter for chunking (default: HeuristicTokenizer)
+        """
+        self.chunk_token_budget = chunk_token_budget
+        self.max_concurrency = max_concurrency
+        self.tokenizer = tokenizer or HeuristicTokenizer()
+        self.cache = LRUCache(cache_size)
+
+    @staticmethod
+    def _cache_key(model: str, language: str, response_text: str) -> str:
+        digest = hashlib.sha256(response_text.encode("utf-8")).hexdigest()
+        return f"{model}:{language}:{digest}"
+
+    def _chunk(self, items: List[dict]) -> List[List[dict]]:
+        """Group items greedily, in order, into chunks within the token budget."""
+        chunks: List[List[dict]] = []
+        current: List[dict] = []
+        used = 0
+        for item in items:
+            tokens = self.tokenizer.count(_format_item(item))
+            if current and used + tokens > self.chunk_token_budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def summarize(
+        self,
+        entries: List[dict],
+        adapter,
+        model: str,
+        language: str = "en",
+        lang_note: str = "",
+    ) -> List[dict]:
+        """Summarize transcript entries in one sentence each.
+
+        Args:
+            entries: Dicts with round, participant and response
+            adapter: Adapter whose invoke(prompt, model, context) is called
+            model: Model name passed to the adapter
+            language: Language code (part of the cache key)
+            lang_note: Language instruction prepended to every prompt
+
+        Returns:
+            {round, participant, summary} rows in entry order; entries whose
+            chunk failed are omitted
+        """
+        summaries: Dict[Tuple[int, str], str] = {}
+        pending: List[dict] = []
+        for entry in entries:
+            response_text = entry.get("response", "")
+            item = {
+                "round": entry.get("round"),
+                "participant": entry.get("participant"),
+                "body": _entry_body(response_text),
+                "cache_key": self._cache_key(model, language, response_text),
+            }
+            cached = self.cache.get(item["cache_key"])
+            if cached is not None:
+                summaries[(item["round"], item["participant"])] = cached
+            else:
+                pending.append(item)
+
+        if pending:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            chunks = self._chunk(pending)
+            logger.info(
+                f"Summarizing {len(pending)} entries in {len(chunks)} chunk(s) "
+                f"({len(entries) - len(pending)} cached)"
+            )
+            results = await asyncio.gather(
+                *(
+                    self._summarize_chunk(chunk, adapter, model, lang_note, semaphore)
+                    for chunk in chunks
+                )
+            )
+            for chunk, rows in zip(chunks, results):
+                by_key = {(row["round"], row["participant"]): row for row in rows}
+                for item in chunk:
+                    key = (item["round"], item["participant"])
+                    row = by_key.get(key)
+                    if row is None:
+                        continue
+                    summaries[key] = row["summary"]
+                    self.cache.put(item["cache_key"], row["summary"])
+
+        merged = []
+        seen = set()
+        for entry in entries:
+            key = (entry.get("round"), entry.get("participant"))
+            if key in summaries and key not in seen:
+                seen.add(key)
+                merged.append(
+                    {"round": key[0], "participant": key[1], "summary": summaries[key]}
+                )
+        return merged
+
+    async def _summarize_chunk(
+        self,
+        chunk: List[dict],
+        adapter,
+        model: str,
+        lang_note: str,
+        semaphore: asyncio.Semaphore,
+    ) -> List[dict]:
+        """Summarize one chunk; returns [] (and logs) if the call or parse fails."""
+        prompt = PROMPT_TEMPLATE.format(
+            lang_note=lang_note,
+            entries_text="\n\n".join(_format_item(item) for item in chunk),
+        )
+        async with semaphore:
+            try:
+                raw_text = await adapter.invoke(
+                    prompt=prompt, model=model, context=None
+                )
+                return parse_summary_rows(raw_text)
+            except Exception as exc:
+                logger.warning(
+                    f"Entry summary chunk of {len(chunk)} entries failed: {exc}"
+                )
+                return []
@@ -1,19 +1,44 @@
 """Export decision graph data to various formats.
 
-Supports GraphML, Graphviz DOT, JSON, and Markdown formats for
+Supports GraphML, Graphviz DOT, JSON, JSON Lines and Markdown formats for
 visualization and analysis in external tools.
+
+Every format has an iter_* generator that yields the document line by line
+from any iterables of decisions, stances and similarities - typically the
+storage cursors (iter_decisions() and friends) - so a graph of any size can
+be streamed to a file or stdout with write() without being held in memory.
+The to_* methods build the same documents as one string.
 """
 
+import gzip
+import heapq
+import io
 import json
 import logging
+import sys
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 
-from decision_graph.schema import DecisionNode, DecisionSimilarity
+from decision_graph.schema import DecisionNode, DecisionSimilarity, ParticipantStance
 from deliberation.query_engine import SimilarResult
 
 logger = logging.getLogger(__name__)
 
+# Relationships listed in Markdown reports
+MARKDOWN_TOP_RELATIONSHIPS = 20
+
+# Edges below this score are left out of DOT output
+DOT_MIN_SIMILARITY = 0.6
+
+_STATUS_COLORS = {
+    "converged": "lightgreen",
+    "refining": "lightyellow",
+    "diverging": "lightcoral",
+    "unanimous_consensus": "lightblue",
+    "majority_decision": "lightcyan",
+    "tie": "lightgray",
+}
+
 
 class DecisionGraphExporter:
     """Export decision graph to various formats."""
@@ -36,35 +61,77 @@ class DecisionGraphExporter:
             "format": "decision_graph_json",
             "version": "1.0",
             "exported_at": datetime.now().isoformat(),
-            "decisions": [
-                {
-                    "id": d.id,
-                    "question": d.question,
-                    "timestamp": d.timestamp.isoformat(),
-                    "consensus": d.consensus,
-                    "winning_option": d.winning_option,
-                    "convergence_status": d.convergence_status,
-                    "participants": d.participants,
-                    "transcript_path": d.transcript_path,
-                    "metadata": d.metadata,
-                }
-                for d in decisions
-            ],
+            "decisions": [_decision_record(d) for d in decisions],
         }
 
         if similarities:
-            data["similarities"] = [
-                {
-                    "source_id": s.source_id,
-                    "target_id": s.target_id,
-                    "similarity_score": s.similarity_score,
-                    "computed_at": s.computed_at.isoformat(),
-                }
-                for s in similarities
-            ]
+            data["similarities"] = [_similarity_record(s) for s in similarities]
 
         return json.dumps(data, indent=2)
 
+    @staticmethod
+    def iter_json(
+        decisions: Iterable[DecisionNode],
+        similarities: Optional[Iterable[DecisionSimilarity]] = None,
+        stances: Optional[Iterable[ParticipantStance]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Stream a JSON document, one record per line.
+
+        Same schema as to_json(), plus a "stances" array when stances are
+        given and any metadata (e.g. incremental export bounds) in the header.
+
+        Args:
+            decisions: Iterable of DecisionNode objects
+            similarities: Optional iterable of DecisionSimilarity relationships
+            stances: Optional iterable of ParticipantStance objects
+            metadata: Optional extra top-level fields
+
+        Yields:
+            Lines of the JSON document
+        """
+        header = json.dumps(_export_header("decision_graph_json", metadata))
+        yield header[:-1] + ', "decisions": ['
+        yield from _json_array_items(_decision_record(d) for d in decisions)
+        if stances is not None:
+            yield '], "stances": ['
+            yield from _json_array_items(_stance_record(s) for s in stances)
+        if similarities is not None:
+            yield '], "similarities": ['
+            yield from _json_array_items(_similarity_record(s) for s in similarities)
+        yield "]}"
+
+    @staticmethod
+    def iter_jsonl(
+        decisions: Iterable[DecisionNode],
+        similarities: Optional[Iterable[DecisionSimilarity]] = None,
+        stances: Optional[Iterable[ParticipantStance]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Stream JSON Lines: a header, then one typed record per line.
+
+        Records carry a "type" of "decision", "stance" or "similarity" and
+        otherwise match the JSON export fields, so dumps can be appended to
+        one another and loaded with any line-oriented tool.
+
+        Args:
+            decisions: Iterable of DecisionNode objects
+            similarities: Optional iterable of DecisionSimilarity relationships
+            stances: Optional iterable of ParticipantStance objects
+            metadata: Optional extra header fields
+
+        Yields:
+            One compact JSON object per line
+        """
+        header = _export_header("decision_graph_jsonl", metadata)
+        yield json.dumps({"type": "header", **header}, separators=(",", ":"))
+        for decision in decisions:
+            yield _jsonl_line("decision", _decision_record(decision))
+        for stance in stances or ():
+            yield _jsonl_line("stance", _stance_record(stance))
+        for sim in similarities or ():
+            yield _jsonl_line("similarity", _similarity_record(sim))
+
     @staticmethod
     def to_graphml(
         decisions: List[DecisionNode],
@@ -79,7 +146,15 @@ class DecisionGraphExporter:
         Returns:
             GraphML XML string
         """
-        graphml = [
+        return "\n".join(DecisionGraphExporter.iter_graphml(decisions, similarities))
+
+    @staticmethod
+    def iter_graphml(
+        decisions: Iterable[DecisionNode],
+        similarities: Optional[Iterable[DecisionSimilarity]] = None,
+    ) -> Iterator[str]:
+        """Stream GraphML lines (see to_graphml)."""
+        yield from [
             '<?xml version="1.0" encoding="UTF-8"?>',
             '<graphml xmlns="http://graphml.graphdrawing.org/xmlns"',
             '  xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
@@ -90,56 +165,33 @@ class DecisionGraphExporter:
         ]
 
         # Add node attributes
-        graphml.extend(
-            [
-                '    <key id="d_question" for="node" attr.name="question" attr.type="string"/>',
-                '    <key id="d_consensus" for="node" attr.name="consensus" attr.type="string"/>',
-                '    <key id="d_status" for="node" attr.name="status" attr.type="string"/>',
-                '    <key id="d_timestamp" for="node" attr.name="timestamp" attr.type="string"/>',
-            ]
-        )
+        yield from [
+            '    <key id="d_question" for="node" attr.name="question" attr.type="string"/>',
+            '    <key id="d_consensus" for="node" attr.name="consensus" attr.type="string"/>',
+            '    <key id="d_status" for="node" attr.name="status" attr.type="string"/>',
+            '    <key id="d_timestamp" for="node" attr.name="timestamp" attr.type="string"/>',
+        ]
 
         # Add nodes
         for decision in decisions:
-            graphml.append(f'    <node id="{decision.id}">')
-            graphml.append(
-                f'      <data key="d_question">{_escape_xml(decision.question)}</data>'
-            )
-            graphml.append(
-                f'      <data key="d_consensus">{_escape_xml(decision.consensus)}</data>'
-            )
-            graphml.append(
-                f'      <data key="d_status">{decision.convergence_status}</data>'
-            )
-            graphml.append(
-                f'      <data key="d_timestamp">{decision.timestamp.isoformat()}</data>'
-            )
-            graphml.append("    </node>")
+            yield f'    <node id="{decision.id}">'
+            yield f'      <data key="d_question">{_escape_xml(decision.question)}</data>'
+            yield f'      <data key="d_consensus">{_escape_xml(decision.consensus)}</data>'
+            yield f'      <data key="d_status">{decision.convergence_status}</data>'
+            yield f'      <data key="d_timestamp">{decision.timestamp.isoformat()}</data>'
+            yield "    </node>"
 
-        graphml.append("    <!-- Edges -->")
-        graphml.append(
-            '    <key id="d_weight" for="edge" attr.name="weight" attr.type="double"/>'
-        )
+        yield "    <!-- Edges -->"
+        yield '    <key id="d_weight" for="edge" attr.name="weight" attr.type="double"/>'
 
         # Add edges (similarities)
-        if similarities:
-            for sim in similarities:
-                graphml.append(
-                    f'    <edge source="{sim.source_id}" target="{sim.target_id}">'
-                )
-                graphml.append(
-                    f'      <data key="d_weight">{sim.similarity_score}</data>'
-                )
-                graphml.append("    </edge>")
+        for sim in similarities or ():
+            yield f'    <edge source="{sim.source_id}" target="{sim.target_id}">'
+            yield f'      <data key="d_weight">{sim.similarity_score}</data>'
+            yield "    </edge>"
 
-        graphml.extend(
-            [
-                "  </graph>",
-                "</graphml>",
-            ]
-        )
-
-        return "\n".join(graphml)
+        yield "  </graph>"
+        yield "</graphml>"
 
     @staticmethod
     def to_dot(
@@ -155,40 +207,38 @@ class DecisionGraphExporter:
         Returns:
             Graphviz DOT string
         """
-        lines = [
-            "digraph DecisionGraph {",
-            "  rankdir=LR;",
-            "  node [shape=box, style=rounded];",
-        ]
+        return "\n".join(DecisionGraphExporter.iter_dot(decisions, similarities))
+
+    @staticmethod
+    def iter_dot(
+        decisions: Iterable[DecisionNode],
+        similarities: Optional[Iterable[DecisionSimilarity]] = None,
+    ) -> Iterator[str]:
+        """Stream Graphviz DOT lines (see to_dot)."""
+        yield "digraph DecisionGraph {"
+        yield "  rankdir=LR;"
+        yield "  node [shape=box, style=rounded];"
 
         # Add nodes
         for decision in decisions:
             label = _truncate_text(decision.question, 40)
-            status_color = {
-                "converged": "lightgreen",
-                "refining": "lightyellow",
-                "diverging": "lightcoral",
-                "unanimous_consensus": "lightblue",
-                "majority_decision": "lightcyan",
-                "tie": "lightgray",
-            }.get(decision.convergence_status, "white")
-
-            lines.append(
-                f'  "{decision.id}" [label="{label}", fillcolor={status_color}, style="rounded,filled"];'
+            status_color = _STATUS_COLORS.get(decision.convergence_status, "white")
+            yield (
+                f'  "{decision.id}" [label="{label}", fillcolor={status_color}, '
+                'style="rounded,filled"];'
             )
 
         # Add edges
-        if similarities:
-            for sim in similarities:
-                weight = sim.similarity_score
-                # Only show strong similarities
-                if weight > 0.6:
-                    lines.append(
-                        f'  "{sim.source_id}" -> "{sim.target_id}" [label="{weight:.2f}", weight={weight}];'
-                    )
-
-        lines.append("}")
-        return "\n".join(lines)
+        for sim in similarities or ():
+            weight = sim.similarity_score
+            # Only show strong similarities
+            if weight > DOT_MIN_SIMILARITY:
+                yield (
+                    f'  "{sim.source_id}" -> "{sim.target_id}" '
+                    f'[label="{weight:.2f}", weight={weight}];'
+                )
+
+        yield "}"
 
     @staticmethod
     def to_markdown(
@@ -204,62 +254,104 @@ class DecisionGraphExporter:
         Returns:
             Markdown formatted string
         """
-        lines = [
-            "# Decision Graph Memory Report",
-            f"\n_Generated: {datetime.now().isoformat()}_\n",
-            f"## Summary\n- Total Decisions: {len(decisions)}\n",
-        ]
+        return "\n".join(
+            DecisionGraphExporter.iter_markdown(
+                decisions,
+                similarities,
+                total_similarities=len(similarities) if similarities else None,
+            )
+        )
 
-        if similarities:
-            lines.append(f"- Total Relationships: {len(similarities)}\n")
+    @staticmethod
+    def iter_markdown(
+        decisions: Iterable[DecisionNode],
+        similarities: Optional[Iterable[DecisionSimilarity]] = None,
+        total_decisions: Optional[int] = None,
+        total_similarities: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream a Markdown report (see to_markdown).
+
+        The summary comes before the decisions, so pass the totals when
+        streaming from cursors; without total_decisions the decisions are
+        buffered to count them. Only the strongest relationships are kept
+        while the similarities stream past.
 
-        lines.extend(
-            [
-                "\n## Decisions\n",
-            ]
-        )
+        Args:
+            decisions: Iterable of DecisionNode objects
+            similarities: Optional iterable of DecisionSimilarity relationships
+            total_decisions: Number of decisions, if known up front
+            total_similarities: Number of relationships, shown when non-zero
+
+        Yields:
+            Lines of the Markdown report
+        """
+        if total_decisions is None:
+            decisions = list(decisions)
+            total_decisions = len(decisions)
 
+        yield "# Decision Graph Memory Report"
+        yield f"\n_Generated: {datetime.now().isoformat()}_\n"
+        yield f"## Summary\n- Total Decisions: {total_decisions}\n"
+
+        if total_similarities:
+            yield f"- Total Relationships: {total_similarities}\n"
+
+        yield "\n## Decisions\n"
+
+        # Question prefixes for the relationship table
+        questions: Dict[str, str] = {}
         for i, decision in enumerate(decisions, 1):
-            lines.extend(
-                [
-                    f"### {i}. {_escape_markdown(decision.question)}\n",
-                    f"- **ID**: `{decision.id}`",
-                    f"- **Timestamp**: {decision.timestamp.isoformat()}",
-                    f"- **Consensus**: {_escape_markdown(decision.consensus)}",
-                    f"- **Status**: {decision.convergence_status}",
-                    f"- **Participants**: {', '.join(decision.participants)}",
-                    f"- **Transcript**: {decision.transcript_path}",
-                    f"- **Winning Option**: {decision.winning_option or 'N/A'}\n",
-                ]
-            )
+            questions[decision.id] = decision.question[:20]
+            yield from [
+                f"### {i}. {_escape_markdown(decision.question)}\n",
+                f"- **ID**: `{decision.id}`",
+                f"- **Timestamp**: {decision.timestamp.isoformat()}",
+                f"- **Consensus**: {_escape_markdown(decision.consensus)}",
+                f"- **Status**: {decision.convergence_status}",
+                f"- **Participants**: {', '.join(decision.participants)}",
+                f"- **Transcript**: {decision.transcript_path}",
+                f"- **Winning Option**: {decision.winning_option or 'N/A'}\n",
+            ]
 
-        if similarities:
-            lines.extend(
-                [
-                    "\n## Relationships\n",
-                    "| Source | Target | Similarity |",
-                    "|--------|--------|------------|",
-                ]
-            )
+        top = heapq.nlargest(
+            MARKDOWN_TOP_RELATIONSHIPS,
+            similarities or (),
+            key=lambda s: s.similarity_score,
+        )
+        if top:
+            yield "\n## Relationships\n"
+            yield "| Source | Target | Similarity |"
+            yield "|--------|--------|------------|"
 
-            for sim in sorted(
-                similarities, key=lambda s: s.similarity_score, reverse=True
-            )[
-                :20
-            ]:  # Top 20
-                source_q = next(
-                    (d.question[:20] for d in decisions if d.id == sim.source_id),
-                    "Unknown",
-                )
-                target_q = next(
-                    (d.question[:20] for d in decisions if d.id == sim.target_id),
-                    "Unknown",
-                )
-                lines.append(
-                    f"| {source_q}... | {target_q}... | {sim.similarity_score:.2%} |"
-                )
+            for sim in top:
+                source_q = questions.get(sim.source_id, "Unknown")
+                target_q = questions.get(sim.target_id, "Unknown")
+                yield f"| {source_q}... | {target_q}... | {sim.similarity_score:.2%} |"
 
-        return "\n".join(lines)
+    @staticmethod
+    def write(
+        lines: Iterable[str], output: Optional[str] = None, compress: bool = False
+    ) -> None:
+        """Write exporter lines to a file, or to stdout when output is None.
+
+        Args:
+            lines: Lines from one of the iter_* generators
+            output: Destination path (stdout if None)
+            compress: Gzip the output
+        """
+        if output is not None:
+            opener = gzip.open if compress else open
+            with opener(output, "wt", encoding="utf-8") as stream:
+                _write_lines(stream, lines)
+        elif compress:
+            sys.stdout.flush()
+            with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb") as raw:
+                with io.TextIOWrapper(raw, encoding="utf-8") as stream:
+                    _write_lines(stream, lines)
+            sys.stdout.buffer.flush()
+        else:
+            _write_lines(sys.stdout, lines)
+            sys.stdout.flush()
 
     @staticmethod
     def to_summary_table(results: List[SimilarResult]) -> str:
@@ -320,3 +412,64 @@ def _truncate_text(text: str, max_len: int) -> str:
     if len(text) > max_len:
         return text[: max_len - 3] + "..."
     return text
+
+
+def _decision_record(d: DecisionNode) -> Dict[str, Any]:
+    return {
+        "id": d.id,
+        "question": d.question,
+        "timestamp": d.timestamp.isoformat(),
+        "consensus": d.consensus,
+        "winning_option": d.winning_option,
+        "convergence_status": d.convergence_status,
+        "participants": d.participants,
+        "transcript_path": d.transcript_path,
+        "metadata": d.metadata,
+    }
+
+
+def _stance_record(s: ParticipantStance) -> Dict[str, Any]:
+    return {
+        "decision_id": s.decision_id,
+        "participant": s.participant,
+        "vote_option": s.vote_option,
+        "confidence": s.confidence,
+        "rationale": s.rationale,
+        "final_position": s.final_position,
+    }
+
+
+def _similarity_record(s: DecisionSimilarity) -> Dict[str, Any]:
+    return {
+        "source_id": s.source_id,
+        "target_id": s.target_id,
+        "similarity_score": s.similarity_score,
+        "computed_at": s.computed_at.isoformat(),
+    }
+
+
+def _export_header(fmt: str, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "format": fmt,
+        "version": "1.0",
+        "exported_at": datetime.now().isoformat(),
+        **(metadata or {}),
+    }
+
+
+def _json_array_items(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """JSON array elements, one per line, comma-separated."""
+    separator = ""
+    for record in records:
+        yield separator + json.dumps(record)
+        separator = ","
+
+
+def _jsonl_line(record_type: str, record: Dict[str, Any]) -> str:
+    return json.dumps({"type": record_type, **record}, separators=(",", ":"))
+
+
+def _write_lines(stream: TextIO, lines: Iterable[str]) -> None:
+    for line in lines:
+        stream.write(line)
+        stream.write("\n")
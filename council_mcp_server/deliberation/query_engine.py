@@ -7,12 +7,15 @@ and CLI commands to provide consistent functionality.
 
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from decision_graph.cache import LRUCache
 from decision_graph.retrieval import DecisionRetriever
 from decision_graph.schema import DecisionNode, ParticipantStance
 from decision_graph.similarity import QuestionSimilarityDetector
 from decision_graph.storage import DecisionGraphStorage
+from deliberation.transcript_index import TranscriptIndex
 
 if TYPE_CHECKING:
     from models.config import DecisionGraphConfig
@@ -65,6 +68,28 @@ class Timeline:
     related_decisions: List[dict] = field(default_factory=list)
 
 
+@dataclass
+class VotingPattern:
+    """Voting behaviour of one participant."""
+
+    participant: str
+    total_votes: int
+    avg_confidence: float
+    preferred_options: List[str] = field(default_factory=list)
+    decisions_participated: int = 0
+
+
+@dataclass
+class PatternAnalysis:
+    """Voting patterns and convergence statistics over a time window."""
+
+    total_decisions: int
+    total_participants: int
+    voting_patterns: List[VotingPattern] = field(default_factory=list)
+    convergence_stats: Dict[str, int] = field(default_factory=dict)
+    participation_metrics: Dict[str, float] = field(default_factory=dict)
+
+
 class QueryEngine:
     """Unified query interface for decision graph memory.
 
@@ -72,10 +97,14 @@ class QueryEngine:
     - Similar decision search
     - Contradiction detection
     - Decision evolution tracing
+    - Voting pattern analysis
 
     Used by both MCP tools and CLI commands.
     """
 
+    # Archived decisions scored by a deep search
+    DEEP_SEARCH_LIMIT = 10000
+
     def __init__(
         self,
         storage: Optional[DecisionGraphStorage] = None,
@@ -95,6 +124,9 @@ class QueryEngine:
         # Extract noise_floor from config or use default
         self.default_threshold = config.noise_floor if config else 0.4
 
+        # Scored diagnostic scans, keyed by graph version and query
+        self._scan_cache = LRUCache(maxsize=64)
+
         logger.info(f"Initialized QueryEngine with threshold={self.default_threshold}")
 
     async def search_similar(
@@ -102,6 +134,7 @@ class QueryEngine:
         query: str,
         limit: int = 5,
         threshold: Optional[float] = None,
+        deep: bool = False,
     ) -> List[SimilarResult]:
         """Find similar past deliberations by semantic meaning.
 
@@ -109,6 +142,7 @@ class QueryEngine:
             query: Query question/text
             limit: Maximum results to return
             threshold: Minimum similarity score (0.0-1.0). If None, uses config's noise_floor.
+            deep: Also search decisions moved to the archive tier
 
         Returns:
             List of SimilarResult objects sorted by score descending
@@ -118,21 +152,26 @@ class QueryEngine:
             threshold = self.default_threshold
         try:
             # Don't use run_in_executor - SQLite connection is thread-bound
-            results = self._search_similar_sync(query, limit, threshold)
+            results = self._search_similar_sync(query, limit, threshold, deep=deep)
             return results
         except Exception as e:
             logger.error(f"Error in search_similar: {e}", exc_info=True)
             return []
 
     def _search_similar_sync(
-        self, query: str, limit: int, threshold: float
+        self, query: str, limit: int, threshold: float, deep: bool = False
     ) -> List[SimilarResult]:
         """Synchronous implementation of similar search."""
         try:
             # Get all decisions from storage
             decisions = self.storage.get_all_decisions()
+            archived = (
+                self.storage.get_archived_decisions(limit=self.DEEP_SEARCH_LIMIT)
+                if deep
+                else []
+            )
 
-            if not decisions:
+            if not decisions and not archived:
                 return []
 
             # Compute similarity scores
@@ -144,6 +183,17 @@ class QueryEngine:
                 if score >= threshold:
                     results.append(SimilarResult(decision=decision, score=score))
 
+            if archived:
+                # The archive can be large: score it as one similarity matrix
+                scores = self.similarity_detector.compute_similarity_matrix(
+                    [query], [decision.question for decision in archived]
+                )
+                results.extend(
+                    SimilarResult(decision=decision, score=score)
+                    for decision, score in zip(archived, scores[0])
+                    if score >= threshold
+                )
+
             # Sort by score descending
             results.sort(key=lambda x: x.score, reverse=True)
 
@@ -258,30 +308,34 @@ class QueryEngine:
         self, decision_id: str, include_related: bool
     ) -> Timeline:
         """Synchronous implementation of evolution tracing."""
-        # Get decision
-        decision = self.storage.get_decision_node(decision_id)
+        # Get decision (an explicit ID may refer to an archived decision)
+        decision = self.storage.get_decision_node(decision_id, include_archived=True)
         if not decision:
             raise ValueError(f"Decision {decision_id} not found")
 
         # Get participant stances
-        stances = self.storage.get_participant_stances(decision_id)
+        stances = self.storage.get_participant_stances(
+            decision_id, include_archived=True
+        )
+
+        final_positions = [
+            {
+                "participant": s.participant,
+                "option": s.vote_option,
+                "confidence": s.confidence,
+            }
+            for s in stances
+        ]
 
-        # Build timeline entries (simplified: single entry for now)
-        # In a full implementation, would track across rounds
-        rounds = [
+        # One entry per debate round when the transcript is indexed; otherwise
+        # a single entry carrying the final stances
+        rounds = self._rounds_from_transcript_index(decision, final_positions) or [
             TimelineEntry(
                 round_num=1,
                 timestamp=decision.timestamp.isoformat(),
                 consensus=decision.consensus,
                 confidence=0.8,  # Placeholder
-                participant_positions=[
-                    {
-                        "participant": s.participant,
-                        "option": s.vote_option,
-                        "confidence": s.confidence,
-                    }
-                    for s in stances
-                ],
+                participant_positions=final_positions,
             )
         ]
 
@@ -300,9 +354,71 @@ class QueryEngine:
             related_decisions=related,
         )
 
+    def _rounds_from_transcript_index(
+        self, decision: DecisionNode, final_positions: List[dict]
+    ) -> List[TimelineEntry]:
+        """Build per-round timeline entries from the transcript index.
+
+        Only index rows are read, not the transcript itself. Earlier rounds
+        list who spoke; the final round carries the recorded stances.
+
+        Returns:
+            Timeline entries, or an empty list if the transcript is not indexed
+        """
+        if not decision.transcript_path:
+            return []
+        try:
+            index = TranscriptIndex.for_transcript(decision.transcript_path)
+            sections = index.sections(decision.transcript_path) if index else []
+        except Exception as e:
+            logger.debug(f"Transcript index unavailable for {decision.id}: {e}")
+            return []
+
+        round_sections = [s for s in sections if s.section > 0]
+        entries = []
+        for i, section in enumerate(round_sections):
+            is_final = i == len(round_sections) - 1
+            entries.append(
+                TimelineEntry(
+                    round_num=section.section,
+                    timestamp=section.started_at or decision.timestamp.isoformat(),
+                    consensus=decision.consensus,
+                    confidence=0.8,  # Placeholder
+                    participant_positions=(
+                        final_positions
+                        if is_final
+                        else [
+                            {"participant": p, "option": None, "confidence": None}
+                            for p in section.participants
+                        ]
+                    ),
+                )
+            )
+        return entries
+
     def _find_related_decisions(self, decision: DecisionNode) -> List[dict]:
-        """Find decisions related to the given decision."""
+        """Find decisions related to the given decision.
+
+        Reads the decision's maintained neighbour list; decisions stored before
+        neighbour lists existed fall back to a full scan until
+        `graph backfill-neighbors` has been run.
+        """
         try:
+            neighbors = self.storage.get_neighbors(decision.id, min_score=0.5, limit=5)
+            if neighbors is not None:
+                return [
+                    {
+                        "id": other.id,
+                        "question": other.question,
+                        "similarity": similarity,
+                        "consensus": other.consensus,
+                    }
+                    for other, similarity in neighbors
+                ]
+
+            logger.debug(
+                f"No neighbour list for decision {decision.id}, scanning all decisions"
+            )
             decisions = self.storage.get_all_decisions()
             related = []
 
@@ -327,6 +443,92 @@ class QueryEngine:
             logger.error(f"Error finding related decisions: {e}")
             return []
 
+    async def analyze_patterns(
+        self,
+        participant: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> PatternAnalysis:
+        """Analyze voting patterns and convergence statistics.
+
+        Args:
+            participant: Only analyze this participant's stances
+            since: Only include decisions from this day onwards
+
+        Returns:
+            PatternAnalysis for the window
+        """
+        # Don't use run_in_executor - SQLite connection is thread-bound
+        return self._analyze_patterns_sync(participant, since)
+
+    def _analyze_patterns_sync(
+        self,
+        participant: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> PatternAnalysis:
+        """Synchronous implementation of pattern analysis.
+
+        All counting happens in SQL over the storage layer's daily rollups,
+        so the cost does not grow with the number of stances.
+        """
+        aggregates = self.storage.get_vote_aggregates(
+            since=since, participant=participant
+        )
+
+        voting_patterns = [
+            VotingPattern(
+                participant=row["participant"],
+                total_votes=row["votes"],
+                avg_confidence=row["avg_confidence"] or 0.0,
+                preferred_options=row["preferred_options"],
+                decisions_participated=row["stances"],
+            )
+            for row in aggregates["participants"]
+        ]
+
+        total_stances = aggregates["total_stances"]
+        votes_cast = aggregates["votes_cast"]
+        window_decisions = aggregates["window_decisions"]
+        participation_metrics = {
+            "total_stances": total_stances,
+            "votes_cast": votes_cast,
+            "abstentions": total_stances - votes_cast,
+            "vote_rate": round(votes_cast / total_stances, 3) if total_stances else 0.0,
+            "avg_participants_per_decision": (
+                round(total_stances / window_decisions, 2)
+                if window_decisions and participant is None
+                else 0.0
+            ),
+        }
+
+        return PatternAnalysis(
+            total_decisions=aggregates["total_decisions"],
+            total_participants=len(voting_patterns),
+            voting_patterns=voting_patterns,
+            convergence_stats=aggregates["convergence"],
+            participation_metrics=participation_metrics,
+        )
+
+    def _score_all_decisions(self, query: str) -> List[Tuple[DecisionNode, float]]:
+        """Score a free-text query against all decisions, best first.
+
+        Uses one similarity matrix for the whole scan and remembers the result
+        until the graph changes, so repeated diagnostics for the same query
+        (e.g. after an empty search) do not rescan.
+        """
+        key = f"{self.storage.get_graph_version()}:{query}"
+        cached = self._scan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        decisions = self.storage.get_all_decisions()
+        scores = self.similarity_detector.compute_similarity_matrix(
+            [query], [decision.question for decision in decisions]
+        )
+        scored = list(zip(decisions, scores[0])) if decisions else []
+        scored.sort(key=lambda x: x[1], reverse=True)
+        self._scan_cache.put(key, scored)
+        return scored
+
     def get_search_diagnostics(
         self, query: str, limit: int = 5, threshold: float = 0.6
     ) -> dict:
@@ -348,10 +550,10 @@ class QueryEngine:
             - suggested_threshold: float (adaptive suggestion)
         """
         try:
-            # Get all decisions
-            decisions = self.storage.get_all_decisions()
+            # Score all decisions (sorted by score descending)
+            scored_decisions = self._score_all_decisions(query)
 
-            if not decisions:
+            if not scored_decisions:
                 return {
                     "matched_above_threshold": [],
                     "near_misses": [],
@@ -360,17 +562,6 @@ class QueryEngine:
                     "suggested_threshold": threshold,
                 }
 
-            # Compute similarity for all decisions
-            scored_decisions = []
-            for decision in decisions:
-                score = self.similarity_detector.compute_similarity(
-                    query, decision.question
-                )
-                scored_decisions.append((decision, score))
-
-            # Sort by score descending
-            scored_decisions.sort(key=lambda x: x[1], reverse=True)
-
             # Find best match
             best_match_score = scored_decisions[0][1] if scored_decisions else 0.0
 
@@ -402,7 +593,7 @@ class QueryEngine:
 
             logger.debug(
                 f"Diagnostics for query '{query[:50]}...': "
-                f"total={len(decisions)}, best={best_match_score:.3f}, "
+                f"total={len(scored_decisions)}, best={best_match_score:.3f}, "
                 f"matched={len(matched)}, near_misses={len(near_misses)}, "
                 f"suggested_threshold={suggested:.2f}"
             )
@@ -410,7 +601,7 @@ class QueryEngine:
             return {
                 "matched_above_threshold": matched,
                 "near_misses": near_misses,
-                "total_decisions": len(decisions),
+                "total_decisions": len(scored_decisions),
                 "best_match_score": best_match_score,
                 "suggested_threshold": suggested,
             }
@@ -0,0 +1,130 @@
+"""Single-flight de-duplication and result caching for deliberations.
+
+A deliberation is a multi-model, multi-round run that can take minutes.
+Double-clicks, client retries after a timeout and identical reruns would
+otherwise each start a new one. DeliberationDeduplicator keys requests by a
+canonical hash of what determines the outcome; concurrent identical requests
+await one shared execution, and (when enabled) a finished result is served
+from a TTL cache.
+
+Example:
+    >>> dedup = DeliberationDeduplicator(cache_ttl_seconds=600)
+    >>> result = await dedup.run(request, lambda: engine.execute(request))
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+from decision_graph.cache import LRUCache
+from models.schema import DeliberateRequest, DeliberationResult
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(request: DeliberateRequest) -> str:
+    """Canonical hash of the fields that determine a deliberation's outcome.
+
+    working_directory is excluded: it only scopes tool access and the HTTP
+    server always defaults it to the project directory.
+
+    Args:
+        request: Deliberation request
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "question": request.question,
+        # Participant order is kept: it decides speaking order
+        "participants": [p.model_dump(mode="json") for p in request.participants],
+        "rounds": request.rounds,
+        "mode": request.mode,
+        "context": request.context,
+        "language": request.language,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DeliberationDeduplicator:
+    """Shares in-flight deliberations and optionally caches their results.
+
+    Must be used from a single event loop (the server's).
+    """
+
+    def __init__(
+        self, cache_ttl_seconds: Optional[float] = None, cache_max_entries: int = 64
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            cache_ttl_seconds: Keep finished results this long (None disables
+                the result cache; in-flight sharing is always on)
+            cache_max_entries: Maximum number of cached results
+        """
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache = LRUCache(cache_max_entries) if cache_ttl_seconds else None
+        self._inflight: Dict[str, "asyncio.Task[DeliberationResult]"] = {}
+        self.shared = 0
+
+    async def run(
+        self,
+        request: DeliberateRequest,
+        execute: Callable[[], Awaitable[DeliberationResult]],
+    ) -> DeliberationResult:
+        """Run a deliberation unless an identical one is running or cached.
+
+        The execution is shielded: if the caller that started it goes away,
+        it keeps running for the other waiters (and for the cache).
+
+        Args:
+            request: Deliberation request (used for the key only)
+            execute: Starts the deliberation when no shared result exists
+
+        Returns:
+            Deliberation result (shared between identical requests)
+
+        Raises:
+            Exception: Whatever the shared execution raised; failures are
+                never cached
+        """
+        key = request_key(request)
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"Deliberation cache hit for {key[:12]}")
+                return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared += 1
+            logger.info(f"Joining in-flight deliberation {key[:12]}")
+        else:
+            task = asyncio.ensure_future(execute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Task[DeliberationResult]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        # Always retrieve the exception: every waiter may already be gone
+        exc = task.exception()
+        if exc is not None:
+            logger.warning(f"Deliberation {key[:12]} failed: {exc}")
+            return
+        if self.cache is not None:
+            self.cache.put(key, task.result(), ttl=self.cache_ttl_seconds)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct deliberations currently running."""
+        return len(self._inflight)
@@ -1,20 +1,40 @@
 """Transcript management for deliberations."""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
+from typing import List, Optional, Tuple
+
+from deliberation.transcript_index import (
+    COMPRESSION_SUFFIXES,
+    INDEX_FILENAME,
+    TranscriptIndex,
+    TranscriptRecord,
+    TranscriptSection,
+    compress_section,
+)
 from models.schema import DeliberationResult
 
+logger = logging.getLogger(__name__)
+
 
 class TranscriptManager:
     """
     Manages saving deliberation transcripts.
 
-    Generates markdown files with full debate history and summary.
+    Generates markdown files with full debate history and summary. Each
+    transcript is written section by section (summary, then one section per
+    debate round) and the section byte offsets are recorded in a
+    TranscriptIndex, so a single round can be read back without the rest.
     """
 
     def __init__(
-        self, output_dir: str = "transcripts", server_dir: Optional[Path] = None
+        self,
+        output_dir: str = "transcripts",
+        server_dir: Optional[Path] = None,
+        compression: Optional[str] = None,
+        index: bool = True,
     ):
         """
         Initialize transcript manager.
@@ -22,6 +42,12 @@ class TranscriptManager:
         Args:
             output_dir: Directory to save transcripts (default: transcripts/)
             server_dir: Server directory to resolve relative paths from
+            compression: None for plain markdown, "gzip" (.md.gz) or
+                "zstd" (.md.zst, requires the zstandard package)
+            index: Record transcripts in transcript_index.db (default: True)
+
+        Raises:
+            ValueError: If compression is unknown or unavailable
         """
         output_path = Path(output_dir)
         # Make output_dir absolute - if relative and server_dir provided, resolve from server directory
@@ -31,6 +57,16 @@ class TranscriptManager:
             self.output_dir = output_path
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown transcript compression: {compression}")
+        # Fail at startup rather than after the first deliberation
+        compress_section(b"", compression)
+        self.compression = compression
+        self.index = (
+            TranscriptIndex(self.output_dir / INDEX_FILENAME) if index else None
+        )
+        self._writer: Optional[ThreadPoolExecutor] = None
+
     def _format_tool_executions_section(self, result: DeliberationResult) -> list[str]:
         """
         Format tool executions section for markdown transcript.
@@ -185,6 +221,26 @@ class TranscriptManager:
         Returns:
             Markdown formatted transcript
         """
+        return "\n".join(
+            line for _, lines in self._render_sections(result) for line in lines
+        )
+
+    def _render_sections(
+        self, result: DeliberationResult
+    ) -> List[Tuple[int, List[str]]]:
+        """
+        Render the transcript as (section, lines) pairs in file order.
+
+        Section 0 holds everything up to the "Full Debate" heading; section N
+        holds debate round N. Joining all lines with newlines gives exactly
+        the generate_markdown output.
+
+        Args:
+            result: Deliberation result
+
+        Returns:
+            List of (section number, markdown lines)
+        """
         lines = [
             "# AI Counsel Deliberation Transcript",
             "",
@@ -259,19 +315,26 @@ class TranscriptManager:
             ]
         )
 
+        sections: List[Tuple[int, List[str]]] = [(0, lines)]
+        seen_rounds = {0}
+
         # Group by round
         current_round = None
         for response in result.full_debate:
             if response.round != current_round:
                 current_round = response.round
-                lines.extend(
-                    [
-                        f"### Round {current_round}",
-                        "",
-                    ]
-                )
-
-            lines.extend(
+                round_header = [
+                    f"### Round {current_round}",
+                    "",
+                ]
+                if current_round in seen_rounds:
+                    # Out-of-order round: keep it contiguous with the last section
+                    sections[-1][1].extend(round_header)
+                else:
+                    seen_rounds.add(current_round)
+                    sections.append((current_round, round_header))
+
+            sections[-1][1].extend(
                 [
                     f"**{response.participant}**",
                     "",
@@ -284,7 +347,7 @@ class TranscriptManager:
                 ]
             )
 
-        return "\n".join(lines)
+        return sections
 
     def save(
         self, result: DeliberationResult, question: str, filename: Optional[str] = None
@@ -310,9 +373,13 @@ class TranscriptManager:
             safe_question = safe_question.strip().replace(" ", "_")
             filename = f"{timestamp}_{safe_question}.md"
 
-        # Ensure .md extension
+        # Ensure .md extension (plus .gz / .zst when compressed)
+        suffix = COMPRESSION_SUFFIXES.get(self.compression, "")
+        if suffix and filename.endswith(".md" + suffix):
+            filename = filename[: -len(suffix)]
         if not filename.endswith(".md"):
             filename += ".md"
+        filename += suffix
 
         filepath = self.output_dir / filename
 
@@ -324,15 +391,132 @@ class TranscriptManager:
                 f"Failed to create transcript directory '{filepath.parent}': {exc}"
             ) from exc
 
-        # Generate markdown with question at top
-        markdown = f"# {question}\n\n" + self.generate_markdown(result)
+        # Generate markdown with question at top, one chunk per section
+        rendered = self._render_sections(result)
+        chunks = ["\n".join(lines) for _, lines in rendered]
+        chunks[0] = f"# {question}\n\n" + chunks[0]
+        for i in range(len(chunks) - 1):
+            chunks[i] += "\n"
 
-        # Save
+        # Save; each section is compressed independently so it can be read alone
+        sections: List[TranscriptSection] = []
         try:
-            filepath.write_text(markdown, encoding="utf-8")
+            with filepath.open("wb") as handle:
+                for (section, _), chunk in zip(rendered, chunks):
+                    data = compress_section(chunk.encode("utf-8"), self.compression)
+                    sections.append(
+                        TranscriptSection(
+                            section=section, offset=handle.tell(), length=len(data)
+                        )
+                    )
+                    handle.write(data)
+                size_bytes = handle.tell()
         except Exception as exc:  # pragma: no cover - defensive path
             raise RuntimeError(
                 f"Failed to write transcript to '{filepath}': {exc}"
             ) from exc
 
+        if self.index is not None:
+            self._record_index(result, question, str(filepath), sections, size_bytes)
+
         return str(filepath)
+
+    async def save_async(
+        self, result: DeliberationResult, question: str, filename: Optional[str] = None
+    ) -> str:
+        """
+        Save deliberation transcript without blocking the event loop.
+
+        Rendering, compression and indexing run on a single writer thread, so
+        concurrent deliberations never write transcripts in parallel.
+
+        Args:
+            result: Deliberation result
+            question: Original question
+            filename: Optional custom filename (default: auto-generated)
+
+        Returns:
+            Path to saved file
+        """
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="transcript-writer"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._writer, self.save, result, question, filename
+        )
+
+    def read_round(self, transcript_path: str, round_num: int) -> Optional[str]:
+        """
+        Read one section of a transcript saved by this manager.
+
+        Only files directly inside output_dir are served, and the index is
+        opened read-only. Blocking; call it from a worker thread in async code.
+
+        Args:
+            transcript_path: Path returned by save()
+            round_num: 0 for the header/summary, N for debate round N
+
+        Returns:
+            Markdown text of the section, or None if it is not indexed
+
+        Raises:
+            ValueError: If the path is outside the transcripts directory
+        """
+        output_dir = self.output_dir.resolve()
+        resolved = Path(transcript_path).resolve()
+        if resolved.parent != output_dir:
+            raise ValueError(
+                f"Transcript path '{transcript_path}' is outside '{self.output_dir}'"
+            )
+        db_path = self.output_dir / INDEX_FILENAME
+        if not db_path.exists():
+            return None
+        index = TranscriptIndex(db_path, read_only=True)
+        # Index rows are keyed by the path save() returned
+        return index.read_section(str(self.output_dir / resolved.name), round_num)
+
+    def close(self) -> None:
+        """Wait for pending transcript writes and stop the writer thread."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+    def _record_index(
+        self,
+        result: DeliberationResult,
+        question: str,
+        path: str,
+        sections: List[TranscriptSection],
+        size_bytes: int,
+    ) -> None:
+        """Record a saved transcript in the index (failures are logged only)."""
+        round_participants: dict = {}
+        round_started: dict = {}
+        for response in result.full_debate:
+            speakers = round_participants.setdefault(response.round, [])
+            if response.participant not in speakers:
+                speakers.append(response.participant)
+            round_started.setdefault(response.round, response.timestamp)
+        for section in sections:
+            section.participants = round_participants.get(section.section, [])
+            section.started_at = round_started.get(section.section)
+
+        try:
+            self.index.record(
+                TranscriptRecord(
+                    path=path,
+                    question=question,
+                    created_at=datetime.now().isoformat(),
+                    status=result.status,
+                    mode=result.mode,
+                    rounds_completed=result.rounds_completed,
+                    participants=list(result.participants),
+                    compression=self.compression,
+                    size_bytes=size_bytes,
+                ),
+                sections,
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to index transcript '{path}': {exc}")
@@ -0,0 +1,354 @@
+"""SQLite index of saved transcripts and their round sections.
+
+Each transcript is written as a sequence of independently readable
+sections: section 0 holds the header, summary, votes and tool executions,
+and section N holds debate round N. For compressed transcripts every
+section is its own gzip member / zstd frame, so the concatenated file is
+still a valid stream while any single section can be decoded on its own.
+
+The index (``transcript_index.db`` next to the transcripts) records each
+section's byte offset and length, so one round can be fetched with a seek
+and a short read instead of loading and parsing the whole file.
+
+Example:
+    >>> index = TranscriptIndex.for_transcript(decision.transcript_path)
+    >>> index.read_section(decision.transcript_path, 2)  # markdown of round 2
+"""
+
+import gzip
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "transcript_index.db"
+
+#: File suffix appended after ".md" for each compression format
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ValueError(
+            "zstd transcript compression requires the 'zstandard' package"
+        ) from exc
+    return zstandard
+
+
+def compress_section(data: bytes, compression: Optional[str]) -> bytes:
+    """Encode one section as a self-contained gzip member or zstd frame.
+
+    Args:
+        data: UTF-8 encoded section text
+        compression: None, "gzip" or "zstd"
+
+    Returns:
+        Bytes to append to the transcript file
+
+    Raises:
+        ValueError: If compression is unknown or zstandard is not installed
+    """
+    if compression is None:
+        return data
+    if compression == "gzip":
+        # mtime=0 keeps output deterministic for identical sections
+        return gzip.compress(data, mtime=0)
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().compress(data)
+    raise ValueError(f"Unknown transcript compression: {compression}")
+
+
+def decompress_section(data: bytes, compression: Optional[str]) -> bytes:
+    """Decode bytes produced by compress_section."""
+    if compression is None:
+        return data
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown transcript compression: {compression}")
+
+
+def compression_for_path(path: Union[str, Path]) -> Optional[str]:
+    """Infer transcript compression from the file suffix."""
+    suffix = Path(path).suffix
+    for compression, compressed_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compressed_suffix:
+            return compression
+    return None
+
+
+def read_transcript(path: Union[str, Path]) -> str:
+    """Read a whole transcript, decompressing .md.gz / .md.zst files.
+
+    Args:
+        path: Transcript file path
+
+    Returns:
+        Markdown text of the transcript
+    """
+    path = Path(path)
+    compression = compression_for_path(path)
+    if compression is None:
+        return path.read_text(encoding="utf-8")
+    if compression == "gzip":
+        # gzip.decompress concatenates all members
+        return gzip.decompress(path.read_bytes()).decode("utf-8")
+    with path.open("rb") as handle:
+        reader = (
+            _zstandard()
+            .ZstdDecompressor()
+            .stream_reader(handle, read_across_frames=True)
+        )
+        return reader.read().decode("utf-8")
+
+
+@dataclass
+class TranscriptSection:
+    """Location of one section inside a transcript file."""
+
+    section: int
+    offset: int
+    length: int
+    participants: List[str] = field(default_factory=list)
+    started_at: Optional[str] = None
+
+
+@dataclass
+class TranscriptRecord:
+    """Indexed metadata of one saved transcript."""
+
+    path: str
+    question: str
+    created_at: str
+    status: str
+    mode: str
+    rounds_completed: int
+    participants: List[str]
+    compression: Optional[str]
+    size_bytes: int
+
+
+class TranscriptIndex:
+    """SQLite index of transcript metadata and section byte offsets.
+
+    Connections are opened per call, so one index can be shared between the
+    transcript writer thread and readers on the event loop.
+    """
+
+    def __init__(self, db_path: Union[str, Path], read_only: bool = False):
+        """
+        Initialize the index, creating its tables if needed.
+
+        Args:
+            db_path: Path of the SQLite index file
+            read_only: Open an existing index without creating or changing
+                anything (lookups only)
+        """
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        if read_only:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS transcripts (
+                    path TEXT PRIMARY KEY,
+                    question TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    rounds_completed INTEGER NOT NULL,
+                    participants TEXT NOT NULL,
+                    compression TEXT,
+                    size_bytes INTEGER NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS transcript_sections (
+                    path TEXT NOT NULL,
+                    section INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    participants TEXT NOT NULL,
+                    started_at TEXT,
+                    PRIMARY KEY (path, section)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_transcripts_created_at "
+                "ON transcripts(created_at)"
+            )
+
+    @classmethod
+    def for_transcript(cls, path: Union[str, Path]) -> Optional["TranscriptIndex"]:
+        """Open the index stored next to a transcript read-only, if there is one.
+
+        Args:
+            path: Transcript file path (e.g. DecisionNode.transcript_path)
+
+        Returns:
+            Read-only TranscriptIndex, or None if the directory has no index
+        """
+        db_path = Path(path).parent / INDEX_FILENAME
+        if not db_path.exists():
+            return None
+        return cls(db_path, read_only=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, timeout=30.0
+            )
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(
+        self, transcript: TranscriptRecord, sections: List[TranscriptSection]
+    ) -> None:
+        """Insert or replace a transcript and its sections.
+
+        Args:
+            transcript: Transcript metadata
+            sections: Section locations in file order
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM transcript_sections WHERE path = ?", (transcript.path,)
+            )
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO transcripts (
+                    path, question, created_at, status, mode,
+                    rounds_completed, participants, compression, size_bytes
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    transcript.path,
+                    transcript.question,
+                    transcript.created_at,
+                    transcript.status,
+                    transcript.mode,
+                    transcript.rounds_completed,
+                    json.dumps(transcript.participants),
+                    transcript.compression,
+                    transcript.size_bytes,
+                ),
+            )
+            conn.executemany(
+                """
+                INSERT INTO transcript_sections (
+                    path, section, offset, length, participants, started_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        transcript.path,
+                        section.section,
+                        section.offset,
+                        section.length,
+                        json.dumps(section.participants),
+                        section.started_at,
+                    )
+                    for section in sections
+                ],
+            )
+
+    def get(self, path: Union[str, Path]) -> Optional[TranscriptRecord]:
+        """Return indexed metadata for a transcript, or None if not indexed."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM transcripts WHERE path = ?", (str(path),)
+            ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def list_transcripts(self, limit: int = 50) -> List[TranscriptRecord]:
+        """Return the most recently saved transcripts, newest first."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM transcripts ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def sections(self, path: Union[str, Path]) -> List[TranscriptSection]:
+        """Return section locations of a transcript in file order.
+
+        Section 0 is the header/summary; section N is debate round N.
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT section, offset, length, participants, started_at
+                FROM transcript_sections
+                WHERE path = ?
+                ORDER BY offset
+                """,
+                (str(path),),
+            ).fetchall()
+        return [
+            TranscriptSection(
+                section=row["section"],
+                offset=row["offset"],
+                length=row["length"],
+                participants=json.loads(row["participants"]),
+                started_at=row["started_at"],
+            )
+            for row in rows
+        ]
+
+    def read_section(self, path: Union[str, Path], section: int) -> Optional[str]:
+        """Read one section of a transcript without loading the whole file.
+
+        Args:
+            path: Transcript file path
+            section: 0 for the header/summary, N for debate round N
+
+        Returns:
+            Markdown text of the section, or None if it is not indexed
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                """
+                SELECT s.offset, s.length, t.compression
+                FROM transcript_sections s
+                JOIN transcripts t ON t.path = s.path
+                WHERE s.path = ? AND s.section = ?
+                """,
+                (str(path), section),
+            ).fetchone()
+        if row is None:
+            return None
+
+        with open(path, "rb") as handle:
+            handle.seek(row["offset"])
+            data = handle.read(row["length"])
+        return decompress_section(data, row["compression"]).decode("utf-8")
+
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> TranscriptRecord:
+        return TranscriptRecord(
+            path=row["path"],
+            question=row["question"],
+            created_at=row["created_at"],
+            status=row["status"],
+            mode=row["mode"],
+            rounds_completed=row["rounds_completed"],
+            participants=json.loads(row["participants"]),
+            compression=row["compression"],
+            size_bytes=row["size_bytes"],
+        )
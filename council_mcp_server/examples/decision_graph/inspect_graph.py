@@ -101,12 +101,13 @@ async def main():
     logger.info("\n📈 Decision Patterns:")
     patterns = await engine.analyze_patterns()
 
-    if patterns:
-        logger.info(f"\n   Common themes: {patterns.get('common_themes', [])[:3]}")
-        logger.info(
-            f"   Models agreement: {patterns.get('avg_model_agreement', 0):.1%}"
-        )
-        logger.info(f"   Convergence time: {patterns.get('avg_rounds', 0):.1f} rounds")
+    if patterns.total_decisions:
+        logger.info(f"\n   Convergence: {patterns.convergence_stats}")
+        for pattern in patterns.voting_patterns[:3]:
+            logger.info(
+                f"   {pattern.participant}: {pattern.total_votes} votes, "
+                f"avg confidence {pattern.avg_confidence:.2f}"
+            )
     else:
         logger.info("\n   Insufficient data for pattern analysis yet")
 
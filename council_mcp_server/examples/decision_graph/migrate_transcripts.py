@@ -25,6 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from decision_graph.schema import DecisionNode
 from decision_graph.storage import DecisionGraphStorage
+from deliberation.transcript_index import read_transcript
 from models.config import load_config
 
 logging.basicConfig(level=logging.INFO)
@@ -46,11 +47,12 @@ def extract_metadata_from_transcript(transcript_path: Path) -> dict:
     }
 
     try:
-        content = transcript_path.read_text()
+        # Handles plain and compressed (.md.gz / .md.zst) transcripts
+        content = read_transcript(transcript_path)
 
         # Extract question from filename or content
-        # Filename format: YYYYMMDD_HHMMSS_Question_truncated.md
-        filename = transcript_path.stem
+        # Filename format: YYYYMMDD_HHMMSS_Question_truncated.md[.gz|.zst]
+        filename = transcript_path.name.split(".md", 1)[0]
         parts = filename.split("_", 2)
         if len(parts) > 2:
             question = parts[2].replace("_", " ")
@@ -128,7 +130,11 @@ async def migrate_transcripts_to_graph(
         return 0
 
     # Find all transcripts
-    transcripts = list(transcripts_dir.glob("*.md"))
+    transcripts = sorted(
+        path
+        for pattern in ("*.md", "*.md.gz", "*.md.zst")
+        for path in transcripts_dir.glob(pattern)
+    )
     logger.info(f"Found {len(transcripts)} transcripts to migrate\n")
 
     if not transcripts:
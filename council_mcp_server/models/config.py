@@ -161,6 +161,16 @@ class StorageConfig(BaseModel):
     transcripts_dir: str
     format: str
     auto_export: bool
+    compression: Optional[Literal["gzip", "zstd"]] = Field(
+        None,
+        description="Store transcripts compressed (.md.gz / .md.zst; zstd needs "
+        "the zstandard package)",
+    )
+    transcript_index: bool = Field(
+        True,
+        description="Index transcript metadata and round byte offsets in "
+        "transcript_index.db",
+    )
 
 
 class ConvergenceDetectionConfig(BaseModel):
@@ -247,6 +257,29 @@ class VoteRetryConfig(BaseModel):
     )
 
 
+class ResultCacheConfig(BaseModel):
+    """Configuration for caching finished deliberation results.
+
+    Identical concurrent requests always share one execution; this cache
+    additionally returns recent identical deliberations without rerunning.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Return cached results for identical recent deliberations",
+    )
+    ttl_seconds: int = Field(
+        default=600,
+        ge=1,
+        description="How long a finished deliberation is served from cache",
+    )
+    max_entries: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum number of cached deliberation results",
+    )
+
+
 class DeliberationConfig(BaseModel):
     """Deliberation engine configuration."""
 
@@ -277,6 +310,10 @@ class DeliberationConfig(BaseModel):
         default_factory=VoteRetryConfig,
         description="Vote extraction retry settings",
     )
+    result_cache: ResultCacheConfig = Field(
+        default_factory=ResultCacheConfig,
+        description="Result cache for identical deliberation requests",
+    )
 
 
 class DecisionGraphConfig(BaseModel):
@@ -336,6 +373,17 @@ class DecisionGraphConfig(BaseModel):
         le=3600,
         description="Time-to-live for cached query results in seconds (default: 5 minutes)",
     )
+    fragment_cache_size: int = Field(
+        1000,
+        ge=10,
+        le=100000,
+        description="LRU cache size for pre-rendered context tier fragments",
+    )
+    context_tokenizer: str = Field(
+        "heuristic",
+        description="Token counter for context budgets: 'heuristic' (~4 chars/token) "
+        "or 'tiktoken[:encoding]'",
+    )
 
     # Adaptive K configuration
     adaptive_k_small_threshold: int = Field(
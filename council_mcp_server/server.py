@@ -396,6 +396,11 @@ async def list_tools() -> list[Tool]:
                                 "Default: 0.6 (moderate similarity)"
                             ),
                         },
+                        "deep": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Also search archived (cold) decisions",
+                        },
                         "format": {
                             "type": "string",
                             "enum": ["summary", "detailed", "json"],
@@ -716,6 +721,7 @@ async def handle_query_decisions(arguments: dict) -> list[TextContent]:
         decision_id = arguments.get("decision_id")
         limit = arguments.get("limit", 5)
         threshold = arguments.get("threshold", 0.6)
+        deep = arguments.get("deep", False)
         format_type = arguments.get("format", "summary")
 
         # Validate mutual exclusivity
@@ -812,7 +818,9 @@ async def handle_query_decisions(arguments: dict) -> list[TextContent]:
 
         if query_text:
             # Search similar decisions
-            results = await engine.search_similar(query_text, limit=limit, threshold=threshold)
+            results = await engine.search_similar(
+                query_text, limit=limit, threshold=threshold, deep=deep
+            )
 
             # If empty, include diagnostics
             if not results:
@@ -972,8 +980,14 @@ async def handle_get_quality_metrics(arguments: dict) -> list[TextContent]:
 async def main():
     """Run the MCP server."""
     logger.info("Starting AI Counsel MCP Server...")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream, write_stream, app.create_initialization_options()
+            )
+    finally:
+        # Wait for transcripts still queued on the writer thread
+        await asyncio.to_thread(engine.transcript_manager.close)
 
 
 if __name__ == "__main__":
@@ -10,10 +10,12 @@ Architecture:
   server_http.py - HTTP/SSE transport, port 8003 (backend MCPClient)
 """
 
+import asyncio
 import logging
 import os
 import socket
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from urllib.error import URLError
 from urllib.request import urlopen
@@ -74,6 +76,8 @@ stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 
 from adapters import create_adapter  # noqa: E402
 from deliberation.engine import DeliberationEngine  # noqa: E402
+from deliberation.entry_summarizer import EntrySummarizer  # noqa: E402
+from deliberation.single_flight import DeliberationDeduplicator  # noqa: E402
 from deliberation.summarizer import DeliberationSummarizer  # noqa: E402
 from deliberation.transcript import TranscriptManager  # noqa: E402
 from models.config import AdapterConfig, CLIToolConfig, load_config  # noqa: E402
@@ -124,10 +128,31 @@ engine = DeliberationEngine(
 engine.tool_executor = None
 engine.tool_execution_history = []
 
+result_cache_config = config.deliberation.result_cache
+deduplicator = DeliberationDeduplicator(
+    cache_ttl_seconds=(
+        result_cache_config.ttl_seconds if result_cache_config.enabled else None
+    ),
+    cache_max_entries=result_cache_config.max_entries,
+)
+# Chunked, concurrent entry summaries; the cache spans tool calls
+entry_summarizer = EntrySummarizer()
+
 logger.info("DeliberationEngine ready")
 
+
+@asynccontextmanager
+async def lifespan(server):
+    try:
+        yield {}
+    finally:
+        # Wait for transcripts still queued on the writer thread
+        await asyncio.to_thread(engine.transcript_manager.close)
+
+
 mcp = FastMCP(
     name="ai-counsel",
+    lifespan=lifespan,
     instructions=(
         "Council deliberation server. "
         "Use the deliberate tool to run a multi-perspective AI deliberation."
@@ -214,7 +239,8 @@ async def deliberate(
         language=language,
     )
 
-    result = await engine.execute(request)
+    # Identical concurrent requests (double-clicks, client retries) share one run
+    result = await deduplicator.run(request, lambda: engine.execute(request))
     logger.info(
         "Deliberation complete: %s rounds, status: %s",
         result.rounds_completed,
@@ -223,6 +249,15 @@ async def deliberate(
     return result.model_dump()
 
 
+@mcp.tool()
+async def transcript_round(transcript_path: str, round: int) -> dict:
+    """Fetch one debate round (0 = summary) of a saved transcript."""
+    text = await asyncio.to_thread(
+        engine.transcript_manager.read_round, transcript_path, round
+    )
+    return {"transcript_path": transcript_path, "round": round, "markdown": text}
+
+
 @mcp.tool()
 async def summarize_entries(
     entries: list[dict],
@@ -235,62 +270,11 @@ async def summarize_entries(
     if chosen_adapter is None:
         raise RuntimeError("No adapters available for summarization")
 
-    items = []
-    for entry in entries:
-        response_text = entry.get("response", "")
-        vote_index = response_text.rfind("VOTE:")
-        body = response_text[:vote_index].strip() if vote_index != -1 else response_text.strip()
-        items.append(
-            {
-                "round": entry.get("round"),
-                "participant": entry.get("participant"),
-                "body": body[:1500],
-            }
-        )
-
-    entries_text = "\n\n".join(
-        f"Round {item['round']} - {item['participant']}:\n{item['body']}"
-        for item in items
-    )
-
     lang_note = _language_instruction(language, "the 'summary' field of every element")
-    prompt = (
-        f"{lang_note}"
-        "For each analyst response below, write a single sentence (max 180 characters) "
-        "capturing the analyst's core strategic position and key finding. "
-        "Be specific - name the key claim, not just the topic.\n\n"
-        "Return ONLY a JSON array. Each element must have exactly these keys: "
-        "round (integer), participant (string), summary (string). "
-        "Preserve the exact round number and participant name from the input.\n\n"
-        f"{entries_text}"
+    return await entry_summarizer.summarize(
+        entries, chosen_adapter, model, language=language, lang_note=lang_note
     )
 
-    try:
-        raw_text = await chosen_adapter.invoke(prompt=prompt, model=model, context=None)
-        text = raw_text.strip()
-        if text.startswith("```"):
-            lines = text.splitlines()
-            text = "\n".join(lines[1:-1]).strip()
-        start = text.find("[")
-        end = text.rfind("]")
-        if start != -1 and end != -1:
-            text = text[start : end + 1]
-        import json
-
-        result = json.loads(text)
-        return [
-            {
-                "round": int(row["round"]),
-                "participant": str(row["participant"]),
-                "summary": str(row["summary"]),
-            }
-            for row in result
-            if "round" in row and "participant" in row and "summary" in row
-        ]
-    except Exception as exc:
-        logger.warning("summarize_entries failed: %s", exc)
-        return []
-
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health(request):
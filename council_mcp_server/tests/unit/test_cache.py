@@ -415,6 +415,21 @@ class TestSimilarityCache:
         assert cache.get_cached_embedding("Question 1?") == [0.1, 0.2]
         assert cache.get_cached_embedding("Question 2?") == [0.3, 0.4]
 
+    def test_versioned_result(self):
+        """Test L1 results keep the graph version they were cached at."""
+        cache = SimilarityCache()
+
+        cache.cache_result("Question 1?", 0.7, 3, [{"id": "d1"}], version=7)
+        cache.cache_result("Question 2?", 0.7, 3, [{"id": "d2"}])
+
+        assert cache.get_versioned_result("Question 1?", 0.7, 3) == (7, [{"id": "d1"}])
+        assert cache.get_versioned_result("Question 2?", 0.7, 3) == (
+            None,
+            [{"id": "d2"}],
+        )
+        assert cache.get_cached_result("Question 1?", 0.7, 3) == [{"id": "d1"}]
+        assert cache.get_versioned_result("Question 3?", 0.7, 3) is None
+
     def test_invalidate_all_queries_sets_timestamp(self):
         """Test invalidation sets last_invalidation timestamp."""
         cache = SimilarityCache()
@@ -12,20 +12,22 @@ Tests cover:
 - File I/O operations
 """
 
+import gzip
 import json
-import tempfile
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
-from cli.graph import contradictions, export, graph, similar, timeline
-from decision_graph.schema import DecisionNode, ParticipantStance
+from cli.graph import (analyze, archive, backfill_neighbors, contradictions,
+                       export, graph, similar, timeline)
+from decision_graph.schema import (DecisionNode, DecisionSimilarity,
+                                   ParticipantStance)
 from decision_graph.storage import DecisionGraphStorage
-from deliberation.query_engine import (Contradiction, QueryEngine,
-                                       SimilarResult, Timeline, TimelineEntry)
+from deliberation.query_engine import (Contradiction, PatternAnalysis,
+                                       QueryEngine, SimilarResult, Timeline,
+                                       TimelineEntry, VotingPattern)
 
 # ============================================================================
 # FIXTURES
@@ -213,7 +215,7 @@ class TestGraphSimilarCommand:
 
         assert result.exit_code == 0
         mock_query_engine._search_similar_sync.assert_called_once_with(
-            "TypeScript adoption", 5, 0.7
+            "TypeScript adoption", 5, 0.7, deep=False
         )
 
     def test_should_respect_custom_threshold_when_provided(
@@ -228,7 +230,9 @@ class TestGraphSimilarCommand:
                 )
 
         assert result.exit_code == 0
-        mock_query_engine._search_similar_sync.assert_called_once_with("test", 5, 0.85)
+        mock_query_engine._search_similar_sync.assert_called_once_with(
+            "test", 5, 0.85, deep=False
+        )
 
     def test_should_respect_custom_limit_when_provided(
         self, cli_runner, mock_storage, mock_query_engine
@@ -242,7 +246,22 @@ class TestGraphSimilarCommand:
                 )
 
         assert result.exit_code == 0
-        mock_query_engine._search_similar_sync.assert_called_once_with("test", 10, 0.7)
+        mock_query_engine._search_similar_sync.assert_called_once_with(
+            "test", 10, 0.7, deep=False
+        )
+
+    def test_should_search_archive_when_deep_flag_given(
+        self, cli_runner, mock_storage, mock_query_engine
+    ):
+        """Test that --deep asks the query engine to include archived decisions."""
+        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
+            with patch("cli.graph.QueryEngine", return_value=mock_query_engine):
+                result = cli_runner.invoke(similar, ["--query", "test", "--deep"])
+
+        assert result.exit_code == 0
+        mock_query_engine._search_similar_sync.assert_called_once_with(
+            "test", 5, 0.7, deep=True
+        )
 
     def test_should_output_json_format_when_format_json_specified(
         self, cli_runner, mock_storage, mock_query_engine, sample_decisions
@@ -567,137 +586,192 @@ class TestGraphTimelineCommand:
 class TestGraphExportCommand:
     """Tests for 'graph export' command."""
 
+    @pytest.fixture
+    def export_db(self, tmp_path, sample_decisions, sample_stances):
+        """Create an on-disk graph with decisions, stances and one edge."""
+        db_path = str(tmp_path / "graph.db")
+        storage = DecisionGraphStorage(db_path)
+        for decision in sample_decisions:
+            storage.save_decision_node(decision)
+        for stance in sample_stances:
+            storage.save_participant_stance(stance)
+        storage.save_similarity(
+            DecisionSimilarity(
+                source_id="dec-1",
+                target_id="dec-3",
+                similarity_score=0.82,
+                computed_at=datetime(2025, 10, 3, 10, 0, 0),
+            )
+        )
+        storage.close()
+        return db_path
+
     def test_should_export_to_json_format_when_format_json_specified(
-        self, cli_runner, mock_storage, sample_decisions
+        self, cli_runner, export_db
     ):
-        """Test JSON export format."""
-        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
-            with patch("cli.graph.DecisionGraphExporter.to_json") as mock_export:
-                mock_export.return_value = '{"format": "decision_graph_json"}'
-                result = cli_runner.invoke(
-                    export,
-                    ["--format", "json"],
-                )
+        """Test JSON export streams decisions, stances and edges."""
+        result = cli_runner.invoke(export, ["--format", "json", "--db", export_db])
 
         assert result.exit_code == 0
-        mock_export.assert_called_once_with(sample_decisions)
-        assert '"format": "decision_graph_json"' in result.output
+        data = json.loads(result.output)
+        assert data["format"] == "decision_graph_json"
+        assert [d["id"] for d in data["decisions"]] == ["dec-1", "dec-2", "dec-3"]
+        assert len(data["stances"]) == 4
+        assert data["similarities"][0]["similarity_score"] == 0.82
+
+    def test_should_export_json_lines_when_format_jsonl_specified(
+        self, cli_runner, export_db
+    ):
+        """Test JSON Lines export format."""
+        result = cli_runner.invoke(export, ["--format", "jsonl", "--db", export_db])
+
+        assert result.exit_code == 0
+        types = [json.loads(line)["type"] for line in result.output.splitlines()]
+        assert types == ["header"] + ["decision"] * 3 + ["stance"] * 4 + [
+            "similarity"
+        ]
 
     def test_should_export_to_graphml_format_when_format_graphml_specified(
-        self, cli_runner, mock_storage, sample_decisions
+        self, cli_runner, export_db
     ):
-        """Test GraphML export format."""
-        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
-            with patch("cli.graph.DecisionGraphExporter.to_graphml") as mock_export:
-                mock_export.return_value = '<?xml version="1.0"?>'
-                result = cli_runner.invoke(
-                    export,
-                    ["--format", "graphml"],
-                )
+        """Test GraphML export format includes similarity edges."""
+        result = cli_runner.invoke(export, ["--format", "graphml", "--db", export_db])
 
         assert result.exit_code == 0
-        mock_export.assert_called_once_with(sample_decisions)
-        assert '<?xml version="1.0"?>' in result.output
+        assert '<?xml version="1.0" encoding="UTF-8"?>' in result.output
+        assert '<edge source="dec-1" target="dec-3">' in result.output
 
     def test_should_export_to_dot_format_when_format_dot_specified(
-        self, cli_runner, mock_storage, sample_decisions
+        self, cli_runner, export_db
     ):
         """Test Graphviz DOT export format."""
-        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
-            with patch("cli.graph.DecisionGraphExporter.to_dot") as mock_export:
-                mock_export.return_value = "digraph DecisionGraph {"
-                result = cli_runner.invoke(
-                    export,
-                    ["--format", "dot"],
-                )
+        result = cli_runner.invoke(export, ["--format", "dot", "--db", export_db])
 
         assert result.exit_code == 0
-        mock_export.assert_called_once_with(sample_decisions)
         assert "digraph DecisionGraph {" in result.output
+        assert '"dec-1" -> "dec-3"' in result.output
 
     def test_should_export_to_markdown_format_when_format_markdown_specified(
-        self, cli_runner, mock_storage, sample_decisions
+        self, cli_runner, export_db
     ):
         """Test Markdown export format."""
-        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
-            with patch("cli.graph.DecisionGraphExporter.to_markdown") as mock_export:
-                mock_export.return_value = "# Decision Graph Memory Report"
-                result = cli_runner.invoke(
-                    export,
-                    ["--format", "markdown"],
-                )
+        result = cli_runner.invoke(
+            export, ["--format", "markdown", "--db", export_db]
+        )
 
         assert result.exit_code == 0
-        mock_export.assert_called_once_with(sample_decisions)
         assert "# Decision Graph Memory Report" in result.output
+        assert "- Total Decisions: 3" in result.output
+        assert "- Total Relationships: 1" in result.output
+        assert "## Relationships" in result.output
 
     def test_should_write_to_file_when_output_option_provided(
-        self, cli_runner, mock_storage, sample_decisions
+        self, cli_runner, export_db, tmp_path
     ):
         """Test file output with --output option."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as tf:
-            temp_path = tf.name
+        output = tmp_path / "graph.json"
+        result = cli_runner.invoke(
+            export, ["--format", "json", "--output", str(output), "--db", export_db]
+        )
 
-        try:
-            with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
-                with patch("cli.graph.DecisionGraphExporter.to_json") as mock_export:
-                    mock_export.return_value = '{"test": "data"}'
-                    result = cli_runner.invoke(
-                        export,
-                        ["--format", "json", "--output", temp_path],
-                    )
+        assert result.exit_code == 0
+        assert f"Exported 3 decisions to {output}" in result.output
+        assert len(json.loads(output.read_text())["decisions"]) == 3
 
-            assert result.exit_code == 0
-            assert f"Exported 3 decisions to {temp_path}" in result.output
+    def test_should_gzip_output_when_gzip_flag_provided(
+        self, cli_runner, export_db, tmp_path
+    ):
+        """Test gzip-compressed file output."""
+        output = tmp_path / "graph.jsonl.gz"
+        result = cli_runner.invoke(
+            export,
+            ["-f", "jsonl", "--gzip", "-o", str(output), "--db", export_db],
+        )
 
-            # Verify file was written
-            content = Path(temp_path).read_text()
-            assert content == '{"test": "data"}'
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        assert result.exit_code == 0
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            assert len(f.readlines()) == 9
 
     def test_should_output_to_stdout_when_no_output_option(
-        self, cli_runner, mock_storage
+        self, cli_runner, export_db
     ):
         """Test stdout output when --output not specified."""
-        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
-            with patch("cli.graph.DecisionGraphExporter.to_json") as mock_export:
-                mock_export.return_value = '{"test": "stdout"}'
-                result = cli_runner.invoke(
-                    export,
-                    ["--format", "json"],
-                )
+        result = cli_runner.invoke(export, ["--format", "json", "--db", export_db])
 
         assert result.exit_code == 0
-        assert '{"test": "stdout"}' in result.output
+        assert '"decision_graph_json"' in result.output
         assert "Exported" not in result.output  # No file message
 
+    def test_should_export_only_new_rows_when_since_last_provided(
+        self, cli_runner, export_db, sample_decisions
+    ):
+        """Test incremental dumps against a named checkpoint."""
+        first = cli_runner.invoke(
+            export, ["-f", "jsonl", "--since-last", "--db", export_db]
+        )
+        assert first.exit_code == 0
+        assert len(first.output.splitlines()) == 9
+
+        storage = DecisionGraphStorage(export_db)
+        storage.save_decision_node(
+            sample_decisions[0].model_copy(update={"id": "dec-4"})
+        )
+        storage.save_similarity(
+            DecisionSimilarity(
+                source_id="dec-4", target_id="dec-1", similarity_score=0.9
+            )
+        )
+        storage.close()
+
+        second = cli_runner.invoke(
+            export, ["-f", "jsonl", "--since-last", "--db", export_db]
+        )
+        records = [json.loads(line) for line in second.output.splitlines()]
+
+        assert second.exit_code == 0
+        assert records[0]["since_version"] == 3
+        assert [r.get("id") for r in records if r["type"] == "decision"] == ["dec-4"]
+        assert [r["source_id"] for r in records if r["type"] == "similarity"] == [
+            "dec-4"
+        ]
+
+        other = cli_runner.invoke(
+            export,
+            ["-f", "jsonl", "--since-last", "--checkpoint", "other", "--db", export_db],
+        )
+        assert len(other.output.splitlines()) == 11
+
+    def test_should_reject_include_archived_with_since_last(
+        self, cli_runner, export_db
+    ):
+        """Test that archived rows are only exported in full dumps."""
+        result = cli_runner.invoke(
+            export, ["--since-last", "--include-archived", "--db", export_db]
+        )
+
+        assert result.exit_code == 2
+        assert "full exports only" in result.output
+
     def test_should_use_custom_database_path_when_db_option_provided(
-        self, cli_runner, mock_storage
+        self, cli_runner, export_db
     ):
         """Test custom database path."""
-        with patch("cli.graph.DecisionGraphStorage") as mock_storage_class:
-            mock_storage_class.return_value = mock_storage
-            with patch("cli.graph.DecisionGraphExporter.to_json") as mock_export:
-                mock_export.return_value = "{}"
-                result = cli_runner.invoke(
-                    export,
-                    ["--format", "json", "--db", "/custom/graph.db"],
-                )
+        with patch(
+            "cli.graph.DecisionGraphStorage", wraps=DecisionGraphStorage
+        ) as mock_storage_class:
+            result = cli_runner.invoke(export, ["--format", "json", "--db", export_db])
 
         assert result.exit_code == 0
-        mock_storage_class.assert_called_once_with("/custom/graph.db")
+        mock_storage_class.assert_called_once_with(export_db)
 
-    def test_should_exit_with_error_when_no_decisions_found(self, cli_runner):
+    def test_should_exit_with_error_when_no_decisions_found(
+        self, cli_runner, tmp_path
+    ):
         """Test error when database is empty."""
-        empty_storage = Mock(spec=DecisionGraphStorage)
-        empty_storage.get_all_decisions.return_value = []
-
-        with patch("cli.graph.DecisionGraphStorage", return_value=empty_storage):
-            result = cli_runner.invoke(
-                export,
-                ["--format", "json"],
-            )
+        result = cli_runner.invoke(
+            export,
+            ["--format", "json", "--db", str(tmp_path / "empty.db")],
+        )
 
         assert result.exit_code == 1
         assert "No decisions found in graph." in result.output
@@ -712,11 +786,131 @@ class TestGraphExportCommand:
         assert "Error: Database error" in result.output
 
 
+class TestGraphBackfillNeighborsCommand:
+    """Test 'graph backfill-neighbors' command."""
+
+    def test_should_backfill_with_options(self, cli_runner):
+        """Test options are passed through to the maintenance backfill."""
+        with patch("cli.graph.DecisionGraphStorage"):
+            with patch("cli.graph.DecisionGraphMaintenance") as mock_maintenance:
+                mock_maintenance.return_value.backfill_neighbor_lists.return_value = {
+                    "decisions_scanned": 3,
+                    "total_decisions": 10,
+                    "neighbor_entries": 7,
+                    "elapsed_seconds": 0.1,
+                }
+                result = cli_runner.invoke(
+                    backfill_neighbors,
+                    ["--threshold", "0.6", "--chunk-size", "8", "--rebuild"],
+                )
+
+        assert result.exit_code == 0
+        mock_maintenance.return_value.backfill_neighbor_lists.assert_called_once_with(
+            threshold=0.6, chunk_size=8, rebuild=True
+        )
+        assert "3 of 10 decisions" in result.output
+
+    def test_should_handle_exception_and_exit_with_error(self, cli_runner):
+        """Test exception handling."""
+        with patch("cli.graph.DecisionGraphStorage") as mock_storage_class:
+            mock_storage_class.side_effect = Exception("Database error")
+            result = cli_runner.invoke(backfill_neighbors, [])
+
+        assert result.exit_code == 1
+        assert "Error: Database error" in result.output
+
+
 # ============================================================================
 # TEST: Error handling and edge cases
 # ============================================================================
 
 
+class TestGraphAnalyzeCommand:
+    """Test 'graph analyze' command."""
+
+    def test_should_pass_since_and_output_json(self, cli_runner, mock_storage):
+        """Test --since is parsed and the analysis is rendered as JSON."""
+        engine = Mock(spec=QueryEngine)
+        engine._analyze_patterns_sync.return_value = PatternAnalysis(
+            total_decisions=2,
+            total_participants=1,
+            voting_patterns=[
+                VotingPattern(
+                    participant="opus@claude",
+                    total_votes=2,
+                    avg_confidence=0.9,
+                    preferred_options=["Yes"],
+                )
+            ],
+            convergence_stats={"converged": 2},
+            participation_metrics={"total_stances": 2},
+        )
+        with patch("cli.graph.DecisionGraphStorage", return_value=mock_storage):
+            with patch("cli.graph.QueryEngine", return_value=engine):
+                result = cli_runner.invoke(
+                    analyze,
+                    [
+                        "--since",
+                        "2025-10-02",
+                        "--participant",
+                        "opus@claude",
+                        "--format",
+                        "json",
+                    ],
+                )
+
+        assert result.exit_code == 0
+        engine._analyze_patterns_sync.assert_called_once_with(
+            "opus@claude", datetime(2025, 10, 2)
+        )
+        data = json.loads(result.output)
+        assert data["total_decisions"] == 2
+        assert data["voting_patterns"][0]["preferred_options"] == ["Yes"]
+        assert data["convergence_stats"] == {"converged": 2}
+
+    def test_should_reject_malformed_since(self, cli_runner):
+        """Test that --since must be a date."""
+        result = cli_runner.invoke(analyze, ["--since", "last week"])
+
+        assert result.exit_code != 0
+
+
+class TestGraphArchiveCommand:
+    """Test 'graph archive' command."""
+
+    def test_should_dry_run_by_default_and_apply_with_flag(self, cli_runner):
+        """Test archive is a dry run unless --apply is given."""
+        with patch("cli.graph.DecisionGraphStorage"):
+            with patch("cli.graph.DecisionGraphMaintenance") as mock_maintenance:
+                archive_old = mock_maintenance.return_value.archive_old_decisions
+                archive_old.return_value = {
+                    "message": "Would archive 4 decisions",
+                    "candidate_count": 4,
+                    "archived_count": 0,
+                    "archive_path": "graph.archive.db",
+                }
+                result = cli_runner.invoke(archive, [])
+                applied = cli_runner.invoke(
+                    archive, ["--apply", "--age-days", "30", "--force"]
+                )
+
+        assert result.exit_code == 0
+        assert applied.exit_code == 0
+        assert "Would archive 4 decisions" in result.output
+        assert archive_old.call_args_list[0].kwargs == {
+            "dry_run": True,
+            "age_days": None,
+            "unused_days": None,
+            "force": False,
+        }
+        assert archive_old.call_args_list[1].kwargs == {
+            "dry_run": False,
+            "age_days": 30,
+            "unused_days": None,
+            "force": True,
+        }
+
+
 class TestErrorHandlingAndEdgeCases:
     """Tests for error conditions and edge cases."""
 
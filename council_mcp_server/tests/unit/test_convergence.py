@@ -57,6 +57,20 @@ class TestJaccardBackend:
         similarity = backend.compute_similarity("", "some text")
         assert similarity == 0.0
 
+    def test_similarity_matrix_matches_pairwise(self):
+        """Matrix scores should equal pairwise compute_similarity scores."""
+        backend = JaccardBackend()
+        rows = ["the quick brown fox", "", "airplane engine"]
+        cols = [
+            "the lazy brown dog",
+            "airplane engine turbulence",
+            "the quick brown fox",
+        ]
+        matrix = backend.compute_similarity_matrix(rows, cols)
+        assert matrix == [
+            [backend.compute_similarity(a, b) for b in cols] for a in rows
+        ]
+
 
 # =============================================================================
 # TF-IDF Backend Tests (optional dependency)
@@ -1,10 +1,12 @@
 """Unit tests for DecisionGraphIntegration with maintenance monitoring."""
+import threading
 from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
 from decision_graph.integration import DecisionGraphIntegration
+from decision_graph.maintenance import DecisionGraphMaintenance
 from decision_graph.schema import DecisionNode
 from decision_graph.storage import DecisionGraphStorage
 from models.schema import ConvergenceInfo, DeliberationResult, Summary
@@ -67,6 +69,26 @@ class TestDecisionGraphIntegrationMaintenance:
         integration.store_deliberation("Question 3", sample_result)
         assert integration._decision_count == 3
 
+    def test_should_prime_context_fragments_on_store(
+        self, integration, sample_result
+    ):
+        """Test that storing a deliberation pre-renders its tier fragments."""
+        decision_id = integration.store_deliberation("Question 1", sample_result)
+        decision = integration.storage.get_decision_node(decision_id)
+
+        assert set(integration.retriever.fragment_cache.get(decision_id)) == {
+            "strong",
+            "moderate",
+            "brief",
+        }
+        with patch.object(integration.storage, "get_participant_stances") as mock_get:
+            result = integration.retriever.format_context_tiered(
+                [(decision, 0.9)], {"strong": 0.75, "moderate": 0.60}, 2000
+            )
+
+        mock_get.assert_not_called()
+        assert result["tier_distribution"]["strong"] == 1
+
     def test_should_log_stats_every_100_decisions(
         self, integration, sample_result, caplog
     ):
@@ -219,6 +241,43 @@ class TestDecisionGraphIntegrationMaintenance:
             ]
             assert len(stats_errors) == 1
 
+    async def test_archival_runs_off_the_request_path(self, tmp_path, sample_result):
+        """Reaching the archival trigger should not archive inside the store call."""
+        storage = DecisionGraphStorage(str(tmp_path / "graph.db"))
+        integration = DecisionGraphIntegration(storage, enable_background_worker=False)
+        release = threading.Event()
+        archive_threads = []
+
+        def slow_archive(maintenance, dry_run=True, **kwargs):
+            archive_threads.append(threading.get_ident())
+            release.wait(timeout=5)
+            return {"archived_count": 3}
+
+        with patch.object(
+            integration.maintenance,
+            "get_database_stats",
+            return_value={
+                "total_decisions": 5000,
+                "total_stances": 0,
+                "total_similarities": 0,
+                "db_size_mb": 1.0,
+            },
+        ), patch.object(
+            DecisionGraphMaintenance, "archive_old_decisions", slow_archive
+        ), patch.object(
+            integration.retriever, "invalidate_cache"
+        ) as invalidate:
+            integration._decision_count = 99
+            integration.store_deliberation("Question", sample_result)
+            assert not invalidate.called
+
+            release.set()
+            await integration.shutdown()
+
+        assert archive_threads and archive_threads[0] != threading.get_ident()
+        invalidate.assert_called_once()
+        storage.close()
+
     def test_get_graph_stats_returns_stats(self, integration):
         """Test get_graph_stats() returns database statistics."""
         # Store some decisions
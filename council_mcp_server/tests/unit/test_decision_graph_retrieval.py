@@ -8,8 +8,9 @@ import pytest
 
 from decision_graph.cache import SimilarityCache
 from decision_graph.retrieval import DecisionRetriever
-from decision_graph.schema import DecisionNode
+from decision_graph.schema import DecisionNode, ParticipantStance
 from decision_graph.storage import DecisionGraphStorage
+from decision_graph.tokenizers import Tokenizer
 
 
 @pytest.fixture
@@ -489,6 +490,109 @@ class TestDecisionRetrieverCacheIntegration:
         assert mock_storage.get_all_decisions.call_count == 2
 
 
+class TestDecisionRetrieverVersionedCache:
+    """Test that stored decisions refresh cached queries instead of clearing them."""
+
+    @staticmethod
+    def _node(question):
+        return DecisionNode(
+            question=question,
+            timestamp=datetime.now(UTC),
+            participants=["claude"],
+            convergence_status="converged",
+            consensus="Consensus",
+            transcript_path="t.md",
+        )
+
+    def test_new_decision_merged_into_cached_result(self):
+        """Only the newly stored decision is scored on the next lookup."""
+        storage = DecisionGraphStorage(":memory:")
+        react = self._node("Should we use React for the frontend?")
+        storage.save_decision_node(react)
+        storage.save_decision_node(self._node("What database should we use?"))
+
+        retriever = DecisionRetriever(storage)
+        query = "Should we use React for the frontend app?"
+        first = retriever.find_relevant_decisions(query)
+        assert [d.id for d, _ in first] == [react.id]
+
+        similar = self._node("Should we use React for the frontend app?")
+        storage.save_decision_node(similar)
+
+        with patch.object(
+            storage, "get_all_decisions", wraps=storage.get_all_decisions
+        ) as full_scan, patch.object(
+            retriever.similarity_detector,
+            "find_similar",
+            wraps=retriever.similarity_detector.find_similar,
+        ) as find_similar:
+            second = retriever.find_relevant_decisions(query)
+
+        full_scan.assert_not_called()
+        assert len(find_similar.call_args[0][1]) == 1
+        assert [d.id for d, _ in second] == [similar.id, react.id]
+        assert retriever.get_cache_stats()["l1_refreshes"] == 1
+
+        # The refreshed entry is stamped with the new version: plain hit now
+        with patch.object(retriever.similarity_detector, "find_similar") as no_scan:
+            third = retriever.find_relevant_decisions(query)
+        no_scan.assert_not_called()
+        assert [d.id for d, _ in third] == [similar.id, react.id]
+
+    def test_unversioned_entry_recomputed(self):
+        """Results cached without a version are recomputed, not trusted."""
+        storage = DecisionGraphStorage(":memory:")
+        node = self._node("Should we use React for the frontend?")
+        storage.save_decision_node(node)
+
+        retriever = DecisionRetriever(storage)
+        retriever.cache.cache_result(node.question, 0.0, 3, [])
+
+        results = retriever.find_relevant_decisions(node.question)
+        assert [d.id for d, _ in results] == [node.id]
+
+    def test_retrieval_hits_record_last_accessed(self):
+        """Returned decisions are stamped so archival keeps them hot."""
+        storage = DecisionGraphStorage(":memory:")
+        hit = self._node("Should we use React for the frontend?")
+        miss = self._node("What database should we use?")
+        storage.save_decision_node(hit)
+        storage.save_decision_node(miss)
+
+        retriever = DecisionRetriever(storage)
+        retriever.find_relevant_decisions("Should we use React for the frontend?")
+        storage.flush_access()
+
+        accessed = dict(
+            storage.conn.execute("SELECT id, last_accessed FROM decision_nodes")
+        )
+        assert accessed[hit.id] is not None
+        assert accessed[miss.id] is None
+
+    def test_retrieval_does_not_write_until_access_flush_is_due(self):
+        """Lookups buffer access stamps instead of writing on every call."""
+        storage = DecisionGraphStorage(":memory:")
+        node = self._node("Should we use React for the frontend?")
+        storage.save_decision_node(node)
+        retriever = DecisionRetriever(storage)
+
+        for _ in range(3):
+            retriever.find_relevant_decisions("Should we use React for the frontend?")
+        before = storage.conn.total_changes
+        retriever.find_relevant_decisions("Should we use React for the frontend?")
+
+        assert storage.conn.total_changes == before
+        assert storage.conn.execute(
+            "SELECT last_accessed FROM decision_nodes"
+        ).fetchone()[0] is None
+
+        storage.ACCESS_FLUSH_INTERVAL = 0.0
+        retriever.find_relevant_decisions("Should we use React for the frontend?")
+        assert storage.conn.execute(
+            "SELECT last_accessed FROM decision_nodes"
+        ).fetchone()[0] is not None
+
+
 class TestDecisionRetrieverTieredFormatting:
     """Test tiered context formatting with token budget tracking."""
 
@@ -751,6 +855,131 @@ class TestDecisionRetrieverTieredFormatting:
         assert result["tier_distribution"]["brief"] == 0
 
 
+class TestDecisionRetrieverTierFragments:
+    """Test pre-rendered tier fragments and greedy budget assembly."""
+
+    TIERS = {"strong": 0.75, "moderate": 0.60}
+
+    def test_primed_fragments_skip_stance_queries(
+        self, mock_storage, sample_decisions
+    ):
+        """Test that fragments primed at store time need no storage access."""
+        retriever = DecisionRetriever(mock_storage)
+        stance = ParticipantStance(
+            decision_id="dec1",
+            participant="claude",
+            vote_option="React",
+            confidence=0.9,
+            rationale="Better ecosystem support",
+            final_position="React",
+        )
+        retriever.prime_fragments(sample_decisions[0], [stance])
+
+        result = retriever.format_context_tiered(
+            [(sample_decisions[0], 0.85)], self.TIERS, 2000
+        )
+
+        mock_storage.get_participant_stances.assert_not_called()
+        assert "### Strong Match (similarity: 0.85): Should we use React" in (
+            result["formatted"]
+        )
+        assert "Better ecosystem support" in result["formatted"]
+
+    def test_rendered_fragments_cached_until_invalidated(
+        self, mock_storage, sample_decisions
+    ):
+        """Test that stances are queried once per decision, not per query."""
+        retriever = DecisionRetriever(mock_storage)
+        mock_storage.get_participant_stances.return_value = []
+        scored = [(sample_decisions[0], 0.85)]
+
+        first = retriever.format_context_tiered(scored, self.TIERS, 2000)
+        second = retriever.format_context_tiered(scored, self.TIERS, 2000)
+        assert first == second
+        assert mock_storage.get_participant_stances.call_count == 1
+
+        retriever.invalidate_cache()
+        retriever.format_context_tiered(scored, self.TIERS, 2000)
+        assert mock_storage.get_participant_stances.call_count == 2
+
+        retriever.invalidate_fragments(["dec1"])
+        retriever.format_context_tiered(scored, self.TIERS, 2000)
+        assert mock_storage.get_participant_stances.call_count == 3
+
+    def test_stance_errors_are_not_cached(self, mock_storage, sample_decisions):
+        """Test that a failed stance lookup is retried on the next query."""
+        retriever = DecisionRetriever(mock_storage)
+        mock_storage.get_participant_stances.side_effect = RuntimeError("locked")
+        scored = [(sample_decisions[0], 0.85)]
+
+        result = retriever.format_context_tiered(scored, self.TIERS, 2000)
+        assert "Error retrieving participant positions" in result["formatted"]
+
+        mock_storage.get_participant_stances.side_effect = None
+        mock_storage.get_participant_stances.return_value = []
+        result = retriever.format_context_tiered(scored, self.TIERS, 2000)
+        assert "Error retrieving participant positions" not in result["formatted"]
+
+    def test_strong_match_falls_back_to_cheaper_tier(
+        self, mock_storage, sample_decisions
+    ):
+        """Test that a decision too large for its tier is included more briefly."""
+        retriever = DecisionRetriever(mock_storage)
+        mock_storage.get_participant_stances.return_value = []
+        scored = [(sample_decisions[0], 0.90), (sample_decisions[1], 0.85)]
+        strong_tokens = retriever._get_fragment(sample_decisions[0], "strong")[1]
+        header_tokens = retriever._estimate_tokens(
+            "## Similar Past Deliberations (Tiered by Relevance)\n\n"
+        )
+
+        result = retriever.format_context_tiered(
+            scored, self.TIERS, header_tokens + strong_tokens + 20
+        )
+
+        assert result["tier_distribution"] == {
+            "strong": 1,
+            "moderate": 0,
+            "brief": 1,
+        }
+        assert result["tokens_used"] <= header_tokens + strong_tokens + 20
+        assert "- **Brief Match** (0.85): What database should we use?" in (
+            result["formatted"]
+        )
+
+    def test_oversized_decision_skipped_not_terminal(
+        self, mock_storage, sample_decisions
+    ):
+        """Test that a decision fitting no tier does not end the context."""
+        retriever = DecisionRetriever(mock_storage)
+        huge = sample_decisions[0].model_copy(
+            update={"id": "huge", "question": "Why? " * 500}
+        )
+
+        result = retriever.format_context_tiered(
+            [(huge, 0.50), (sample_decisions[1], 0.45)], self.TIERS, 200
+        )
+
+        assert result["tier_distribution"]["brief"] == 1
+        assert "What database should we use?" in result["formatted"]
+        assert "Why? Why?" not in result["formatted"]
+
+    def test_pluggable_tokenizer_sizes_fragments(self, mock_storage, sample_decisions):
+        """Test that budgets are counted with the configured tokenizer."""
+
+        class WordTokenizer(Tokenizer):
+            name = "words"
+
+            def count(self, text: str) -> int:
+                return len(text.split())
+
+        retriever = DecisionRetriever(mock_storage, tokenizer=WordTokenizer())
+        result = retriever.format_context_tiered(
+            [(sample_decisions[2], 0.45)], self.TIERS, 2000
+        )
+
+        assert result["tokens_used"] == len(result["formatted"].split())
+
+
 class TestDecisionRetrieverAdaptiveK:
     """Test adaptive k selection based on database size."""
 
@@ -648,6 +648,142 @@ class TestDecisionSimilarityCRUD:
         assert len(similar) == 1
         assert similar[0][1] == 0.9  # Updated score
 
+    def test_save_similarities_bulk(self, storage):
+        """Test saving many similarities in one call."""
+        nodes = []
+        for i in range(3):
+            node = DecisionNode(
+                question=f"Q{i}",
+                timestamp=datetime.now(),
+                consensus="C",
+                convergence_status="converged",
+                participants=[],
+                transcript_path="t",
+            )
+            storage.save_decision_node(node)
+            nodes.append(node)
+
+        written = storage.save_similarities(
+            [
+                DecisionSimilarity(
+                    source_id=nodes[0].id, target_id=nodes[1].id, similarity_score=0.6
+                ),
+                DecisionSimilarity(
+                    source_id=nodes[0].id, target_id=nodes[2].id, similarity_score=0.8
+                ),
+            ]
+        )
+
+        assert written == 2
+        similar = storage.get_similar_decisions(nodes[0].id, threshold=0.0)
+        assert [score for _, score in similar] == [0.8, 0.6]
+        assert storage.save_similarities([]) == 0
+
+    def test_save_similarities_rolls_back_on_invalid_edge(
+        self, storage, sample_decision_node
+    ):
+        """Test that one invalid edge leaves none of the batch stored."""
+        other = DecisionNode(
+            question="Q2",
+            timestamp=datetime.now(),
+            consensus="C",
+            convergence_status="converged",
+            participants=[],
+            transcript_path="t",
+        )
+        storage.save_decision_node(sample_decision_node)
+        storage.save_decision_node(other)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            storage.save_similarities(
+                [
+                    DecisionSimilarity(
+                        source_id=sample_decision_node.id,
+                        target_id=other.id,
+                        similarity_score=0.6,
+                    ),
+                    DecisionSimilarity(
+                        source_id=sample_decision_node.id,
+                        target_id="nonexistent-id",
+                        similarity_score=0.6,
+                    ),
+                ]
+            )
+
+        assert storage.get_similar_decisions(sample_decision_node.id, 0.0) == []
+
+    def test_neighbor_lists_maintained_in_both_directions(self, storage):
+        """Test saved edges are mirrored into both endpoints' neighbour lists."""
+        nodes = []
+        for i in range(3):
+            node = DecisionNode(
+                question=f"Q{i}",
+                timestamp=datetime.now(),
+                consensus="C",
+                convergence_status="converged",
+                participants=[],
+                transcript_path="t",
+            )
+            storage.save_decision_node(node)
+            nodes.append(node)
+
+        assert storage.get_neighbors(nodes[0].id) is None
+
+        storage.save_similarities(
+            [
+                DecisionSimilarity(
+                    source_id=nodes[2].id, target_id=nodes[0].id, similarity_score=0.7
+                ),
+                DecisionSimilarity(
+                    source_id=nodes[2].id, target_id=nodes[1].id, similarity_score=0.9
+                ),
+            ],
+            scanned_ids=[nodes[0].id, nodes[2].id],
+        )
+
+        newest = storage.get_neighbors(nodes[2].id)
+        assert [(n.id, score) for n, score in newest] == [
+            (nodes[1].id, 0.9),
+            (nodes[0].id, 0.7),
+        ]
+        assert [n.id for n, _ in storage.get_neighbors(nodes[0].id)] == [nodes[2].id]
+        assert storage.get_neighbors(nodes[2].id, min_score=0.8, limit=5)[0][0].id == (
+            nodes[1].id
+        )
+        # Not scanned: the list exists but is not trusted as complete
+        assert storage.get_neighbors(nodes[1].id) is None
+
+    def test_neighbor_lists_trimmed_to_list_size(self, storage, monkeypatch):
+        """Test neighbour lists keep only the best NEIGHBOR_LIST_SIZE entries."""
+        monkeypatch.setattr(DecisionGraphStorage, "NEIGHBOR_LIST_SIZE", 2)
+        nodes = []
+        for i in range(4):
+            node = DecisionNode(
+                question=f"Q{i}",
+                timestamp=datetime.now(),
+                consensus="C",
+                convergence_status="converged",
+                participants=[],
+                transcript_path="t",
+            )
+            storage.save_decision_node(node)
+            nodes.append(node)
+
+        storage.save_similarities(
+            [
+                DecisionSimilarity(
+                    source_id=nodes[0].id,
+                    target_id=other.id,
+                    similarity_score=score,
+                )
+                for other, score in zip(nodes[1:], [0.6, 0.9, 0.7])
+            ],
+            scanned_ids=[nodes[0].id],
+        )
+
+        neighbors = storage.get_neighbors(nodes[0].id)
+        assert [n.id for n, _ in neighbors] == [nodes[2].id, nodes[3].id]
+
     def test_get_similar_decisions_empty(self, storage, sample_decision_node):
         """Test getting similar decisions when none exist."""
         storage.save_decision_node(sample_decision_node)
@@ -917,3 +1053,297 @@ class TestStorageEdgeCases:
         # Verify nothing was saved
         retrieved = storage.get_decision_node("test-id")
         assert retrieved is None
+
+
+class TestArchiveTier:
+    """Tests for access tracking and the archive tier."""
+
+    def test_touch_decisions_sets_last_accessed(self, storage, sample_decision_node):
+        """Test that retrieval hits are stamped on the hot row."""
+        storage.save_decision_node(sample_decision_node)
+        storage.touch_decisions([sample_decision_node.id])
+
+        row = storage.conn.execute(
+            "SELECT last_accessed FROM decision_nodes WHERE id = ?",
+            (sample_decision_node.id,),
+        ).fetchone()
+        assert row["last_accessed"] is not None
+
+    def test_record_access_is_buffered_until_flush(
+        self, storage, sample_decision_node
+    ):
+        """Test that access stamps are written by flush_access, not per call."""
+        storage.save_decision_node(sample_decision_node)
+        storage.record_access([sample_decision_node.id])
+
+        query = "SELECT last_accessed FROM decision_nodes WHERE id = ?"
+        params = (sample_decision_node.id,)
+        assert storage.conn.execute(query, params).fetchone()[0] is None
+
+        assert storage.flush_access() == 1
+        assert storage.conn.execute(query, params).fetchone()[0] is not None
+        assert storage.flush_access() == 0
+
+    def test_close_writes_buffered_access(self, tmp_path, sample_decision_node):
+        """Test that closing storage does not lose buffered access stamps."""
+        db_path = str(tmp_path / "graph.db")
+        storage = DecisionGraphStorage(db_path=db_path)
+        storage.save_decision_node(sample_decision_node)
+        storage.record_access([sample_decision_node.id])
+        storage.close()
+
+        storage = DecisionGraphStorage(db_path=db_path)
+        try:
+            row = storage.conn.execute(
+                "SELECT last_accessed FROM decision_nodes WHERE id = ?",
+                (sample_decision_node.id,),
+            ).fetchone()
+            assert row["last_accessed"] is not None
+        finally:
+            storage.close()
+
+    def test_archive_decisions_moves_rows_to_archive_file(
+        self, tmp_path, sample_decision_node, sample_participant_stance
+    ):
+        """Test that archived rows live in the archive file, not the hot DB."""
+        storage = DecisionGraphStorage(db_path=str(tmp_path / "graph.db"))
+        try:
+            assert storage.archive_path == str(tmp_path / "graph.archive.db")
+            assert storage.get_archived_decisions() == []
+            assert not (tmp_path / "graph.archive.db").exists()
+
+            storage.save_decision_node(sample_decision_node)
+            storage.save_participant_stance(sample_participant_stance)
+            counts = storage.archive_decisions([sample_decision_node.id])
+
+            assert counts == {"decisions": 1, "stances": 1, "similarities": 0}
+            assert storage.count_decisions() == 0
+            assert storage.count_archived_decisions() == 1
+            assert storage.get_all_decisions() == []
+            assert [d.id for d in storage.get_archived_decisions()] == [
+                sample_decision_node.id
+            ]
+            assert storage.get_participant_stances(sample_decision_node.id) == []
+            stances = storage.get_participant_stances(
+                sample_decision_node.id, include_archived=True
+            )
+            assert [s.participant for s in stances] == ["opus@claude"]
+        finally:
+            storage.close()
+
+        # The archive is re-attached on demand after reopening
+        reopened = DecisionGraphStorage(db_path=str(tmp_path / "graph.db"))
+        try:
+            assert reopened.count_archived_decisions() == 1
+            node = reopened.get_decision_node(
+                sample_decision_node.id, include_archived=True
+            )
+            assert node.question == sample_decision_node.question
+        finally:
+            reopened.close()
+
+    def test_archive_decisions_moves_edges_touching_cold_decisions(self, storage):
+        """Test that edges to an archived decision leave the hot tables."""
+        nodes = [
+            DecisionNode(
+                question=f"Question {i}?",
+                timestamp=datetime.now(),
+                consensus="Yes",
+                convergence_status="converged",
+                participants=["opus@claude"],
+                transcript_path=f"/transcripts/{i}.md",
+            )
+            for i in range(3)
+        ]
+        for node in nodes:
+            storage.save_decision_node(node)
+        storage.save_similarities(
+            [
+                DecisionSimilarity(
+                    source_id=nodes[1].id, target_id=nodes[0].id, similarity_score=0.9
+                ),
+                DecisionSimilarity(
+                    source_id=nodes[2].id, target_id=nodes[1].id, similarity_score=0.7
+                ),
+            ],
+            scanned_ids=[nodes[1].id, nodes[2].id],
+        )
+
+        counts = storage.archive_decisions([nodes[0].id])
+
+        assert counts["similarities"] == 1
+        remaining = storage.conn.execute(
+            "SELECT source_id, target_id FROM decision_similarities"
+        ).fetchall()
+        assert [tuple(row) for row in remaining] == [(nodes[2].id, nodes[1].id)]
+        neighbors = storage.get_neighbors(nodes[1].id)
+        assert [node.id for node, _ in neighbors] == [nodes[2].id]
+
+
+class TestVoteAggregates:
+    """Tests for the daily rollups behind voting analytics."""
+
+    def test_rollups_rebuilt_by_migration(
+        self, storage, sample_decision_node, sample_participant_stance
+    ):
+        """Test that a database without rollup triggers is backfilled."""
+        storage.save_decision_node(sample_decision_node)
+        storage.save_participant_stance(sample_participant_stance)
+        expected = storage.get_vote_aggregates()
+
+        storage.conn.execute("DROP TRIGGER trg_stance_daily_summary")
+        storage.conn.execute("DROP TRIGGER trg_decision_daily_summary")
+        storage.conn.execute("DELETE FROM stance_daily_summary")
+        storage.conn.execute("DELETE FROM decision_daily_summary")
+        storage.conn.commit()
+        assert storage.get_vote_aggregates()["total_decisions"] == 0
+
+        assert storage.pending_migrations() != []
+        storage.apply_migrations()
+
+        assert storage.pending_migrations() == []
+        assert storage.get_vote_aggregates() == expected
+        assert expected["participants"][0]["preferred_options"] == [
+            "Gradual Migration"
+        ]
+
+    def test_rollup_migration_counts_archived_decisions(
+        self, tmp_path, sample_decision_node, sample_participant_stance
+    ):
+        """Test that the rollup backfill includes decisions in the archive."""
+        db_path = str(tmp_path / "graph.db")
+        storage = DecisionGraphStorage(db_path)
+        storage.save_decision_node(sample_decision_node)
+        storage.save_participant_stance(sample_participant_stance)
+        expected = storage.get_vote_aggregates()
+        storage.archive_decisions([sample_decision_node.id])
+        storage.conn.execute("DROP TRIGGER trg_stance_daily_summary")
+        storage.conn.execute("DROP TRIGGER trg_decision_daily_summary")
+        storage.conn.commit()
+        storage.close()
+
+        reopened = DecisionGraphStorage(db_path)
+
+        assert reopened.pending_migrations() == []
+        assert reopened.count_decisions() == 0
+        assert reopened.get_vote_aggregates() == expected
+        reopened.close()
+
+    def test_stance_without_vote_counts_as_abstention(
+        self, storage, sample_decision_node
+    ):
+        """Test that stances with no vote option are not counted as votes."""
+        storage.save_decision_node(sample_decision_node)
+        storage.save_participant_stance(
+            ParticipantStance(
+                decision_id=sample_decision_node.id,
+                participant="opus@claude",
+                vote_option=None,
+                confidence=None,
+                rationale=None,
+                final_position="Undecided",
+            )
+        )
+
+        aggregates = storage.get_vote_aggregates()
+
+        assert aggregates["total_stances"] == 1
+        assert aggregates["votes_cast"] == 0
+        assert aggregates["participants"][0]["avg_confidence"] is None
+        assert aggregates["participants"][0]["preferred_options"] == []
+
+
+class TestStreamingReads:
+    """Tests for the cursor-backed iterators used by exports."""
+
+    def _save(self, storage, question):
+        node = DecisionNode(
+            question=question,
+            timestamp=datetime.now(),
+            consensus="Consensus",
+            convergence_status="converged",
+            participants=["opus@claude"],
+            transcript_path="transcripts/t.md",
+        )
+        storage.save_decision_node(node)
+        storage.save_participant_stance(
+            ParticipantStance(
+                decision_id=node.id,
+                participant="opus@claude",
+                vote_option="A",
+                confidence=0.5,
+                rationale="r",
+                final_position="p",
+            )
+        )
+        return node
+
+    def test_iter_decisions_streams_in_batches_and_versions(self, storage):
+        """Test iteration order, batching and graph-version bounds."""
+        nodes = [self._save(storage, f"Question {i}") for i in range(5)]
+
+        streamed = list(storage.iter_decisions(batch_size=2))
+        assert [d.id for d in streamed] == [n.id for n in nodes]
+
+        version = storage.get_graph_version()
+        newer = self._save(storage, "Question 5")
+        since = list(storage.iter_decisions(since_version=version))
+        assert [d.id for d in since] == [newer.id]
+        assert list(storage.iter_decisions(until_version=version - 4)) == [
+            streamed[0]
+        ]
+
+        stances = list(storage.iter_participant_stances(since_version=version))
+        assert [s.decision_id for s in stances] == [newer.id]
+
+    def test_iter_similarities_filters_by_computed_at(self, storage):
+        """Test that incremental edge reads only return recent edges."""
+        a = self._save(storage, "A")
+        b = self._save(storage, "B")
+        c = self._save(storage, "C")
+        storage.save_similarity(
+            DecisionSimilarity(
+                source_id=a.id,
+                target_id=b.id,
+                similarity_score=0.8,
+                computed_at=datetime(2025, 1, 1),
+            )
+        )
+        storage.save_similarity(
+            DecisionSimilarity(
+                source_id=a.id,
+                target_id=c.id,
+                similarity_score=0.7,
+                computed_at=datetime(2025, 6, 1),
+            )
+        )
+
+        assert len(list(storage.iter_similarities())) == 2
+        recent = list(storage.iter_similarities(computed_after=datetime(2025, 3, 1)))
+        assert [s.target_id for s in recent] == [c.id]
+
+    def test_iterators_include_archive_tier(self, tmp_path):
+        """Test that archived rows are streamed after hot rows on request."""
+        storage = DecisionGraphStorage(db_path=str(tmp_path / "graph.db"))
+        try:
+            old = self._save(storage, "Old")
+            hot = self._save(storage, "Hot")
+            storage.archive_decisions([old.id])
+
+            assert [d.id for d in storage.iter_decisions()] == [hot.id]
+            assert [
+                d.id for d in storage.iter_decisions(include_archived=True)
+            ] == [hot.id, old.id]
+            assert len(list(storage.iter_participant_stances(include_archived=True))) == 2
+        finally:
+            storage.close()
+
+    def test_export_checkpoint_round_trip(self, storage):
+        """Test saving and replacing a named export checkpoint."""
+        assert storage.get_export_checkpoint("default") is None
+
+        storage.save_export_checkpoint("default", 3, datetime(2025, 1, 1))
+        storage.save_export_checkpoint("default", 5, datetime(2025, 2, 1))
+
+        assert storage.get_export_checkpoint("default") == (5, datetime(2025, 2, 1))
+        assert storage.get_export_checkpoint("other") is None
@@ -0,0 +1,159 @@
+"""Unit tests for chunked transcript entry summaries."""
+import asyncio
+import json
+import re
+
+import pytest
+
+from deliberation.entry_summarizer import EntrySummarizer, parse_summary_rows
+
+
+class FakeAdapter:
+    """Summarizes each prompt entry as "summary of <participant> r<round>"."""
+
+    def __init__(self, fail_on=None, delay=0.0):
+        self.prompts = []
+        self.fail_on = fail_on
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def invoke(self, prompt, model, context=None):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on and self.fail_on in prompt:
+                return "not json at all"
+            rows = [
+                {
+                    "round": int(rnd),
+                    "participant": participant,
+                    "summary": f"summary of {participant} r{rnd}",
+                }
+                for rnd, participant in re.findall(
+                    r"^Round (\d+) - (.+):$", prompt, re.M
+                )
+            ]
+            return f"```json\n{json.dumps(rows)}\n```"
+        finally:
+            self.active -= 1
+
+
+def make_entries(count, rounds=1, text="Long analysis " * 40):
+    return [
+        {
+            "round": rnd,
+            "participant": f"analyst-{i}",
+            "response": f"{text} ({i}, {rnd})\nVOTE: {{}}",
+        }
+        for rnd in range(1, rounds + 1)
+        for i in range(count)
+    ]
+
+
+class TestParseSummaryRows:
+    """Tests for parsing the model's JSON-array reply."""
+
+    def test_parses_fenced_array(self):
+        rows = parse_summary_rows(
+            '```json\n[{"round": "2", "participant": "a", "summary": "s"}]\n```'
+        )
+        assert rows == [{"round": 2, "participant": "a", "summary": "s"}]
+
+    def test_skips_incomplete_rows(self):
+        rows = parse_summary_rows('Here: [{"round": 1, "participant": "a"}]')
+        assert rows == []
+
+    def test_raises_on_invalid_json(self):
+        with pytest.raises(ValueError):
+            parse_summary_rows("no array here")
+
+
+class TestEntrySummarizer:
+    """Tests for chunking, concurrency, merging and caching."""
+
+    async def test_summarizes_all_entries_in_order(self):
+        summarizer = EntrySummarizer(chunk_token_budget=300)
+        adapter = FakeAdapter()
+        entries = make_entries(3, rounds=2)
+
+        rows = await summarizer.summarize(entries, adapter, "model")
+
+        assert [(r["round"], r["participant"]) for r in rows] == [
+            (e["round"], e["participant"]) for e in entries
+        ]
+        assert rows[0]["summary"] == "summary of analyst-0 r1"
+        assert len(adapter.prompts) > 1
+
+    def test_chunks_respect_token_budget(self):
+        summarizer = EntrySummarizer(chunk_token_budget=300)
+        entries = make_entries(6)
+
+        items = [
+            {"round": e["round"], "participant": e["participant"], "body": "x" * 500}
+            for e in entries
+        ]
+        chunks = summarizer._chunk(items)
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 2]
+
+    def test_oversized_entry_gets_own_chunk(self):
+        summarizer = EntrySummarizer(chunk_token_budget=10)
+        items = [{"round": 1, "participant": "a", "body": "x" * 500}] * 2
+
+        assert [len(chunk) for chunk in summarizer._chunk(items)] == [1, 1]
+
+    async def test_concurrency_is_bounded(self):
+        summarizer = EntrySummarizer(chunk_token_budget=1, max_concurrency=2)
+        adapter = FakeAdapter(delay=0.01)
+
+        await summarizer.summarize(make_entries(6), adapter, "model")
+
+        assert len(adapter.prompts) == 6
+        assert adapter.max_active == 2
+
+    async def test_failed_chunk_only_drops_its_entries(self):
+        summarizer = EntrySummarizer(chunk_token_budget=1)
+        adapter = FakeAdapter(fail_on="analyst-1:")
+
+        rows = await summarizer.summarize(make_entries(3), adapter, "model")
+
+        assert [r["participant"] for r in rows] == ["analyst-0", "analyst-2"]
+
+    async def test_unchanged_entries_are_served_from_cache(self):
+        summarizer = EntrySummarizer(chunk_token_budget=1)
+        adapter = FakeAdapter()
+        entries = make_entries(3)
+        await summarizer.summarize(entries, adapter, "model")
+        adapter.prompts.clear()
+
+        entries[1]["response"] = "Revised analysis"
+        rows = await summarizer.summarize(entries, adapter, "model")
+
+        assert len(rows) == 3
+        assert len(adapter.prompts) == 1
+        assert "Revised analysis" in adapter.prompts[0]
+
+    async def test_cache_is_scoped_by_model_and_language(self):
+        summarizer = EntrySummarizer()
+        adapter = FakeAdapter()
+        entries = make_entries(1)
+
+        await summarizer.summarize(entries, adapter, "model", language="en")
+        await summarizer.summarize(entries, adapter, "model", language="no")
+        await summarizer.summarize(entries, adapter, "other", language="en")
+
+        assert len(adapter.prompts) == 3
+
+    async def test_prompt_strips_vote_and_includes_language_note(self):
+        summarizer = EntrySummarizer()
+        adapter = FakeAdapter()
+
+        await summarizer.summarize(
+            make_entries(1), adapter, "model", lang_note="LANGUAGE: Norwegian\n\n"
+        )
+
+        assert adapter.prompts[0].startswith("LANGUAGE: Norwegian")
+        assert "VOTE:" not in adapter.prompts[0]
@@ -6,13 +6,15 @@ and utility functions (_escape_xml, _escape_markdown, _truncate_text).
 Following TDD approach: tests written before implementation changes.
 """
 
+import gzip
 import json
 from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
-from decision_graph.schema import DecisionNode, DecisionSimilarity
+from decision_graph.schema import (DecisionNode, DecisionSimilarity,
+                                   ParticipantStance)
 from deliberation.exporters import (DecisionGraphExporter, _escape_markdown,
                                     _escape_xml, _truncate_text)
 from deliberation.query_engine import SimilarResult
@@ -561,6 +563,133 @@ class TestToMarkdown:
         assert "- Total Relationships:" not in result
 
 
+# ============================================================================
+# TEST: iter_*() / write() - Streaming Export
+# ============================================================================
+
+
+class TestStreamingExport:
+    """Tests for the generator-based exporters and write()."""
+
+    def test_iter_json_matches_to_json_schema(
+        self, sample_decision_nodes, sample_similarities
+    ):
+        """Test streamed JSON parses to the same records as to_json."""
+        streamed = json.loads(
+            "\n".join(
+                DecisionGraphExporter.iter_json(
+                    iter(sample_decision_nodes), iter(sample_similarities)
+                )
+            )
+        )
+        built = json.loads(
+            DecisionGraphExporter.to_json(sample_decision_nodes, sample_similarities)
+        )
+
+        assert streamed["format"] == "decision_graph_json"
+        assert streamed["decisions"] == built["decisions"]
+        assert streamed["similarities"] == built["similarities"]
+        assert "stances" not in streamed
+
+    def test_iter_json_includes_stances_and_metadata(self, sample_decision_nodes):
+        """Test stances array and metadata fields in streamed JSON."""
+        stance = ParticipantStance(
+            decision_id="dec-001",
+            participant="opus@claude",
+            vote_option="Option A",
+            confidence=0.9,
+            rationale="Because",
+            final_position="Yes",
+        )
+        data = json.loads(
+            "\n".join(
+                DecisionGraphExporter.iter_json(
+                    [],
+                    stances=[stance],
+                    metadata={"since_version": 3, "graph_version": 7},
+                )
+            )
+        )
+
+        assert data["decisions"] == []
+        assert data["stances"][0]["vote_option"] == "Option A"
+        assert data["since_version"] == 3
+        assert data["graph_version"] == 7
+
+    def test_iter_jsonl_emits_typed_records(
+        self, sample_decision_nodes, sample_similarities
+    ):
+        """Test JSON Lines output has a header and one record per line."""
+        lines = list(
+            DecisionGraphExporter.iter_jsonl(
+                sample_decision_nodes, sample_similarities, metadata={"full": True}
+            )
+        )
+        records = [json.loads(line) for line in lines]
+
+        assert records[0]["type"] == "header"
+        assert records[0]["format"] == "decision_graph_jsonl"
+        assert records[0]["full"] is True
+        assert [r["type"] for r in records[1:]] == ["decision"] * 3 + [
+            "similarity"
+        ] * 3
+        assert records[1]["id"] == "dec-001"
+        assert records[-1]["similarity_score"] == 0.55
+
+    def test_iter_markdown_streams_with_known_totals(
+        self, sample_decision_nodes, sample_similarities, fixed_datetime
+    ):
+        """Test streamed Markdown from generators matches to_markdown."""
+        with patch("deliberation.exporters.datetime") as mock_dt:
+            mock_dt.now.return_value = fixed_datetime
+            built = DecisionGraphExporter.to_markdown(
+                sample_decision_nodes, sample_similarities
+            )
+            streamed = "\n".join(
+                DecisionGraphExporter.iter_markdown(
+                    iter(sample_decision_nodes),
+                    iter(sample_similarities),
+                    total_decisions=3,
+                    total_similarities=3,
+                )
+            )
+
+        assert streamed == built
+
+    def test_write_plain_file(self, tmp_path, sample_decision_nodes):
+        """Test write() streams lines to a file."""
+        output = tmp_path / "graph.dot"
+        DecisionGraphExporter.write(
+            DecisionGraphExporter.iter_dot(sample_decision_nodes), str(output)
+        )
+
+        assert output.read_text() == (
+            DecisionGraphExporter.to_dot(sample_decision_nodes) + "\n"
+        )
+
+    def test_write_gzip_file(self, tmp_path, sample_decision_nodes):
+        """Test write() gzips output when asked."""
+        output = tmp_path / "graph.jsonl.gz"
+        DecisionGraphExporter.write(
+            DecisionGraphExporter.iter_jsonl(sample_decision_nodes),
+            str(output),
+            compress=True,
+        )
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert len(records) == 4
+
+    def test_write_gzip_stdout(self, capsysbinary, sample_decision_nodes):
+        """Test write() gzips to the binary stdout stream."""
+        DecisionGraphExporter.write(
+            DecisionGraphExporter.iter_jsonl(sample_decision_nodes), compress=True
+        )
+
+        text = gzip.decompress(capsysbinary.readouterr().out).decode("utf-8")
+        assert len(text.splitlines()) == 4
+
+
 # ============================================================================
 # TEST: to_summary_table() - ASCII Table Export
 # ============================================================================
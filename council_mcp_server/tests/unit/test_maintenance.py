@@ -5,10 +5,12 @@ Tests verify:
 - Growth rate analysis
 - Archival benefit estimation
 - Health check validation
-- Migration SQL generation
+- Archival to the archive tier
+- Schema migration status
 - Performance requirements (<100ms stats, <200ms growth, <1s health)
 """
 
+import sqlite3
 import time
 from datetime import datetime, timedelta
 from typing import Generator
@@ -591,92 +593,218 @@ class TestHealthCheck:
         assert health["healthy"] is True
 
 
-class TestArchivalMethods:
-    """Tests for Phase 2 archival methods (skeleton only)."""
+class TestNeighborBackfill:
+    """Tests for the neighbour list backfill."""
 
-    def test_identify_archive_candidates_not_implemented(
-        self, maintenance: DecisionGraphMaintenance
+    def test_backfill_builds_missing_lists(
+        self, maintenance: DecisionGraphMaintenance, temp_storage
     ):
-        """Archive candidate identification should return empty list in Phase 1."""
-        candidates = maintenance.identify_archive_candidates()
+        """Backfill should scan unscanned decisions against all others."""
+        questions = [
+            "Should we adopt TypeScript for the frontend?",
+            "Should we adopt TypeScript for the backend?",
+            "What database should we use?",
+        ]
+        nodes = []
+        for question in questions:
+            node = DecisionNode(
+                question=question,
+                timestamp=datetime.now(),
+                consensus="C",
+                convergence_status="converged",
+                participants=["claude"],
+                transcript_path="/tmp/t.md",
+            )
+            temp_storage.save_decision_node(node)
+            nodes.append(node)
 
-        assert candidates == []
-        assert isinstance(candidates, list)
+        result = maintenance.backfill_neighbor_lists(threshold=0.3, chunk_size=2)
 
-    def test_archive_old_decisions_not_implemented(
-        self, maintenance: DecisionGraphMaintenance
-    ):
-        """Archive operation should return not_implemented status in Phase 1."""
-        result = maintenance.archive_old_decisions(dry_run=True)
+        assert result["decisions_scanned"] == 3
+        assert result["total_decisions"] == 3
+        neighbors = temp_storage.get_neighbors(nodes[0].id)
+        assert neighbors is not None
+        assert neighbors[0][0].id == nodes[1].id
 
-        assert result["status"] == "not_implemented"
-        assert result["phase"] == "Phase 1"
-        assert result["archived_count"] == 0
-        assert "Phase 2" in result["message"]
+        # Second run has nothing left to do unless rebuilding
+        assert maintenance.backfill_neighbor_lists()["decisions_scanned"] == 0
+        assert (
+            maintenance.backfill_neighbor_lists(rebuild=True)["decisions_scanned"] == 3
+        )
 
-    def test_archive_old_decisions_respects_dry_run(
-        self, maintenance: DecisionGraphMaintenance
-    ):
-        """Archive dry_run parameter should be passed through."""
-        result = maintenance.archive_old_decisions(dry_run=False)
 
-        assert result["dry_run"] is False
+class TestArchivalMethods:
+    """Tests for moving cold decisions to the archive tier."""
 
+    @staticmethod
+    def _save(storage: DecisionGraphStorage, question: str, age_days: int) -> str:
+        decision = DecisionNode(
+            question=question,
+            timestamp=datetime.now() - timedelta(days=age_days),
+            consensus=f"Consensus for {question}",
+            convergence_status="converged",
+            participants=["claude-sonnet-4-5"],
+            transcript_path="/tmp/transcript.md",
+        )
+        storage.save_decision_node(decision)
+        storage.save_participant_stance(
+            ParticipantStance(
+                decision_id=decision.id,
+                participant="claude-sonnet-4-5",
+                vote_option="Yes",
+                confidence=0.9,
+                rationale="Because",
+                final_position="Yes",
+            )
+        )
+        return decision.id
 
-class TestMigrationGeneration:
-    """Tests for migration SQL generation."""
+    def test_identify_archive_candidates_uses_age_and_last_access(
+        self, maintenance: DecisionGraphMaintenance, temp_storage: DecisionGraphStorage
+    ):
+        """Old decisions are candidates unless they were retrieved recently."""
+        old_unused = self._save(temp_storage, "Old unused?", age_days=200)
+        old_used = self._save(temp_storage, "Old but used?", age_days=300)
+        recent = self._save(temp_storage, "Recent?", age_days=10)
+        temp_storage.touch_decisions([old_used])
+
+        assert maintenance.identify_archive_candidates() == [old_unused]
+        assert maintenance.identify_archive_candidates(age_days=5, unused_days=5) == [
+            old_unused,
+            recent,
+        ]
+
+    def test_archive_old_decisions_below_threshold(
+        self, maintenance: DecisionGraphMaintenance, temp_storage: DecisionGraphStorage
+    ):
+        """Archival does nothing until the hot set reaches the size trigger."""
+        self._save(temp_storage, "Old?", age_days=200)
 
-    def test_get_pending_migrations_returns_list(
-        self, maintenance: DecisionGraphMaintenance
+        result = maintenance.archive_old_decisions(dry_run=False)
+
+        assert result["status"] == "below_threshold"
+        assert result["candidate_count"] == 1
+        assert result["archived_count"] == 0
+        assert temp_storage.count_decisions() == 1
+
+    def test_archive_old_decisions_dry_run(
+        self, maintenance: DecisionGraphMaintenance, temp_storage: DecisionGraphStorage
     ):
-        """Pending migrations should return list of SQL statements."""
-        migrations = maintenance.get_pending_migrations()
+        """Dry run reports candidates without moving them."""
+        self._save(temp_storage, "Old?", age_days=200)
 
-        assert isinstance(migrations, list)
-        assert len(migrations) > 0
+        result = maintenance.archive_old_decisions(dry_run=True, force=True)
 
-    def test_get_pending_migrations_includes_archived_column(
-        self, maintenance: DecisionGraphMaintenance
+        assert result["status"] == "dry_run"
+        assert result["dry_run"] is True
+        assert result["candidate_count"] == 1
+        assert result["archived_count"] == 0
+        assert temp_storage.count_decisions() == 1
+
+    def test_archive_old_decisions_moves_cold_decisions(
+        self, maintenance: DecisionGraphMaintenance, temp_storage: DecisionGraphStorage
     ):
-        """Migrations should include archived column addition."""
-        migrations = maintenance.get_pending_migrations()
+        """Archived decisions leave the hot tier but stay reachable by ID."""
+        old_id = self._save(temp_storage, "Old?", age_days=200)
+        recent_id = self._save(temp_storage, "Recent?", age_days=1)
+        temp_storage.save_similarities(
+            [
+                DecisionSimilarity(
+                    source_id=recent_id, target_id=old_id, similarity_score=0.8
+                )
+            ],
+            scanned_ids=[recent_id],
+        )
 
-        # Join all migrations to search
-        migrations_text = " ".join(migrations)
+        result = maintenance.archive_old_decisions(dry_run=False, force=True)
 
-        assert "archived" in migrations_text.lower()
-        assert "ALTER TABLE decision_nodes" in migrations_text
+        assert result["status"] == "archived"
+        assert result["archived_count"] == 1
+        assert result["archived_stances"] == 1
+        assert result["archived_similarities"] == 1
+        assert temp_storage.get_decision_node(old_id) is None
+        assert temp_storage.get_decision_node(old_id, include_archived=True).id == (
+            old_id
+        )
+        assert temp_storage.get_neighbors(recent_id) == []
 
-    def test_get_pending_migrations_includes_last_accessed_column(
-        self, maintenance: DecisionGraphMaintenance
+        stats = maintenance.get_database_stats()
+        assert stats["total_decisions"] == 1
+        assert stats["archived_decisions"] == 1
+        assert stats["total_stances"] == 1
+        assert stats["total_similarities"] == 0
+        assert maintenance.health_check()["healthy"] is True
+
+    def test_archive_old_decisions_no_candidates(
+        self, maintenance: DecisionGraphMaintenance, temp_storage: DecisionGraphStorage
     ):
-        """Migrations should include last_accessed column addition."""
-        migrations = maintenance.get_pending_migrations()
+        """Nothing is archived when every decision is recent."""
+        self._save(temp_storage, "Recent?", age_days=1)
+
+        result = maintenance.archive_old_decisions(dry_run=False, force=True)
+
+        assert result["status"] == "no_candidates"
+        assert result["archived_count"] == 0
 
-        migrations_text = " ".join(migrations)
 
-        assert "last_accessed" in migrations_text.lower()
+class TestMigrationGeneration:
+    """Tests for schema migration status."""
 
-    def test_get_pending_migrations_includes_indexes(
+    def test_get_pending_migrations_empty_for_current_schema(
         self, maintenance: DecisionGraphMaintenance
     ):
-        """Migrations should include indexes for archival queries."""
+        """Storage applies migrations on open, so none are pending."""
         migrations = maintenance.get_pending_migrations()
 
-        migrations_text = " ".join(migrations)
+        assert isinstance(migrations, list)
+        assert migrations == []
 
-        assert "CREATE INDEX" in migrations_text
-        assert (
-            "idx_decision_archived" in migrations_text
-            or "archived" in migrations_text.lower()
-        )
+    def test_get_pending_migrations_reports_missing_index(
+        self, maintenance: DecisionGraphMaintenance, temp_storage: DecisionGraphStorage
+    ):
+        """A dropped migration index is reported and can be re-applied."""
+        temp_storage.conn.execute("DROP INDEX idx_decision_last_accessed")
 
-    def test_get_pending_migrations_count(self, maintenance: DecisionGraphMaintenance):
-        """Should have expected number of migrations."""
         migrations = maintenance.get_pending_migrations()
+        assert len(migrations) == 1
+        assert "CREATE INDEX" in migrations[0]
+        assert "last_accessed" in migrations[0]
+
+        assert maintenance.apply_pending_migrations() == migrations
+        assert maintenance.get_pending_migrations() == []
+
+    def test_legacy_database_is_migrated_on_open(self, tmp_path):
+        """Databases created before archival gain the last_accessed column."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE decision_nodes (
+                id TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                consensus TEXT NOT NULL,
+                winning_option TEXT,
+                convergence_status TEXT NOT NULL,
+                participants TEXT NOT NULL,
+                transcript_path TEXT NOT NULL,
+                metadata TEXT
+            )
+            """
+        )
+        conn.commit()
+        conn.close()
 
-        # Should have at least: archived column, last_accessed column, indexes
-        assert len(migrations) >= 3
+        storage = DecisionGraphStorage(str(db_path))
+        try:
+            columns = {
+                row["name"]
+                for row in storage.conn.execute("PRAGMA table_info(decision_nodes)")
+            }
+            assert "last_accessed" in columns
+            assert DecisionGraphMaintenance(storage).get_pending_migrations() == []
+        finally:
+            storage.close()
 
 
 class TestErrorHandling:
@@ -730,16 +858,16 @@ class TestMaintenanceInitialization:
         assert maintenance.ARCHIVE_TRIGGER_AGE_DAYS == 180
         assert maintenance.ARCHIVE_TRIGGER_UNUSED_DAYS == 90
 
-    def test_initialization_logs_phase(
+    def test_initialization_logs_archive_trigger(
         self, temp_storage: DecisionGraphStorage, caplog
     ):
-        """Initialization should log Phase 1 status."""
+        """Initialization should log the archival trigger."""
         import logging
 
         caplog.set_level(logging.INFO)
         DecisionGraphMaintenance(temp_storage)
 
-        assert "Phase 1" in caplog.text or "monitoring only" in caplog.text
+        assert "archive trigger: 5000 decisions" in caplog.text
 
 
 if __name__ == "__main__":
@@ -5,10 +5,13 @@ for querying and analyzing the decision graph, used by both MCP tools and CLI.
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
-from decision_graph.schema import DecisionNode, ParticipantStance
+from decision_graph.maintenance import DecisionGraphMaintenance
+from decision_graph.schema import (DecisionNode, DecisionSimilarity,
+                                   ParticipantStance)
 from decision_graph.storage import DecisionGraphStorage
 from deliberation.query_engine import QueryEngine, Timeline
 
@@ -241,6 +244,243 @@ class TestQueryEngineEvolution:
         with pytest.raises(ValueError):
             await engine.trace_evolution("nonexistent-id")
 
+    async def test_trace_evolution_uses_transcript_index_rounds(
+        self, storage, tmp_path
+    ):
+        """Indexed transcripts give one timeline entry per debate round."""
+        from deliberation.transcript import TranscriptManager
+        from models.schema import DeliberationResult, RoundResponse, Summary
+
+        result = DeliberationResult(
+            status="complete",
+            mode="conference",
+            rounds_completed=2,
+            participants=["opus@claude", "gpt4@codex"],
+            summary=Summary(
+                consensus="Adopt",
+                key_agreements=[],
+                key_disagreements=[],
+                final_recommendation="Adopt",
+            ),
+            transcript_path="",
+            full_debate=[
+                RoundResponse(
+                    round=r,
+                    participant=p,
+                    response=f"{p} round {r}",
+                    timestamp=f"2025-10-01T10:0{r}:00",
+                )
+                for r in (1, 2)
+                for p in ("opus@claude", "gpt4@codex")
+            ],
+        )
+        path = TranscriptManager(output_dir=str(tmp_path)).save(result, "Adopt?")
+        storage.save_decision_node(
+            DecisionNode(
+                id="dec-indexed",
+                question="Adopt?",
+                timestamp=datetime(2025, 10, 1, 10, 0, 0),
+                consensus="Adopt",
+                convergence_status="converged",
+                participants=["opus@claude", "gpt4@codex"],
+                transcript_path=path,
+            )
+        )
+        storage.save_participant_stance(
+            ParticipantStance(
+                decision_id="dec-indexed",
+                participant="opus@claude",
+                vote_option="Adopt",
+                confidence=0.9,
+                rationale="Types",
+                final_position="Adopt",
+            )
+        )
+
+        timeline = await QueryEngine(storage).trace_evolution("dec-indexed")
+
+        assert [entry.round_num for entry in timeline.rounds] == [1, 2]
+        assert timeline.rounds[0].timestamp == "2025-10-01T10:01:00"
+        assert [p["participant"] for p in timeline.rounds[0].participant_positions] == [
+            "opus@claude",
+            "gpt4@codex",
+        ]
+        assert timeline.rounds[1].participant_positions == [
+            {"participant": "opus@claude", "option": "Adopt", "confidence": 0.9}
+        ]
+
+
+class TestQueryEngineNeighborLists:
+    """Test related-decision lookups served from maintained neighbour lists."""
+
+    def test_related_decisions_read_from_neighbor_list(
+        self, storage, sample_decisions
+    ):
+        """A scanned decision's related list comes from decision_neighbors."""
+        storage.save_similarities(
+            [
+                DecisionSimilarity(
+                    source_id="dec-2", target_id="dec-1", similarity_score=0.9
+                ),
+                DecisionSimilarity(
+                    source_id="dec-3", target_id="dec-1", similarity_score=0.6
+                ),
+            ],
+            scanned_ids=["dec-1"],
+        )
+        engine = QueryEngine(storage)
+
+        with patch.object(
+            engine.similarity_detector, "compute_similarity"
+        ) as compute_similarity:
+            related = engine._find_related_decisions(storage.get_decision_node("dec-1"))
+
+        compute_similarity.assert_not_called()
+        assert [r["id"] for r in related] == ["dec-2", "dec-3"]
+        assert related[0]["similarity"] == 0.9
+
+    def test_related_decisions_fall_back_to_scan_when_not_scanned(
+        self, storage, sample_decisions
+    ):
+        """Decisions without a neighbour list are still answered by a scan."""
+        engine = QueryEngine(storage)
+
+        related = engine._find_related_decisions(storage.get_decision_node("dec-1"))
+
+        assert "dec-2" in [r["id"] for r in related]
+
+    def test_backfill_makes_lookup_indexed(self, storage, sample_decisions):
+        """After a backfill the lookup matches the scan without scoring."""
+        engine = QueryEngine(storage)
+        decision = storage.get_decision_node("dec-1")
+        scanned = engine._find_related_decisions(decision)
+
+        DecisionGraphMaintenance(storage).backfill_neighbor_lists()
+
+        with patch.object(
+            engine.similarity_detector, "compute_similarity"
+        ) as compute_similarity:
+            indexed = engine._find_related_decisions(decision)
+        compute_similarity.assert_not_called()
+        assert [r["id"] for r in indexed] == [r["id"] for r in scanned]
+
+    def test_diagnostics_scan_reused_until_graph_changes(
+        self, storage, sample_decisions
+    ):
+        """Repeated diagnostics for a query reuse the scan until a write."""
+        engine = QueryEngine(storage)
+
+        with patch.object(
+            engine.similarity_detector,
+            "compute_similarity_matrix",
+            wraps=engine.similarity_detector.compute_similarity_matrix,
+        ) as matrix:
+            engine.get_search_diagnostics("TypeScript", threshold=0.9)
+            engine.get_search_diagnostics("TypeScript", threshold=0.5)
+            assert matrix.call_count == 1
+
+            storage.save_decision_node(
+                DecisionNode(
+                    question="Should we keep TypeScript?",
+                    timestamp=datetime(2025, 10, 4, 10, 0, 0),
+                    consensus="Yes",
+                    convergence_status="converged",
+                    participants=["opus@claude"],
+                    transcript_path="/transcripts/dec4.md",
+                )
+            )
+            diagnostics = engine.get_search_diagnostics("TypeScript", threshold=0.5)
+            assert matrix.call_count == 2
+            assert diagnostics["total_decisions"] == 4
+
+
+class TestQueryEngineArchive:
+    """Test deep search and lookups across the archive tier."""
+
+    async def test_deep_search_includes_archived_decisions(
+        self, storage, sample_decisions
+    ):
+        """Archived decisions are only returned by a deep search."""
+        storage.archive_decisions(["dec-1"])
+        engine = QueryEngine(storage)
+
+        hot = await engine.search_similar(
+            "Should we use TypeScript?", limit=5, threshold=0.9
+        )
+        deep = await engine.search_similar(
+            "Should we use TypeScript?", limit=5, threshold=0.9, deep=True
+        )
+
+        assert "dec-1" not in [r.decision.id for r in hot]
+        assert deep[0].decision.id == "dec-1"
+        assert deep[0].score > 0.9
+
+    async def test_trace_evolution_finds_archived_decision(
+        self, storage, sample_decisions, sample_stances
+    ):
+        """An explicit ID is resolved in the archive when it is cold."""
+        storage.archive_decisions(["dec-1"])
+        engine = QueryEngine(storage)
+
+        timeline = await engine.trace_evolution("dec-1")
+
+        assert timeline.question == "Should we use TypeScript?"
+        assert timeline.rounds[0].participant_positions
+
+
+class TestQueryEnginePatternAnalysis:
+    """Test voting pattern analysis over the daily rollups."""
+
+    async def test_analyze_patterns_all_participants(
+        self, storage, sample_decisions, sample_stances
+    ):
+        """Votes, confidence and preferred options are aggregated per participant."""
+        engine = QueryEngine(storage)
+        analysis = await engine.analyze_patterns()
+
+        assert analysis.total_decisions == 3
+        assert analysis.total_participants == 2
+        opus, gpt4 = analysis.voting_patterns
+        assert opus.participant == "opus@claude"
+        assert opus.total_votes == 3
+        assert opus.avg_confidence == pytest.approx((0.95 + 0.9 + 0.88) / 3)
+        assert opus.preferred_options == ["Yes", "Gradual"]
+        assert gpt4.preferred_options == ["Yes"]
+        assert analysis.convergence_stats == {
+            "unanimous_consensus": 1,
+            "majority_decision": 1,
+            "converged": 1,
+        }
+        assert analysis.participation_metrics["total_stances"] == 4
+        assert analysis.participation_metrics["avg_participants_per_decision"] == 1.33
+
+    def test_analyze_patterns_since_and_participant(
+        self, storage, sample_decisions, sample_stances
+    ):
+        """The window and participant filters narrow every aggregate."""
+        engine = QueryEngine(storage)
+
+        recent = engine._analyze_patterns_sync(since=datetime(2025, 10, 2))
+        assert recent.total_decisions == 2
+        assert [p.participant for p in recent.voting_patterns] == ["opus@claude"]
+        assert recent.voting_patterns[0].total_votes == 2
+
+        gpt4 = engine._analyze_patterns_sync("gpt4@codex")
+        assert gpt4.total_decisions == 1
+        assert gpt4.total_participants == 1
+        assert gpt4.convergence_stats == {"unanimous_consensus": 1}
+
+    def test_analyze_patterns_counts_archived_decisions(
+        self, storage, sample_decisions, sample_stances
+    ):
+        """Archiving moves decisions out of the hot tier but not out of history."""
+        engine = QueryEngine(storage)
+        before = engine._analyze_patterns_sync()
+
+        storage.archive_decisions(["dec-1"])
+
+        assert engine._analyze_patterns_sync() == before
+
 
 class TestQueryEngineDiagnostics:
     """Test search diagnostics for empty/poor results."""
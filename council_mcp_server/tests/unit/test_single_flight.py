@@ -0,0 +1,165 @@
+"""Unit tests for deliberation single-flight de-duplication and caching."""
+import asyncio
+
+import pytest
+
+from deliberation.single_flight import DeliberationDeduplicator, request_key
+from models.schema import DeliberateRequest, Participant
+
+
+def make_request(**overrides) -> DeliberateRequest:
+    fields = {
+        "question": "Should we adopt TypeScript?",
+        "participants": [
+            Participant(cli="claude", model="sonnet"),
+            Participant(cli="codex", model="gpt-4"),
+        ],
+        "rounds": 2,
+        "mode": "quick",
+        "context": "Existing JS codebase",
+        "working_directory": "/tmp",
+        "language": "en",
+    }
+    fields.update(overrides)
+    return DeliberateRequest(**fields)
+
+
+class CountingExecutor:
+    """Fake engine.execute that counts runs and can be held open."""
+
+    def __init__(self, result="result", error=None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return f"{self.result}-{self.calls}"
+
+
+class TestRequestKey:
+    """Tests for the canonical request hash."""
+
+    def test_identical_requests_share_key(self):
+        assert request_key(make_request()) == request_key(make_request())
+
+    def test_working_directory_is_ignored(self):
+        assert request_key(make_request(working_directory="/a")) == request_key(
+            make_request(working_directory="/b")
+        )
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"question": "Should we adopt Rust?"},
+            {"rounds": 3},
+            {"mode": "conference"},
+            {"context": None},
+            {"language": "no"},
+            {
+                "participants": [
+                    Participant(cli="codex", model="gpt-4"),
+                    Participant(cli="claude", model="sonnet"),
+                ]
+            },
+        ],
+    )
+    def test_outcome_fields_change_key(self, overrides):
+        assert request_key(make_request(**overrides)) != request_key(make_request())
+
+
+class TestDeliberationDeduplicator:
+    """Tests for in-flight sharing and the TTL result cache."""
+
+    async def test_concurrent_identical_requests_share_one_run(self):
+        dedup = DeliberationDeduplicator()
+        execute = CountingExecutor()
+
+        first = asyncio.create_task(dedup.run(make_request(), execute))
+        second = asyncio.create_task(dedup.run(make_request(), execute))
+        await asyncio.sleep(0)
+        assert dedup.in_flight == 1
+        execute.release.set()
+
+        assert await first == await second == "result-1"
+        assert execute.calls == 1
+        assert dedup.shared == 1
+        assert dedup.in_flight == 0
+
+    async def test_different_requests_run_separately(self):
+        dedup = DeliberationDeduplicator()
+        execute = CountingExecutor()
+        execute.release.set()
+
+        await asyncio.gather(
+            dedup.run(make_request(), execute),
+            dedup.run(make_request(rounds=3), execute),
+        )
+
+        assert execute.calls == 2
+
+    async def test_reruns_without_cache_execute_again(self):
+        dedup = DeliberationDeduplicator()
+        execute = CountingExecutor()
+        execute.release.set()
+
+        await dedup.run(make_request(), execute)
+        assert await dedup.run(make_request(), execute) == "result-2"
+
+    async def test_cache_returns_recent_result(self):
+        dedup = DeliberationDeduplicator(cache_ttl_seconds=60)
+        execute = CountingExecutor()
+        execute.release.set()
+
+        await dedup.run(make_request(), execute)
+        assert await dedup.run(make_request(), execute) == "result-1"
+        assert execute.calls == 1
+
+    async def test_failures_are_shared_but_not_cached(self):
+        dedup = DeliberationDeduplicator(cache_ttl_seconds=60)
+        execute = CountingExecutor(error=RuntimeError("adapter down"))
+
+        first = asyncio.create_task(dedup.run(make_request(), execute))
+        second = asyncio.create_task(dedup.run(make_request(), execute))
+        await asyncio.sleep(0)
+        execute.release.set()
+
+        for task in (first, second):
+            with pytest.raises(RuntimeError):
+                await task
+        assert execute.calls == 1
+
+        execute.error = None
+        assert await dedup.run(make_request(), execute) == "result-2"
+
+    async def test_cancelled_caller_does_not_cancel_shared_run(self):
+        dedup = DeliberationDeduplicator()
+        execute = CountingExecutor()
+
+        first = asyncio.create_task(dedup.run(make_request(), execute))
+        await asyncio.sleep(0)
+        retry = asyncio.create_task(dedup.run(make_request(), execute))
+        await asyncio.sleep(0)
+        first.cancel()
+        execute.release.set()
+
+        assert await retry == "result-1"
+        assert execute.calls == 1
+
+    async def test_failure_after_caller_cancelled_is_logged(self, caplog):
+        dedup = DeliberationDeduplicator()
+        execute = CountingExecutor(error=RuntimeError("adapter down"))
+
+        caller = asyncio.create_task(dedup.run(make_request(), execute))
+        await asyncio.sleep(0)
+        caller.cancel()
+        execute.release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert dedup.in_flight == 0
+        assert "adapter down" in caplog.text
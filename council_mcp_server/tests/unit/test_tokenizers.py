@@ -0,0 +1,46 @@
+"""Unit tests for decision graph token counting."""
+import builtins
+
+import pytest
+
+from decision_graph.tokenizers import (
+    HeuristicTokenizer,
+    TiktokenTokenizer,
+    get_tokenizer,
+)
+
+
+class TestGetTokenizer:
+    """Tests for building tokenizers from config strings."""
+
+    def test_heuristic_counts_four_chars_per_token(self):
+        tokenizer = get_tokenizer("heuristic")
+
+        assert isinstance(tokenizer, HeuristicTokenizer)
+        assert tokenizer.name == "heuristic"
+        assert tokenizer.count("x" * 41) == 10
+
+    def test_tiktoken_falls_back_when_not_installed(self, monkeypatch):
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "tiktoken":
+                raise ImportError("No module named 'tiktoken'")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+
+        assert isinstance(get_tokenizer("tiktoken:o200k_base"), HeuristicTokenizer)
+
+    def test_tiktoken_counts_real_tokens(self):
+        pytest.importorskip("tiktoken")
+
+        tokenizer = get_tokenizer("tiktoken")
+
+        assert isinstance(tokenizer, TiktokenTokenizer)
+        assert tokenizer.name == "tiktoken:cl100k_base"
+        assert 0 < tokenizer.count("Should we adopt TypeScript?") < 10
+
+    def test_unknown_tokenizer_rejected(self):
+        with pytest.raises(ValueError, match="Unknown tokenizer"):
+            get_tokenizer("sentencepiece")
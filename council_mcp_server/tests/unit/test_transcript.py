@@ -1,10 +1,16 @@
 """Unit tests for transcript management."""
 from pathlib import Path
 import shutil
+import sqlite3
 
 import pytest
 
 from deliberation.transcript import TranscriptManager
+from deliberation.transcript_index import (
+    INDEX_FILENAME,
+    TranscriptIndex,
+    read_transcript,
+)
 from models.schema import DeliberationResult, RoundResponse, Summary
 
 
@@ -93,3 +99,156 @@ class TestTranscriptManager:
 
         assert Path(filepath).exists()
         assert output_dir.exists()
+
+
+@pytest.fixture
+def multi_round_result(sample_result):
+    """Fixture extending the sample result with a second debate round."""
+    return sample_result.model_copy(
+        update={
+            "full_debate": sample_result.full_debate
+            + [
+                RoundResponse(
+                    round=2,
+                    participant="gpt-4@codex",
+                    response="Round two rebuttal",
+                    timestamp="2025-10-12T15:31:00Z",
+                ),
+            ]
+        }
+    )
+
+
+class TestTranscriptSections:
+    """Tests for section-indexed and compressed transcript storage."""
+
+    def test_plain_file_matches_rendered_markdown(self, multi_round_result, tmp_path):
+        """Section-wise writing produces the same bytes as a single render."""
+        manager = TranscriptManager(output_dir=str(tmp_path))
+
+        filepath = manager.save(multi_round_result, "Should we use TypeScript?")
+
+        expected = "# Should we use TypeScript?\n\n" + manager.generate_markdown(
+            multi_round_result
+        )
+        assert Path(filepath).read_text(encoding="utf-8") == expected
+
+    def test_index_records_metadata_and_rounds(self, multi_round_result, tmp_path):
+        """Transcript metadata and per-round participants are indexed."""
+        manager = TranscriptManager(output_dir=str(tmp_path))
+
+        filepath = manager.save(multi_round_result, "Should we use TypeScript?")
+
+        record = manager.index.get(filepath)
+        assert record.question == "Should we use TypeScript?"
+        assert record.rounds_completed == 2
+        assert record.size_bytes == Path(filepath).stat().st_size
+
+        sections = manager.index.sections(filepath)
+        assert [s.section for s in sections] == [0, 1, 2]
+        assert sections[1].participants == [
+            "claude-3-5-sonnet@claude-code",
+            "gpt-4@codex",
+        ]
+        assert sections[2].started_at == "2025-10-12T15:31:00Z"
+
+    def test_read_section_returns_single_round(self, multi_round_result, tmp_path):
+        """A round can be read by offset without the rest of the transcript."""
+        manager = TranscriptManager(output_dir=str(tmp_path))
+        filepath = manager.save(multi_round_result, "Should we use TypeScript?")
+
+        index = TranscriptIndex.for_transcript(filepath)
+        round_two = index.read_section(filepath, 2)
+
+        assert round_two.startswith("### Round 2")
+        assert "Round two rebuttal" in round_two
+        assert "I think TypeScript offers" not in round_two
+        assert index.read_section(filepath, 5) is None
+
+    def test_gzip_transcript_round_trips(self, multi_round_result, tmp_path):
+        """Gzip transcripts decompress whole and by section."""
+        plain = TranscriptManager(output_dir=str(tmp_path / "plain"))
+        compressed = TranscriptManager(
+            output_dir=str(tmp_path / "gz"), compression="gzip"
+        )
+
+        plain_path = plain.save(multi_round_result, "Q", filename="t")
+        gz_path = compressed.save(multi_round_result, "Q", filename="t")
+
+        assert gz_path.endswith(".md.gz")
+        assert read_transcript(gz_path) == Path(plain_path).read_text()
+        assert compressed.index.read_section(gz_path, 1) == plain.index.read_section(
+            plain_path, 1
+        )
+
+    def test_zstd_transcript_round_trips(self, multi_round_result, tmp_path):
+        """Zstd transcripts decompress whole and by section."""
+        pytest.importorskip("zstandard")
+        manager = TranscriptManager(output_dir=str(tmp_path), compression="zstd")
+
+        filepath = manager.save(multi_round_result, "Q")
+
+        assert filepath.endswith(".md.zst")
+        assert "Round two rebuttal" in read_transcript(filepath)
+        assert "Round two rebuttal" in manager.index.read_section(filepath, 2)
+
+    def test_unknown_compression_rejected(self, tmp_path):
+        """Unknown compression formats fail at construction."""
+        with pytest.raises(ValueError):
+            TranscriptManager(output_dir=str(tmp_path), compression="lz4")
+
+    def test_index_can_be_disabled(self, sample_result, tmp_path):
+        """No index database is created when indexing is off."""
+        manager = TranscriptManager(output_dir=str(tmp_path), index=False)
+
+        manager.save(sample_result, "Q")
+
+        assert manager.index is None
+        assert not (tmp_path / INDEX_FILENAME).exists()
+
+    async def test_save_async_writes_on_writer_thread(self, sample_result, tmp_path):
+        """save_async writes the same transcript without blocking the loop."""
+        manager = TranscriptManager(output_dir=str(tmp_path))
+
+        try:
+            filepath = await manager.save_async(sample_result, "Async question")
+        finally:
+            manager.close()
+
+        assert Path(filepath).read_text().startswith("# Async question")
+        assert manager.index.get(filepath) is not None
+
+    def test_read_round_serves_own_transcripts(self, multi_round_result, tmp_path):
+        """read_round returns a section of a transcript in output_dir."""
+        manager = TranscriptManager(output_dir=str(tmp_path))
+        filepath = manager.save(multi_round_result, "Q")
+
+        assert manager.read_round(filepath, 2).startswith("### Round 2")
+        assert manager.read_round(filepath, 7) is None
+
+    def test_read_round_rejects_paths_outside_output_dir(
+        self, multi_round_result, tmp_path
+    ):
+        """Paths outside the transcripts directory are refused."""
+        manager = TranscriptManager(output_dir=str(tmp_path / "transcripts"))
+        other = TranscriptManager(output_dir=str(tmp_path / "other"))
+        foreign = other.save(multi_round_result, "Q")
+        escaping = str(tmp_path / "transcripts" / ".." / "other" / Path(foreign).name)
+
+        for path in (foreign, escaping):
+            with pytest.raises(ValueError):
+                manager.read_round(path, 1)
+
+    def test_for_transcript_opens_index_read_only(self, tmp_path):
+        """Looking up an index never creates tables or changes the file."""
+        db_path = tmp_path / INDEX_FILENAME
+        sqlite3.connect(db_path).close()
+        before = db_path.read_bytes()
+
+        index = TranscriptIndex.for_transcript(tmp_path / "t.md")
+
+        assert index.read_only
+        with pytest.raises(sqlite3.OperationalError):
+            index.read_section(tmp_path / "t.md", 1)
+        assert db_path.read_bytes() == before
+        assert not (tmp_path / f"{INDEX_FILENAME}-wal").exists()
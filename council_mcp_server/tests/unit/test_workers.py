@@ -12,6 +12,14 @@ from decision_graph.storage import DecisionGraphStorage
 from decision_graph.workers import BackgroundWorker, SimilarityJob
 
 
+async def _wait_until(predicate, timeout=5.0):
+    """Poll until predicate() holds; the worker scores jobs in an executor."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate() and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+
 @pytest.fixture
 def temp_db():
     """Create temporary database for testing."""
@@ -37,6 +45,7 @@ async def worker(storage):
         max_queue_size=100,
         batch_size=10,
         similarity_threshold=0.5,
+        batch_wait_ms=0,
     )
     yield worker
     # Cleanup
@@ -280,8 +289,7 @@ class TestBackgroundWorkerProcessing:
         await worker.start()
         await worker.enqueue(node.id, delay_seconds=0)
 
-        # Wait for processing
-        await asyncio.sleep(0.3)
+        await _wait_until(lambda: worker.jobs_processed == 1)
 
         assert worker.jobs_processed == 1
         assert worker.jobs_failed == 0
@@ -309,8 +317,7 @@ class TestBackgroundWorkerProcessing:
         for node in nodes:
             await worker.enqueue(node.id, delay_seconds=0)
 
-        # Wait for processing
-        await asyncio.sleep(0.5)
+        await _wait_until(lambda: worker.jobs_processed == 3)
 
         assert worker.jobs_processed == 3
         assert worker.jobs_failed == 0
@@ -345,8 +352,7 @@ class TestBackgroundWorkerProcessing:
         # Then high priority
         await worker.enqueue(high_node.id, priority="high", delay_seconds=0)
 
-        # Wait for first job to process
-        await asyncio.sleep(0.3)
+        await _wait_until(lambda: worker.jobs_processed >= 1)
 
         # First job processed should be high priority
         # (We can't directly assert order, but both should complete)
@@ -359,8 +365,7 @@ class TestBackgroundWorkerProcessing:
         await worker.start()
         await worker.enqueue("non-existent-id", delay_seconds=0)
 
-        # Wait for processing
-        await asyncio.sleep(0.3)
+        await _wait_until(lambda: worker.jobs_failed == 1)
 
         # Job should fail but worker should continue
         assert worker.jobs_failed == 1
@@ -436,7 +441,7 @@ class TestBackgroundWorkerStats:
 
         await worker.start()
         await worker.enqueue(node.id, delay_seconds=0)
-        await asyncio.sleep(0.3)
+        await _wait_until(lambda: worker.jobs_processed == 1)
 
         stats = worker.get_stats()
 
@@ -545,7 +550,7 @@ class TestBackgroundWorkerBatching:
         # Process last node
         await worker.start()
         await worker.enqueue(nodes[-1].id, delay_seconds=0)
-        await asyncio.sleep(0.5)
+        await _wait_until(lambda: worker.jobs_processed == 1)
 
         # Should have compared against at most batch_size decisions
         # (batch_size + 1 to account for self, then -1 for self-exclusion = batch_size)
@@ -554,6 +559,69 @@ class TestBackgroundWorkerBatching:
 
         await worker.stop()
 
+    @pytest.mark.asyncio
+    async def test_burst_processed_as_one_batch(self, storage):
+        """Jobs arriving together should share one batch and one write."""
+        worker = BackgroundWorker(
+            storage, batch_size=10, max_batch_jobs=10, batch_wait_ms=100
+        )
+        nodes = []
+        for i in range(5):
+            node = DecisionNode(
+                question=f"Should we adopt option {i} for the backend",
+                timestamp=datetime.now(),
+                consensus="Test",
+                convergence_status="converged",
+                participants=["test"],
+                transcript_path=f"/tmp/{i}.md",
+            )
+            storage.save_decision_node(node)
+            nodes.append(node)
+
+        await worker.start()
+        for node in nodes:
+            await worker.enqueue(node.id, delay_seconds=0)
+        await _wait_until(lambda: worker.jobs_processed == 5)
+
+        stats = worker.get_stats()
+        assert stats["jobs_processed"] == 5
+        assert stats["batches_processed"] == 1
+        assert stats["last_batch_size"] == 5
+        assert stats["max_batch_size"] == 5
+        assert stats["avg_batch_latency_ms"] > 0
+        # Every pair of the burst is compared in both directions
+        assert stats["total_similarities_computed"] == 20
+        for node in nodes:
+            assert len(storage.get_similar_decisions(node.id, threshold=0.0)) == 4
+
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_missing_decision_fails_only_its_job(self, storage):
+        """A missing decision should not fail the other jobs in its batch."""
+        worker = BackgroundWorker(storage, batch_wait_ms=100)
+        node = DecisionNode(
+            question="Test",
+            timestamp=datetime.now(),
+            consensus="Test",
+            convergence_status="converged",
+            participants=["test"],
+            transcript_path="/tmp/test.md",
+        )
+        storage.save_decision_node(node)
+
+        await worker.start()
+        await worker.enqueue(node.id, delay_seconds=0)
+        await worker.enqueue("non-existent-id", delay_seconds=0)
+        await _wait_until(lambda: worker.jobs_processed + worker.jobs_failed == 2)
+
+        stats = worker.get_stats()
+        assert stats["jobs_processed"] == 1
+        assert stats["jobs_failed"] == 1
+        assert stats["batches_processed"] == 1
+
+        await worker.stop()
+
 
 class TestBackgroundWorkerFallback:
     """Test fallback behavior for read path."""
@@ -2,16 +2,38 @@
 
 The MCP server reads knowledge.db and sessions.db (uploaded_files) in
 read-only mode.  Both backends share the same .db files via WAL mode.
+
+Connections are pooled per thread: each worker thread keeps one read-only
+connection per database file (``mode=ro`` URI, ``query_only``, memory-mapped
+reads) and reuses it, together with its prepared-statement cache, across
+tool calls. Callers must not close the connections they are handed.
 """
 
 import json
+import logging
 import os
 import sqlite3
+import threading
 from pathlib import Path
 
+logger = logging.getLogger("app")
+
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _DEFAULT_DATA_DIR = _PROJECT_ROOT / "backend" / "data"
 
+_MMAP_SIZE = int(os.getenv("MCP_SQLITE_MMAP_BYTES", str(64 * 1024 * 1024)))
+_CACHED_STATEMENTS = int(os.getenv("MCP_SQLITE_CACHED_STATEMENTS", "256"))
+
+# path -> (connection, (st_dev, st_ino), generation) for the current thread.
+# The file identity is checked on checkout so a re-created database
+# (re-seeding) is reopened instead of read through a stale handle; the
+# generation retires every thread's connections after close_db_connections().
+_local = threading.local()
+_all_connections: list[sqlite3.Connection] = []
+_pool_lock = threading.Lock()
+_generation = 0
+_stats = {"opened": 0, "reused": 0, "reopened": 0}
+
 
 def _resolve_db(env_var: str, filename: str) -> str:
     override = os.getenv(env_var)
@@ -20,21 +42,89 @@ def _resolve_db(env_var: str, filename: str) -> str:
     return str(_DEFAULT_DATA_DIR / filename)
 
 
-def get_knowledge_connection() -> sqlite3.Connection:
-    """Open a read-only WAL connection to knowledge.db."""
-    path = _resolve_db("KNOWLEDGE_DB_PATH", "knowledge.db")
-    conn = sqlite3.connect(path)
-    conn.execute("PRAGMA journal_mode=WAL")
+def _open_read_only(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        f"{Path(path).resolve().as_uri()}?mode=ro",
+        uri=True,
+        cached_statements=_CACHED_STATEMENTS,
+        # Only ever used by the owning thread; close_db_connections() closes
+        # it from the shutdown thread.
+        check_same_thread=False,
+    )
     conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
     conn.row_factory = sqlite3.Row
     return conn
 
 
-def get_sessions_connection() -> sqlite3.Connection:
-    """Open a read-only WAL connection to sessions.db (for uploaded files)."""
-    path = _resolve_db("SESSIONS_DB_PATH", "sessions.db")
-    conn = sqlite3.connect(path)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=5000")
-    conn.row_factory = sqlite3.Row
+def _pooled_connection(path: str) -> sqlite3.Connection:
+    stat = os.stat(path)  # raises if the DB does not exist; callers fall back
+    identity = (stat.st_dev, stat.st_ino)
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = {}
+
+    pooled = pool.get(path)
+    if pooled is not None:
+        conn, pooled_identity, generation = pooled
+        if generation != _generation:
+            pass  # already closed by close_db_connections()
+        elif pooled_identity == identity:
+            _stats["reused"] += 1
+            return conn
+        else:
+            _discard(conn)
+            _stats["reopened"] += 1
+
+    conn = _open_read_only(path)
+    pool[path] = (conn, identity, _generation)
+    with _pool_lock:
+        _all_connections.append(conn)
+    _stats["opened"] += 1
     return conn
+
+
+def _discard(conn: sqlite3.Connection) -> None:
+    with _pool_lock:
+        if conn in _all_connections:
+            _all_connections.remove(conn)
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def get_knowledge_connection() -> sqlite3.Connection:
+    """Return this thread's pooled read-only connection to knowledge.db."""
+    return _pooled_connection(_resolve_db("KNOWLEDGE_DB_PATH", "knowledge.db"))
+
+
+def get_sessions_connection() -> sqlite3.Connection:
+    """Return this thread's pooled read-only connection to sessions.db (for uploaded files)."""
+    return _pooled_connection(_resolve_db("SESSIONS_DB_PATH", "sessions.db"))
+
+
+def close_db_connections() -> None:
+    """Close every pooled connection (server shutdown)."""
+    global _generation
+    with _pool_lock:
+        _generation += 1
+        connections = list(_all_connections)
+        _all_connections.clear()
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            logger.warning("[db] Failed to close pooled connection", exc_info=True)
+
+
+def pool_stats() -> dict:
+    with _pool_lock:
+        open_connections = len(_all_connections)
+    return {"open_connections": open_connections, **_stats}
+
+
+def get_cache_db_path() -> str:
+    """Path of the MCP server's response cache DB (next to knowledge.db)."""
+    return _resolve_db("MCP_CACHE_DB_PATH", "mcp_cache.db")
@@ -1,5 +1,8 @@
 """MCP Prompts package."""
 
+import hashlib
+from pathlib import Path
+
 from .analysis import analysis_generate
 from .collection import (
     collection_collect,
@@ -10,6 +13,12 @@ from .collection import (
 from .direction import direction_gathering, direction_pir, direction_summary
 from .processing import processing_modify, processing_process
 
+# Fingerprint of the prompt sources. Advertised as the server version so
+# clients caching rendered prompts drop them when the templates change.
+PROMPTS_VERSION = hashlib.sha256(
+    b"".join(path.read_bytes() for path in sorted(Path(__file__).parent.glob("*.py")))
+).hexdigest()[:12]
+
 
 def register_prompts(mcp) -> None:
     mcp.prompt(direction_gathering)
@@ -1,5 +1,17 @@
 """Shared helpers used across all prompt modules."""
 
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+# Rendered prompts kept per adapter; see memoize_prompt().
+_PROMPT_MEMO_MAX_ENTRIES = int(os.getenv("PROMPT_MEMO_MAX_ENTRIES", "128"))
+
 # Maps BCP-47 language codes to human-readable names used in language instructions.
 _LANGUAGE_NAMES: dict[str, str] = {
     "en": "English",
@@ -28,3 +40,36 @@ def _language_instruction(language: str, scope: str = "all output") -> str:
     """
     language_name = _LANGUAGE_NAMES.get(language, "English")
     return f"LANGUAGE INSTRUCTION: You MUST write {scope} in {language_name}.\n\n"
+
+
+def memoize_prompt(fn: Callable[..., str]) -> Callable[..., str]:
+    """Memoize a prompt adapter on a hash of its arguments.
+
+    The backend requests the same prompt with the same arguments on every
+    turn of a phase step, so rendered output is kept in a small LRU. Builders
+    embed today's date, so the UTC date is part of the key.
+    """
+    entries: OrderedDict[str, str] = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> str:
+        payload = json.dumps(
+            [datetime.now(UTC).strftime("%Y-%m-%d"), args, sorted(kwargs.items())],
+            default=str,
+        )
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        with lock:
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                return cached
+        rendered = fn(*args, **kwargs)
+        with lock:
+            entries[key] = rendered
+            while len(entries) > _PROMPT_MEMO_MAX_ENTRIES:
+                entries.popitem(last=False)
+        return rendered
+
+    wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+    return wrapper
@@ -6,7 +6,7 @@ The corresponding AI #2 (reviewer) prompt lives in review_mcp_server/src/prompts
 
 from datetime import UTC, datetime
 
-from ._shared import _language_instruction
+from ._shared import _language_instruction, memoize_prompt
 
 # Analytical lens per perspective — mirrors council_mcp_server/personas.py.
 # Tells the model what angle and themes to pursue when writing the `analysis` field.
@@ -131,6 +131,7 @@ Return ONLY valid JSON. No preamble, no explanation, no markdown fences.
 # ── MCP adapter functions ─────────────────────────────────────────────────────
 
 
+@memoize_prompt
 def analysis_generate(
     pir: str,
     findings: str,
@@ -3,12 +3,29 @@
 import json
 from datetime import UTC, datetime, timedelta
 
-from ._shared import SOURCE_TOOL_MAP, _language_instruction
+from ._shared import SOURCE_TOOL_MAP, _language_instruction, memoize_prompt
 
+# Static sections, built once at import rather than on every render.
+_AVAILABLE_SOURCES_STR = ", ".join(f'"{s}"' for s in SOURCE_TOOL_MAP)
+
+_PERSP_REGION_LANG: dict[str, tuple[str, str]] = {
+    "us": ("us", "en"),
+    "eu": ("gb", "en"),
+    "norway": ("no", "no"),
+    "china": ("cn", "zh-cn"),
+    "russia": ("ru", "ru"),
+    "neutral": ("", ""),
+}
 
 _FUTURE_KEYWORDS = (
-    "next ", "coming ", "upcoming ", "future ", "forward",
-    "in the next", "over the next", "within the next",
+    "next ",
+    "coming ",
+    "upcoming ",
+    "future ",
+    "forward",
+    "in the next",
+    "over the next",
+    "within the next",
 )
 
 
@@ -60,13 +77,10 @@ def build_collection_plan_prompt(
     current_plan: str | None = None,
     language: str = "en",
 ) -> str:
-    available_sources = list(SOURCE_TOOL_MAP.keys())
-    available_sources_str = ", ".join(f'"{s}"' for s in available_sources)
     lang_note = _language_instruction(language, "the 'plan' field")
 
     existing_plan_section = (
-        f"\n## Existing Plan\n{current_plan}\n"
-        if current_plan else ""
+        f"\n## Existing Plan\n{current_plan}\n" if current_plan else ""
     )
 
     modifications_section = (
@@ -78,7 +92,8 @@ def build_collection_plan_prompt(
         f"  Keep all other steps unchanged and only modify the ones explicitly mentioned.\n"
         f"- General (e.g. 'too broad', 'not relevant'):\n"
         f"  Regenerate all steps from scratch using the feedback as guidance.\n"
-        if modifications else ""
+        if modifications
+        else ""
     )
 
     return f"""{lang_note}You are a professional threat intelligence analyst. Your task is to create a collection plan and suggest relevant sources for the given Priority Intelligence Requirements (PIRs).
@@ -87,7 +102,7 @@ def build_collection_plan_prompt(
 {pir}
 {existing_plan_section}{modifications_section}
 ## Available Sources
-The following sources are available: {available_sources_str}
+The following sources are available: {_AVAILABLE_SOURCES_STR}
 Only suggest sources that are genuinely relevant to the PIRs.
 
 ## Allowed Tools
@@ -129,7 +144,8 @@ def build_collection_collect_prompt(
 ) -> str:
     approved_tools = [
         tool
-        for s in selected_sources if s in SOURCE_TOOL_MAP
+        for s in selected_sources
+        if s in SOURCE_TOOL_MAP
         for tool in SOURCE_TOOL_MAP[s]
     ]
     unmapped = [s for s in selected_sources if s not in SOURCE_TOOL_MAP]
@@ -138,15 +154,21 @@ def build_collection_collect_prompt(
     unmapped_note = (
         f"\nNote: The following selected sources could not be mapped to tools "
         f"and will be skipped: {', '.join(unmapped)}"
-        if unmapped else ""
+        if unmapped
+        else ""
     )
-    _upload_tools_in_use = [t for t in ["list_uploads", "search_local_data", "read_upload"] if t in approved_tools]
+    _upload_tools_in_use = [
+        t
+        for t in ["list_uploads", "search_local_data", "read_upload"]
+        if t in approved_tools
+    ]
     session_note = (
-        f"\nNote: For uploaded document tools, always use session_id=\"{session_id}\". "
+        f'\nNote: For uploaded document tools, always use session_id="{session_id}". '
         f"Workflow: (1) call list_uploads(session_id) to see available files and their file_ids; "
         f"(2) call search_local_data(session_id, query) for keyword-relevant snippets; "
         f"(3) call read_upload(session_id, file_upload_id) to read the full content of relevant files."
-        if session_id and _upload_tools_in_use else ""
+        if session_id and _upload_tools_in_use
+        else ""
     )
     _now = datetime.now(UTC)
     _stf = source_timeframes or {}
@@ -159,16 +181,19 @@ def build_collection_collect_prompt(
         "historical window to search for this supporting context. Do NOT restrict queries "
         "to only events that have already concluded; focus on indicators and patterns that "
         "are relevant to what may occur during the PIR timeframe."
-        if _pir_is_future else ""
+        if _pir_is_future
+        else ""
     )
     since_note = (
-        f"\nNote: Today's date is {_now.strftime('%Y-%m-%d')}. The PIR timeframe is \"{since_date}\"."
+        f'\nNote: Today\'s date is {_now.strftime("%Y-%m-%d")}. The PIR timeframe is "{since_date}".'
         f"{_future_context}"
-        f" For all query_otx calls, use since_date=\"{_otx_lookback}\"."
-        if "query_otx" in approved_tools else (
-            f"\nNote: Today's date is {_now.strftime('%Y-%m-%d')}. The PIR timeframe is \"{since_date}\"."
+        f' For all query_otx calls, use since_date="{_otx_lookback}".'
+        if "query_otx" in approved_tools
+        else (
+            f'\nNote: Today\'s date is {_now.strftime("%Y-%m-%d")}. The PIR timeframe is "{since_date}".'
             f"{_future_context}"
-            if since_date and _pir_is_future else ""
+            if since_date and _pir_is_future
+            else ""
         )
     )
 
@@ -178,17 +203,10 @@ def build_collection_collect_prompt(
         f"A source is NOT considered covered if only partial data was collected — "
         f"query it again with different search terms or angles to fill remaining gaps. "
         f"You MUST still query ALL approved sources.\n{existing_data}"
-        if existing_data else ""
+        if existing_data
+        else ""
     )
 
-    _PERSP_REGION_LANG: dict[str, tuple[str, str]] = {
-        "us":      ("us",   "en"),
-        "eu":      ("gb",   "en"),
-        "norway":  ("no",   "no"),
-        "china":   ("cn",   "zh-cn"),
-        "russia":  ("ru",   "ru"),
-        "neutral": ("",     ""),
-    }
     _active = [p for p in (perspectives or []) if p != "neutral"]
     if not _active:
         _active = ["neutral"]
@@ -196,14 +214,14 @@ def build_collection_collect_prompt(
     if _has_web_tools:
         _persp_str = ", ".join(perspectives) if perspectives else "neutral"
         _mapping_lines = "\n".join(
-            f"  {p:<8} → region=\"{_PERSP_REGION_LANG.get(p, ('',''))[0] or 'omit'}\", language=\"{_PERSP_REGION_LANG.get(p, ('',''))[1] or 'omit'}\""
+            f'  {p:<8} → region="{_PERSP_REGION_LANG.get(p, ("", ""))[0] or "omit"}", language="{_PERSP_REGION_LANG.get(p, ("", ""))[1] or "omit"}"'
             for p in _active
         )
         _web_examples = "\n".join(
             (
-                f"  google_search(query=\"<topic> {p} perspective\", num_results=10, "
-                f"region=\"{_PERSP_REGION_LANG.get(p, ('',''))[0]}\", "
-                f"language=\"{_PERSP_REGION_LANG.get(p, ('',''))[1]}\", date_restrict=\"<code>\")"
+                f'  google_search(query="<topic> {p} perspective", num_results=10, '
+                f'region="{_PERSP_REGION_LANG.get(p, ("", ""))[0]}", '
+                f'language="{_PERSP_REGION_LANG.get(p, ("", ""))[1]}", date_restrict="<code>")'
             )
             for p in _active
         )
@@ -223,31 +241,33 @@ def build_collection_collect_prompt(
             f"\nBad queries match too many unrelated pages (military hardware wikis, hobby sites, blogs)."
             f"\nGood queries combine: a specific named entity or event + the analytic angle + the source type."
             + (
-                f"\n"
-                f"\nFUTURE-ORIENTED PIR: The PIR covers a future period. Construct queries that surface"
-                f"\ncurrent capabilities, intentions, forecasts, and trend assessments — not news about"
-                f"\nevents that will happen in the future (those do not exist yet). Target indicators,"
-                f"\nbuildup patterns, and analytical projections."
-                if _pir_is_future else ""
+                "\n"
+                "\nFUTURE-ORIENTED PIR: The PIR covers a future period. Construct queries that surface"
+                "\ncurrent capabilities, intentions, forecasts, and trend assessments — not news about"
+                "\nevents that will happen in the future (those do not exist yet). Target indicators,"
+                "\nbuildup patterns, and analytical projections."
+                if _pir_is_future
+                else ""
             )
-            + f"\n"
-            f"\nQuery construction:"
-            f"\n  BAD:  \"China military Taiwan\"                → too broad, matches everything"
-            f"\n  BAD:  \"GPS jamming\"                         → matches hobby and history pages"
-            f"\n  GOOD: \"Volt Typhoon critical infrastructure pre-positioning CISA analysis\""
-            f"\n  GOOD: \"PLA amphibious capability assessment 2025 RAND\""
-            f"\n  GOOD: \"Russia hybrid warfare Norway Nordic analysis site:nato.int OR site:rand.org\""
-            f"\n"
-            f"\nTips for precision:"
-            f"\n  - Use named threat actors, operations, or policy names (e.g. 'Volt Typhoon', 'Operation X')"
-            f"\n  - Add source-type words: 'analysis', 'assessment', 'report', 'white paper'"
-            f"\n  - Add known authoritative domains with OR: 'site:csis.org OR site:rand.org OR site:rusi.org'"
-            f"\n  - Use year or date range when timeframe matters: '2025' or '2024 2025'"
+            + "\n"
+            "\nQuery construction:"
+            '\n  BAD:  "China military Taiwan"                → too broad, matches everything'
+            '\n  BAD:  "GPS jamming"                         → matches hobby and history pages'
+            '\n  GOOD: "Volt Typhoon critical infrastructure pre-positioning CISA analysis"'
+            '\n  GOOD: "PLA amphibious capability assessment 2025 RAND"'
+            '\n  GOOD: "Russia hybrid warfare Norway Nordic analysis site:nato.int OR site:rand.org"'
+            "\n"
+            "\nTips for precision:"
+            "\n  - Use named threat actors, operations, or policy names (e.g. 'Volt Typhoon', 'Operation X')"
+            "\n  - Add source-type words: 'analysis', 'assessment', 'report', 'white paper'"
+            "\n  - Add known authoritative domains with OR: 'site:csis.org OR site:rand.org OR site:rusi.org'"
+            "\n  - Use year or date range when timeframe matters: '2025' or '2024 2025'"
             + (
-                f"\n  - For future PIRs: prefer 'forecast', 'projection', 'outlook', 'assessment', 'trajectory'"
-                if _pir_is_future else ""
+                "\n  - For future PIRs: prefer 'forecast', 'projection', 'outlook', 'assessment', 'trajectory'"
+                if _pir_is_future
+                else ""
             )
-            f"\n"
+            + f"\n"
             f"\nSource authority hierarchy — prefer queries that surface sources in this order:"
             f"\n  1. Government & official sources (.gov, .mil, ministry/agency sites)"
             f"\n  2. Established research institutions & think tanks (CSIS, RAND, Chatham House, RUSI, CFR, Brookings, ISW)"
@@ -261,17 +281,18 @@ def build_collection_collect_prompt(
             f"\n"
             f"\n## Per-Source-Type Timeframes"
             + (
-                f"\nThis PIR covers a future period. These date windows define how far back to search for"
-                f"\nbackground intelligence (recent activity, trend data, capability indicators) that"
-                f"\nsupports the forward-looking analysis — they are NOT a mirror of the future PIR period."
-                f"\n"
-                if _pir_is_future else ""
+                "\nThis PIR covers a future period. These date windows define how far back to search for"
+                "\nbackground intelligence (recent activity, trend data, capability indicators) that"
+                "\nsupports the forward-looking analysis — they are NOT a mirror of the future PIR period."
+                "\n"
+                if _pir_is_future
+                else ""
             )
             + f"\nApply these date_restrict codes based on the type of source the query targets:"
-            f"\n  Government & official (.gov, .mil, ministry/agency, state media): date_restrict=\"{_stf.get('web_gov', '') or 'omit'}\""
-            f"\n  Think tanks & research (RAND, CSIS, Chatham House, RUSI, CFR):    date_restrict=\"{_stf.get('web_think_tank', '') or 'omit'}\""
-            f"\n  News & media (Reuters, BBC, AP, FT, national newspapers):          date_restrict=\"{_stf.get('web_news', '') or 'omit'}\""
-            f"\n  Other web sources:                                                  date_restrict=\"{_stf.get('web_other', '') or 'omit'}\""
+            f'\n  Government & official (.gov, .mil, ministry/agency, state media): date_restrict="{_stf.get("web_gov", "") or "omit"}"'
+            f'\n  Think tanks & research (RAND, CSIS, Chatham House, RUSI, CFR):    date_restrict="{_stf.get("web_think_tank", "") or "omit"}"'
+            f'\n  News & media (Reuters, BBC, AP, FT, national newspapers):          date_restrict="{_stf.get("web_news", "") or "omit"}"'
+            f'\n  Other web sources:                                                  date_restrict="{_stf.get("web_other", "") or "omit"}"'
             f"\nIf the code is 'omit', do not pass date_restrict for that query."
             f"\nWhen a query mixes types (no site: restriction), use the tier most likely to satisfy the PIR."
             f"\ndate_restrict codes: d1=day, w1=week, m1=month, m3=3 months, m6=6 months, y1=year, y2=2 years, y3=3 years."
@@ -281,7 +302,9 @@ def build_collection_collect_prompt(
     else:
         web_search_note = ""
 
-    step_guidance_section = f"\n{step_source_guidance}\n" if step_source_guidance else ""
+    step_guidance_section = (
+        f"\n{step_source_guidance}\n" if step_source_guidance else ""
+    )
 
     return f"""You are a threat intelligence data collector. Your only task is to retrieve raw data from approved sources. Do not summarize, interpret, or draw conclusions.
 
@@ -405,6 +428,7 @@ Return ONLY valid JSON. No preamble, no explanation, no markdown.
 # ── MCP adapter functions ─────────────────────────────────────────────────────
 
 
+@memoize_prompt
 def collection_plan(
     pir: str,
     modifications: str = "",
@@ -427,6 +451,7 @@ def collection_plan(
     )
 
 
+@memoize_prompt
 def collection_collect(
     pir: str,
     selected_sources: str,
@@ -466,6 +491,7 @@ def collection_collect(
     )
 
 
+@memoize_prompt
 def collection_summarize(
     pir: str,
     collected_data: str,
@@ -485,6 +511,7 @@ def collection_summarize(
     )
 
 
+@memoize_prompt
 def collection_modify(
     collected_data: str,
     modifications: str,
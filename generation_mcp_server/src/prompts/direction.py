@@ -2,7 +2,7 @@
 
 import json
 
-from ._shared import _language_instruction
+from ._shared import _language_instruction, memoize_prompt
 
 
 def build_direction_dialogue_prompt(
@@ -320,6 +320,7 @@ Do not treat "None" as feedback content.
 # ── MCP adapter functions ─────────────────────────────────────────────────────
 
 
+@memoize_prompt
 def direction_gathering(
     user_message: str,
     missing_fields: str,
@@ -337,6 +338,7 @@ def direction_gathering(
     )
 
 
+@memoize_prompt
 def direction_summary(
     scope: str,
     timeframe: str,
@@ -371,6 +373,7 @@ def direction_summary(
     )
 
 
+@memoize_prompt
 def direction_pir(
     scope: str,
     timeframe: str,
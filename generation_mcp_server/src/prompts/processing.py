@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from ._shared import _language_instruction
+from ._shared import _language_instruction, memoize_prompt
 
 
 def build_processing_prompt(
@@ -175,6 +175,7 @@ Same structure as the input."""
 # ── MCP adapter functions ─────────────────────────────────────────────────────
 
 
+@memoize_prompt
 def processing_process(
     pir: str,
     collected_data: str,
@@ -200,6 +201,7 @@ def processing_process(
     )
 
 
+@memoize_prompt
 def processing_modify(
     existing_result: str,
     modifications: str,
@@ -5,6 +5,7 @@ import logging
 from pathlib import Path
 
 from models import PIRResponse
+from resources.keyword_index import KeywordIndex
 
 logger = logging.getLogger("mcp_server")
 
@@ -140,8 +141,59 @@ KNOWLEDGE_REGISTRY: dict[str, dict] = {
 }
 
 
+# Built lazily from knowledge.db (ids, keywords, priority — no markdown) and
+# rebuilt when the table's fingerprint changes, e.g. after the backend seeds.
+_db_index: KeywordIndex | None = None
+_db_index_version: tuple | None = None
+_registry_index: KeywordIndex | None = None
+
+
+def invalidate_knowledge_index() -> None:
+    """Drop the cached knowledge index; the next lookup rebuilds it."""
+    global _db_index, _db_index_version
+    _db_index = None
+    _db_index_version = None
+
+
+def _get_db_index(conn) -> KeywordIndex:
+    global _db_index, _db_index_version
+    version = tuple(
+        conn.execute(
+            "SELECT COUNT(*), MAX(last_updated) FROM knowledge_resources"
+        ).fetchone()
+    )
+    if _db_index is None or version != _db_index_version:
+        rows = conn.execute(
+            "SELECT id, keywords, priority FROM knowledge_resources"
+        ).fetchall()
+        _db_index = KeywordIndex(
+            (
+                row["id"],
+                json.loads(row["keywords"]) if row["keywords"] else [],
+                row["priority"],
+            )
+            for row in rows
+        )
+        _db_index_version = version
+    return _db_index
+
+
+def _get_registry_index() -> KeywordIndex:
+    global _registry_index
+    if _registry_index is None:
+        _registry_index = KeywordIndex(
+            (resource_id, entry["keywords"], entry["priority"])
+            for resource_id, entry in KNOWLEDGE_REGISTRY.items()
+        )
+    return _registry_index
+
+
 def _load_knowledge_from_db(scan_text: str) -> str | None:
-    """DB-backed keyword search — returns formatted markdown or None."""
+    """DB-backed keyword search — returns formatted markdown or None.
+
+    Keywords are matched through the cached KeywordIndex; markdown is only
+    read for the top 5 resources.
+    """
     try:
         from db import get_knowledge_connection
         conn = get_knowledge_connection()
@@ -149,34 +201,24 @@ def _load_knowledge_from_db(scan_text: str) -> str | None:
         return None  # DB not available, caller falls back to file-based
 
     try:
+        top_ids = _get_db_index(conn).top(scan_text, limit=5)
+        if not top_ids:
+            return None
+        placeholders = ", ".join("?" for _ in top_ids)
         rows = conn.execute(
-            "SELECT id, keywords, priority, markdown_content FROM knowledge_resources"
+            f"SELECT id, markdown_content FROM knowledge_resources WHERE id IN ({placeholders})",
+            top_ids,
         ).fetchall()
     except Exception:
-        conn.close()
         return None
 
-    text_lower = scan_text.lower()
-    scored: list[tuple[int, dict]] = []
-
-    for row in rows:
-        keywords = json.loads(row["keywords"]) if row["keywords"] else []
-        hits = sum(1 for kw in keywords if kw.lower() in text_lower)
-        if hits > 0:
-            scored.append((hits, {"id": row["id"], "priority": row["priority"], "content": row["markdown_content"]}))
-
-    conn.close()
-
-    if not scored:
-        return None
-
-    scored.sort(key=lambda x: (-x[0], x[1]["priority"]))
-    top = scored[:5]
+    markdown_by_id = {row["id"]: row["markdown_content"] for row in rows}
 
     content = ["## Background Knowledge"]
-    for _, entry in top:
-        content.append(f"### Source: {entry['id']}")
-        content.append(entry["content"])
+    for resource_id in top_ids:
+        if resource_id in markdown_by_id:
+            content.append(f"### Source: {resource_id}")
+            content.append(markdown_by_id[resource_id])
 
     return "\n".join(content) if len(content) > 1 else None
 
@@ -190,7 +232,6 @@ def _get_citation_from_db(resource_id: str) -> dict | None:
             "SELECT citation FROM knowledge_resources WHERE id = ?",
             (resource_id,),
         ).fetchone()
-        conn.close()
         if row and row["citation"]:
             return json.loads(row["citation"])
     except Exception:
@@ -219,22 +260,18 @@ def load_knowledge(scan_text: str) -> str | None:
 
     # Fallback: file-based
     logger.debug("knowledge.db unavailable, falling back to file-based knowledge loading")
-    text_lower = scan_text.lower()
-    matches: dict[str, dict] = {}
-
-    for resource_id, entry in KNOWLEDGE_REGISTRY.items():
-        for keyword in entry["keywords"]:
-            if keyword.lower() in text_lower:
-                matches[resource_id] = entry
-                break
-
+    matches = _get_registry_index().hits(scan_text)
     if not matches:
         return None
 
-    sorted_entries = sorted(matches.items(), key=lambda x: x[1]["priority"])[:5]
+    # Registry order is preserved among equal priorities (stable sort).
+    sorted_ids = sorted(
+        (rid for rid in KNOWLEDGE_REGISTRY if rid in matches),
+        key=lambda rid: KNOWLEDGE_REGISTRY[rid]["priority"],
+    )[:5]
 
     content = ["## Background Knowledge"]
-    for resource_id, _ in sorted_entries:
+    for resource_id in sorted_ids:
         path = RESOURCES_DIR / f"{resource_id}.md"
         try:
             content.append(f"### Source: {resource_id}")
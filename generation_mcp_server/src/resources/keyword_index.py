@@ -0,0 +1,99 @@
+"""Inverted keyword index over knowledge resources (Aho-Corasick matcher).
+
+Every keyword of every resource is compiled into one automaton, so matching
+a scan text costs one pass over the text regardless of how many resources
+or keywords exist. The backend keeps the same class in
+backend/src/db/keyword_index.py; tests/test_shared_parity.py keeps the two
+in step.
+"""
+
+from collections import Counter, deque
+from collections.abc import Iterable
+
+
+class KeywordIndex:
+    """keyword -> resource ids, with a multi-pattern matcher over all keywords.
+
+    Args:
+        entries: ``(resource_id, keywords, priority)`` in the order ties
+            should be broken (load order).
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, list[str], int]]):
+        self.priority: dict[str, int] = {}
+        self._order: dict[str, int] = {}
+        self._postings: dict[str, list[str]] = {}
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[str]] = [frozenset()]
+
+        for resource_id, keywords, priority in entries:
+            self.priority[resource_id] = priority
+            self._order.setdefault(resource_id, len(self._order))
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    self._postings.setdefault(keyword, []).append(resource_id)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.priority)
+
+    def _build(self) -> None:
+        outputs: list[set[str]] = [set()]
+        for keyword in self._postings:
+            node = 0
+            for char in keyword:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                node = nxt
+            outputs[node].add(keyword)
+
+        # Breadth-first failure links; each node inherits the outputs of its
+        # failure target so a match needs no suffix walk at scan time.
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child] |= outputs[self._fail[child]]
+        self._out = [frozenset(found) for found in outputs]
+
+    def matched_keywords(self, text: str) -> set[str]:
+        """All indexed keywords occurring in text (case-insensitive)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[str] = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found |= out[node]
+        return found
+
+    def hits(self, text: str) -> Counter[str]:
+        """resource id -> number of its keywords found in text."""
+        counts: Counter[str] = Counter()
+        for keyword in self.matched_keywords(text):
+            counts.update(self._postings[keyword])
+        return counts
+
+    def top(self, text: str, limit: int = 5) -> list[str]:
+        """Best matching resource ids: most keyword hits, then priority."""
+        counts = self.hits(text)
+        ranked = sorted(
+            counts,
+            key=lambda rid: (-counts[rid], self.priority[rid], self._order[rid]),
+        )
+        return ranked[:limit]
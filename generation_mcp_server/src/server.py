@@ -3,6 +3,7 @@
 import os
 import socket
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from urllib.error import URLError
 from urllib.request import urlopen
@@ -51,24 +52,43 @@ except ModuleNotFoundError as exc:
     raise SystemExit(1)
 
 # from pymisp import PyMISP  # MISP not configured on external server
-from prompts import register_prompts
+from db import close_db_connections, pool_stats  # noqa: E402
+from prompts import PROMPTS_VERSION, register_prompts
 from resources import KNOWLEDGE_REGISTRY, RESOURCES_DIR
-from tools.google_search import register_google_search_tools
-from tools.knowledge_tools import register_knowledge_resources, register_knowledge_tools
+from tools.google_search import register_google_search_tools, serper_cache
+from tools.http_clients import close_http_clients  # noqa: E402
+from tools.knowledge_tools import (
+    knowledge_cache,
+    register_knowledge_resources,
+    register_knowledge_tools,
+)
 from tools.local_search import register_local_search_tools
 from tools.pmesii_clarification import register_processing_tools
-from tools.otx_tools import register_otx_tools
+from tools.otx_tools import otx_cache, register_otx_tools
 from tools.session_resources import register_session_resources
 from tools.upload_tools import register_upload_tools
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the pooled OSINT HTTP clients and SQLite connections on shutdown."""
+    try:
+        yield {}
+    finally:
+        await close_http_clients()
+        close_db_connections()
+
+
 mcp = FastMCP(
     name="ThreatIntelligence",
+    version=PROMPTS_VERSION,
     instructions=(
         "MCP server providing OSINT tools and knowledge bank resources for the "
         "Collection and Processing phases of the Threat Intelligence cycle."
     ),
+    lifespan=_lifespan,
 )
 
 # Tools and resources registration
@@ -89,6 +109,18 @@ async def health(request):
     return JSONResponse({"status": "ok"})
 
 
+@mcp.custom_route("/health/metrics", methods=["GET"])
+async def health_metrics(request):
+    return JSONResponse(
+        {
+            "otx_cache": otx_cache.stats(),
+            "serper_cache": serper_cache.stats(),
+            "sqlite_pool": pool_stats(),
+            "knowledge_cache": knowledge_cache.stats(),
+        }
+    )
+
+
 # Test tool
 
 @mcp.tool
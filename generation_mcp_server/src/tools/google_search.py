@@ -1,7 +1,9 @@
 """Google Search and Google News MCP tools powered by Serper.dev.
 
 Estimated usage: ~5 web + ~5 news queries per perspective per collection attempt.
-A 3-perspective session uses roughly 30 queries total.
+A 3-perspective session uses roughly 30 queries total. Retries and "gather
+more" loops often reissue near-identical queries, so results are cached by
+normalized query + parameters (serper_cache) to save Serper quota.
 """
 
 import logging
@@ -9,6 +11,10 @@ import os
 
 import httpx
 
+from db import get_cache_db_path
+from tools.http_clients import get_http_client
+from tools.response_cache import ResponseCache, make_cache_key
+
 logger = logging.getLogger("app")
 
 _SERPER_SEARCH_URL = "https://google.serper.dev/search"
@@ -58,6 +64,27 @@ _NOISE_SITES = [
 ]
 _SITE_EXCLUSION = " ".join(f"-site:{s}" for s in _NOISE_SITES)
 
+# News goes stale quickly; web results for the same query change slowly.
+_NEWS_TTL_SECONDS = float(os.getenv("SERPER_CACHE_NEWS_TTL_SECONDS", "1800"))
+_WEB_TTL_SECONDS = float(os.getenv("SERPER_CACHE_WEB_TTL_SECONDS", "86400"))
+
+# Set SERPER_CACHE_PERSIST=1 to keep results across restarts in mcp_cache.db.
+serper_cache = ResponseCache(
+    "serper",
+    ttl_seconds=_WEB_TTL_SECONDS,
+    max_entries=int(os.getenv("SERPER_CACHE_MAX_ENTRIES", "5000")),
+    db_path=get_cache_db_path() if os.getenv("SERPER_CACHE_PERSIST") == "1" else None,
+)
+
+
+def _normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace for cache keys.
+
+    Quotes, operators and punctuation change what Serper returns, so they
+    stay in the key.
+    """
+    return " ".join(query.casefold().split())
+
 
 def _build_serper_payload(
     query: str,
@@ -82,6 +109,38 @@ def _build_serper_payload(
     return payload
 
 
+async def _serper_post(url: str, payload: dict) -> dict:
+    client = get_http_client("serper", timeout=15.0)
+    response = await client.post(url, json=payload, headers=_serper_headers())
+    response.raise_for_status()
+    return response.json()
+
+
+async def _cached_serper_search(
+    url: str,
+    query: str,
+    num_results: int,
+    date_restrict: str | None,
+    region: str | None,
+    language: str | None,
+) -> dict:
+    payload = _build_serper_payload(query, num_results, date_restrict, region, language)
+    key = make_cache_key(
+        url,
+        {
+            "q": _normalize_query(query),
+            "num": payload["num"],
+            "date_restrict": date_restrict or "",
+            "region": (region or "").lower(),
+            "language": (language or "").lower(),
+        },
+    )
+    ttl = _NEWS_TTL_SECONDS if url == _SERPER_NEWS_URL else _WEB_TTL_SECONDS
+    return await serper_cache.get_or_fetch(
+        key, lambda: _serper_post(url, payload), ttl_seconds=ttl
+    )
+
+
 def _serper_headers() -> dict:
     return {
         "X-API-KEY": os.getenv("SERPER_API_KEY", ""),
@@ -102,7 +161,7 @@ def _handle_serper_error(e: Exception) -> str | None:
     return f"Error: {e}"
 
 
-def google_search(
+async def google_search(
     query: str,
     num_results: int = 10,
     date_restrict: str | None = None,
@@ -146,13 +205,10 @@ def google_search(
             "Set the SERPER_API_KEY environment variable."
         )
 
-    payload = _build_serper_payload(query, num_results, date_restrict, region, language)
-
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.post(_SERPER_SEARCH_URL, json=payload, headers=_serper_headers())
-            response.raise_for_status()
-            data = response.json()
+        data = await _cached_serper_search(
+            _SERPER_SEARCH_URL, query, num_results, date_restrict, region, language
+        )
 
         items = data.get("organic", [])
         if not items:
@@ -170,7 +226,7 @@ def google_search(
         return f"[google_search] {err or e}"
 
 
-def google_news_search(
+async def google_news_search(
     query: str,
     num_results: int = 5,
     date_restrict: str | None = None,
@@ -204,13 +260,10 @@ def google_news_search(
             "Set the SERPER_API_KEY environment variable."
         )
 
-    payload = _build_serper_payload(query, num_results, date_restrict, region, language)
-
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.post(_SERPER_NEWS_URL, json=payload, headers=_serper_headers())
-            response.raise_for_status()
-            data = response.json()
+        data = await _cached_serper_search(
+            _SERPER_NEWS_URL, query, num_results, date_restrict, region, language
+        )
 
         items = data.get("news", [])
         if not items:
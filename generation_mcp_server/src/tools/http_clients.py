@@ -0,0 +1,62 @@
+"""Shared async HTTP clients for the OSINT tools, one per upstream.
+
+Each upstream (Serper, OTX) gets a long-lived httpx.AsyncClient so tool calls
+reuse pooled keep-alive connections instead of opening a new TLS session per
+request. HTTP/2 is used when the optional ``h2`` package is installed
+(``httpx[http2]``). close_http_clients() is called from the server lifespan.
+"""
+
+import asyncio
+import logging
+import os
+
+import httpx
+
+logger = logging.getLogger("app")
+
+_MAX_CONNECTIONS = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "20"))
+_MAX_KEEPALIVE = int(os.getenv("MCP_HTTP_MAX_KEEPALIVE", "10"))
+
+# name -> (client, loop it was created on). httpx pools are bound to the loop
+# that opened their connections, so a client is only reused on the same loop.
+_clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client(name: str, *, timeout: float) -> httpx.AsyncClient:
+    """Return the shared client for an upstream, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    existing = _clients.get(name)
+    if existing is not None and existing[1] is loop and not existing[0].is_closed:
+        return existing[0]
+
+    client = httpx.AsyncClient(
+        timeout=timeout,
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=_MAX_CONNECTIONS,
+            max_keepalive_connections=_MAX_KEEPALIVE,
+        ),
+    )
+    _clients[name] = (client, loop)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every shared client (server shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client, loop in clients:
+        if loop is not asyncio.get_running_loop():
+            continue
+        try:
+            await client.aclose()
+        except Exception:
+            logger.warning("[http_clients] Failed to close client", exc_info=True)
@@ -5,13 +5,22 @@ Reads from knowledge.db when available, falls back to file-based .md resources.
 
 import json
 import logging
+import os
+from pathlib import Path
 
 from fastmcp import Context
 from resources import KNOWLEDGE_REGISTRY, RESOURCES_DIR
+from resources.content_cache import ContentCache, file_etag
 from tools.local_search import _get_tlp_level, _RESTRICTED_TLP, _USE_LOCAL, _maybe_elicit_provider_switch
 
 logger = logging.getLogger("mcp_server")
 
+# Markdown of recently read resources, revalidated against last_updated (DB)
+# or mtime/size (files) on every read.
+knowledge_cache = ContentCache(
+    max_bytes=int(os.getenv("KNOWLEDGE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+)
+
 
 def _db_list_ids() -> list[str] | None:
     """Return all resource IDs from knowledge.db, or None if unavailable."""
@@ -19,29 +28,52 @@ def _db_list_ids() -> list[str] | None:
         from db import get_knowledge_connection
         conn = get_knowledge_connection()
         rows = conn.execute("SELECT id FROM knowledge_resources ORDER BY id").fetchall()
-        conn.close()
         return [r["id"] for r in rows]
     except Exception:
         return None
 
 
 def _db_read(resource_id: str) -> str | None:
-    """Read markdown content from knowledge.db, or None if unavailable."""
+    """Read markdown content from knowledge.db, or None if unavailable.
+
+    Only last_updated is queried when the cached copy is still current.
+    """
     try:
         from db import get_knowledge_connection
         conn = get_knowledge_connection()
         row = conn.execute(
-            "SELECT markdown_content FROM knowledge_resources WHERE id = ?",
+            "SELECT last_updated FROM knowledge_resources WHERE id = ?",
+            (resource_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        cached = knowledge_cache.get(("db", resource_id), row["last_updated"])
+        if cached is not None:
+            return cached
+        row = conn.execute(
+            "SELECT markdown_content, last_updated FROM knowledge_resources WHERE id = ?",
             (resource_id,),
         ).fetchone()
-        conn.close()
         if row:
-            return row["markdown_content"]
+            content = row["markdown_content"]
+            knowledge_cache.put(("db", resource_id), row["last_updated"], content)
+            return content
     except Exception:
         pass
     return None
 
 
+def _file_read(resource_id: str, path: Path) -> str:
+    """Read a fallback .md resource, reusing the cached copy while unchanged."""
+    etag = file_etag(path)
+    cached = knowledge_cache.get(("file", resource_id), etag)
+    if cached is not None:
+        return cached
+    content = path.read_text(encoding="utf-8")
+    knowledge_cache.put(("file", resource_id), etag, content)
+    return content
+
+
 def _db_index() -> list[dict] | None:
     """Return the full knowledge index from DB, or None if unavailable."""
     try:
@@ -50,7 +82,6 @@ def _db_index() -> list[dict] | None:
         rows = conn.execute(
             "SELECT id, keywords, priority, citation FROM knowledge_resources ORDER BY id"
         ).fetchall()
-        conn.close()
         return [
             {
                 "uri": f"knowledge://{r['id']}",
@@ -94,7 +125,7 @@ async def read_knowledge_base(ctx: Context, resource_id: str, session_id: str) -
         path = RESOURCES_DIR / f"{resource_id}.md"
         if not path.exists():
             raise ValueError(f"Resource file not found: {resource_id}")
-        content = path.read_text(encoding="utf-8")
+        content = _file_read(resource_id, path)
 
     tlp_level = _get_tlp_level(content[:300])
     if tlp_level in _RESTRICTED_TLP:
@@ -151,4 +182,4 @@ def register_knowledge_resources(mcp) -> None:
         if not path.exists():
             raise ValueError(f"Resource file not found: {resource_id}")
 
-        return path.read_text(encoding="utf-8")
+        return _file_read(resource_id, path)
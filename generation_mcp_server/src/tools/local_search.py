@@ -4,6 +4,7 @@ import csv
 import json
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from fastmcp import Context
@@ -73,7 +74,7 @@ def _parse_markdown_front_matter(markdown_text: str) -> tuple[dict[str, str], st
         value = value.strip().strip('"')
         if key in {
             "author", "year", "title", "publisher",
-            "file_upload_id", "source_filename", "session_id",
+            "file_upload_id", "source_filename", "session_id", "content_path",
         }:
             metadata[key] = value
     return metadata, body
@@ -117,6 +118,26 @@ def _read_text_by_extension(path: Path, extension: str) -> str:
     return ""
 
 
+# Parsed artifacts keyed by (path, mtime_ns, size): the manifest fallback
+# re-reads a file only when it changed on disk.
+@lru_cache(maxsize=256)
+def _load_pdf_sections(
+    path: str, mtime_ns: int, size: int
+) -> tuple[dict[str, str], list[tuple[int, str]]]:
+    raw_markdown = Path(path).read_text(encoding="utf-8", errors="ignore")
+    front_matter, body = _parse_markdown_front_matter(raw_markdown)
+    # Re-uploads of known bytes keep their pages in the backend content store
+    content_path = front_matter.get("content_path")
+    if content_path and Path(content_path).exists():
+        body += Path(content_path).read_text(encoding="utf-8", errors="ignore")
+    return front_matter, _extract_page_sections(body)
+
+
+@lru_cache(maxsize=256)
+def _load_text(path: str, extension: str, mtime_ns: int, size: int) -> str:
+    return _read_text_by_extension(Path(path), extension)
+
+
 def _search_record(entry: dict, terms: list[str], max_results: int) -> list[dict]:
     extension = str(entry.get("extension", "")).lower()
     filename = str(entry.get("filename") or entry.get("original_filename") or "unknown")
@@ -133,8 +154,10 @@ def _search_record(entry: dict, terms: list[str], max_results: int) -> list[dict
         if not md_path.exists():
             return []
 
-        raw_markdown = md_path.read_text(encoding="utf-8", errors="ignore")
-        front_matter, body = _parse_markdown_front_matter(raw_markdown)
+        stat = md_path.stat()
+        front_matter, sections = _load_pdf_sections(
+            str(md_path), stat.st_mtime_ns, stat.st_size
+        )
         if front_matter:
             citation = {
                 "author": front_matter.get("author", "Unknown"),
@@ -143,7 +166,7 @@ def _search_record(entry: dict, terms: list[str], max_results: int) -> list[dict
                 "publisher": front_matter.get("publisher", "Unknown"),
             }
 
-        for page_number, page_text in _extract_page_sections(body):
+        for page_number, page_text in sections:
             score = _score_text(page_text, terms)
             if score <= 0:
                 continue
@@ -171,7 +194,8 @@ def _search_record(entry: dict, terms: list[str], max_results: int) -> list[dict
         return []
 
     try:
-        text = _read_text_by_extension(source_path, extension)
+        stat = source_path.stat()
+        text = _load_text(str(source_path), extension, stat.st_mtime_ns, stat.st_size)
     except Exception:
         return []
 
@@ -195,44 +219,45 @@ def _search_record(entry: dict, terms: list[str], max_results: int) -> list[dict
     ]
 
 
+def _fts_query(terms: list[str]) -> str:
+    """Build an FTS5 MATCH expression: any term, each as a quoted prefix."""
+    return " OR ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
 def _db_search_uploads(session_id: str, terms: list[str], max_results: int) -> list[dict] | None:
-    """Search uploaded_files table for keyword matches. Returns None if DB unavailable."""
+    """Search the upload_pages FTS5 index for a session. Returns None if DB unavailable.
+
+    Pages are ranked with BM25 and snippets come from FTS5's snippet(), so only
+    the matching excerpts leave sqlite.
+    """
     try:
         from db import get_sessions_connection
         conn = get_sessions_connection()
         rows = conn.execute(
-            "SELECT id, original_filename, parsed_content, citation, searchable, search_skip_reason "
-            "FROM uploaded_files WHERE session_id = ? ORDER BY uploaded_at",
-            (session_id,),
+            "SELECT u.id, u.original_filename, u.citation, "
+            "substr(u.parsed_content, 1, 300) AS content_header, upload_pages.page, "
+            "snippet(upload_pages, 0, '', '', '...', 32) AS snippet "
+            "FROM upload_pages JOIN uploaded_files u ON u.content_ref = upload_pages.sha256 "
+            "WHERE upload_pages MATCH ? AND u.session_id = ? AND u.searchable "
+            "ORDER BY bm25(upload_pages) LIMIT ?",
+            (_fts_query(terms), session_id, max_results),
         ).fetchall()
-        conn.close()
     except Exception:
         return None
 
     results: list[dict] = []
     for row in rows:
-        if not row["searchable"]:
-            continue
-        content = row["parsed_content"] or ""
-        if not content:
-            continue
-        score = _score_text(content, terms)
-        if score <= 0:
-            continue
         citation = json.loads(row["citation"]) if row["citation"] else _default_citation(row["original_filename"])
         results.append({
-            "score": score,
             "file_upload_id": row["id"],
             "filename": row["original_filename"],
-            "_content_header": content[:300],
-            "page_reference": None,
-            "snippet": _make_snippet(content, terms),
+            "_content_header": row["content_header"] or "",
+            "page_reference": f"Page {row['page']}" if row["page"] is not None else None,
+            "snippet": row["snippet"],
             "citation": citation,
             "apa_citation": _format_apa_citation(citation),
         })
-
-    results.sort(key=lambda x: x.get("score", 0), reverse=True)
-    return results[:max_results]
+    return results
 
 
 # TLP levels that require a provider-switch warning before sending to a cloud LLM.
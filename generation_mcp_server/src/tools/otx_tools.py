@@ -1,15 +1,29 @@
 """AlienVault OTX MCP tool."""
 
+import asyncio
 import json
 import logging
 import os
 
 import httpx
 
+from db import get_cache_db_path
+from tools.http_clients import get_http_client
+from tools.response_cache import ResponseCache, make_cache_key
+
 logger = logging.getLogger("app")
 
 OTX_BASE_URL = "https://otx.alienvault.com/api/v1"
 
+# Successful OTX responses, shared by all sessions. Set OTX_CACHE_PERSIST=1 to
+# keep them across restarts in mcp_cache.db next to knowledge.db.
+otx_cache = ResponseCache(
+    "otx",
+    ttl_seconds=float(os.getenv("OTX_CACHE_TTL_SECONDS", "3600")),
+    max_entries=int(os.getenv("OTX_CACHE_MAX_ENTRIES", "2000")),
+    db_path=get_cache_db_path() if os.getenv("OTX_CACHE_PERSIST") == "1" else None,
+)
+
 _OTX_INDICATOR_SECTIONS: dict[str, str] = {
     "ipv4": "IPv4",
     "ipv6": "IPv6",
@@ -23,20 +37,29 @@ _OTX_INDICATOR_SECTIONS: dict[str, str] = {
 }
 
 
-def _otx_request(path: str, params: dict | None = None) -> dict:
+async def _otx_request(path: str, params: dict | None = None) -> dict:
     api_key = os.getenv("OTX_API_KEY")
     if not api_key:
         logger.error("[query_otx] OTX_API_KEY environment variable is not set")
         return {}
 
-    url = f"{OTX_BASE_URL}/{path.lstrip('/')}"
+    path = path.lstrip("/")
+    cache_key = make_cache_key(path, params)
+    cached = otx_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    url = f"{OTX_BASE_URL}/{path}"
     headers = {"X-OTX-API-KEY": api_key}
 
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client("otx", timeout=60.0)
+        response = await client.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        data = response.json()
+        if data:
+            otx_cache.set(cache_key, data)
+        return data
     except httpx.HTTPStatusError as e:
         logger.error(f"[query_otx] HTTP {e.response.status_code} for {path}")
         if e.response.status_code == 403:
@@ -49,12 +72,12 @@ def _otx_request(path: str, params: dict | None = None) -> dict:
         return {}
 
 
-def _search_otx_indicator(indicator_type: str, value: str) -> list[dict]:
+async def _search_otx_indicator(indicator_type: str, value: str) -> list[dict]:
     section = _OTX_INDICATOR_SECTIONS.get(indicator_type.lower())
     if not section:
         return []
 
-    data = _otx_request(f"indicators/{section}/{value}/general")
+    data = await _otx_request(f"indicators/{section}/{value}/general")
     if not data:
         return []
 
@@ -75,7 +98,7 @@ def _search_otx_indicator(indicator_type: str, value: str) -> list[dict]:
     return results
 
 
-def _search_otx_pulses(query: str, since_date: str = "") -> list[dict]:
+async def _search_otx_pulses(query: str, since_date: str = "") -> list[dict]:
     all_results: list[dict] = []
     limit = 10
 
@@ -83,7 +106,7 @@ def _search_otx_pulses(query: str, since_date: str = "") -> list[dict]:
         params: dict = {"q": query, "limit": limit, "page": page}
         if since_date:
             params["modified_since"] = since_date
-        data = _otx_request("search/pulses", params=params)
+        data = await _otx_request("search/pulses", params=params)
         if not data:
             break
 
@@ -110,8 +133,8 @@ def _search_otx_pulses(query: str, since_date: str = "") -> list[dict]:
     return all_results
 
 
-def _fetch_pulse_details(pulse_id: str) -> dict:
-    data = _otx_request(f"pulses/{pulse_id.strip()}")
+async def _fetch_pulse_details(pulse_id: str) -> dict:
+    data = await _otx_request(f"pulses/{pulse_id.strip()}")
     if not data:
         return {"pulse_id": pulse_id, "error": "No data returned"}
     indicators = data.get("indicators", [])
@@ -138,7 +161,7 @@ def _fetch_pulse_details(pulse_id: str) -> dict:
     }
 
 
-def query_otx(search_term: str, indicator_type: str = "", since_date: str = "") -> str:
+async def query_otx(search_term: str, indicator_type: str = "", since_date: str = "") -> str:
     """Query AlienVault OTX for threat intelligence on indicators or keywords.
 
     When indicator_type is provided (ipv4, domain, md5, sha256, etc.),
@@ -154,7 +177,7 @@ def query_otx(search_term: str, indicator_type: str = "", since_date: str = "")
 
     try:
         if indicator_type:
-            results = _search_otx_indicator(indicator_type.strip(), search_term.strip())
+            results = await _search_otx_indicator(indicator_type.strip(), search_term.strip())
             return json.dumps(
                 {
                     "search_term": search_term,
@@ -164,7 +187,7 @@ def query_otx(search_term: str, indicator_type: str = "", since_date: str = "")
                 }
             )
         else:
-            pulses = _search_otx_pulses(search_term.strip(), since_date=since_date.strip())
+            pulses = await _search_otx_pulses(search_term.strip(), since_date=since_date.strip())
     except PermissionError as e:
         return json.dumps(
             {
@@ -175,13 +198,13 @@ def query_otx(search_term: str, indicator_type: str = "", since_date: str = "")
             }
         )
 
-    enriched = []
-    for pulse in pulses[:3]:
-        pulse_id = pulse.get("pulse_id", "")
-        if pulse_id:
-            details = _fetch_pulse_details(pulse_id)
-            pulse.update(details)
-        enriched.append(pulse)
+    enriched = pulses[:3]
+    to_fetch = [pulse for pulse in enriched if pulse.get("pulse_id")]
+    details = await asyncio.gather(
+        *(_fetch_pulse_details(pulse["pulse_id"]) for pulse in to_fetch)
+    )
+    for pulse, detail in zip(to_fetch, details, strict=True):
+        pulse.update(detail)
 
     return json.dumps(
         {
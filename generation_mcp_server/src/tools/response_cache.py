@@ -0,0 +1,256 @@
+"""TTL + LRU cache for upstream API responses, with optional SQLite persistence.
+
+The MCP server is shared by every analysis session, so the same OTX lookup
+(a popular actor, a well-known IP) is often repeated across sessions. Cached
+responses are held in memory (bounded by entry count) and, when persistence
+is enabled, written through to a small SQLite file next to knowledge.db so
+they survive a server restart. get_or_fetch() also collapses concurrent
+identical lookups into a single upstream call, and runs the disk reads and
+writes of a persistent cache in a worker thread so they never block the
+event loop.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger("app")
+
+# Expired / surplus rows are pruned from disk every this many writes.
+_PRUNE_EVERY = 100
+
+
+def make_cache_key(endpoint: str, params: dict | None = None) -> str:
+    """Stable key for an endpoint plus its query parameters."""
+    return json.dumps([endpoint, sorted((params or {}).items())], default=str)
+
+
+class ResponseCache:
+    """Bounded response cache for one upstream (``namespace``).
+
+    Args:
+        namespace: Upstream name; rows of different caches share one DB file.
+        ttl_seconds: Default lifetime of an entry.
+        max_entries: Maximum entries kept in memory and on disk.
+        db_path: SQLite file for persistence, or None for memory only.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        max_entries: int,
+        db_path: str | None = None,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._writes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._coalesced = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._expirations += 1
+
+            row = self._db_get(key, now)
+            if row is not None:
+                expires_at, value = row
+                self._remember(key, expires_at, value)
+                self._hits += 1
+                self._disk_hits += 1
+                return value
+
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        expires_at = time.time() + (
+            self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._db_set(key, expires_at, value)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: float | None = None,
+    ) -> Any:
+        """Return the cached value, or await ``fetch()`` once and cache it.
+
+        Concurrent callers asking for the same key while a fetch is running
+        wait for that fetch instead of issuing their own. The fetch runs in
+        its own task, so cancelling the caller that started it does not
+        cancel it for the others. Exceptions reach every waiter and nothing
+        is cached.
+        """
+        cached = await self._off_loop(self.get, key)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._fetch(key, fetch, ttl_seconds))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: float | None,
+    ) -> Any:
+        value = await fetch()
+        await self._off_loop(self.set, key, value, ttl_seconds)
+        return value
+
+    async def _off_loop(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call func in a worker thread if it may touch the DB, else inline."""
+        if self.db_path is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieved here so a failure nobody awaited is not logged as lost.
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            conn = self._db()
+            if conn is not None:
+                conn.execute(
+                    "DELETE FROM response_cache WHERE namespace = ?", (self.namespace,)
+                )
+                conn.commit()
+
+    def stats(self) -> dict:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "persistent": self.db_path is not None,
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "coalesced": self._coalesced,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # -- persistence --------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection | None:
+        if self.db_path is None:
+            return None
+        if self._conn is None:
+            try:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA busy_timeout=5000")
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS response_cache (
+                        namespace TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        expires_at REAL NOT NULL,
+                        PRIMARY KEY (namespace, key)
+                    )"""
+                )
+                conn.commit()
+            except sqlite3.Error:
+                logger.warning(
+                    f"[ResponseCache] Persistence disabled for {self.namespace}",
+                    exc_info=True,
+                )
+                self.db_path = None
+                return None
+            self._conn = conn
+        return self._conn
+
+    def _db_get(self, key: str, now: float) -> tuple[float, Any] | None:
+        conn = self._db()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT expires_at, value FROM response_cache "
+                "WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (self.namespace, key, now),
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("[ResponseCache] Disk read failed", exc_info=True)
+            return None
+        return (row[0], json.loads(row[1])) if row else None
+
+    def _db_set(self, key: str, expires_at: float, value: Any) -> None:
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), expires_at),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY == 0:
+                self._db_prune(conn)
+            conn.commit()
+        except sqlite3.Error:
+            logger.warning("[ResponseCache] Disk write failed", exc_info=True)
+
+    def _db_prune(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM response_cache WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, time.time()),
+        )
+        conn.execute(
+            """DELETE FROM response_cache WHERE namespace = ? AND key NOT IN (
+                   SELECT key FROM response_cache WHERE namespace = ?
+                   ORDER BY expires_at DESC LIMIT ?
+               )""",
+            (self.namespace, self.namespace, self.max_entries),
+        )
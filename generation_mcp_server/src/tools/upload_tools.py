@@ -31,7 +31,6 @@ def _db_list(session_id: str) -> str | None:
             "SELECT id, original_filename, size_bytes FROM uploaded_files WHERE session_id = ? ORDER BY uploaded_at",
             (session_id,),
         ).fetchall()
-        conn.close()
         return json.dumps([
             {"file_id": r["id"], "filename": r["original_filename"], "size_bytes": r["size_bytes"]}
             for r in rows
@@ -46,10 +45,12 @@ def _db_read(session_id: str, file_upload_id: str) -> str | None:
         from db import get_sessions_connection
         conn = get_sessions_connection()
         row = conn.execute(
-            "SELECT parsed_content, original_filename FROM uploaded_files WHERE id = ? AND session_id = ?",
+            "SELECT COALESCE(u.parsed_content, '') || COALESCE(p.body, '') AS parsed_content, "
+            "u.original_filename FROM uploaded_files u "
+            "LEFT JOIN parsed_documents p ON p.sha256 = u.content_ref "
+            "WHERE u.id = ? AND u.session_id = ?",
             (file_upload_id, session_id),
         ).fetchone()
-        conn.close()
         if row and row["parsed_content"]:
             return row["parsed_content"]
     except Exception:
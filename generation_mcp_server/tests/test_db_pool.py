@@ -0,0 +1,76 @@
+import sqlite3
+import threading
+
+import pytest
+
+import db
+
+
+@pytest.fixture
+def knowledge_db(tmp_path, monkeypatch):
+    path = tmp_path / "knowledge.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE knowledge_resources (id TEXT PRIMARY KEY)")
+    conn.execute("INSERT INTO knowledge_resources VALUES ('a/one')")
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv("KNOWLEDGE_DB_PATH", str(path))
+    yield path
+    db.close_db_connections()
+
+
+def test_connection_is_reused_within_a_thread(knowledge_db):
+    first = db.get_knowledge_connection()
+    assert db.get_knowledge_connection() is first
+
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(db.get_knowledge_connection())
+    )
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+
+
+def test_connection_is_read_only_and_sees_new_writes(knowledge_db):
+    conn = db.get_knowledge_connection()
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO knowledge_resources VALUES ('a/two')")
+
+    writer = sqlite3.connect(knowledge_db)
+    writer.execute("INSERT INTO knowledge_resources VALUES ('a/two')")
+    writer.commit()
+    writer.close()
+    assert conn.execute("SELECT COUNT(*) FROM knowledge_resources").fetchone()[0] == 2
+
+
+def test_recreated_database_is_reopened(knowledge_db):
+    stale = db.get_knowledge_connection()
+    replacement = knowledge_db.with_name("replacement.db")
+    conn = sqlite3.connect(replacement)
+    conn.execute("CREATE TABLE knowledge_resources (id TEXT PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+    replacement.replace(knowledge_db)
+
+    fresh = db.get_knowledge_connection()
+    assert fresh is not stale
+    assert fresh.execute("SELECT COUNT(*) FROM knowledge_resources").fetchone()[0] == 0
+
+
+def test_missing_database_raises_without_creating_it(tmp_path, monkeypatch):
+    missing = tmp_path / "missing.db"
+    monkeypatch.setenv("KNOWLEDGE_DB_PATH", str(missing))
+    with pytest.raises(OSError):
+        db.get_knowledge_connection()
+    assert not missing.exists()
+
+
+def test_close_db_connections_retires_pooled_connections(knowledge_db):
+    before = db.get_knowledge_connection()
+    db.close_db_connections()
+
+    after = db.get_knowledge_connection()
+    assert after is not before
+    assert after.execute("SELECT id FROM knowledge_resources").fetchone()[0] == "a/one"
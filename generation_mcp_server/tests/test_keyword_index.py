@@ -0,0 +1,92 @@
+"""Tests for the knowledge bank keyword index."""
+
+import json
+import random
+import sqlite3
+
+import resources
+from resources import KNOWLEDGE_REGISTRY, load_knowledge
+from resources.keyword_index import KeywordIndex
+
+
+def _naive_hits(entries, text):
+    lowered = text.lower()
+    hits = {}
+    for resource_id, keywords, _ in entries:
+        count = sum(1 for kw in keywords if kw.lower() in lowered)
+        if count:
+            hits[resource_id] = count
+    return hits
+
+
+def test_index_matches_naive_substring_scan():
+    rng = random.Random(7)
+    alphabet = "abcde "
+    entries = [
+        (
+            f"r{i}",
+            [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(5)
+            ],
+            rng.randint(1, 3),
+        )
+        for i in range(40)
+    ]
+    index = KeywordIndex(entries)
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        assert dict(index.hits(text)) == _naive_hits(entries, text)
+
+
+def test_top_ranks_by_hits_then_priority():
+    index = KeywordIndex(
+        [
+            ("low", ["russia"], 3),
+            ("many", ["russia", "gru", "svr"], 3),
+            ("high", ["russia"], 1),
+        ]
+    )
+    assert index.top("GRU and SVR units of Russia", limit=2) == ["many", "high"]
+    assert index.top("nothing relevant") == []
+
+
+def test_load_knowledge_reads_markdown_for_top_ids_only(tmp_path, monkeypatch):
+    db_path = tmp_path / "knowledge.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE knowledge_resources (id TEXT PRIMARY KEY, keywords TEXT, "
+        "priority INTEGER, markdown_content TEXT, citation TEXT, last_updated TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO knowledge_resources VALUES (?, ?, ?, ?, NULL, '2026-01-01')",
+        [
+            ("a/energy", json.dumps(["energy", "pipeline"]), 2, "ENERGY DOC"),
+            ("a/telecom", json.dumps(["telecom"]), 2, "TELECOM DOC"),
+        ],
+    )
+    conn.commit()
+    monkeypatch.setenv("KNOWLEDGE_DB_PATH", str(db_path))
+    resources.invalidate_knowledge_index()
+
+    result = load_knowledge("Attack on an energy pipeline")
+    assert "ENERGY DOC" in result
+    assert "TELECOM DOC" not in result
+
+    # A re-seed (new last_updated) is picked up without an explicit invalidate
+    conn.execute(
+        "UPDATE knowledge_resources SET keywords = ?, last_updated = '2026-02-01' "
+        "WHERE id = 'a/telecom'",
+        (json.dumps(["telecom", "pipeline"]),),
+    )
+    conn.commit()
+    conn.close()
+    assert "TELECOM DOC" in load_knowledge("pipeline")
+    resources.invalidate_knowledge_index()
+
+
+def test_registry_fallback_uses_index(monkeypatch):
+    monkeypatch.setattr(resources, "_load_knowledge_from_db", lambda scan_text: None)
+    result = load_knowledge("Volt Typhoon intrusion")
+    assert "### Source: threat_actors/chinese_state" in result
+    assert "threat_actors/chinese_state" in KNOWLEDGE_REGISTRY
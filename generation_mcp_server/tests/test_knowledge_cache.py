@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+import db
+from resources.content_cache import ContentCache
+from tools import knowledge_tools
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ContentCache(max_bytes=1024)
+    monkeypatch.setattr(knowledge_tools, "knowledge_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def knowledge_db(tmp_path, monkeypatch):
+    path = tmp_path / "knowledge.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE knowledge_resources (id TEXT PRIMARY KEY, "
+        "markdown_content TEXT, last_updated TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO knowledge_resources VALUES ('a/one', 'first', '2026-01-01')"
+    )
+    conn.commit()
+    monkeypatch.setenv("KNOWLEDGE_DB_PATH", str(path))
+    yield conn
+    conn.close()
+    db.close_db_connections()
+
+
+def test_db_read_revalidates_on_last_updated(cache, knowledge_db):
+    assert knowledge_tools._db_read("a/one") == "first"
+    assert knowledge_tools._db_read("a/one") == "first"
+    assert cache.stats()["hits"] == 1
+
+    knowledge_db.execute(
+        "UPDATE knowledge_resources SET markdown_content = 'second', "
+        "last_updated = '2026-02-01' WHERE id = 'a/one'"
+    )
+    knowledge_db.commit()
+
+    assert knowledge_tools._db_read("a/one") == "second"
+    assert cache.stats()["stale"] == 1
+    assert knowledge_tools._db_read("a/missing") is None
+
+
+def test_file_read_revalidates_on_change(cache, tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("v1", encoding="utf-8")
+    assert knowledge_tools._file_read("a/doc", path) == "v1"
+    assert knowledge_tools._file_read("a/doc", path) == "v1"
+
+    path.write_text("version 2", encoding="utf-8")
+    assert knowledge_tools._file_read("a/doc", path) == "version 2"
+
+
+def test_content_cache_evicts_least_recently_used():
+    cache = ContentCache(max_bytes=10)
+    cache.put("a", 1, "aaaa")
+    cache.put("b", 1, "bbbb")
+    assert cache.get("a", 1) == "aaaa"
+    cache.put("c", 1, "cccc")
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "aaaa"
+    assert cache.stats()["size_bytes"] == 8
+    cache.put("huge", 1, "x" * 11)
+    assert cache.get("huge", 1) is None
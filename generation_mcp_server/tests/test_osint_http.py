@@ -0,0 +1,255 @@
+"""Tests for the async, pooled OSINT HTTP tools."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from tools import google_search as google_search_module
+from tools import http_clients, otx_tools
+from tools.google_search import (
+    _SERPER_NEWS_URL,
+    _SERPER_SEARCH_URL,
+    google_news_search,
+    google_search,
+)
+from tools.otx_tools import OTX_BASE_URL, query_otx
+from tools.response_cache import ResponseCache, make_cache_key
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch):
+    """Memory-only caches so tests neither share state nor touch mcp_cache.db."""
+    monkeypatch.setattr(otx_tools, "otx_cache", ResponseCache("otx", 60, 100))
+    monkeypatch.setattr(
+        google_search_module, "serper_cache", ResponseCache("serper", 60, 100)
+    )
+
+
+async def test_google_search_reuses_shared_client(monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "key")
+    with respx.mock:
+        route = respx.post(_SERPER_SEARCH_URL).mock(
+            return_value=httpx.Response(
+                200, json={"organic": [{"title": "T", "link": "https://a.example"}]}
+            )
+        )
+        first = await google_search("apt29")
+        client = http_clients.get_http_client("serper", timeout=15.0)
+        await google_search("apt28")
+
+    assert "https://a.example" in first
+    assert route.call_count == 2
+    assert http_clients.get_http_client("serper", timeout=15.0) is client
+    await http_clients.close_http_clients()
+    assert client.is_closed
+
+
+async def test_concurrent_otx_lookups_overlap(monkeypatch):
+    monkeypatch.setenv("OTX_API_KEY", "key")
+
+    async def slow_response(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"pulse_info": {"pulses": [{"name": "P"}]}})
+
+    with respx.mock:
+        respx.get(url__startswith=OTX_BASE_URL).mock(side_effect=slow_response)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        raws = await asyncio.gather(
+            *(query_otx(f"10.0.0.{i}", "ipv4") for i in range(5))
+        )
+        elapsed = loop.time() - started
+
+    assert all(json.loads(raw)["total_results"] == 1 for raw in raws)
+    assert elapsed < 0.6
+    await http_clients.close_http_clients()
+
+
+async def test_pulse_enrichment_runs_concurrently(monkeypatch):
+    monkeypatch.setenv("OTX_API_KEY", "key")
+    pulses = [{"id": f"p{i}", "name": f"Pulse {i}"} for i in range(3)]
+
+    async def slow_details(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"name": "details", "indicators": []})
+
+    with respx.mock:
+        respx.get(f"{OTX_BASE_URL}/search/pulses").mock(
+            return_value=httpx.Response(200, json={"results": pulses})
+        )
+        respx.get(url__regex=rf"{OTX_BASE_URL}/pulses/p\d").mock(
+            side_effect=slow_details
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        data = json.loads(await query_otx("APT29"))
+        elapsed = loop.time() - started
+
+    assert [p["pulse_id"] for p in data["enriched_pulses"]] == ["p0", "p1", "p2"]
+    assert all(p["name"] == "details" for p in data["enriched_pulses"])
+    assert elapsed < 0.5
+    await http_clients.close_http_clients()
+
+
+async def test_repeated_otx_lookup_is_served_from_cache(monkeypatch):
+    monkeypatch.setenv("OTX_API_KEY", "key")
+    with respx.mock:
+        route = respx.get(url__startswith=OTX_BASE_URL).mock(
+            return_value=httpx.Response(
+                200, json={"pulse_info": {"pulses": [{"name": "P"}]}}
+            )
+        )
+        first = await query_otx("1.2.3.4", "ipv4")
+        second = await query_otx("1.2.3.4", "ipv4")
+
+    assert first == second
+    assert route.call_count == 1
+    assert otx_tools.otx_cache.stats()["hits"] == 1
+    await http_clients.close_http_clients()
+
+
+def test_response_cache_expires_and_evicts(monkeypatch):
+    import tools.response_cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache("test", ttl_seconds=60, max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.set(name, {"v": name})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"v": "c"}
+    now[0] += 120
+    assert cache.get("c") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["expirations"] == 1
+
+
+def test_response_cache_persists_across_instances(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    key = make_cache_key("search/pulses", {"q": "APT29", "modified_since": "2025"})
+    ResponseCache("otx", ttl_seconds=60, max_entries=10, db_path=db_path).set(
+        key, {"results": [1]}
+    )
+
+    fresh = ResponseCache("otx", ttl_seconds=60, max_entries=10, db_path=db_path)
+
+    assert fresh.get(key) == {"results": [1]}
+    assert fresh.stats()["disk_hits"] == 1
+    assert ResponseCache("serper", 60, 10, db_path=db_path).get(key) is None
+
+
+async def test_persistent_get_or_fetch_keeps_disk_io_off_the_loop(tmp_path):
+    cache = ResponseCache("test", 60, 10, db_path=str(tmp_path / "cache.db"))
+    loop_thread = threading.get_ident()
+    io_threads = []
+    for name in ("_db_get", "_db_set"):
+        original = getattr(cache, name)
+
+        def recording(*args, _original=original):
+            io_threads.append(threading.get_ident())
+            return _original(*args)
+
+        setattr(cache, name, recording)
+
+    async def fetch():
+        return {"ok": True}
+
+    assert await cache.get_or_fetch("k", fetch) == {"ok": True}
+    assert len(io_threads) == 2
+    assert loop_thread not in io_threads
+
+
+async def test_near_identical_serper_queries_share_cache_entry(monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "key")
+    with respx.mock:
+        route = respx.post(_SERPER_SEARCH_URL).mock(
+            return_value=httpx.Response(
+                200, json={"organic": [{"title": "T", "link": "https://a.example"}]}
+            )
+        )
+        first = await google_search("APT29  Norway", region="no")
+        second = await google_search(" apt29\tNORWAY ", region="NO")
+        other_region = await google_search("apt29 norway", region="us")
+
+    assert first.split("\n", 1)[1] == second.split("\n", 1)[1]
+    assert "https://a.example" in other_region
+    assert route.call_count == 2
+    stats = google_search_module.serper_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    await http_clients.close_http_clients()
+
+
+async def test_quoted_serper_query_gets_its_own_cache_entry(monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "key")
+    with respx.mock:
+        route = respx.post(_SERPER_SEARCH_URL).mock(
+            return_value=httpx.Response(200, json={"organic": []})
+        )
+        await google_search("apt29 norway")
+        await google_search('"apt29 norway"')
+
+    assert route.call_count == 2
+    await http_clients.close_http_clients()
+
+
+async def test_concurrent_identical_news_queries_are_single_flight(monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "key")
+
+    async def slow_news(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"news": [{"title": "N", "link": "https://n"}]})
+
+    with respx.mock:
+        route = respx.post(_SERPER_NEWS_URL).mock(side_effect=slow_news)
+        results = await asyncio.gather(
+            *(google_news_search("russia gps jamming") for _ in range(4))
+        )
+
+    assert len(set(results)) == 1
+    assert route.call_count == 1
+    assert google_search_module.serper_cache.stats()["coalesced"] == 3
+    await http_clients.close_http_clients()
+
+
+async def test_failed_fetch_is_not_cached():
+    cache = ResponseCache("test", 60, 10)
+
+    async def failing():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("k", failing)
+
+    async def ok():
+        return {"ok": True}
+
+    assert await cache.get_or_fetch("k", ok) == {"ok": True}
+
+
+async def test_cancelled_first_caller_does_not_fail_waiters():
+    cache = ResponseCache("test", 60, 10)
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"ok": True}
+
+    first = asyncio.create_task(cache.get_or_fetch("k", slow))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_fetch("k", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await waiter == {"ok": True}
+    assert first.cancelled()
+    assert calls == 1
+    assert cache.get("k") == {"ok": True}
@@ -0,0 +1,45 @@
+import json
+
+import prompts
+from prompts import collection
+from prompts.collection import build_collection_collect_prompt, collection_collect
+
+
+def test_memoized_adapter_matches_builder():
+    collection_collect.cache_clear()
+    kwargs = {
+        "pir": "PIR-1",
+        "selected_sources": json.dumps(["Web Search", "AlienVault OTX"]),
+        "plan": "plan",
+        "perspectives": json.dumps(["us", "norway"]),
+    }
+    expected = build_collection_collect_prompt(
+        pir="PIR-1",
+        selected_sources=["Web Search", "AlienVault OTX"],
+        plan="plan",
+        perspectives=["us", "norway"],
+    )
+    assert collection_collect(**kwargs) == expected
+    assert collection_collect(**kwargs) == expected
+
+
+def test_repeated_arguments_render_once(monkeypatch):
+    collection.collection_summarize.cache_clear()
+    calls = []
+
+    def fake_builder(**kwargs):
+        calls.append(kwargs)
+        return f"rendered {len(calls)}"
+
+    monkeypatch.setattr(collection, "build_collection_summarize_prompt", fake_builder)
+
+    assert collection.collection_summarize("pir", "data") == "rendered 1"
+    assert collection.collection_summarize("pir", "data") == "rendered 1"
+    assert collection.collection_summarize("pir", "other") == "rendered 2"
+    assert len(calls) == 2
+    collection.collection_summarize.cache_clear()
+
+
+def test_prompts_version_is_stable_fingerprint():
+    assert len(prompts.PROMPTS_VERSION) == 12
+    assert prompts.PROMPTS_VERSION == prompts.PROMPTS_VERSION.lower()
@@ -1,7 +1,9 @@
 import json
+import sqlite3
 from pathlib import Path
 
 from src import server
+from src.tools.local_search import _db_search_uploads, _search_record
 
 
 def _write_session_manifest(root: Path, session_id: str, files: list[dict]) -> None:
@@ -100,6 +102,42 @@ def test_search_local_data_finds_pdf_markdown_with_page_reference(tmp_path, monk
     assert result["apa_citation"] == "Jane Analyst. (2026). Threat Report. Security Org."
 
 
+def test_pdf_search_follows_content_path_to_shared_body(tmp_path):
+    body_path = tmp_path / ".content" / "abc" / "parsed.md"
+    body_path.parent.mkdir(parents=True, exist_ok=True)
+    body_path.write_text(
+        "\n## Page 1\nAPT29 campaign details and norwegian targets.\n",
+        encoding="utf-8",
+    )
+    parsed_path = tmp_path / "s1" / "parsed" / "pdf1.md"
+    parsed_path.parent.mkdir(parents=True, exist_ok=True)
+    parsed_path.write_text(
+        "\n".join(
+            [
+                "---",
+                'file_upload_id: "pdf1"',
+                'title: "Threat Report"',
+                f'content_path: "{body_path.as_posix()}"',
+                "---",
+                "",
+                "# Threat Report",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    entry = {
+        "file_upload_id": "pdf1",
+        "filename": "report.pdf",
+        "extension": ".pdf",
+        "parsed_markdown_path": parsed_path.as_posix(),
+    }
+
+    results = _search_record(entry, ["norwegian"], 20)
+
+    assert [r["page_reference"] for r in results] == ["Page 1"]
+
+
 def test_search_local_data_is_session_isolated(tmp_path, monkeypatch):
     monkeypatch.setattr(server, "UPLOADS_ROOT", tmp_path)
 
@@ -142,3 +180,58 @@ def test_search_local_data_is_session_isolated(tmp_path, monkeypatch):
 
     assert data_s1["total_results"] == 0
     assert data_s2["total_results"] == 1
+
+
+def _write_sessions_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE uploaded_files (
+            id TEXT PRIMARY KEY, session_id TEXT, original_filename TEXT,
+            uploaded_at TEXT, searchable BOOLEAN, search_skip_reason TEXT,
+            parsed_content TEXT, content_ref TEXT, citation TEXT
+        );
+        CREATE VIRTUAL TABLE upload_pages USING fts5(
+            content, sha256 UNINDEXED, page UNINDEXED, tokenize='unicode61'
+        );
+        """
+    )
+    citation = json.dumps({"author": "Jane", "year": "2025", "title": "Report", "publisher": "X"})
+    conn.executemany(
+        "INSERT INTO uploaded_files VALUES (?, ?, ?, ?, ?, NULL, ?, ?, ?)",
+        [
+            ("file1", "s1", "report.pdf", "2026-01-01", 1, "---\ntlp: TLP:CLEAR\n---\n", "abc", citation),
+            ("file2", "s2", "report.pdf", "2026-01-01", 1, "---\n---\n", "abc", citation),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO upload_pages (content, sha256, page) VALUES (?, ?, ?)",
+        [
+            ("Background on regional threat actors.", "abc", 1),
+            ("APT29 targeted Norwegian infrastructure via phishing.", "abc", 2),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_db_search_ranks_pages_with_fts_and_scopes_to_session(tmp_path, monkeypatch):
+    db_path = tmp_path / "sessions.db"
+    _write_sessions_db(db_path)
+    monkeypatch.setenv("SESSIONS_DB_PATH", str(db_path))
+
+    results = _db_search_uploads("s1", ["apt29", "norweg"], max_results=5)
+
+    assert [r["file_upload_id"] for r in results] == ["file1"]
+    assert results[0]["page_reference"] == "Page 2"
+    assert "APT29" in results[0]["snippet"]
+    assert results[0]["apa_citation"].startswith("Jane. (2025)")
+    assert _db_search_uploads("s3", ["apt29"], max_results=5) == []
+
+
+def test_db_search_returns_none_without_fts_index(tmp_path, monkeypatch):
+    db_path = tmp_path / "sessions.db"
+    sqlite3.connect(db_path).close()
+    monkeypatch.setenv("SESSIONS_DB_PATH", str(db_path))
+
+    assert _db_search_uploads("s1", ["apt29"], max_results=5) is None
@@ -0,0 +1,33 @@
+"""The server's KeywordIndex and ContentCache must match the backend's copies."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+_BACKEND_SRC = Path(__file__).resolve().parents[2] / "backend" / "src"
+
+
+def _class_dump(path: Path, name: str) -> str:
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == name:
+            return ast.dump(node)
+    raise AssertionError(f"{name} not defined in {path}")
+
+
+@pytest.mark.parametrize(
+    ("local", "backend", "name"),
+    [
+        ("resources/keyword_index.py", "db/keyword_index.py", "KeywordIndex"),
+        ("resources/content_cache.py", "db/content_cache.py", "ContentCache"),
+    ],
+)
+def test_shared_class_matches_backend(local, backend, name):
+    backend_path = _BACKEND_SRC / backend
+    if not backend_path.exists():
+        pytest.skip("backend tree not checked out")
+    assert _class_dump(_SRC / local, name) == _class_dump(backend_path, name), (
+        f"{name} differs from backend/src/{backend}; change both copies together"
+    )